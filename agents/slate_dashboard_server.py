@@ -5,6 +5,7 @@
 # Modified: 2026-02-07T05:00:00Z | Author: COPILOT | Change: Mono theme refinement, WCAG AAA accessibility, missing JS functions
 # Modified: 2026-02-07T06:00:00Z | Author: COPILOT | Change: Add /reload and /watcher-event endpoints, enhanced WebSocket broadcast
 # Modified: 2026-02-07T09:00:00Z | Author: COPILOT | Change: Add /api/slate/* control endpoints for dashboard button interface
+# Modified: 2026-10-16T09:00:00Z | Author: COPILOT | Change: Route endpoint subprocess calls through non-blocking async executor
 # Purpose: SLATE Dashboard Server - Robust FastAPI server for agentic workflow management
 # ═══════════════════════════════════════════════════════════════════════════════
 """
@@ -28,7 +29,7 @@ Design System:
 Endpoints:
     GET  /                    -> Dashboard UI
     GET  /health              -> Health check
-    WS   /ws                  -> WebSocket for real-time updates
+    WS   /ws                  -> WebSocket for real-time updates and streamed inference
 
     GET  /api/status          -> Full system status
     GET  /api/orchestrator    -> Orchestrator status
@@ -71,6 +72,10 @@ except ImportError:
     print("[!] Missing dependencies. Run: pip install fastapi uvicorn websockets")
     sys.exit(1)
 
+from slate.async_subprocess import get_executor, run_async  # noqa: E402
+from slate.response_cache import AsyncTTLCache  # noqa: E402
+from slate_core.task_store import get_task_store  # noqa: E402
+
 # ─── App Configuration ────────────────────────────────────────────────────────
 
 app = FastAPI(
@@ -213,23 +218,34 @@ def get_gh_cli() -> str:
         return str(gh_path)
     return "gh"
 
-def load_tasks() -> List[Dict[str, Any]]:
-    """Load tasks from current_tasks.json."""
-    task_file = WORKSPACE_ROOT / "current_tasks.json"
-    if task_file.exists():
-        try:
-            data = json.loads(task_file.read_text(encoding="utf-8"))
-            if isinstance(data, list):
-                return data
-            return data.get("tasks", [])
-        except Exception:
-            pass
-    return []
+# Modified: 2026-10-16T10:00:00Z | Author: COPILOT | Change: TTL + single-flight cache for gh-backed endpoints
+# Per-endpoint freshness (seconds). Stale values are served for a further
+# 4x TTL while one background refresh runs, so polling never waits on gh.
+GH_CACHE_TTLS = {
+    "workflows": 15,
+    "github_prs": 30,
+    "github_commits": 60,
+    "github_issues": 60,
+    "workflow_stats": 30,
+}
+
+gh_cache = AsyncTTLCache()
+
+def _cacheable(payload: Dict[str, Any]) -> bool:
+    """Only cache successful gh payloads; errors are retried on the next request."""
+    return "error" not in payload
 
-def save_tasks(tasks: List[Dict[str, Any]]):
-    """Save tasks to current_tasks.json."""
-    task_file = WORKSPACE_ROOT / "current_tasks.json"
-    task_file.write_text(json.dumps(tasks, indent=2), encoding="utf-8")
+async def _cached(key: str, fetch) -> Dict[str, Any]:
+    """Serve a gh-backed payload through the shared response cache."""
+    return await gh_cache.get_or_fetch(key, fetch, ttl=GH_CACHE_TTLS[key], cacheable=_cacheable)
+
+# Modified: 2026-10-17T00:00:00Z | Author: COPILOT | Change: Tasks served from the indexed task store
+def load_tasks() -> List[Dict[str, Any]]:
+    """Load tasks from the task store (current_tasks.json)."""
+    try:
+        return get_task_store(WORKSPACE_ROOT / "current_tasks.json").list()
+    except Exception:
+        return []
 
 # ─── Health & Status Endpoints ────────────────────────────────────────────────
 
@@ -238,6 +254,16 @@ async def health():
     """Health check endpoint."""
     return {"status": "ok", "timestamp": datetime.now(timezone.utc).isoformat(), "service": "slate-dashboard"}
 
+@app.get("/api/subprocess/stats")
+async def api_subprocess_stats():
+    """Get async subprocess executor statistics (calls, timeouts, in-flight per binary)."""
+    return JSONResponse(content={"binaries": get_executor().stats()})
+
+@app.get("/api/cache/stats")
+async def api_cache_stats():
+    """Get response cache hit/miss counters for gh-backed endpoints."""
+    return JSONResponse(content=gh_cache.stats())
+
 @app.get("/api/status")
 def api_status():
     """Get comprehensive system status.
@@ -258,11 +284,12 @@ def api_orchestrator():
 
     Uses def (not async def) so FastAPI runs in thread pool, keeping event loop free.
     """
-    # Modified: 2026-02-07T07:30:00Z | Author: COPILOT | Change: Use sync def for thread pool execution
+    # Modified: 2026-10-16T20:00:00Z | Author: COPILOT | Change: Serve from the background status snapshot
     try:
-        from slate.slate_orchestrator import SlateOrchestrator
-        orch = SlateOrchestrator()
-        return JSONResponse(content=orch.status(skip_dashboard_check=True))
+        from slate.status_snapshot import get_status_snapshot_service
+        service = get_status_snapshot_service(skip_dashboard_check=True)
+        service.wait_ready(timeout=15)
+        return JSONResponse(content=service.snapshot())
     except Exception as e:
         return JSONResponse(content={"error": str(e)}, status_code=500)
 
@@ -291,20 +318,23 @@ def api_runner():
     except Exception as e:
         return JSONResponse(content={"error": str(e)}, status_code=500)
 
+async def _fetch_workflows() -> Dict[str, Any]:
+    gh_cli = get_gh_cli()
+    result = await run_async(
+        [gh_cli, "run", "list", "--limit", "15", "--json",
+         "name,status,conclusion,createdAt,updatedAt,databaseId,headBranch,event"],
+        timeout=15, cwd=str(WORKSPACE_ROOT)
+    )
+    if result.returncode == 0:
+        runs = json.loads(result.stdout)
+        return {"runs": runs, "count": len(runs)}
+    return {"error": result.stderr, "runs": []}
+
 @app.get("/api/workflows")
 async def api_workflows():
     """Get recent GitHub workflow runs."""
     try:
-        gh_cli = get_gh_cli()
-        result = subprocess.run(
-            [gh_cli, "run", "list", "--limit", "15", "--json",
-             "name,status,conclusion,createdAt,updatedAt,databaseId,headBranch,event"],
-            capture_output=True, text=True, timeout=15, cwd=str(WORKSPACE_ROOT)
-        )
-        if result.returncode == 0:
-            runs = json.loads(result.stdout)
-            return JSONResponse(content={"runs": runs, "count": len(runs)})
-        return JSONResponse(content={"error": result.stderr, "runs": []})
+        return JSONResponse(content=await _cached("workflows", _fetch_workflows))
     except Exception as e:
         return JSONResponse(content={"error": str(e), "runs": []})
 
@@ -313,10 +343,10 @@ async def api_workflow_detail(run_id: int):
     """Get detailed workflow run info."""
     try:
         gh_cli = get_gh_cli()
-        result = subprocess.run(
+        result = await run_async(
             [gh_cli, "run", "view", str(run_id), "--json",
              "name,status,conclusion,jobs,createdAt,updatedAt"],
-            capture_output=True, text=True, timeout=10, cwd=str(WORKSPACE_ROOT)
+            timeout=10, cwd=str(WORKSPACE_ROOT)
         )
         if result.returncode == 0:
             return JSONResponse(content=json.loads(result.stdout))
@@ -341,9 +371,9 @@ async def api_workflow_pipeline():
         # Get workflow info
         try:
             gh_cli = get_gh_cli()
-            result = subprocess.run(
+            result = await run_async(
                 [gh_cli, "run", "list", "--limit", "10", "--json", "status,conclusion"],
-                capture_output=True, text=True, timeout=10, cwd=str(WORKSPACE_ROOT)
+                timeout=10, cwd=str(WORKSPACE_ROOT)
             )
             if result.returncode == 0:
                 runs = json.loads(result.stdout)
@@ -372,54 +402,63 @@ async def api_workflow_pipeline():
 
 # ─── GitHub Integration Endpoints ────────────────────────────────────────────
 
+async def _fetch_github_prs() -> Dict[str, Any]:
+    gh_cli = get_gh_cli()
+    result = await run_async(
+        [gh_cli, "pr", "list", "--state", "open", "--limit", "10",
+         "--json", "number,title,author,labels,createdAt,headRefName,additions,deletions"],
+        timeout=15, cwd=str(WORKSPACE_ROOT)
+    )
+    if result.returncode == 0:
+        prs = json.loads(result.stdout) if result.stdout.strip() else []
+        return {"prs": prs, "count": len(prs)}
+    return {"error": result.stderr, "prs": [], "count": 0}
+
 @app.get("/api/github/prs")
 async def api_github_prs():
     """Get open pull requests."""
     try:
-        gh_cli = get_gh_cli()
-        result = subprocess.run(
-            [gh_cli, "pr", "list", "--state", "open", "--limit", "10",
-             "--json", "number,title,author,labels,createdAt,headRefName,additions,deletions"],
-            capture_output=True, text=True, timeout=15, cwd=str(WORKSPACE_ROOT)
-        )
-        if result.returncode == 0:
-            prs = json.loads(result.stdout) if result.stdout.strip() else []
-            return JSONResponse(content={"prs": prs, "count": len(prs)})
-        return JSONResponse(content={"error": result.stderr, "prs": [], "count": 0})
+        return JSONResponse(content=await _cached("github_prs", _fetch_github_prs))
     except Exception as e:
         return JSONResponse(content={"error": str(e), "prs": [], "count": 0})
 
+async def _fetch_github_commits() -> Dict[str, Any]:
+    gh_cli = get_gh_cli()
+    result = await run_async(
+        [gh_cli, "api", "repos/SynchronizedLivingArchitecture/S.L.A.T.E/commits",
+         "--jq", "[.[:10][] | {sha: .sha, message: .commit.message, author: .commit.author.name, date: .commit.author.date}]"],
+        timeout=15, cwd=str(WORKSPACE_ROOT)
+    )
+    if result.returncode == 0:
+        commits = json.loads(result.stdout) if result.stdout.strip() else []
+        return {"commits": commits, "count": len(commits)}
+    return {"error": result.stderr, "commits": [], "count": 0}
+
 @app.get("/api/github/commits")
 async def api_github_commits():
     """Get recent commits on current branch."""
     try:
-        gh_cli = get_gh_cli()
-        result = subprocess.run(
-            [gh_cli, "api", "repos/SynchronizedLivingArchitecture/S.L.A.T.E/commits",
-             "--jq", "[.[:10][] | {sha: .sha, message: .commit.message, author: .commit.author.name, date: .commit.author.date}]"],
-            capture_output=True, text=True, timeout=15, cwd=str(WORKSPACE_ROOT)
-        )
-        if result.returncode == 0:
-            commits = json.loads(result.stdout) if result.stdout.strip() else []
-            return JSONResponse(content={"commits": commits, "count": len(commits)})
-        return JSONResponse(content={"error": result.stderr, "commits": [], "count": 0})
+        return JSONResponse(content=await _cached("github_commits", _fetch_github_commits))
     except Exception as e:
         return JSONResponse(content={"error": str(e), "commits": [], "count": 0})
 
+async def _fetch_github_issues() -> Dict[str, Any]:
+    gh_cli = get_gh_cli()
+    result = await run_async(
+        [gh_cli, "issue", "list", "--state", "open", "--limit", "15",
+         "--json", "number,title,labels,author,createdAt"],
+        timeout=15, cwd=str(WORKSPACE_ROOT)
+    )
+    if result.returncode == 0:
+        issues = json.loads(result.stdout) if result.stdout.strip() else []
+        return {"issues": issues, "count": len(issues)}
+    return {"error": result.stderr, "issues": [], "count": 0}
+
 @app.get("/api/github/issues")
 async def api_github_issues():
     """Get open issues."""
     try:
-        gh_cli = get_gh_cli()
-        result = subprocess.run(
-            [gh_cli, "issue", "list", "--state", "open", "--limit", "15",
-             "--json", "number,title,labels,author,createdAt"],
-            capture_output=True, text=True, timeout=15, cwd=str(WORKSPACE_ROOT)
-        )
-        if result.returncode == 0:
-            issues = json.loads(result.stdout) if result.stdout.strip() else []
-            return JSONResponse(content={"issues": issues, "count": len(issues)})
-        return JSONResponse(content={"error": result.stderr, "issues": [], "count": 0})
+        return JSONResponse(content=await _cached("github_issues", _fetch_github_issues))
     except Exception as e:
         return JSONResponse(content={"error": str(e), "issues": [], "count": 0})
 
@@ -428,10 +467,10 @@ async def api_github_releases():
     """Get latest release."""
     try:
         gh_cli = get_gh_cli()
-        result = subprocess.run(
+        result = await run_async(
             [gh_cli, "release", "list", "--limit", "1",
              "--json", "tagName,name,publishedAt,isPrerelease"],
-            capture_output=True, text=True, timeout=10, cwd=str(WORKSPACE_ROOT)
+            timeout=10, cwd=str(WORKSPACE_ROOT)
         )
         if result.returncode == 0:
             releases = json.loads(result.stdout) if result.stdout.strip() else []
@@ -447,10 +486,10 @@ async def api_github_releases():
 async def api_system_gpu():
     """Get real-time GPU utilization."""
     try:
-        result = subprocess.run(
+        result = await run_async(
             ["nvidia-smi", "--query-gpu=index,name,utilization.gpu,utilization.memory,memory.used,memory.total,temperature.gpu",
              "--format=csv,noheader,nounits"],
-            capture_output=True, text=True, timeout=10
+            timeout=10
         )
         if result.returncode == 0 and result.stdout.strip():
             gpus = []
@@ -685,9 +724,9 @@ async def api_design_css():
 async def api_docker_containers():
     """Get Docker container list."""
     try:
-        result = subprocess.run(
+        result = await run_async(
             ["docker", "ps", "-a", "--format", "{{json .}}"],
-            capture_output=True, text=True, timeout=10
+            timeout=10
         )
         if result.returncode == 0 and result.stdout.strip():
             containers = []
@@ -716,9 +755,9 @@ async def api_docker_containers():
 async def api_docker_images():
     """Get Docker image list."""
     try:
-        result = subprocess.run(
+        result = await run_async(
             ["docker", "images", "--format", "{{json .}}"],
-            capture_output=True, text=True, timeout=10
+            timeout=10
         )
         if result.returncode == 0 and result.stdout.strip():
             images = []
@@ -749,9 +788,9 @@ async def api_docker_action(request: Request):
         action = data.get("action")
         if not container or action not in ["start", "stop", "restart"]:
             return JSONResponse(content={"success": False, "error": "Invalid request"})
-        result = subprocess.run(
+        result = await run_async(
             ["docker", action, container],
-            capture_output=True, text=True, timeout=30
+            timeout=30
         )
         return JSONResponse(content={
             "success": result.returncode == 0,
@@ -780,10 +819,10 @@ async def api_benchmark_run():
     """Run GPU benchmark."""
     try:
         # Get GPU info
-        result = subprocess.run(
+        result = await run_async(
             ["nvidia-smi", "--query-gpu=name,memory.total,compute_cap,power.draw",
              "--format=csv,noheader,nounits"],
-            capture_output=True, text=True, timeout=10
+            timeout=10
         )
         benchmark_result = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -841,7 +880,7 @@ async def api_system_ollama():
 
     # Get installed models
     try:
-        proc = subprocess.run(["ollama", "list"], capture_output=True, text=True, timeout=5)
+        proc = await run_async(["ollama", "list"], timeout=5)
         if proc.returncode == 0:
             lines = proc.stdout.strip().split("\n")[1:]  # Skip header
             for line in lines:
@@ -853,7 +892,7 @@ async def api_system_ollama():
 
     # Get loaded/running models
     try:
-        proc = subprocess.run(["ollama", "ps"], capture_output=True, text=True, timeout=5)
+        proc = await run_async(["ollama", "ps"], timeout=5)
         if proc.returncode == 0:
             lines = proc.stdout.strip().split("\n")[1:]  # Skip header
             for line in lines:
@@ -875,9 +914,7 @@ async def api_services():
 
     # Orchestrator
     try:
-        from slate.slate_orchestrator import SlateOrchestrator
-        orch = SlateOrchestrator()
-        status = orch.status()
+        status = await _get_status_async()
         services.append({"id": "orch", "name": "Orchestrator", "online": status.get("orchestrator", {}).get("running", False)})
     except Exception:
         services.append({"id": "orch", "name": "Orchestrator", "online": False})
@@ -983,9 +1020,9 @@ async def api_task_activity():
         # Also count workflow runs from GitHub for a more complete picture
         try:
             gh_cli = get_gh_cli()
-            result = subprocess.run(
+            result = await run_async(
                 [gh_cli, "run", "list", "--limit", "100", "--json", "conclusion,createdAt"],
-                capture_output=True, text=True, timeout=15, cwd=str(WORKSPACE_ROOT)
+                timeout=15, cwd=str(WORKSPACE_ROOT)
             )
             if result.returncode == 0 and result.stdout.strip():
                 runs = json.loads(result.stdout)
@@ -1036,12 +1073,16 @@ async def api_tasks():
     """Get all tasks."""
     tasks = load_tasks()
 
-    # Calculate stats
+    # Calculate stats from the status index (tasks without a status are pending)
+    try:
+        counts = get_task_store(WORKSPACE_ROOT / "current_tasks.json").counts()
+    except Exception:
+        counts = {}
     stats = {"total": len(tasks), "pending": 0, "in_progress": 0, "completed": 0}
-    for t in tasks:
-        status = t.get("status", "pending")
+    for status, n in counts.items():
+        status = "pending" if status == "unknown" else status
         if status in stats:
-            stats[status] += 1
+            stats[status] += n
 
     return JSONResponse(content={"tasks": tasks, "stats": stats})
 
@@ -1050,7 +1091,6 @@ async def create_task(request: Request):
     """Create a new task."""
     try:
         data = await request.json()
-        tasks = load_tasks()
 
         new_task = {
             "id": str(uuid.uuid4())[:8],
@@ -1063,8 +1103,7 @@ async def create_task(request: Request):
             "created_by": "dashboard"
         }
 
-        tasks.append(new_task)
-        save_tasks(tasks)
+        get_task_store(WORKSPACE_ROOT / "current_tasks.json").add(new_task)
 
         # Broadcast update
         await manager.broadcast({"type": "task_created", "task": new_task})
@@ -1078,17 +1117,13 @@ async def update_task(task_id: str, request: Request):
     """Update a task."""
     try:
         data = await request.json()
-        tasks = load_tasks()
-
-        for task in tasks:
-            if task.get("id") == task_id:
-                task.update(data)
-                task["updated_at"] = datetime.now(timezone.utc).isoformat()
-                save_tasks(tasks)
-                await manager.broadcast({"type": "task_updated", "task": task})
-                return JSONResponse(content=task)
-
-        raise HTTPException(status_code=404, detail="Task not found")
+        data.pop("id", None)
+        data["updated_at"] = datetime.now(timezone.utc).isoformat()
+        task = get_task_store(WORKSPACE_ROOT / "current_tasks.json").update(task_id, **data)
+        if task is None:
+            raise HTTPException(status_code=404, detail="Task not found")
+        await manager.broadcast({"type": "task_updated", "task": task})
+        return JSONResponse(content=task)
     except HTTPException:
         raise
     except Exception as e:
@@ -1097,14 +1132,9 @@ async def update_task(task_id: str, request: Request):
 @app.delete("/api/tasks/{task_id}")
 async def delete_task(task_id: str):
     """Delete a task."""
-    tasks = load_tasks()
-    original_len = len(tasks)
-    tasks = [t for t in tasks if t.get("id") != task_id]
-
-    if len(tasks) == original_len:
+    if not get_task_store(WORKSPACE_ROOT / "current_tasks.json").delete(task_id):
         raise HTTPException(status_code=404, detail="Task not found")
 
-    save_tasks(tasks)
     await manager.broadcast({"type": "task_deleted", "task_id": task_id})
     return JSONResponse(content={"deleted": task_id})
 
@@ -1126,9 +1156,11 @@ async def dispatch_workflow(workflow_name: str, request: Request):
         for key, value in inputs.items():
             cmd.extend(["-f", f"{key}={value}"])
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30, cwd=str(WORKSPACE_ROOT))
+        result = await run_async(cmd, timeout=30, cwd=str(WORKSPACE_ROOT))
 
         if result.returncode == 0:
+            gh_cache.invalidate("workflows")
+            gh_cache.invalidate("workflow_stats")
             await manager.broadcast({"type": "workflow_dispatched", "workflow": workflow_name})
             return JSONResponse(content={"success": True, "workflow": workflow_name})
         return JSONResponse(content={"success": False, "error": result.stderr}, status_code=400)
@@ -1138,16 +1170,16 @@ async def dispatch_workflow(workflow_name: str, request: Request):
 # ─── SLATE Control Panel API ─────────────────────────────────────────────────
 # Modified: 2026-02-07T09:00:00Z | Author: COPILOT | Change: Add control endpoints for dashboard buttons
 
-def _run_slate_cmd(script: str, args: str = "", timeout: int = 60) -> Dict[str, Any]:
+async def _run_slate_cmd(script: str, args: str = "", timeout: int = 60) -> Dict[str, Any]:
     """Run a SLATE Python script and return structured result."""
     python = str(WORKSPACE_ROOT / ".venv" / "Scripts" / "python.exe")
     cmd_parts = [python, str(WORKSPACE_ROOT / script)]
     if args:
         cmd_parts.extend(args.split())
     try:
-        result = subprocess.run(
+        result = await run_async(
             cmd_parts,
-            capture_output=True, text=True, timeout=timeout,
+            timeout=timeout,
             cwd=str(WORKSPACE_ROOT),
             env={**dict(__import__('os').environ),
                  "PYTHONPATH": str(WORKSPACE_ROOT),
@@ -1176,7 +1208,7 @@ async def slate_run_protocol():
         ("Workflow Status", "slate/slate_workflow_manager.py", "--status"),
         ("Enforce Completion", "slate/slate_workflow_manager.py", "--enforce"),
     ]:
-        result = _run_slate_cmd(script, args)
+        result = await _run_slate_cmd(script, args)
         steps.append({"step": label, **result})
     all_ok = all(s["success"] for s in steps)
     await manager.broadcast({"type": "slate_protocol", "status": "ok" if all_ok else "error"})
@@ -1189,19 +1221,19 @@ async def slate_update():
     steps = []
     # Git pull
     try:
-        git_result = subprocess.run(
+        git_result = await run_async(
             ["git", "pull", "--ff-only"],
-            capture_output=True, text=True, timeout=30, cwd=str(WORKSPACE_ROOT)
+            timeout=30, cwd=str(WORKSPACE_ROOT)
         )
         steps.append({"step": "Git Pull", "success": git_result.returncode == 0,
                        "output": git_result.stdout.strip(), "error": git_result.stderr.strip()})
     except Exception as e:
         steps.append({"step": "Git Pull", "success": False, "output": "", "error": str(e)})
     # Fork check
-    result = _run_slate_cmd("slate/slate_fork_manager.py", "--status")
+    result = await _run_slate_cmd("slate/slate_fork_manager.py", "--status")
     steps.append({"step": "Fork Status", **result})
     # Deps check
-    result = _run_slate_cmd("slate/slate_runtime.py", "--check-all")
+    result = await _run_slate_cmd("slate/slate_runtime.py", "--check-all")
     steps.append({"step": "Runtime Check", **result})
     all_ok = all(s["success"] for s in steps)
     return JSONResponse(content={"success": all_ok, "steps": steps})
@@ -1218,7 +1250,7 @@ async def slate_debug():
         ("Workflow", "slate/slate_workflow_manager.py", "--status"),
         ("Runner", "slate/slate_runner_manager.py", "--status"),
     ]:
-        result = _run_slate_cmd(script, args)
+        result = await _run_slate_cmd(script, args)
         steps.append({"step": label, **result})
     errors = [s for s in steps if not s["success"]]
     return JSONResponse(content={"success": len(errors) == 0, "steps": steps, "error_count": len(errors)})
@@ -1233,7 +1265,7 @@ async def slate_security():
         ("PII Scanner", "slate/pii_scanner.py", "--scan"),
         ("SDK Source Guard", "slate/sdk_source_guard.py", "--check"),
     ]:
-        result = _run_slate_cmd(script, args)
+        result = await _run_slate_cmd(script, args)
         steps.append({"step": label, **result})
     all_ok = all(s["success"] for s in steps)
     return JSONResponse(content={"success": all_ok, "steps": steps})
@@ -1244,7 +1276,7 @@ async def slate_deploy(action: str):
     """Manage services: start, stop, or status."""
     if action not in ("start", "stop", "status"):
         raise HTTPException(status_code=400, detail="Invalid action. Use: start, stop, status")
-    result = _run_slate_cmd("slate/slate_orchestrator.py", action, timeout=30)
+    result = await _run_slate_cmd("slate/slate_orchestrator.py", action, timeout=30)
     return JSONResponse(content=result)
 
 
@@ -1257,7 +1289,7 @@ async def slate_agents():
         ("Copilot Runner", "slate/copilot_slate_runner.py", "--status"),
         ("Integrated Loop", "slate/integrated_autonomous_loop.py", "--status"),
     ]:
-        result = _run_slate_cmd(script, args)
+        result = await _run_slate_cmd(script, args)
         steps.append({"step": label, **result})
     return JSONResponse(content={"steps": steps})
 
@@ -1270,7 +1302,7 @@ async def slate_gpu():
         ("GPU Manager", "slate/slate_gpu_manager.py", "--status"),
         ("Hardware Optimizer", "slate/slate_hardware_optimizer.py", ""),
     ]:
-        result = _run_slate_cmd(script, args)
+        result = await _run_slate_cmd(script, args)
         steps.append({"step": label, **result})
     return JSONResponse(content={"steps": steps})
 
@@ -1278,7 +1310,7 @@ async def slate_gpu():
 @app.post("/api/slate/benchmark")
 async def slate_benchmark():
     """Run performance benchmarks."""
-    result = _run_slate_cmd("slate/slate_benchmark.py", "", timeout=120)
+    result = await _run_slate_cmd("slate/slate_benchmark.py", "", timeout=120)
     return JSONResponse(content=result)
 
 
@@ -1960,9 +1992,9 @@ async def api_forks():
                     # Try to get git info
                     if fork_info["has_git"]:
                         try:
-                            result = subprocess.run(
+                            result = await run_async(
                                 ["git", "log", "-1", "--format=%H|%s|%ar"],
-                                capture_output=True, text=True, timeout=5,
+                                timeout=5,
                                 cwd=str(fork_dir)
                             )
                             if result.returncode == 0 and result.stdout.strip():
@@ -1976,9 +2008,9 @@ async def api_forks():
 
                         # Get remote URL
                         try:
-                            result = subprocess.run(
+                            result = await run_async(
                                 ["git", "remote", "get-url", "origin"],
-                                capture_output=True, text=True, timeout=5,
+                                timeout=5,
                                 cwd=str(fork_dir)
                             )
                             if result.returncode == 0:
@@ -2036,86 +2068,98 @@ async def api_multirunner():
         return JSONResponse(content={"error": str(e), "runners": []})
 
 
-@app.get("/api/workflow-stats")
-async def api_workflow_stats():
-    """Get comprehensive workflow statistics."""
-    try:
-        workflows_dir = WORKSPACE_ROOT / ".github" / "workflows"
-        workflows = []
-
-        if workflows_dir.exists():
-            for wf_file in sorted(workflows_dir.glob("*.yml")):
-                wf_info = {
-                    "name": wf_file.stem,
-                    "file": wf_file.name,
-                    "has_concurrency": False,
-                    "triggers": [],
-                    "jobs": [],
-                }
+# Modified: 2026-10-17T09:00:00Z | Author: COPILOT | Change: Report gh failures so workflow stats are not cached
+async def _fetch_workflow_stats() -> Dict[str, Any]:
+    """Analyze local workflow files and summarize recent GitHub run outcomes."""
+    workflows_dir = WORKSPACE_ROOT / ".github" / "workflows"
+    workflows = []
+
+    if workflows_dir.exists():
+        for wf_file in sorted(workflows_dir.glob("*.yml")):
+            wf_info = {
+                "name": wf_file.stem,
+                "file": wf_file.name,
+                "has_concurrency": False,
+                "triggers": [],
+                "jobs": [],
+            }
 
-                try:
-                    content = wf_file.read_text(encoding="utf-8")
-
-                    # Check for concurrency
-                    wf_info["has_concurrency"] = "concurrency:" in content
-
-                    # Extract triggers
-                    if "push:" in content:
-                        wf_info["triggers"].append("push")
-                    if "pull_request:" in content:
-                        wf_info["triggers"].append("pull_request")
-                    if "schedule:" in content:
-                        wf_info["triggers"].append("schedule")
-                    if "workflow_dispatch:" in content:
-                        wf_info["triggers"].append("manual")
-
-                    # Count jobs - look for job names after "jobs:" section
-                    import re
-                    jobs_match = re.search(r'^jobs:\s*$', content, re.MULTILINE)
-                    if jobs_match:
-                        jobs_section = content[jobs_match.end():]
-                        # Jobs are at 2-space indent under jobs:
-                        jobs = re.findall(r'^\s{2}(\w[\w-]*):\s*$', jobs_section, re.MULTILINE)
-                        # Exclude common non-job keys
-                        excluded = {'name', 'runs-on', 'needs', 'if', 'env', 'steps', 'timeout-minutes', 'permissions', 'outputs', 'strategy', 'continue-on-error', 'services', 'container', 'defaults'}
-                        job_names = [j for j in jobs if j not in excluded]
-                        wf_info["jobs"] = job_names[:10]
-                        wf_info["job_count"] = len(job_names)
+            try:
+                content = wf_file.read_text(encoding="utf-8")
+
+                # Check for concurrency
+                wf_info["has_concurrency"] = "concurrency:" in content
+
+                # Extract triggers
+                if "push:" in content:
+                    wf_info["triggers"].append("push")
+                if "pull_request:" in content:
+                    wf_info["triggers"].append("pull_request")
+                if "schedule:" in content:
+                    wf_info["triggers"].append("schedule")
+                if "workflow_dispatch:" in content:
+                    wf_info["triggers"].append("manual")
+
+                # Count jobs - look for job names after "jobs:" section
+                import re
+                jobs_match = re.search(r'^jobs:\s*$', content, re.MULTILINE)
+                if jobs_match:
+                    jobs_section = content[jobs_match.end():]
+                    # Jobs are at 2-space indent under jobs:
+                    jobs = re.findall(r'^\s{2}(\w[\w-]*):\s*$', jobs_section, re.MULTILINE)
+                    # Exclude common non-job keys
+                    excluded = {'name', 'runs-on', 'needs', 'if', 'env', 'steps', 'timeout-minutes', 'permissions', 'outputs', 'strategy', 'continue-on-error', 'services', 'container', 'defaults'}
+                    job_names = [j for j in jobs if j not in excluded]
+                    wf_info["jobs"] = job_names[:10]
+                    wf_info["job_count"] = len(job_names)
 
-                except Exception:
-                    pass
+            except Exception:
+                pass
 
-                workflows.append(wf_info)
+            workflows.append(wf_info)
 
-        # Get recent run stats from GitHub
-        run_stats = {"success": 0, "failure": 0, "cancelled": 0, "in_progress": 0}
-        try:
-            gh_cli = get_gh_cli()
-            result = subprocess.run(
-                [gh_cli, "run", "list", "--limit", "50", "--json", "conclusion,status"],
-                capture_output=True, text=True, timeout=15, cwd=str(WORKSPACE_ROOT)
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                runs = json.loads(result.stdout)
-                for run in runs:
-                    conclusion = run.get("conclusion") or run.get("status", "")
-                    if conclusion == "success":
-                        run_stats["success"] += 1
-                    elif conclusion == "failure":
-                        run_stats["failure"] += 1
-                    elif conclusion == "cancelled":
-                        run_stats["cancelled"] += 1
-                    elif run.get("status") == "in_progress":
-                        run_stats["in_progress"] += 1
-        except Exception:
-            pass
+    # Get recent run stats from GitHub. A gh failure is reported in "error"
+    # so the zeroed run_stats are not cached as if they were real.
+    run_stats = {"success": 0, "failure": 0, "cancelled": 0, "in_progress": 0}
+    error = None
+    try:
+        gh_cli = get_gh_cli()
+        result = await run_async(
+            [gh_cli, "run", "list", "--limit", "50", "--json", "conclusion,status"],
+            timeout=15, cwd=str(WORKSPACE_ROOT)
+        )
+        if result.returncode != 0:
+            error = result.stderr or f"gh run list exited with {result.returncode}"
+        elif result.stdout.strip():
+            runs = json.loads(result.stdout)
+            for run in runs:
+                conclusion = run.get("conclusion") or run.get("status", "")
+                if conclusion == "success":
+                    run_stats["success"] += 1
+                elif conclusion == "failure":
+                    run_stats["failure"] += 1
+                elif conclusion == "cancelled":
+                    run_stats["cancelled"] += 1
+                elif run.get("status") == "in_progress":
+                    run_stats["in_progress"] += 1
+    except Exception as e:
+        error = str(e)
 
-        return JSONResponse(content={
-            "workflows": workflows,
-            "total": len(workflows),
-            "with_concurrency": sum(1 for w in workflows if w.get("has_concurrency")),
-            "run_stats": run_stats,
-        })
+    payload = {
+        "workflows": workflows,
+        "total": len(workflows),
+        "with_concurrency": sum(1 for w in workflows if w.get("has_concurrency")),
+        "run_stats": run_stats,
+    }
+    if error is not None:
+        payload["error"] = error
+    return payload
+
+@app.get("/api/workflow-stats")
+async def api_workflow_stats():
+    """Get comprehensive workflow statistics."""
+    try:
+        return JSONResponse(content=await _cached("workflow_stats", _fetch_workflow_stats))
     except Exception as e:
         return JSONResponse(content={"error": str(e), "workflows": []})
 
@@ -2243,23 +2287,88 @@ async def api_tech_tree():
 
 # ─── WebSocket ────────────────────────────────────────────────────────────────
 
-# Modified: 2026-02-07T07:30:00Z | Author: COPILOT | Change: Run blocking status() in thread executor to prevent event loop blocking
+# Modified: 2026-10-16T20:00:00Z | Author: COPILOT | Change: Serve orchestrator status from the background snapshot service
+_status_unsubscribe = None
+
+
+def _get_status_service():
+    """Start the snapshot service once and relay its section deltas to every /ws client.
+
+    Uses skip_dashboard_check=True since we ARE the dashboard — no self-connection.
+    """
+    global _status_unsubscribe
+    from slate.status_snapshot import get_status_snapshot_service
+    service = get_status_snapshot_service(skip_dashboard_check=True)
+    if _status_unsubscribe is None:
+        loop = asyncio.get_running_loop()
+
+        def push(delta: dict):
+            message = {"type": "status_delta", **delta}
+            asyncio.run_coroutine_threadsafe(manager.broadcast(message), loop)
+
+        _status_unsubscribe = service.subscribe(push)
+    return service
+
+
 async def _get_status_async() -> dict:
     """Get orchestrator status without blocking the async event loop.
 
-    SlateOrchestrator.status() makes synchronous subprocess calls (gh api, tasklist)
-    which would block the entire uvicorn event loop if called directly.
-    Uses skip_dashboard_check=True since we ARE the dashboard — no self-connection.
+    Reads the in-memory snapshot (refreshed per section in the background,
+    see slate.status_snapshot). Only the very first call after startup waits,
+    in a worker thread, for the initial refresh.
     """
-    loop = asyncio.get_event_loop()
     try:
-        from slate.slate_orchestrator import SlateOrchestrator
-        orch = SlateOrchestrator()
-        return await loop.run_in_executor(None, lambda: orch.status(skip_dashboard_check=True))
+        service = _get_status_service()
+        if not service.wait_ready(timeout=0):
+            await asyncio.get_running_loop().run_in_executor(None, service.wait_ready, 15)
+        return service.snapshot()
     except Exception:
         return {"error": "status unavailable"}
 
 
+# Modified: 2026-10-16T15:00:00Z | Author: COPILOT | Change: Relay streamed inference tokens over /ws
+_ml_orchestrator = None
+
+
+def _get_ml_orchestrator():
+    """Lazily create the MLOrchestrator shared by /ws inference streams."""
+    global _ml_orchestrator
+    if _ml_orchestrator is None:
+        from slate.ml_orchestrator import MLOrchestrator
+        _ml_orchestrator = MLOrchestrator()
+    return _ml_orchestrator
+
+
+async def _relay_inference(websocket: WebSocket, stream_id: str, msg: dict):
+    """Stream one /ws "infer" request back to the client token by token.
+
+    Sends infer_start, one infer_token per generated fragment, then
+    infer_done with the infer() stats (incl. ttft) or infer_error.
+    """
+    summary: dict = {}
+    try:
+        orch = _get_ml_orchestrator()
+        await websocket.send_json({"type": "infer_start", "id": stream_id})
+        async for token in orch.infer_stream_async(
+            msg.get("prompt", ""),
+            task_type=msg.get("task_type", "general"),
+            system=msg.get("system", ""),
+            temperature=float(msg.get("temperature", 0.7)),
+            max_tokens=int(msg.get("max_tokens", 2048)),
+            summary=summary,
+        ):
+            await websocket.send_json({"type": "infer_token", "id": stream_id, "token": token})
+        summary.pop("response", None)
+        await websocket.send_json({"type": "infer_done", "id": stream_id, "stats": summary})
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        try:
+            await websocket.send_json({"type": "infer_error", "id": stream_id, "message": str(e)})
+        except Exception:
+            pass
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket for real-time updates.
@@ -2268,13 +2377,17 @@ async def websocket_endpoint(websocket: WebSocket):
 
     Handles message types:
     - ping/pong: Connection keepalive
-    - refresh: Request full status update
+    - refresh: Request full status update (snapshot; "force": true also re-probes)
+    - status_delta (server push): one status section changed
     - subscribe_interactive: Subscribe to learning/devcycle/feedback events
     - learning_action: Learning panel actions (complete_step, skip, etc.)
     - devcycle_action: Dev cycle actions (transition, add_activity, etc.)
+    - infer: Stream an inference (prompt, task_type, ...) as infer_token messages
+    - infer_cancel: Stop a running inference stream by id
     """
     await manager.connect(websocket)
     subscriptions = set()  # Track client subscriptions
+    infer_streams: Dict[str, asyncio.Task] = {}  # Running inference relays by id
 
     try:
         # Send initial status (non-blocking)
@@ -2319,11 +2432,24 @@ async def websocket_endpoint(websocket: WebSocket):
 
                 elif msg_type == "refresh":
                     try:
+                        if msg.get("force"):
+                            _get_status_service().refresh()
                         status_data = await _get_status_async()
                         await websocket.send_json({"type": "status", "data": status_data})
                     except Exception:
                         pass
 
+                elif msg_type == "infer":
+                    stream_id = str(msg.get("id") or uuid.uuid4().hex[:8])
+                    task = asyncio.create_task(_relay_inference(websocket, stream_id, msg))
+                    infer_streams[stream_id] = task
+                    task.add_done_callback(lambda _t, sid=stream_id: infer_streams.pop(sid, None))
+
+                elif msg_type == "infer_cancel":
+                    task = infer_streams.get(str(msg.get("id", "")))
+                    if task:
+                        task.cancel()
+
                 elif msg_type == "subscribe_interactive":
                     # Subscribe to interactive events
                     channels = msg.get("channels", ["learning", "devcycle", "feedback"])
@@ -2376,6 +2502,9 @@ async def websocket_endpoint(websocket: WebSocket):
                     await websocket.send_json({"type": "ping"})
     except WebSocketDisconnect:
         manager.disconnect(websocket)
+    finally:
+        for task in list(infer_streams.values()):
+            task.cancel()
 
 # ─── Dashboard HTML ───────────────────────────────────────────────────────────
 
@@ -6747,6 +6876,7 @@ DASHBOARD_HTML = """
         checkHeroVisibility();
 
         // WebSocket Connection
+        let lastStatus = {};
         function connectWebSocket() {
             ws = new WebSocket(`ws://${window.location.host}/ws`);
 
@@ -6759,7 +6889,12 @@ DASHBOARD_HTML = """
             ws.onmessage = (event) => {
                 const msg = JSON.parse(event.data);
                 if (msg.type === 'status') {
+                    lastStatus = msg.data;
                     updateStatus(msg.data);
+                } else if (msg.type === 'status_delta') {
+                    // Server pushes only the section that changed; merge into the last snapshot
+                    lastStatus = { ...lastStatus, [msg.section]: msg.data };
+                    updateStatus(lastStatus);
                 } else if (msg.type === 'task_created' || msg.type === 'task_updated' || msg.type === 'task_deleted') {
                     refreshTasks();
                 } else if (msg.type === 'workflow_dispatched') {
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# ═══════════════════════════════════════════════════════════════════════════════
+# CELL: async_subprocess [python]
+# Author: COPILOT | Created: 2026-10-16T09:00:00Z
+# Purpose: Non-blocking subprocess execution for async dashboard endpoints
+# ═══════════════════════════════════════════════════════════════════════════════
+"""
+Async Subprocess Executor
+=========================
+Runs external commands (gh, nvidia-smi, docker, git, ollama) from ``async def``
+code without stalling the event loop.
+
+``subprocess.run`` inside an ``async def`` FastAPI endpoint blocks every other
+request and WebSocket client until the child exits. This module wraps
+``asyncio.create_subprocess_exec`` with:
+
+- Per-call timeouts (the child is killed, ``subprocess.TimeoutExpired`` raised)
+- Per-binary concurrency limits (e.g. at most 4 concurrent ``gh`` processes)
+- Cancellation: if the awaiting task is cancelled, the child is killed too
+- Call statistics per binary (calls, timeouts, in-flight, total time)
+
+Results are ``subprocess.CompletedProcess`` objects, so existing
+``result.returncode`` / ``result.stdout`` handling keeps working.
+
+Usage:
+    from slate.async_subprocess import run_async
+
+    result = await run_async(["gh", "pr", "list"], timeout=15)
+    if result.returncode == 0:
+        prs = json.loads(result.stdout)
+"""
+
+import asyncio
+import os
+import subprocess
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+# Default maximum concurrent processes per binary
+DEFAULT_CONCURRENCY = 4
+
+# Per-binary overrides (keyed by normalized binary name)
+BINARY_LIMITS: Dict[str, int] = {
+    "gh": 4,
+    "nvidia-smi": 2,
+    "docker": 4,
+    "git": 4,
+    "ollama": 2,
+}
+
+DEFAULT_TIMEOUT = 30.0
+
+
+def binary_key(cmd: Sequence[str]) -> str:
+    """Normalize a command's executable to a limit key ("C:/x/gh.exe" -> "gh")."""
+    if not cmd:
+        return ""
+    name = Path(str(cmd[0])).name.lower()
+    if name.endswith(".exe"):
+        name = name[:-4]
+    return name
+
+
+class AsyncSubprocessExecutor:
+    """
+    Shared executor for non-blocking subprocess calls.
+
+    Attributes:
+        default_timeout: Timeout applied when a call does not pass one (seconds)
+        default_limit: Concurrency limit for binaries not in ``limits``
+        limits: Per-binary concurrency limits
+    """
+
+    def __init__(
+        self,
+        default_timeout: float = DEFAULT_TIMEOUT,
+        default_limit: int = DEFAULT_CONCURRENCY,
+        limits: Optional[Dict[str, int]] = None,
+    ):
+        self.default_timeout = default_timeout
+        self.default_limit = default_limit
+        self.limits = dict(BINARY_LIMITS if limits is None else limits)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def _semaphore(self, key: str) -> asyncio.Semaphore:
+        """Get the semaphore for a binary, rebuilding if the event loop changed."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphores = {}
+        sem = self._semaphores.get(key)
+        if sem is None:
+            sem = asyncio.Semaphore(max(1, self.limits.get(key, self.default_limit)))
+            self._semaphores[key] = sem
+        return sem
+
+    def _stat(self, key: str) -> Dict[str, Any]:
+        return self._stats.setdefault(key, {
+            "calls": 0, "timeouts": 0, "cancelled": 0, "errors": 0,
+            "in_flight": 0, "total_ms": 0.0, "max_ms": 0.0,
+        })
+
+    async def run(
+        self,
+        cmd: Sequence[str],
+        timeout: Optional[float] = None,
+        cwd: Optional[Union[str, Path]] = None,
+        env: Optional[Dict[str, str]] = None,
+        input: Optional[str] = None,
+        text: bool = True,
+        encoding: str = "utf-8",
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a command without blocking the event loop.
+
+        Args:
+            cmd: Command and arguments
+            timeout: Seconds before the child is killed (default: default_timeout)
+            cwd: Working directory
+            env: Environment for the child
+            input: Data written to the child's stdin
+            text: Decode stdout/stderr to str (otherwise bytes)
+            encoding: Encoding used when ``text`` is True
+
+        Returns:
+            subprocess.CompletedProcess with captured stdout/stderr.
+
+        Raises:
+            subprocess.TimeoutExpired: If the command exceeds ``timeout``.
+            FileNotFoundError: If the executable does not exist.
+        """
+        args: List[str] = [str(c) for c in cmd]
+        key = binary_key(args)
+        timeout = self.default_timeout if timeout is None else timeout
+        stat = self._stat(key)
+
+        async with self._semaphore(key):
+            stat["calls"] += 1
+            stat["in_flight"] += 1
+            start = time.perf_counter()
+            proc = None
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *args,
+                    stdin=asyncio.subprocess.PIPE if input is not None else asyncio.subprocess.DEVNULL,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=str(cwd) if cwd is not None else None,
+                    env=env,
+                )
+                data = input.encode(encoding) if input is not None else None
+                try:
+                    stdout, stderr = await asyncio.wait_for(proc.communicate(data), timeout)
+                except asyncio.TimeoutError:
+                    stat["timeouts"] += 1
+                    await _kill(proc)
+                    raise subprocess.TimeoutExpired(args, timeout) from None
+            except asyncio.CancelledError:
+                stat["cancelled"] += 1
+                if proc is not None:
+                    await _kill(proc)
+                raise
+            except subprocess.TimeoutExpired:
+                raise
+            except Exception:
+                stat["errors"] += 1
+                raise
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                stat["in_flight"] -= 1
+                stat["total_ms"] += elapsed_ms
+                stat["max_ms"] = max(stat["max_ms"], elapsed_ms)
+
+        if text:
+            stdout = stdout.decode(encoding, errors="replace")
+            stderr = stderr.decode(encoding, errors="replace")
+        return subprocess.CompletedProcess(args, proc.returncode, stdout, stderr)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-binary call statistics."""
+        result = {}
+        for key, stat in self._stats.items():
+            entry = dict(stat)
+            entry["total_ms"] = round(entry["total_ms"], 1)
+            entry["max_ms"] = round(entry["max_ms"], 1)
+            entry["avg_ms"] = round(stat["total_ms"] / stat["calls"], 1) if stat["calls"] else 0.0
+            entry["limit"] = self.limits.get(key, self.default_limit)
+            result[key] = entry
+        return result
+
+
+async def _kill(proc: asyncio.subprocess.Process) -> None:
+    """Kill a child process and reap it."""
+    if proc.returncode is not None:
+        return
+    try:
+        proc.kill()
+    except ProcessLookupError:
+        return
+    try:
+        await asyncio.wait_for(proc.wait(), 5)
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        pass
+
+
+# Global instance
+_executor: Optional[AsyncSubprocessExecutor] = None
+
+
+def get_executor() -> AsyncSubprocessExecutor:
+    """Get the global async subprocess executor."""
+    global _executor
+    if _executor is None:
+        limit = int(os.environ.get("SLATE_SUBPROCESS_CONCURRENCY", DEFAULT_CONCURRENCY))
+        _executor = AsyncSubprocessExecutor(default_limit=limit)
+    return _executor
+
+
+async def run_async(cmd: Sequence[str], **kwargs: Any) -> subprocess.CompletedProcess:
+    """Run a command on the global executor. See ``AsyncSubprocessExecutor.run``."""
+    return await get_executor().run(cmd, **kwargs)
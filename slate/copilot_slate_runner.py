@@ -43,6 +43,8 @@ from pathlib import Path
 WORKSPACE_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(WORKSPACE_ROOT))
 
+from slate_core.task_store import get_task_store  # noqa: E402
+
 if sys.platform == "win32":
     sys.stdout.reconfigure(encoding="utf-8", errors="replace")
     sys.stderr.reconfigure(encoding="utf-8", errors="replace")
@@ -165,11 +167,7 @@ class CopilotSlateRunner:
     def _inject_task(self, task: dict):
         """Inject a Copilot task into current_tasks.json."""
         try:
-            data = {"tasks": [], "last_updated": ""}
-            if TASK_FILE.exists():
-                data = json.loads(TASK_FILE.read_text(encoding="utf-8"))
-
-            data["tasks"].append({
+            get_task_store(TASK_FILE).add({
                 "id": task["id"],
                 "title": task["title"],
                 "description": task["description"],
@@ -178,8 +176,6 @@ class CopilotSlateRunner:
                 "status": "pending",
                 "created_at": task.get("queued_at", datetime.now(timezone.utc).isoformat()),
             })
-            data["last_updated"] = datetime.now(timezone.utc).isoformat()
-            TASK_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
         except Exception as e:
             self._log(f"Failed to inject task: {e}", "ERROR")
 
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# Modified: 2026-10-16T12:00:00Z | Author: COPILOT | Change: Persistent content-addressed embedding cache
+"""
+SLATE Embedding Cache — Content-Addressed Vector Reuse Across Indexers
+=======================================================================
+
+Stores embeddings on disk keyed by (model, sha256(chunk text)) so that
+re-indexing a changed file only embeds the chunks whose text actually
+changed. Shared by SlateChromaDB and the MLOrchestrator flat-file index.
+
+Storage:
+    slate_memory/embeddings/embedding_cache.sqlite  (WAL mode)
+    vectors stored as packed float32 blobs
+
+Usage:
+    from slate.embedding_cache import get_embedding_cache
+
+    cache = get_embedding_cache()
+    vectors = cache.embed_with_cache(model, chunks, embed_fn)
+
+    python slate/embedding_cache.py --stats     # Show cache stats
+    python slate/embedding_cache.py --clear     # Drop all cached vectors
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Callable, Optional
+
+# Modified: 2026-10-16T12:00:00Z | Author: COPILOT | Change: workspace setup
+WORKSPACE_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(WORKSPACE_ROOT))
+
+CACHE_PATH = WORKSPACE_ROOT / "slate_memory" / "embeddings" / "embedding_cache.sqlite"
+
+# SQLite limits bound parameters per statement; look up keys in slices
+_LOOKUP_SLICE = 500
+
+
+def text_key(text: str) -> str:
+    """Content address of a chunk."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def is_block_start(line: str) -> bool:
+    """True for any non-empty, non-indented line not starting with a closing bracket.
+
+    That covers def/class lines, headings and top-level keys, but also imports,
+    assignments and prose paragraphs; it is a cheap, language-agnostic anchor
+    rather than a parser.
+
+    Chunkers cut at these lines once a chunk is half full, so chunk boundaries
+    are anchored to content rather than to cumulative length. An edit inside
+    one function then only changes the chunks up to the next top-level block,
+    and every later chunk keeps its text (and its cache key).
+    """
+    return bool(line) and not line[0].isspace() and line[0] not in ")]}"
+
+
+def _pack(vector: list[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _unpack(blob: bytes) -> list[float]:
+    values = array("f")
+    values.frombytes(blob)
+    return values.tolist()
+
+
+class EmbeddingCache:
+    """SQLite-backed embedding cache keyed by (model, sha256(text))."""
+
+    def __init__(self, path: Path = CACHE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " model TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " dim INTEGER NOT NULL,"
+            " vector BLOB NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " PRIMARY KEY (model, key))"
+        )
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, model: str, texts: list[str]) -> list[Optional[list[float]]]:
+        """Look up cached vectors; None where a text is not cached."""
+        keys = [text_key(t) for t in texts]
+        found: dict[str, list[float]] = {}
+        unique = list(dict.fromkeys(keys))
+        with self._lock:
+            for start in range(0, len(unique), _LOOKUP_SLICE):
+                part = unique[start:start + _LOOKUP_SLICE]
+                marks = ",".join("?" * len(part))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE model = ? AND key IN ({marks})",
+                    [model, *part],
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = _unpack(blob)
+        return [found.get(k) for k in keys]
+
+    def put_many(self, model: str, texts: list[str], vectors: list[list[float]]) -> int:
+        """Store vectors for texts. Empty and all-zero (failed) vectors are skipped."""
+        now = time.time()
+        rows = [
+            (model, text_key(t), len(v), _pack(v), now)
+            for t, v in zip(texts, vectors)
+            if v and any(v)
+        ]
+        if rows:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (model, key, dim, vector, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.commit()
+        return len(rows)
+
+    def embed_with_cache(
+        self,
+        model: str,
+        texts: list[str],
+        embed_fn: Callable[[list[str]], list[list[float]]],
+    ) -> list[list[float]]:
+        """
+        Return embeddings for texts, calling embed_fn only for uncached text.
+
+        Duplicate texts within one call are embedded once.
+        """
+        cached = self.get_many(model, texts)
+        missing = list(dict.fromkeys(t for t, v in zip(texts, cached) if v is None))
+        with self._lock:
+            self.hits += len(texts) - sum(1 for v in cached if v is None)
+            self.misses += len(missing)
+        if missing:
+            fresh = embed_fn(missing)
+            self.put_many(model, missing, fresh)
+            by_text = dict(zip(missing, fresh))
+            cached = [v if v is not None else by_text[t] for t, v in zip(texts, cached)]
+        return cached
+
+    def stats(self) -> dict:
+        """Get cache statistics."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT model, COUNT(*) FROM embeddings GROUP BY model"
+            ).fetchall()
+        return {
+            "path": str(self.path),
+            "entries": sum(n for _, n in rows),
+            "models": {m: n for m, n in rows},
+            "size_mb": round(self.path.stat().st_size / (1024 * 1024), 2) if self.path.exists() else 0,
+            "session_hits": self.hits,
+            "session_misses": self.misses,
+        }
+
+    def clear(self, model: Optional[str] = None):
+        """Drop cached vectors (for one model, or all)."""
+        with self._lock:
+            if model:
+                self._conn.execute("DELETE FROM embeddings WHERE model = ?", (model,))
+            else:
+                self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[EmbeddingCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the process-wide embedding cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = EmbeddingCache()
+        return _cache
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="SLATE Embedding Cache")
+    parser.add_argument("--stats", action="store_true", help="Show cache stats")
+    parser.add_argument("--clear", action="store_true", help="Drop all cached vectors")
+    args = parser.parse_args()
+
+    cache = get_embedding_cache()
+    if args.clear:
+        cache.clear()
+        print("Embedding cache cleared.")
+    else:
+        print(json.dumps(cache.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
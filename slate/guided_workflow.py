@@ -585,18 +585,10 @@ class GuidedWorkflowEngine:
         }
 
         # Add to task queue
-        tasks_file = WORKSPACE_ROOT / "current_tasks.json"
         try:
-            from slate_core.file_lock import FileLock
+            from slate_core.task_store import get_task_store
 
-            with FileLock(str(tasks_file)):
-                if tasks_file.exists():
-                    tasks = json.loads(tasks_file.read_text())
-                else:
-                    tasks = []
-
-                tasks.append(task)
-                tasks_file.write_text(json.dumps(tasks, indent=2))
+            get_task_store(WORKSPACE_ROOT / "current_tasks.json").add(task)
 
             # Attempt to dispatch workflow
             dispatch_result = await self._dispatch_workflow()
@@ -672,14 +664,10 @@ class GuidedWorkflowEngine:
             return {"error": "No job submitted"}
 
         # Check task queue status
-        tasks_file = WORKSPACE_ROOT / "current_tasks.json"
-        task_status = "unknown"
-
-        if tasks_file.exists():
-            tasks = json.loads(tasks_file.read_text())
-            task = next((t for t in tasks if t.get("id") == self.job_id), None)
-            if task:
-                task_status = task.get("status", "unknown")
+        from slate_core.task_store import get_task_store
+
+        task = get_task_store(WORKSPACE_ROOT / "current_tasks.json").get(self.job_id)
+        task_status = task.get("status", "unknown") if task else "unknown"
 
         # Check workflow runs
         workflow_status = "unknown"
@@ -435,21 +435,10 @@ class IntegratedAutonomousLoop:
             return auto.execute_task(task)
 
     def _inject_tasks(self, tasks: list[dict]):
-        """Inject generated tasks into current_tasks.json."""
+        """Inject generated tasks into current_tasks.json (one store transaction, existing ids skipped)."""
         try:
-            data = {"tasks": [], "last_updated": ""}
-            if (self.workspace / "current_tasks.json").exists():
-                data = json.loads((self.workspace / "current_tasks.json").read_text(encoding="utf-8"))
-
-            existing_ids = {t.get("id") for t in data.get("tasks", [])}
-            for task in tasks:
-                if task.get("id") not in existing_ids:
-                    data["tasks"].append(task)
-
-            data["last_updated"] = datetime.now(timezone.utc).isoformat()
-            (self.workspace / "current_tasks.json").write_text(
-                json.dumps(data, indent=2), encoding="utf-8"
-            )
+            from slate_core.task_store import get_task_store
+            get_task_store(self.workspace / "current_tasks.json").add_many(tasks)
         except Exception as e:
             self._log(f"Failed to inject tasks: {e}", "ERROR")
 
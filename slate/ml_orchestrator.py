@@ -12,7 +12,7 @@ Features:
 - Ollama model management (load/unload/route)
 - GPU memory-aware model placement
 - Embedding index for codebase semantic search
-- Inference API for agent task processing
+- Inference API for agent task processing (blocking or token-streaming)
 - Training pipeline for local fine-tuning
 
 Usage:
@@ -24,19 +24,21 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
 import subprocess
 import sys
 import time
-import urllib.request
-import urllib.error
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import AsyncIterator, Iterator
 
 # Modified: 2026-07-12T02:55:00Z | Author: COPILOT | Change: workspace setup + lazy tracing import
 WORKSPACE_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(WORKSPACE_ROOT))
 
+from slate.ollama_http import get_ollama_http, iterate_in_thread  # noqa: E402
+
 OLLAMA_BASE = "http://127.0.0.1:11434"
 
 # Lazy tracer import to avoid circular dependencies
@@ -99,25 +101,16 @@ class OllamaClient:
     # Modified: 2026-02-07T04:30:00Z | Author: COPILOT | Change: Ollama API client
     def __init__(self, base_url: str = OLLAMA_BASE):
         self.base_url = base_url
+        # Modified: 2026-10-16T14:00:00Z | Author: COPILOT | Change: Shared pooled keep-alive client
+        self._http = get_ollama_http(base_url)
 
     def _request(self, path: str, data: dict | None = None, timeout: int = 120) -> dict:
         """Make a request to Ollama API."""
-        url = f"{self.base_url}{path}"
-        if data:
-            body = json.dumps(data).encode("utf-8")
-            req = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
-        else:
-            req = urllib.request.Request(url)
-        resp = urllib.request.urlopen(req, timeout=timeout)
-        return json.loads(resp.read().decode("utf-8"))
+        return self._http.request(path, data, timeout=timeout)
 
     def is_running(self) -> bool:
         """Check if Ollama is running."""
-        try:
-            self._request("/api/tags", timeout=3)
-            return True
-        except Exception:
-            return False
+        return self._http.is_running(timeout=3)
 
     def list_models(self) -> list[dict]:
         """List available models."""
@@ -154,6 +147,32 @@ class OllamaClient:
             data["system"] = system
         return self._request("/api/generate", data, timeout=300)
 
+    def generate_stream(self, model: str, prompt: str, system: str = "",
+                        temperature: float = 0.7, max_tokens: int = 2048,
+                        keep_alive: str = "24h") -> Iterator[dict]:
+        """Generate text with a model, yielding Ollama's NDJSON chunks as they arrive.
+
+        Each chunk carries a "response" token fragment; the final chunk has
+        done=True plus eval_count/eval_duration timings.
+        """
+        # Modified: 2026-10-16T15:00:00Z | Author: COPILOT | Change: Streaming generation
+        data = {
+            "model": model,
+            "prompt": prompt,
+            "stream": True,
+            "keep_alive": keep_alive,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens,
+            },
+        }
+        if system:
+            data["system"] = system
+        for chunk in self._http.stream("/api/generate", data, timeout=300):
+            if chunk.get("error"):
+                raise RuntimeError(chunk["error"])
+            yield chunk
+
     def embed(self, model: str, text: str) -> list[float]:
         """Generate embeddings for text."""
         # Modified: 2026-02-07T08:00:00Z | Author: COPILOT | Change: Added keep_alive
@@ -162,6 +181,20 @@ class OllamaClient:
         embeddings = result.get("embeddings", [[]])
         return embeddings[0] if embeddings else []
 
+    def embed_batch(self, model: str, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for several texts in one request (/api/embed list input)."""
+        # Modified: 2026-10-16T11:00:00Z | Author: COPILOT | Change: Batched embedding request
+        if not texts:
+            return []
+        data = {"model": model, "input": texts, "keep_alive": "24h"}
+        result = self._request("/api/embed", data, timeout=120)
+        embeddings = result.get("embeddings", [])
+        if len(embeddings) != len(texts):
+            raise RuntimeError(
+                f"Ollama returned {len(embeddings)} embeddings for {len(texts)} inputs"
+            )
+        return embeddings
+
     def chat(self, model: str, messages: list[dict], temperature: float = 0.7) -> dict:
         """Chat completion."""
         data = {
@@ -281,6 +314,68 @@ class MLOrchestrator:
             result = {"response": "", "eval_count": 0, "eval_duration": 0}
         elapsed = time.time() - start
 
+        summary = self._record_inference(model, task_type, prompt, result, elapsed,
+                                         temperature, max_tokens, error_msg)
+        if error_msg:
+            raise RuntimeError(error_msg)
+        return summary
+
+    # Modified: 2026-10-16T15:00:00Z | Author: COPILOT | Change: Streaming inference API with time-to-first-token tracing
+    def infer_stream(self, prompt: str, task_type: str = "general",
+                     system: str = "", temperature: float = 0.7,
+                     max_tokens: int = 2048, summary: dict | None = None) -> Iterator[str]:
+        """Run inference like infer(), yielding response tokens as they are generated.
+
+        Stats and the trace (including time-to-first-token) are recorded when
+        the stream ends or is closed early. If a summary dict is passed it is
+        filled with the same fields infer() returns, plus "ttft".
+        """
+        model = self.get_model_for_task(task_type)
+        start = time.time()
+        ttft = None
+        parts: list[str] = []
+        final: dict = {}
+        error_msg = None
+        try:
+            for chunk in self.ollama.generate_stream(model, prompt, system=system,
+                                                     temperature=temperature,
+                                                     max_tokens=max_tokens):
+                token = chunk.get("response", "")
+                if token:
+                    if ttft is None:
+                        ttft = time.time() - start
+                    parts.append(token)
+                    yield token
+                if chunk.get("done"):
+                    final = chunk
+        except Exception as e:
+            error_msg = str(e)
+        finally:
+            result = {"eval_count": 0, "eval_duration": 0, **final, "response": "".join(parts)}
+            recorded = self._record_inference(model, task_type, prompt, result,
+                                              time.time() - start, temperature,
+                                              max_tokens, error_msg, ttft=ttft)
+            if summary is not None:
+                summary.update(recorded)
+        if error_msg:
+            raise RuntimeError(error_msg)
+
+    async def infer_stream_async(self, prompt: str, task_type: str = "general",
+                                 system: str = "", temperature: float = 0.7,
+                                 max_tokens: int = 2048,
+                                 summary: dict | None = None) -> AsyncIterator[str]:
+        """Async generator over infer_stream(); the blocking stream runs in a worker thread."""
+        async for token in iterate_in_thread(
+            lambda: self.infer_stream(prompt, task_type, system=system,
+                                      temperature=temperature, max_tokens=max_tokens,
+                                      summary=summary)
+        ):
+            yield token
+
+    def _record_inference(self, model: str, task_type: str, prompt: str, result: dict,
+                          elapsed: float, temperature: float, max_tokens: int,
+                          error_msg: str | None, ttft: float | None = None) -> dict:
+        """Update model stats, trace the call, and build the infer() result dict."""
         # Track stats
         self.state["total_inferences"] += 1
         if model not in self.state["model_stats"]:
@@ -307,14 +402,12 @@ class MLOrchestrator:
                     max_tokens=max_tokens,
                     routing_reason=routing_reason,
                     error=error_msg,
+                    ttft=ttft,
                 )
             except Exception:
                 pass  # Tracing must never break inference
 
-        if error_msg:
-            raise RuntimeError(error_msg)
-
-        return {
+        summary = {
             "response": result.get("response", ""),
             "model": model,
             "task_type": task_type,
@@ -323,6 +416,9 @@ class MLOrchestrator:
             "total_time": elapsed,
             "tok_per_sec": result.get("eval_count", 0) / max(result.get("eval_duration", 1) / 1e9, 0.001),
         }
+        if ttft is not None:
+            summary["ttft"] = ttft
+        return summary
 
     def analyze_code(self, code: str, instruction: str = "Review this code") -> dict:
         """Analyze code using the code review model."""
@@ -373,6 +469,25 @@ Categories: implement, test, analyze, integrate, complex"""
         self._save_state()
         return self.ollama.embed("nomic-embed-text:latest", text)
 
+    def embed_chunks(self, texts: list[str]) -> list[list[float]]:
+        """Embed many chunks, reusing vectors from the shared embedding cache.
+
+        Only uncached chunks reach Ollama (as one batched request). State is
+        not saved here; callers persist it once when their run completes.
+        """
+        # Modified: 2026-10-16T12:00:00Z | Author: COPILOT | Change: Cached batch embedding for indexers
+        from slate.embedding_cache import get_embedding_cache
+        model = MODEL_ROUTING["embedding"]
+
+        def embed_missing(missing: list[str]) -> list[list[float]]:
+            self.state["total_embeddings"] += len(missing)
+            try:
+                return self.ollama.embed_batch(model, missing)
+            except Exception:
+                return [self.ollama.embed(model, t) for t in missing]
+
+        return get_embedding_cache().embed_with_cache(model, texts, embed_missing)
+
     def index_codebase(self, extensions: list[str] | None = None,
                        dirs: list[str] | None = None) -> dict:
         # Modified: 2026-02-06T22:30:00Z | Author: COPILOT | Change: Use ChromaDB for persistent vector storage
@@ -392,15 +507,26 @@ Categories: implement, test, analyze, integrate, complex"""
 
         # Fallback: flat-file JSON index
         # Modified: 2026-02-07T08:00:00Z | Author: COPILOT | Change: faster indexing, larger chunks, fewer dirs
+        # Modified: 2026-10-16T13:00:00Z | Author: COPILOT | Change: Keep vectors in NumPy index for searchable fallback
         if not extensions:
             extensions = [".py", ".yml", ".yaml"]
         if not dirs:
             dirs = ["slate", "agents", ".github/workflows"]
 
+        vector_index = None
+        try:
+            from slate.slate_vector_index import SlateVectorIndex, collection_for
+            vector_index = SlateVectorIndex()
+            print("  Using NumPy vector index")
+        except ImportError:
+            print("  NumPy not available, index will not be searchable")
+
         EMBEDDINGS_DIR.mkdir(parents=True, exist_ok=True)
         index = {"files": [], "built_at": datetime.now(timezone.utc).isoformat()}
         total_files = 0
         total_chunks = 0
+        files_skipped = 0
+        seen: set[str] = set()
 
         for dir_name in dirs:
             dir_path = self.workspace / dir_name
@@ -412,13 +538,38 @@ Categories: implement, test, analyze, integrate, complex"""
                         content = file_path.read_text(encoding="utf-8", errors="replace")
                         if len(content) < 20:
                             continue
+                        rel_path = str(file_path.relative_to(self.workspace))
+                        seen.add(rel_path)
                         chunks = self._chunk_text(content, max_chars=1000)
 
-                        for chunk in chunks:
-                            self.embed_text(chunk)
-                            total_chunks += 1
+                        if vector_index is None:
+                            self.embed_chunks(chunks)
+                        else:
+                            digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+                            if vector_index.file_hashes.get(rel_path) == digest:
+                                files_skipped += 1
+                            else:
+                                vectors = self.embed_chunks(chunks)
+                                vector_index.delete_file(rel_path)
+                                vector_index.add(
+                                    ids=[f"{rel_path}::{i}" for i in range(len(chunks))],
+                                    embeddings=vectors,
+                                    documents=chunks,
+                                    metadatas=[
+                                        {
+                                            "file_path": rel_path,
+                                            "chunk_index": i,
+                                            "total_chunks": len(chunks),
+                                            "extension": ext,
+                                            "directory": dir_name,
+                                            "collection": collection_for(rel_path),
+                                        }
+                                        for i in range(len(chunks))
+                                    ],
+                                )
+                                vector_index.file_hashes[rel_path] = digest
+                        total_chunks += len(chunks)
 
-                        rel_path = str(file_path.relative_to(self.workspace))
                         index["files"].append({
                             "path": rel_path,
                             "chunks": len(chunks),
@@ -433,6 +584,14 @@ Categories: implement, test, analyze, integrate, complex"""
         index["total_files"] = total_files
         index["total_chunks"] = total_chunks
 
+        if vector_index is not None:
+            # Drop files that were deleted since the last run
+            for rel_path in set(vector_index.indexed_files()) - seen:
+                vector_index.delete_file(rel_path)
+            vector_index.save()
+            index["files_skipped"] = files_skipped
+            index["vector_index"] = vector_index.get_status()
+
         index_path = EMBEDDINGS_DIR / "index.json"
         index_path.write_text(json.dumps(index, indent=2), encoding="utf-8")
 
@@ -443,13 +602,15 @@ Categories: implement, test, analyze, integrate, complex"""
         return index
 
     def _chunk_text(self, text: str, max_chars: int = 500) -> list[str]:
-        """Split text into chunks."""
+        """Split text into chunks, cutting at top-level blocks once half full."""
+        from slate.embedding_cache import is_block_start
         lines = text.split("\n")
         chunks = []
         current = []
         current_len = 0
         for line in lines:
-            if current_len + len(line) > max_chars and current:
+            at_block = current_len >= max_chars // 2 and is_block_start(line)
+            if (at_block or current_len + len(line) > max_chars) and current:
                 chunks.append("\n".join(current))
                 current = []
                 current_len = 0
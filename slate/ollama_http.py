@@ -0,0 +1,548 @@
+#!/usr/bin/env python3
+# Modified: 2026-10-16T14:00:00Z | Author: COPILOT | Change: Shared pooled keep-alive HTTP client for Ollama
+"""
+SLATE Ollama HTTP — Pooled Keep-Alive Client Shared by All Ollama Callers
+==========================================================================
+
+One HTTP/1.1 client per Ollama base URL, shared process-wide by
+ml_orchestrator, the AI scheduler/orchestrator, the model trainer and the
+evaluation/production modules. Replaces the per-call urllib.urlopen pattern,
+which opened (and tore down) a fresh TCP connection for every request.
+
+Features:
+- Keep-alive connection pool (idle connections reused, stale ones replaced)
+- Per-endpoint default timeouts (fast for /api/tags, long for /api/generate)
+- Retry with exponential backoff on connect failures and 503 (server busy)
+- NDJSON streaming (/api/generate, /api/chat) yielding chunks as they arrive
+- Optional async variant (aiohttp when installed, else a worker thread)
+- Connection-setup statistics for measuring pooling benefit
+
+Errors keep urllib's contract: HTTP status >= 400 raises
+urllib.error.HTTPError, connection failures raise urllib.error.URLError,
+and read timeouts raise TimeoutError.
+
+Usage:
+    from slate.ollama_http import get_ollama_http
+
+    http = get_ollama_http("http://127.0.0.1:11434")
+    models = http.request("/api/tags").get("models", [])
+    result = http.request("/api/generate", {"model": m, "prompt": p, "stream": False})
+    for chunk in http.stream("/api/generate", {"model": m, "prompt": p}):
+        print(chunk.get("response", ""), end="")
+
+    python slate/ollama_http.py --stats            # Probe Ollama and show pool stats
+    python slate/ollama_http.py --bench 50         # Pooled vs per-call connection overhead
+"""
+
+import argparse
+import asyncio
+import http.client
+import io
+import json
+import socket
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+
+# Modified: 2026-10-16T14:00:00Z | Author: COPILOT | Change: workspace setup
+WORKSPACE_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(WORKSPACE_ROOT))
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+OLLAMA_URL = "http://127.0.0.1:11434"
+
+# Default timeout (seconds) per endpoint; callers may still override per call
+ENDPOINT_TIMEOUTS = {
+    "/api/tags": 5,
+    "/api/ps": 5,
+    "/api/version": 3,
+    "/api/show": 10,
+    "/api/embed": 60,
+    "/api/embeddings": 60,
+    "/api/generate": 300,
+    "/api/chat": 300,
+    "/api/create": 600,
+    "/api/pull": 3600,
+}
+DEFAULT_TIMEOUT = 120
+DEFAULT_POOL_SIZE = 4        # idle keep-alive connections kept per base URL
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 0.25       # seconds; doubles on each retry
+IDLE_TTL = 60.0              # drop pooled connections idle longer than this
+RETRY_STATUSES = (503,)      # Ollama returns 503 when its request queue is full
+
+# Errors that mean a reused keep-alive socket was closed by the server
+_STALE_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError,
+                 BrokenPipeError, http.client.BadStatusLine)
+
+
+class _RequestNotSent(Exception):
+    """Wraps a connect/send failure; the server never saw the request, so any method may retry."""
+
+
+def endpoint_timeout(path: str) -> float:
+    """Default timeout for an Ollama API path."""
+    return ENDPOINT_TIMEOUTS.get(path.split("?", 1)[0], DEFAULT_TIMEOUT)
+
+
+class OllamaHTTPClient:
+    """Thread-safe pooled keep-alive HTTP/1.1 client for one Ollama base URL."""
+
+    def __init__(self, base_url: str = OLLAMA_URL, pool_size: int = DEFAULT_POOL_SIZE,
+                 retries: int = DEFAULT_RETRIES, backoff: float = DEFAULT_BACKOFF):
+        parsed = urllib.parse.urlsplit(base_url)
+        if parsed.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported Ollama URL: {base_url}")
+        self.base_url = base_url.rstrip("/")
+        self.scheme = parsed.scheme
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        self.prefix = parsed.path.rstrip("/")
+        self.pool_size = max(0, pool_size)
+        self.retries = retries
+        self.backoff = backoff
+        self._idle: list[tuple[http.client.HTTPConnection, float]] = []
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "connections_opened": 0,
+            "connections_reused": 0,
+            "stale_reconnects": 0,
+            "retries": 0,
+            "errors": 0,
+            "connect_time_s": 0.0,
+        }
+
+    # ── Pool ────────────────────────────────────────────────────────────
+
+    def _connect(self, timeout: float) -> http.client.HTTPConnection:
+        cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        conn = cls(self.host, self.port, timeout=timeout)
+        start = time.perf_counter()
+        conn.connect()
+        conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self._lock:
+            self._stats["connections_opened"] += 1
+            self._stats["connect_time_s"] += time.perf_counter() - start
+        return conn
+
+    def _acquire(self, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        """Return (connection, reused)."""
+        now = time.monotonic()
+        with self._lock:
+            while self._idle:
+                conn, last_used = self._idle.pop()
+                if now - last_used <= IDLE_TTL and conn.sock is not None:
+                    self._stats["connections_reused"] += 1
+                    conn.sock.settimeout(timeout)
+                    return conn, True
+                conn.close()
+        return self._connect(timeout), False
+
+    def _release(self, conn: http.client.HTTPConnection, reusable: bool):
+        if reusable and conn.sock is not None:
+            with self._lock:
+                if len(self._idle) < self.pool_size:
+                    self._idle.append((conn, time.monotonic()))
+                    return
+        conn.close()
+
+    def close(self):
+        """Close all idle pooled connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            conn.close()
+
+    # ── Requests ────────────────────────────────────────────────────────
+
+    def _open(self, method: str, path: str, body: Optional[bytes],
+              timeout: float) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """Send one request on a pooled connection and return its response (body unread).
+
+        Transparently redials once if a reused keep-alive socket turns out stale.
+        Failures before the request was fully sent raise _RequestNotSent.
+        """
+        headers = {"Host": f"{self.host}:{self.port}", "Connection": "keep-alive",
+                   "Accept": "application/json"}
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+        try:
+            conn, reused = self._acquire(timeout)
+        except (OSError, http.client.HTTPException) as exc:
+            raise _RequestNotSent() from exc
+        try:
+            try:
+                self._send(conn, method, path, body, headers)
+                return conn, conn.getresponse()
+            except (_RequestNotSent, *_STALE_ERRORS):
+                conn.close()
+                if not reused:
+                    raise
+                # The server closed an idle keep-alive socket; nothing was processed
+                with self._lock:
+                    self._stats["stale_reconnects"] += 1
+                try:
+                    conn = self._connect(timeout)
+                except (OSError, http.client.HTTPException) as exc:
+                    raise _RequestNotSent() from exc
+                self._send(conn, method, path, body, headers)
+                return conn, conn.getresponse()
+        except BaseException:
+            conn.close()
+            raise
+
+    def _send(self, conn: http.client.HTTPConnection, method: str, path: str,
+              body: Optional[bytes], headers: dict):
+        try:
+            conn.request(method, self.prefix + path, body=body, headers=headers)
+        except (OSError, http.client.HTTPException) as exc:
+            conn.close()
+            raise _RequestNotSent() from exc
+
+    def _open_with_retries(self, method: str, path: str, body: Optional[bytes],
+                           timeout: float, retries: int
+                           ) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """_open with retry/backoff; returns only a successful (< 400) response."""
+        url = self.base_url + path
+        with self._lock:
+            self._stats["requests"] += 1
+
+        attempt = 0
+        while True:
+            try:
+                conn, resp = self._open(method, path, body, timeout)
+            except _RequestNotSent as wrapped:
+                # Never reached the server, so retrying is safe for any method
+                exc = wrapped.__cause__
+                if attempt >= retries:
+                    with self._lock:
+                        self._stats["errors"] += 1
+                    if isinstance(exc, (socket.timeout, TimeoutError)):
+                        raise exc from None
+                    raise urllib.error.URLError(exc) from exc
+            except (socket.timeout, TimeoutError):
+                with self._lock:
+                    self._stats["errors"] += 1
+                # A timed-out POST may already be running server-side; never repeat it
+                if method != "GET" or attempt >= retries:
+                    raise
+            except (OSError, http.client.HTTPException) as exc:
+                # Sent but no usable response: a POST may be running; never repeat it
+                if method != "GET" or attempt >= retries:
+                    with self._lock:
+                        self._stats["errors"] += 1
+                    raise urllib.error.URLError(exc) from exc
+            else:
+                if resp.status < 400:
+                    return conn, resp
+                payload = self._finish(conn, resp)
+                if resp.status not in RETRY_STATUSES or attempt >= retries:
+                    with self._lock:
+                        self._stats["errors"] += 1
+                    raise urllib.error.HTTPError(url, resp.status, resp.reason,
+                                                 resp.headers, io.BytesIO(payload))
+            attempt += 1
+            with self._lock:
+                self._stats["retries"] += 1
+            time.sleep(self.backoff * (2 ** (attempt - 1)))
+
+    def _finish(self, conn: http.client.HTTPConnection, resp: http.client.HTTPResponse) -> bytes:
+        """Read the rest of a response and return its connection to the pool."""
+        try:
+            payload = resp.read()
+        except BaseException:
+            conn.close()
+            raise
+        self._release(conn, not resp.will_close)
+        return payload
+
+    def request_raw(self, path: str, data: Optional[dict] = None,
+                    timeout: Optional[float] = None, method: Optional[str] = None,
+                    retries: Optional[int] = None) -> bytes:
+        """Make a request and return the raw response body."""
+        method = method or ("POST" if data is not None else "GET")
+        timeout = timeout if timeout is not None else endpoint_timeout(path)
+        retries = self.retries if retries is None else retries
+        body = json.dumps(data).encode("utf-8") if data is not None else None
+        conn, resp = self._open_with_retries(method, path, body, timeout, retries)
+        return self._finish(conn, resp)
+
+    # Modified: 2026-10-16T15:00:00Z | Author: COPILOT | Change: NDJSON streaming on pooled connections
+    def stream(self, path: str, data: dict, timeout: Optional[float] = None,
+               retries: Optional[int] = None) -> Iterator[dict]:
+        """POST data and yield each NDJSON object as Ollama emits it.
+
+        timeout bounds each socket read (the gap between chunks), not the
+        whole stream. The connection goes back to the pool once the stream is
+        fully consumed; closing the generator early discards it.
+        """
+        timeout = timeout if timeout is not None else endpoint_timeout(path)
+        retries = self.retries if retries is None else retries
+        body = json.dumps(data).encode("utf-8")
+        conn, resp = self._open_with_retries("POST", path, body, timeout, retries)
+        try:
+            for line in resp:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        except BaseException:
+            conn.close()
+            raise
+        self._release(conn, not resp.will_close)
+
+    def request(self, path: str, data: Optional[dict] = None,
+                timeout: Optional[float] = None, method: Optional[str] = None,
+                retries: Optional[int] = None) -> dict:
+        """Make a request and decode the JSON response.
+
+        POST when data is given, GET otherwise. timeout defaults to the
+        endpoint's entry in ENDPOINT_TIMEOUTS.
+        """
+        payload = self.request_raw(path, data, timeout=timeout, method=method, retries=retries)
+        return json.loads(payload.decode("utf-8")) if payload else {}
+
+    def is_running(self, timeout: float = 3) -> bool:
+        """Fast liveness probe (no retries)."""
+        try:
+            self.request("/api/tags", timeout=timeout, retries=0)
+            return True
+        except Exception:
+            return False
+
+    def stats(self) -> dict:
+        """Pool statistics; connect_avg_ms is the mean TCP setup cost per new connection."""
+        with self._lock:
+            s = dict(self._stats)
+            s["idle_connections"] = len(self._idle)
+        opened = s["connections_opened"]
+        s["connect_time_s"] = round(s["connect_time_s"], 6)
+        s["connect_avg_ms"] = round(s["connect_time_s"] * 1000 / opened, 3) if opened else 0.0
+        s["reuse_rate"] = round(s["connections_reused"] / s["requests"], 3) if s["requests"] else 0.0
+        s["base_url"] = self.base_url
+        return s
+
+
+class AsyncOllamaHTTPClient:
+    """Async variant. Uses an aiohttp keep-alive session when aiohttp is installed,
+    otherwise runs the shared sync pool in a worker thread."""
+
+    def __init__(self, base_url: str = OLLAMA_URL, pool_size: int = DEFAULT_POOL_SIZE,
+                 retries: int = DEFAULT_RETRIES, backoff: float = DEFAULT_BACKOFF,
+                 use_aiohttp: bool = AIOHTTP_AVAILABLE):
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        self.retries = retries
+        self.backoff = backoff
+        self.use_aiohttp = use_aiohttp and AIOHTTP_AVAILABLE
+        self._session = None
+        self._sync = None if self.use_aiohttp else get_ollama_http(base_url)
+
+    async def _get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size * 4,
+                                             limit_per_host=self.pool_size * 4,
+                                             keepalive_timeout=IDLE_TTL)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def request(self, path: str, data: Optional[dict] = None,
+                      timeout: Optional[float] = None, method: Optional[str] = None,
+                      retries: Optional[int] = None) -> dict:
+        """Async request with the same semantics as OllamaHTTPClient.request."""
+        if self._sync is not None:
+            return await asyncio.to_thread(self._sync.request, path, data,
+                                           timeout, method, retries)
+
+        method = method or ("POST" if data is not None else "GET")
+        timeout = timeout if timeout is not None else endpoint_timeout(path)
+        retries = self.retries if retries is None else retries
+        url = self.base_url + path
+        session = await self._get_session()
+        attempt = 0
+        while True:
+            try:
+                async with session.request(method, url, json=data,
+                                           timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+                    payload = await resp.read()
+                    if resp.status < 400:
+                        return json.loads(payload.decode("utf-8")) if payload else {}
+                    if resp.status not in RETRY_STATUSES or attempt >= retries:
+                        raise urllib.error.HTTPError(url, resp.status, resp.reason or "",
+                                                     resp.headers, io.BytesIO(payload))
+            except asyncio.TimeoutError:
+                if method != "GET" or attempt >= retries:
+                    raise TimeoutError(f"{method} {url} timed out after {timeout}s")
+            except aiohttp.ClientConnectionError as exc:
+                if attempt >= retries:
+                    raise urllib.error.URLError(exc) from exc
+            attempt += 1
+            await asyncio.sleep(self.backoff * (2 ** (attempt - 1)))
+
+    async def stream(self, path: str, data: dict, timeout: Optional[float] = None,
+                     retries: Optional[int] = None) -> AsyncIterator[dict]:
+        """Async NDJSON stream with the same semantics as OllamaHTTPClient.stream."""
+        if self._sync is not None:
+            async for chunk in iterate_in_thread(
+                lambda: self._sync.stream(path, data, timeout, retries)
+            ):
+                yield chunk
+            return
+
+        timeout = timeout if timeout is not None else endpoint_timeout(path)
+        retries = self.retries if retries is None else retries
+        url = self.base_url + path
+        session = await self._get_session()
+        attempt = 0
+        while True:
+            try:
+                resp = await session.post(
+                    url, json=data, timeout=aiohttp.ClientTimeout(sock_read=timeout)
+                )
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"POST {url} timed out after {timeout}s")
+            except aiohttp.ClientConnectionError as exc:
+                if attempt >= retries:
+                    raise urllib.error.URLError(exc) from exc
+            else:
+                if resp.status < 400:
+                    break
+                payload = await resp.read()
+                resp.release()
+                if resp.status not in RETRY_STATUSES or attempt >= retries:
+                    raise urllib.error.HTTPError(url, resp.status, resp.reason or "",
+                                                 resp.headers, io.BytesIO(payload))
+            attempt += 1
+            await asyncio.sleep(self.backoff * (2 ** (attempt - 1)))
+        try:
+            async for line in resp.content:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        finally:
+            resp.release()
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+async def iterate_in_thread(make_iter: Callable[[], Iterator[Any]]) -> AsyncIterator[Any]:
+    """Drive a blocking iterator in a worker thread and yield its items asynchronously.
+
+    Items are handed to the event loop as they are produced. If the consumer
+    stops early, the worker closes the iterator at its next item.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+    done = object()
+
+    def put(entry):
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, entry)
+        except RuntimeError:  # event loop already closed; nobody is listening
+            stop.set()
+
+    def worker():
+        iterator = None
+        try:
+            iterator = make_iter()
+            for item in iterator:
+                if stop.is_set():
+                    break
+                put((item, None))
+        except BaseException as exc:
+            put((done, exc))
+            return
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+        put((done, None))
+
+    thread = threading.Thread(target=worker, daemon=True, name="slate-stream")
+    thread.start()
+    try:
+        while True:
+            item, exc = await queue.get()
+            if item is done:
+                if exc is not None:
+                    raise exc
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+_clients: dict[str, OllamaHTTPClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_ollama_http(base_url: str = OLLAMA_URL) -> OllamaHTTPClient:
+    """Get the process-wide pooled client for base_url."""
+    key = base_url.rstrip("/")
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = OllamaHTTPClient(key)
+        return client
+
+
+def benchmark_connection_overhead(base_url: str = OLLAMA_URL, path: str = "/api/tags",
+                                  n: int = 50) -> dict:
+    """Compare per-call latency of urllib (new connection each call) against the pool."""
+    url = base_url.rstrip("/") + path
+    start = time.perf_counter()
+    for _ in range(n):
+        with urllib.request.urlopen(url, timeout=endpoint_timeout(path)) as resp:
+            resp.read()
+    urllib_ms = (time.perf_counter() - start) * 1000 / n
+
+    client = OllamaHTTPClient(base_url)
+    start = time.perf_counter()
+    for _ in range(n):
+        client.request_raw(path)
+    pooled_ms = (time.perf_counter() - start) * 1000 / n
+    stats = client.stats()
+    client.close()
+    return {
+        "requests": n,
+        "urllib_per_call_ms": round(urllib_ms, 3),
+        "pooled_per_call_ms": round(pooled_ms, 3),
+        "saved_per_call_ms": round(urllib_ms - pooled_ms, 3),
+        "pooled_connections_opened": stats["connections_opened"],
+        "connect_avg_ms": stats["connect_avg_ms"],
+    }
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="SLATE Ollama HTTP client")
+    parser.add_argument("--url", default=OLLAMA_URL, help="Ollama base URL")
+    parser.add_argument("--stats", action="store_true", help="Probe Ollama and show pool stats")
+    parser.add_argument("--bench", type=int, metavar="N",
+                        help="Measure per-call connection overhead over N requests")
+    args = parser.parse_args()
+
+    if args.bench:
+        print(json.dumps(benchmark_connection_overhead(args.url, n=args.bench), indent=2))
+        return
+    client = get_ollama_http(args.url)
+    print(f"Ollama running: {client.is_running()}")
+    print(json.dumps(client.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,36 @@
-# Modified: 2026-02-07T09:00:00Z | Author: COPILOT | Change: Add K8s Secret/ConfigMap/env scanning
+# Modified: 2026-10-17T09:00:00Z | Author: COPILOT | Change: Report overlapping matches of every pattern like per-pattern scans
 """
 PII Scanner for SLATE Project Boards and Kubernetes Manifests
 
 Prevents personal identifiable information from being exposed in public project boards
 and Kubernetes Secret/ConfigMap/environment variable definitions.
 Scans issue/PR titles, descriptions, comments, and K8s manifests before deployment.
+
+All scanning goes through ScanEngine, which reports exactly the matches a
+separate finditer per pattern would (matches of different patterns may
+overlap, e.g. a credit card number inside an address-shaped span):
+- one combined alternation locates the spans where any pattern can start;
+  text outside them is never scanned again, and each pattern is only tried
+  (anchored) at the positions inside those spans
+- patterns whose required literals (e.g. "@" for email, "akia" for AWS keys)
+  are absent from a document are left out of the regex used for it
+- allowlists are one compiled alternation, checked once per match, and an
+  allowlisted match hides nothing else
+- redaction merges overlapping matches and rebuilds the text with a single join
 """
 
+import bisect
 import re
 import sys
 from pathlib import Path
-from typing import NamedTuple
+from typing import Callable, Collection, Iterator, NamedTuple, Optional, Sequence
+
+try:
+    from re import _parser as _sre_parse      # Python 3.11+
+    from re import _constants as _sre_const
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_constants as _sre_const
+    import sre_parse as _sre_parse
 
 # PII detection patterns
 PII_PATTERNS: dict[str, re.Pattern] = {
@@ -52,13 +72,330 @@ class PIIMatch(NamedTuple):
     end: int
 
 
+# ── Scan Engine ─────────────────────────────────────────────────────────
+
+_SCOPED_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"))
+_MAX_CLASS_FACTORS = 16   # a character class of up to this many chars still counts as a required literal
+_MAX_GUARD_CHARS = 32     # wider first-character sets reject too few positions to pay for a guard
+_CATEGORY_CLASSES = {
+    _sre_const.CATEGORY_DIGIT: r"\d",
+    _sre_const.CATEGORY_SPACE: r"\s",
+    _sre_const.CATEGORY_WORD: r"\w",
+}
+
+
+def _scoped(pattern: re.Pattern) -> str:
+    """Pattern source wrapped so its flags only apply to itself inside an alternation."""
+    flags = "".join(letter for flag, letter in _SCOPED_FLAGS if pattern.flags & flag)
+    return f"(?{flags}:{pattern.pattern})" if flags else f"(?:{pattern.pattern})"
+
+
+def _factor_score(factors: frozenset) -> tuple:
+    # Prefer long literals, then few alternatives
+    return (min(len(f) for f in factors), -len(factors))
+
+
+def _seq_factors(items) -> Optional[frozenset]:
+    """Literals of which every match of the sequence contains at least one (None if unknown)."""
+    candidates = []
+    run: list[str] = []
+    for op, av in items:
+        if op is _sre_const.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            candidates.append(frozenset(["".join(run)]))
+            run = []
+        factors = _node_factors(op, av)
+        if factors:
+            candidates.append(factors)
+    if run:
+        candidates.append(frozenset(["".join(run)]))
+    return max(candidates, key=_factor_score) if candidates else None
+
+
+def _node_factors(op, av) -> Optional[frozenset]:
+    if op is _sre_const.SUBPATTERN:
+        return _seq_factors(av[-1])
+    if op is _sre_const.BRANCH:
+        union: set = set()
+        for branch in av[1]:
+            factors = _seq_factors(branch)
+            if not factors:
+                return None
+            union |= factors
+        return frozenset(union)
+    if op in (_sre_const.MAX_REPEAT, _sre_const.MIN_REPEAT):
+        return _seq_factors(av[2]) if av[0] >= 1 else None
+    if op is _sre_const.IN:
+        chars: set = set()
+        for item_op, item in av:
+            if item_op is _sre_const.LITERAL:
+                chars.add(chr(item))
+            elif item_op is _sre_const.RANGE and item[1] - item[0] < _MAX_CLASS_FACTORS:
+                chars.update(chr(c) for c in range(item[0], item[1] + 1))
+            else:
+                return None
+        return frozenset(chars) if len(chars) <= _MAX_CLASS_FACTORS else None
+    return None
+
+
+def _first_chars(items, ignorecase: bool) -> tuple[Optional[set], bool]:
+    """(characters a match of the sequence can start with or None if unbounded, can be empty)."""
+    chars: set = set()
+    for op, av in items:
+        if op is _sre_const.AT:
+            continue
+        if op is _sre_const.LITERAL:
+            first, nullable = {chr(av)}, False
+        elif op is _sre_const.IN:
+            first, nullable = set(), False
+            for item_op, item in av:
+                if item_op is _sre_const.LITERAL:
+                    first.add(chr(item))
+                elif item_op is _sre_const.RANGE and item[1] - item[0] < 128:
+                    first.update(chr(c) for c in range(item[0], item[1] + 1))
+                elif item_op is _sre_const.CATEGORY and item in _CATEGORY_CLASSES:
+                    first.add(_CATEGORY_CLASSES[item])
+                else:
+                    return None, False
+        elif op is _sre_const.SUBPATTERN:
+            _, add_flags, del_flags, sub = av
+            scoped_ignorecase = (ignorecase or bool(add_flags & re.IGNORECASE)) and not del_flags & re.IGNORECASE
+            first, nullable = _first_chars(sub, scoped_ignorecase)
+        elif op is _sre_const.BRANCH:
+            first, nullable = set(), False
+            for branch in av[1]:
+                branch_first, branch_nullable = _first_chars(branch, ignorecase)
+                if branch_first is None:
+                    return None, False
+                first |= branch_first
+                nullable = nullable or branch_nullable
+        elif op in (_sre_const.MAX_REPEAT, _sre_const.MIN_REPEAT):
+            first, nullable = _first_chars(av[2], ignorecase)
+            nullable = nullable or av[0] == 0
+        else:
+            return None, False
+        if first is None:
+            return None, False
+        if ignorecase:
+            first = first | {c.swapcase() for c in first if len(c) == 1}
+        chars |= first
+        if not nullable:
+            return chars, False
+    return chars, True
+
+
+def first_chars(pattern: re.Pattern) -> Optional[frozenset]:
+    """
+    Characters every match starts with, or None when unbounded. Class
+    escapes (\\d, \\s, \\w) stand for themselves so Unicode digits etc. stay covered.
+    """
+    try:
+        chars, nullable = _first_chars(_sre_parse.parse(pattern.pattern, pattern.flags),
+                                       bool(pattern.flags & re.IGNORECASE))
+    except Exception:
+        return None
+    return frozenset(chars) if chars and not nullable else None
+
+
+def _guard_width(chars: Optional[Collection[str]]) -> int:
+    if chars is None:
+        return sys.maxsize
+    # \d / \s count as ten characters, \w as a whole alphabet
+    return sum(1 if len(c) == 1 else (64 if c == r"\w" else 10) for c in chars)
+
+
+def _guard(chars: Optional[Collection[str]]) -> str:
+    """Lookahead that rejects a start position with one character test."""
+    if not chars or _guard_width(chars) > _MAX_GUARD_CHARS:
+        return ""
+    return "(?=[" + "".join(c if len(c) > 1 else re.escape(c) for c in sorted(chars)) + "])"
+
+
+def _starter(chars: Optional[Collection[str]]) -> re.Pattern:
+    """Regex finding the next position a match can start at (every position when unbounded)."""
+    if not chars:
+        return re.compile("")
+    return re.compile("[" + "".join(c if len(c) > 1 else re.escape(c) for c in sorted(chars)) + "]")
+
+
+def required_literals(pattern: re.Pattern) -> Optional[frozenset]:
+    """
+    Lowercased literals of which every match contains at least one, or None
+    when no such set can be derived (the pattern then runs on every text).
+    """
+    try:
+        factors = _seq_factors(_sre_parse.parse(pattern.pattern, pattern.flags))
+    except Exception:
+        return None
+    return frozenset(f.lower() for f in factors) if factors else None
+
+
+class ScanEngine:
+    """
+    Named patterns compiled for single-pass scanning and redaction.
+
+    Attributes:
+        patterns: name -> compiled pattern; for matches starting at the same
+            position, the earlier pattern is reported (and redacted) first
+        allowlisted_types: names whose matches are dropped when an allowlist
+            pattern occurs in the matched value (default: all)
+    """
+
+    def __init__(self, patterns: dict[str, re.Pattern], allowlist: Sequence[re.Pattern] = (),
+                 allowlisted_types: Optional[Collection[str]] = None):
+        self.patterns = dict(patterns)
+        self._names = list(self.patterns)
+        self._sources: list[tuple[bool, str]] = []   # (starts with \b, scoped source without it)
+        self._first = [first_chars(p) for p in self.patterns.values()]
+        self._starters = [_starter(chars) for chars in self._first]
+        for name, pattern in self.patterns.items():
+            if re.search(r"\\[1-9]|\(\?P=", pattern.pattern):
+                raise ValueError(f"Pattern {name!r} uses a backreference; it cannot be combined")
+            self._sources.append(self._split_boundary(pattern))
+        self._literals = [required_literals(p) for p in self.patterns.values()]
+        self._allow = re.compile("|".join(_scoped(p) for p in allowlist)) if allowlist else None
+        self._allow_types = set(self.patterns if allowlisted_types is None else allowlisted_types)
+        self._compiled: dict[tuple, re.Pattern] = {}
+
+    @staticmethod
+    def _split_boundary(pattern: re.Pattern) -> tuple[bool, str]:
+        # A leading \b shared by many alternatives is checked once for all of them
+        parsed = _sre_parse.parse(pattern.pattern, pattern.flags)
+        leads_with_boundary = (
+            pattern.pattern.startswith(r"\b") and len(parsed) > 0
+            and parsed[0] == (_sre_const.AT, _sre_const.AT_BOUNDARY)
+        )
+        if leads_with_boundary:
+            return True, _scoped(re.compile(pattern.pattern[2:], pattern.flags))
+        return False, _scoped(pattern)
+
+    def _regex_for(self, indices: tuple) -> re.Pattern:
+        regex = self._compiled.get(indices)
+        if regex is None:
+            # Consecutive patterns of the same kind (leading \b or not) share one
+            # first-character guard and boundary check
+            branches: list[str] = []
+            run: list[int] = []
+            run_chars: Optional[set] = None
+            for i in indices:
+                if run and self._joins_run(run, run_chars, i):
+                    run.append(i)
+                    if run_chars is not None:
+                        run_chars |= self._first[i]
+                    continue
+                if run:
+                    branches.append(self._run_source(run, run_chars))
+                run = [i]
+                run_chars = set(self._first[i]) if _guard_width(self._first[i]) <= _MAX_GUARD_CHARS else None
+            if run:
+                branches.append(self._run_source(run, run_chars))
+            regex = re.compile("|".join(branches))
+            self._compiled[indices] = regex
+        return regex
+
+    def _joins_run(self, run: list[int], run_chars: Optional[set], i: int) -> bool:
+        """Same kind (leading \\b or not) and the run's guard stays narrow, or both unguarded."""
+        if self._sources[run[0]][0] != self._sources[i][0]:
+            return False
+        if run_chars is None:
+            return _guard_width(self._first[i]) > _MAX_GUARD_CHARS
+        return _guard_width(run_chars | (self._first[i] or {r"\w"})) <= _MAX_GUARD_CHARS
+
+    def _run_source(self, run: list[int], run_chars: Optional[set]) -> str:
+        body = "|".join(f"(?P<g{i}>{self._sources[i][1]})" for i in run)
+        boundary = r"\b" if self._sources[run[0]][0] else ""
+        return f"{_guard(run_chars)}{boundary}(?:{body})"
+
+    def candidates(self, text: str) -> tuple:
+        """Indices of the patterns that can possibly match text."""
+        lowered = text.lower()
+        return tuple(i for i, literals in enumerate(self._literals)
+                     if literals is None or any(f in lowered for f in literals))
+
+    def finditer(self, text: str) -> Iterator[PIIMatch]:
+        """
+        Non-allowlisted matches of every pattern, ordered by start, then pattern.
+
+        Each pattern contributes the matches its own finditer would find. The
+        combined alternation is tried at every position outside its previous
+        matches, so no pattern can match starting anywhere else: the patterns
+        only need to be re-tried inside the alternation's spans.
+        """
+        if not text:
+            return
+        indices = self.candidates(text)
+        if not indices:
+            return
+        spans = [m.span() for m in self._regex_for(indices).finditer(text)]
+        if not spans:
+            return
+
+        found = []
+        patterns = list(self.patterns.values())
+        for i in indices:
+            match_at, next_start = patterns[i].match, self._starters[i].search
+            pos = 0  # end of this pattern's previous match: its matches never overlap
+            for start, end in spans:
+                q = max(start, pos)
+                while q < end:
+                    hit = next_start(text, q, end)
+                    if hit is None:
+                        break
+                    q = hit.start()
+                    m = match_at(text, q)
+                    if m is None:
+                        q += 1
+                        continue
+                    found.append((q, i, m.end(), m.group()))
+                    pos = q = max(m.end(), q + 1)
+
+        names, allow, allow_types = self._names, self._allow, self._allow_types
+        for start, i, end, value in sorted(found):
+            name = names[i]
+            if allow is not None and name in allow_types and allow.search(value):
+                continue
+            yield PIIMatch(pii_type=name, value=value, start=start, end=end)
+
+    def scan(self, text: str) -> list[PIIMatch]:
+        return list(self.finditer(text))
+
+    def redact(self, text: str, matches: Optional[list[PIIMatch]] = None,
+               replacement: Optional[Callable[[PIIMatch], str]] = None) -> tuple[str, list[PIIMatch]]:
+        """
+        Replace every match in one join; returns (redacted text, matches).
+
+        Overlapping matches are merged into one redaction labelled after the
+        first of them (matches must be ordered by start, as finditer yields them).
+        """
+        if not text:
+            return text, []
+        if matches is None:
+            matches = self.scan(text)
+        if not matches:
+            return text, matches
+        replacement = replacement or (lambda m: f"[REDACTED:{m.pii_type.upper()}]")
+        parts = []
+        pos = 0
+        for match in matches:
+            if match.start < pos:
+                pos = max(pos, match.end)  # overlaps the current redaction: extend it
+                continue
+            parts.append(text[pos:match.start])
+            parts.append(replacement(match))
+            pos = match.end
+        parts.append(text[pos:])
+        return "".join(parts), matches
+
+
+PII_ENGINE = ScanEngine(PII_PATTERNS, ALLOWLIST_PATTERNS)
+_ALLOWLIST_RE = re.compile("|".join(_scoped(p) for p in ALLOWLIST_PATTERNS))
+
+
 def is_allowlisted(text: str, match: re.Match) -> bool:
     """Check if a match is in the allowlist."""
-    matched_text = match.group()
-    for pattern in ALLOWLIST_PATTERNS:
-        if pattern.search(matched_text):
-            return True
-    return False
+    return _ALLOWLIST_RE.search(match.group()) is not None
 
 
 def scan_text(text: str) -> list[PIIMatch]:
@@ -69,24 +406,11 @@ def scan_text(text: str) -> list[PIIMatch]:
         text: The text to scan
 
     Returns:
-        List of PII matches found
+        List of PII matches found, in text order
     """
     if not text:
         return []
-
-    matches: list[PIIMatch] = []
-
-    for pii_type, pattern in PII_PATTERNS.items():
-        for match in pattern.finditer(text):
-            if not is_allowlisted(text, match):
-                matches.append(PIIMatch(
-                    pii_type=pii_type,
-                    value=match.group(),
-                    start=match.start(),
-                    end=match.end()
-                ))
-
-    return matches
+    return PII_ENGINE.scan(text)
 
 
 def redact_text(text: str) -> tuple[str, list[PIIMatch]]:
@@ -99,22 +423,7 @@ def redact_text(text: str) -> tuple[str, list[PIIMatch]]:
     Returns:
         Tuple of (redacted text, list of matches)
     """
-    if not text:
-        return text, []
-
-    matches = scan_text(text)
-    if not matches:
-        return text, []
-
-    # Sort by position (reverse) to replace from end
-    sorted_matches = sorted(matches, key=lambda m: m.start, reverse=True)
-
-    redacted = text
-    for match in sorted_matches:
-        redaction = f"[REDACTED:{match.pii_type.upper()}]"
-        redacted = redacted[:match.start] + redaction + redacted[match.end:]
-
-    return redacted, matches
+    return PII_ENGINE.redact(text)
 
 
 def scan_github_content(title: str, body: str | None = None) -> dict:
@@ -143,19 +452,18 @@ def scan_github_content(title: str, body: str | None = None) -> dict:
     if title_matches:
         results["has_pii"] = True
         results["title_pii"] = [{"type": m.pii_type, "value": "[hidden]"} for m in title_matches]
-        results["redacted_title"], _ = redact_text(title)
+        results["redacted_title"], _ = PII_ENGINE.redact(title, title_matches)
 
     # Scan body
-    if body:
-        body_matches = scan_text(body)
-        if body_matches:
-            results["has_pii"] = True
-            results["body_pii"] = [{"type": m.pii_type, "value": "[hidden]"} for m in body_matches]
-            results["redacted_body"], _ = redact_text(body)
+    body_matches = scan_text(body) if body else []
+    if body_matches:
+        results["has_pii"] = True
+        results["body_pii"] = [{"type": m.pii_type, "value": "[hidden]"} for m in body_matches]
+        results["redacted_body"], _ = PII_ENGINE.redact(body, body_matches)
 
     # Determine if blocked
     critical_types = {"ssn", "credit_card", "private_key", "aws_key"}
-    all_matches = title_matches + (scan_text(body) if body else [])
+    all_matches = title_matches + body_matches
 
     for match in all_matches:
         if match.pii_type in critical_types:
@@ -200,6 +508,8 @@ K8S_ALLOWLIST = [
     re.compile(r"valueFrom:"),  # Dynamic value reference (safe)
 ]
 
+K8S_ENGINE = ScanEngine(K8S_SECRET_PATTERNS, K8S_ALLOWLIST)
+
 
 def scan_k8s_manifest(manifest_path: str) -> dict:
     """Scan a Kubernetes manifest file for hardcoded secrets and PII.
@@ -232,26 +542,23 @@ def scan_k8s_manifest(manifest_path: str) -> dict:
         results["violations"].append(f"Cannot read file: {e}")
         return results
 
-    # Check for hardcoded secrets
-    for secret_type, pattern in K8S_SECRET_PATTERNS.items():
-        for match in pattern.finditer(content):
-            matched_text = match.group()
-            # Skip if it's a template reference
-            if any(allow.search(matched_text) for allow in K8S_ALLOWLIST):
-                continue
-            results["has_secrets"] = True
-            results["violations"].append({
-                "type": secret_type,
-                "line_approx": content[:match.start()].count("\n") + 1,
-                "context": matched_text[:80],
-            })
+    line_starts = [0] + [m.end() for m in re.finditer("\n", content)]
+
+    # Check for hardcoded secrets (template references are allowlisted)
+    for match in K8S_ENGINE.finditer(content):
+        results["has_secrets"] = True
+        results["violations"].append({
+            "type": match.pii_type,
+            "line_approx": bisect.bisect_right(line_starts, match.start),
+            "context": match.value[:80],
+        })
 
     # Standard PII scan on the full content
     pii_matches = scan_text(content)
     if pii_matches:
         results["has_pii"] = True
         results["pii_matches"] = [
-            {"type": m.pii_type, "line_approx": content[:m.start].count("\n") + 1}
+            {"type": m.pii_type, "line_approx": bisect.bisect_right(line_starts, m.start)}
             for m in pii_matches
         ]
 
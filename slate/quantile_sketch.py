@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# Modified: 2026-10-16T17:00:00Z | Author: COPILOT | Change: Mergeable streaming quantile sketch for latency metrics
+"""
+SLATE Quantile Sketch — Constant-Size, Mergeable Streaming Percentiles
+=======================================================================
+
+Log-bucketed histogram (DDSketch-style) with a fixed relative accuracy:
+every reported quantile is within ±alpha (default 1%) of a true sample
+value. Memory is bounded by max_bins regardless of how many values are
+added, sketches merge exactly (bucket counts add), and they serialize to a
+small JSON dict, so per-process or per-day sketches can be combined into
+accurate long-run P50/P95/P99.
+
+Usage:
+    from slate.quantile_sketch import QuantileSketch
+
+    sketch = QuantileSketch()
+    for latency_ms in samples:
+        sketch.add(latency_ms)
+    sketch.quantile(0.95)
+
+    merged = QuantileSketch.from_dict(saved).merge(sketch)
+"""
+
+import math
+from typing import Optional
+
+DEFAULT_ALPHA = 0.01      # relative accuracy of reported quantiles
+DEFAULT_MAX_BINS = 2048   # ~1% accuracy over >17 orders of magnitude before collapsing
+MIN_TRACKED = 1e-6        # values at or below this are counted in the zero bucket
+
+
+class QuantileSketch:
+    """Streaming quantile sketch with relative-error guarantees."""
+
+    __slots__ = ("alpha", "max_bins", "gamma", "_log_gamma", "bins",
+                 "zero_count", "count", "sum", "min", "max")
+
+    def __init__(self, alpha: float = DEFAULT_ALPHA, max_bins: int = DEFAULT_MAX_BINS):
+        if not 0 < alpha < 1:
+            raise ValueError(f"alpha must be in (0, 1), got {alpha}")
+        self.alpha = alpha
+        self.max_bins = max_bins
+        self.gamma = (1 + alpha) / (1 - alpha)
+        self._log_gamma = math.log(self.gamma)
+        self.bins: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        # Midpoint (in relative terms) of bucket (gamma^(i-1), gamma^i]
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def add(self, value: float, weight: int = 1):
+        """Record a non-negative value (negative values are clamped to 0)."""
+        value = max(float(value), 0.0)
+        if value <= MIN_TRACKED:
+            self.zero_count += weight
+        else:
+            idx = self._index(value)
+            self.bins[idx] = self.bins.get(idx, 0) + weight
+            if len(self.bins) > self.max_bins:
+                self._collapse()
+        self.count += weight
+        self.sum += value * weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def _collapse(self):
+        """Fold the lowest buckets together to stay within max_bins."""
+        keys = sorted(self.bins)
+        excess = len(keys) - self.max_bins
+        target = keys[excess]
+        for k in keys[:excess]:
+            self.bins[target] += self.bins.pop(k)
+
+    def quantile(self, q: float) -> float:
+        """Value at quantile q in [0, 1]; 0.0 for an empty sketch."""
+        if self.count == 0:
+            return 0.0
+        q = min(max(q, 0.0), 1.0)
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for idx in sorted(self.bins):
+            seen += self.bins[idx]
+            if seen > rank:
+                return min(max(self._value(idx), self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Add other's counts into this sketch (in place) and return self."""
+        if other.count == 0:
+            return self
+        if not math.isclose(other.gamma, self.gamma):
+            raise ValueError("Cannot merge sketches with different alpha")
+        for idx, n in other.bins.items():
+            self.bins[idx] = self.bins.get(idx, 0) + n
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def copy(self) -> "QuantileSketch":
+        return QuantileSketch(self.alpha, self.max_bins).merge(self)
+
+    def to_dict(self) -> dict:
+        """Compact JSON-serializable form."""
+        return {
+            "alpha": self.alpha,
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "zero": self.zero_count,
+            "bins": {str(k): v for k, v in sorted(self.bins.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict], max_bins: int = DEFAULT_MAX_BINS) -> "QuantileSketch":
+        sketch = cls(alpha=(data or {}).get("alpha", DEFAULT_ALPHA), max_bins=max_bins)
+        if not data or not data.get("count"):
+            return sketch
+        sketch.bins = {int(k): int(v) for k, v in data.get("bins", {}).items()}
+        sketch.zero_count = int(data.get("zero", 0))
+        sketch.count = int(data["count"])
+        sketch.sum = float(data.get("sum", 0.0))
+        sketch.min = float(data["min"]) if data.get("min") is not None else math.inf
+        sketch.max = float(data["max"]) if data.get("max") is not None else -math.inf
+        return sketch
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return (f"QuantileSketch(count={self.count}, bins={len(self.bins)}, "
+                f"p50={self.quantile(0.5):.3g}, p99={self.quantile(0.99):.3g})")
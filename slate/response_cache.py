@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# ═══════════════════════════════════════════════════════════════════════════════
+# CELL: response_cache [python]
+# Author: COPILOT | Created: 2026-10-16T10:00:00Z
+# Purpose: TTL + single-flight response cache for async dashboard endpoints
+# ═══════════════════════════════════════════════════════════════════════════════
+"""
+Response Cache
+==============
+Async TTL cache with stale-while-revalidate and single-flight coalescing.
+
+Dashboard endpoints backed by ``gh`` fork a process per request, and every
+polling browser tab multiplies that. Wrapping the fetch in this cache gives:
+
+- Fresh hits: served from memory while younger than ``ttl``
+- Stale hits: served immediately while younger than ``ttl + stale_ttl``,
+  with one background refresh scheduled
+- Single flight: N concurrent misses for a key await ONE fetch
+- Counters: hits / misses / stale hits / coalesced waiters per key
+
+Usage:
+    from slate.response_cache import AsyncTTLCache
+
+    cache = AsyncTTLCache()
+
+    async def fetch_prs():
+        result = await run_async(["gh", "pr", "list", "--json", "number"])
+        return {"prs": json.loads(result.stdout)}
+
+    payload = await cache.get_or_fetch("github_prs", fetch_prs, ttl=30)
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+DEFAULT_TTL = 30.0
+DEFAULT_STALE_MULTIPLIER = 4.0
+DEFAULT_MAX_ENTRIES = 256
+
+
+@dataclass
+class CacheEntry:
+    """A cached value with its freshness window."""
+    value: Any
+    stored_at: float
+    ttl: float
+    stale_ttl: float
+
+    def age(self, now: float) -> float:
+        return now - self.stored_at
+
+    def is_fresh(self, now: float) -> bool:
+        return self.age(now) < self.ttl
+
+    def is_usable(self, now: float) -> bool:
+        return self.age(now) < self.ttl + self.stale_ttl
+
+
+class AsyncTTLCache:
+    """
+    TTL cache for async fetchers with stale-while-revalidate and single flight.
+
+    Attributes:
+        default_ttl: Freshness window when a call does not pass ``ttl`` (seconds)
+        max_entries: Maximum number of keys kept (least recently used evicted)
+    """
+
+    def __init__(
+        self,
+        default_ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _stat(self, key: str) -> Dict[str, int]:
+        return self._stats.setdefault(key, {
+            "hits": 0, "stale_hits": 0, "misses": 0, "coalesced": 0,
+            "fetches": 0, "refreshes": 0, "errors": 0,
+        })
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        Return the cached value for ``key`` or fetch it.
+
+        Args:
+            key: Cache key
+            fetch: Zero-argument coroutine function producing the value
+            ttl: Freshness window in seconds (default: default_ttl)
+            stale_ttl: Extra window during which a stale value is served while
+                       refreshing in the background (default: 4 x ttl)
+            cacheable: Predicate deciding whether a fetched value is stored
+                       (e.g. skip error payloads). Uncached values are still
+                       returned to every coalesced waiter.
+
+        Returns:
+            The cached or freshly fetched value.
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        stale_ttl = ttl * DEFAULT_STALE_MULTIPLIER if stale_ttl is None else stale_ttl
+        stat = self._stat(key)
+        now = self._clock()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.is_fresh(now):
+                stat["hits"] += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            if entry.is_usable(now):
+                stat["stale_hits"] += 1
+                self._entries.move_to_end(key)
+                if self._pending(key) is None:
+                    stat["refreshes"] += 1
+                    self._start_fetch(key, fetch, ttl, stale_ttl, cacheable)
+                return entry.value
+
+        task = self._pending(key)
+        if task is None:
+            stat["misses"] += 1
+            task = self._start_fetch(key, fetch, ttl, stale_ttl, cacheable)
+        else:
+            stat["coalesced"] += 1
+        # Shield so one client disconnecting doesn't cancel the shared fetch
+        return await asyncio.shield(task)
+
+    def _pending(self, key: str) -> Optional[asyncio.Future]:
+        """Get the in-flight fetch for ``key`` on the running loop, if any."""
+        task = self._inflight.get(key)
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            return None
+        return task
+
+    def _start_fetch(self, key, fetch, ttl, stale_ttl, cacheable) -> asyncio.Future:
+        stat = self._stat(key)
+
+        async def run():
+            stat["fetches"] += 1
+            try:
+                value = await fetch()
+            except Exception:
+                stat["errors"] += 1
+                raise
+            if cacheable is None or cacheable(value):
+                self._store(key, value, ttl, stale_ttl)
+            return value
+
+        task = asyncio.ensure_future(run())
+        self._inflight[key] = task
+
+        def done(t: asyncio.Future) -> None:
+            if self._inflight.get(key) is t:
+                del self._inflight[key]
+            if not t.cancelled():
+                t.exception()  # Mark retrieved for background refreshes
+
+        task.add_done_callback(done)
+        return task
+
+    def _store(self, key: str, value: Any, ttl: float, stale_ttl: float) -> None:
+        self._entries[key] = CacheEntry(value, self._clock(), ttl, stale_ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one key, or every key when ``key`` is None."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters, overall and per key."""
+        now = self._clock()
+        keys = {}
+        totals = {"hits": 0, "stale_hits": 0, "misses": 0, "coalesced": 0,
+                  "fetches": 0, "refreshes": 0, "errors": 0}
+        for key, stat in self._stats.items():
+            entry = self._entries.get(key)
+            keys[key] = {
+                **stat,
+                "cached": entry is not None,
+                "age_s": round(entry.age(now), 1) if entry else None,
+                "ttl_s": entry.ttl if entry else None,
+            }
+            for name in totals:
+                totals[name] += stat[name]
+        requests = totals["hits"] + totals["stale_hits"] + totals["misses"] + totals["coalesced"]
+        served = totals["hits"] + totals["stale_hits"] + totals["coalesced"]
+        return {
+            **totals,
+            "requests": requests,
+            "hit_rate": round(served / requests, 3) if requests else 0.0,
+            "entries": len(self._entries),
+            "keys": keys,
+        }
@@ -4,6 +4,13 @@ SLATE Runner Cost Tracker
 Tracks objective cost data for GitHub Actions runner usage.
 Maintains historical records and provides cost analytics.
 
+Costed runs live in a local SQLite store (.slate_runner_costs.sqlite) that
+remembers which run IDs are already costed, so an update only fetches jobs
+for new completed runs (concurrently, with a bounded pool). Monthly rollups
+are maintained as materialized aggregates in the same transaction as each
+run insert. .slate_runner_costs.json is rewritten from the store after
+every update as the summary the report/export commands read.
+
 Usage:
     python slate/runner_cost_tracker.py --report           # Show cost report
     python slate/runner_cost_tracker.py --update           # Update from GitHub API
@@ -14,13 +21,24 @@ Usage:
 import argparse
 import csv
 import json
+import sqlite3
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Callable, Iterable, Optional
 
 WORKSPACE = Path(__file__).parent.parent
 COST_DATA_FILE = WORKSPACE / ".slate_runner_costs.json"
+COST_DB_FILE = WORKSPACE / ".slate_runner_costs.sqlite"
+
+# Modified: 2026-10-16T21:00:00Z | Author: COPILOT | Change: Incremental ingestion settings
+INCREMENTAL_RUN_LIMIT = 30   # runs listed per update once the store has history
+BACKFILL_RUN_LIMIT = 200     # runs listed on first sync or when the gap is larger than one page
+JOB_FETCH_WORKERS = 6        # concurrent `gh api .../jobs` calls
+RECENT_RUNS_IN_SUMMARY = 100
 
 # GitHub Actions pricing (USD per minute)
 RUNNER_COSTS = {
@@ -100,6 +118,11 @@ def get_workflow_runs(limit: int = 100) -> list:
 
 def get_run_jobs(run_id: int) -> list:
     """Fetch jobs for a specific run."""
+    return fetch_run_jobs(run_id) or []
+
+
+def fetch_run_jobs(run_id: int) -> Optional[list]:
+    """Fetch jobs for a run; None when the call failed (so the run is retried later)."""
     gh = get_gh_path()
     try:
         result = subprocess.run(
@@ -116,7 +139,7 @@ def get_run_jobs(run_id: int) -> list:
             return json.loads(result.stdout)
     except Exception:
         pass
-    return []
+    return None
 
 
 def calculate_job_cost(job: dict) -> dict:
@@ -163,84 +186,240 @@ def calculate_job_cost(job: dict) -> dict:
     }
 
 
-def update_cost_data(verbose: bool = False) -> dict:
-    """Update cost data from GitHub API."""
-    data = load_cost_data()
-    runs = get_workflow_runs(200)
-
-    total_self_hosted = 0
-    total_hosted = 0
-    total_saved = 0
-    total_spent = 0
-
-    processed_runs = []
-
-    for run in runs:
-        if run.get("status") != "completed":
-            continue
-
-        run_id = run.get("databaseId")
-        workflow = run.get("workflowName")
-        created = run.get("createdAt")
-
-        if verbose:
-            print(f"Processing: {workflow} (#{run_id})")
-
-        jobs = get_run_jobs(run_id)
-
-        run_data = {
-            "id": run_id,
-            "workflow": workflow,
-            "created": created,
-            "conclusion": run.get("conclusion"),
-            "jobs": [],
-            "total_minutes": 0,
-            "total_cost": 0,
-            "total_saved": 0,
+def cost_run(run: dict, jobs: list) -> dict:
+    """Cost one completed run from its job list."""
+    run_data = {
+        "id": run.get("databaseId"),
+        "workflow": run.get("workflowName"),
+        "created": run.get("createdAt"),
+        "conclusion": run.get("conclusion"),
+        "jobs": [],
+        "total_minutes": 0,
+        "total_cost": 0,
+        "total_saved": 0,
+    }
+    for job in jobs:
+        job_cost = calculate_job_cost(job)
+        run_data["jobs"].append(job_cost)
+        run_data["total_minutes"] += job_cost["duration_minutes"]
+        run_data["total_cost"] += job_cost["actual_cost"]
+        run_data["total_saved"] += job_cost["saved"]
+    return run_data
+
+
+# Modified: 2026-10-16T21:00:00Z | Author: COPILOT | Change: SQLite run/job store with materialized monthly rollups
+class RunCostStore:
+    """SQLite store of costed runs, their jobs and monthly rollups."""
+
+    def __init__(self, path: Path = None):
+        self.path = Path(path or COST_DB_FILE)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            " id INTEGER PRIMARY KEY,"
+            " workflow TEXT, created TEXT, month TEXT, conclusion TEXT,"
+            " total_minutes REAL, total_cost REAL, total_saved REAL);"
+            "CREATE INDEX IF NOT EXISTS runs_created ON runs (created);"
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " run_id INTEGER NOT NULL REFERENCES runs (id),"
+            " job_name TEXT, runner_type TEXT, is_self_hosted INTEGER,"
+            " duration_minutes REAL, cost_rate REAL, actual_cost REAL, saved REAL);"
+            "CREATE INDEX IF NOT EXISTS jobs_run ON jobs (run_id);"
+            "CREATE TABLE IF NOT EXISTS monthly ("
+            " month TEXT PRIMARY KEY,"
+            " runs INTEGER NOT NULL DEFAULT 0,"
+            " self_hosted_minutes REAL NOT NULL DEFAULT 0,"
+            " hosted_minutes REAL NOT NULL DEFAULT 0,"
+            " saved_usd REAL NOT NULL DEFAULT 0,"
+            " spent_usd REAL NOT NULL DEFAULT 0);"
+        )
+        self._conn.commit()
+
+    def known_run_ids(self, run_ids: Iterable[int]) -> set:
+        """Subset of run_ids that are already costed."""
+        ids = [int(i) for i in run_ids if i is not None]
+        known = set()
+        with self._lock:
+            for start in range(0, len(ids), 500):
+                part = ids[start:start + 500]
+                marks = ",".join("?" * len(part))
+                known.update(r[0] for r in self._conn.execute(
+                    f"SELECT id FROM runs WHERE id IN ({marks})", part))
+        return known
+
+    def add_run(self, run_data: dict) -> bool:
+        """Insert a costed run and fold it into its month's rollup (atomically).
+
+        Returns False if the run was already stored.
+        """
+        created = run_data.get("created") or ""
+        month = created[:7] or datetime.now().strftime("%Y-%m")
+        jobs = run_data.get("jobs", [])
+        self_hosted = sum(j["duration_minutes"] for j in jobs if j["is_self_hosted"])
+        hosted = sum(j["duration_minutes"] for j in jobs if not j["is_self_hosted"])
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "INSERT OR IGNORE INTO runs (id, workflow, created, month, conclusion,"
+                " total_minutes, total_cost, total_saved) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_data["id"], run_data.get("workflow"), created, month, run_data.get("conclusion"),
+                 run_data["total_minutes"], run_data["total_cost"], run_data["total_saved"]),
+            )
+            if cur.rowcount == 0:
+                return False
+            self._conn.executemany(
+                "INSERT INTO jobs (run_id, job_name, runner_type, is_self_hosted,"
+                " duration_minutes, cost_rate, actual_cost, saved) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_data["id"], j.get("job_name"), j.get("runner_type"), int(bool(j.get("is_self_hosted"))),
+                  j.get("duration_minutes", 0), j.get("cost_rate", 0), j.get("actual_cost", 0),
+                  j.get("saved", 0)) for j in jobs],
+            )
+            self._conn.execute(
+                "INSERT INTO monthly (month, runs, self_hosted_minutes, hosted_minutes, saved_usd, spent_usd)"
+                " VALUES (?, 1, ?, ?, ?, ?) ON CONFLICT (month) DO UPDATE SET"
+                " runs = runs + 1,"
+                " self_hosted_minutes = self_hosted_minutes + excluded.self_hosted_minutes,"
+                " hosted_minutes = hosted_minutes + excluded.hosted_minutes,"
+                " saved_usd = saved_usd + excluded.saved_usd,"
+                " spent_usd = spent_usd + excluded.spent_usd",
+                (month, self_hosted, hosted, run_data["total_saved"], run_data["total_cost"]),
+            )
+        return True
+
+    def run_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def monthly_summaries(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT month, runs, self_hosted_minutes, hosted_minutes, saved_usd, spent_usd"
+                " FROM monthly ORDER BY month").fetchall()
+        return {
+            m: {"runs": n, "self_hosted_minutes": round(sh, 2), "hosted_minutes": round(h, 2),
+                "saved_usd": round(saved, 2), "spent_usd": round(spent, 2)}
+            for m, n, sh, h, saved, spent in rows
         }
 
-        for job in jobs:
-            job_cost = calculate_job_cost(job)
-            run_data["jobs"].append(job_cost)
-            run_data["total_minutes"] += job_cost["duration_minutes"]
-            run_data["total_cost"] += job_cost["actual_cost"]
-            run_data["total_saved"] += job_cost["saved"]
-
-            if job_cost["is_self_hosted"]:
-                total_self_hosted += job_cost["duration_minutes"]
-            else:
-                total_hosted += job_cost["duration_minutes"]
-
-            total_saved += job_cost["saved"]
-            total_spent += job_cost["actual_cost"]
-
-        processed_runs.append(run_data)
-
-    data["runs"] = processed_runs[:100]  # Keep last 100 runs
-    data["total_self_hosted_minutes"] = round(total_self_hosted, 2)
-    data["total_hosted_minutes"] = round(total_hosted, 2)
-    data["total_saved_usd"] = round(total_saved, 2)
-    data["total_spent_usd"] = round(total_spent, 2)
-
-    # Monthly summary
-    current_month = datetime.now().strftime("%Y-%m")
-    if current_month not in data["monthly_summaries"]:
-        data["monthly_summaries"][current_month] = {
-            "self_hosted_minutes": 0,
-            "hosted_minutes": 0,
-            "saved_usd": 0,
-            "spent_usd": 0,
+    def totals(self) -> dict:
+        """All-time totals, summed from the monthly rollups (not from runs)."""
+        with self._lock:
+            sh, h, saved, spent = self._conn.execute(
+                "SELECT COALESCE(SUM(self_hosted_minutes), 0), COALESCE(SUM(hosted_minutes), 0),"
+                " COALESCE(SUM(saved_usd), 0), COALESCE(SUM(spent_usd), 0) FROM monthly").fetchone()
+        return {
+            "total_self_hosted_minutes": round(sh, 2),
+            "total_hosted_minutes": round(h, 2),
+            "total_saved_usd": round(saved, 2),
+            "total_spent_usd": round(spent, 2),
         }
 
-    data["monthly_summaries"][current_month] = {
-        "self_hosted_minutes": round(total_self_hosted, 2),
-        "hosted_minutes": round(total_hosted, 2),
-        "saved_usd": round(total_saved, 2),
-        "spent_usd": round(total_spent, 2),
-    }
-
-    save_cost_data(data)
-    return data
+    def recent_runs(self, limit: int = RECENT_RUNS_IN_SUMMARY) -> list:
+        """Most recent runs (newest first) with their jobs, in the JSON summary shape."""
+        with self._lock:
+            runs = self._conn.execute(
+                "SELECT id, workflow, created, conclusion, total_minutes, total_cost, total_saved"
+                " FROM runs ORDER BY created DESC, id DESC LIMIT ?", (limit,)).fetchall()
+            ids = [r[0] for r in runs]
+            marks = ",".join("?" * len(ids))
+            job_rows = self._conn.execute(
+                f"SELECT run_id, job_name, runner_type, is_self_hosted, duration_minutes, cost_rate,"
+                f" actual_cost, saved FROM jobs WHERE run_id IN ({marks}) ORDER BY rowid", ids
+            ).fetchall() if ids else []
+        jobs_by_run: dict = {}
+        for run_id, name, runner, self_hosted, mins, rate, cost, saved in job_rows:
+            jobs_by_run.setdefault(run_id, []).append({
+                "job_name": name, "runner_type": runner, "is_self_hosted": bool(self_hosted),
+                "duration_minutes": mins, "cost_rate": rate, "actual_cost": cost, "saved": saved,
+            })
+        return [
+            {"id": rid, "workflow": wf, "created": created, "conclusion": conclusion,
+             "jobs": jobs_by_run.get(rid, []), "total_minutes": mins, "total_cost": cost,
+             "total_saved": saved}
+            for rid, wf, created, conclusion, mins, cost, saved in runs
+        ]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def ingest_runs(
+    store: RunCostStore,
+    runs: list,
+    fetch_jobs: Callable[[int], Optional[list]] = fetch_run_jobs,
+    workers: int = JOB_FETCH_WORKERS,
+    verbose: bool = False,
+) -> dict:
+    """Cost the completed runs the store has not seen, fetching jobs concurrently."""
+    completed = [r for r in runs if r.get("status") == "completed" and r.get("databaseId") is not None]
+    known = store.known_run_ids(r["databaseId"] for r in completed)
+    new_runs = [r for r in completed if r["databaseId"] not in known]
+    stats = {"listed": len(runs), "completed": len(completed), "already_costed": len(known),
+             "fetched": 0, "ingested": 0, "failed": 0}
+    if not new_runs:
+        return stats
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(new_runs)))) as pool:
+        for run, jobs in zip(new_runs, pool.map(lambda r: fetch_jobs(r["databaseId"]), new_runs)):
+            stats["fetched"] += 1
+            if jobs is None:
+                stats["failed"] += 1  # not stored, so the next update retries it
+                continue
+            if verbose:
+                print(f"Processing: {run.get('workflowName')} (#{run['databaseId']})")
+            if store.add_run(cost_run(run, jobs)):
+                stats["ingested"] += 1
+    return stats
+
+
+def migrate_json_runs(store: RunCostStore, data: dict) -> int:
+    """Import runs from a pre-SQLite .slate_runner_costs.json so they are not re-costed."""
+    imported = 0
+    for run in data.get("runs", []):
+        if run.get("id") is not None and store.add_run(run):
+            imported += 1
+    return imported
+
+
+def update_cost_data(verbose: bool = False, store: Optional[RunCostStore] = None,
+                     list_runs: Callable[[int], list] = None,
+                     fetch_jobs: Callable[[int], Optional[list]] = None) -> dict:
+    """Update cost data from GitHub API (incrementally) and rewrite the JSON summary."""
+    own_store = store is None
+    store = store or RunCostStore()
+    list_runs = list_runs or get_workflow_runs
+    fetch_jobs = fetch_jobs or fetch_run_jobs
+    try:
+        data = load_cost_data()
+        if store.run_count() == 0 and data.get("runs"):
+            migrate_json_runs(store, data)
+
+        # Once history exists, one short page usually covers everything new;
+        # if none of it is known yet the gap may be bigger, so widen to a backfill.
+        limit = INCREMENTAL_RUN_LIMIT if store.run_count() else BACKFILL_RUN_LIMIT
+        runs = list_runs(limit)
+        completed_ids = [r.get("databaseId") for r in runs if r.get("status") == "completed"]
+        if (limit < BACKFILL_RUN_LIMIT and len(runs) >= limit and completed_ids
+                and not store.known_run_ids(completed_ids)):
+            runs = list_runs(BACKFILL_RUN_LIMIT)
+
+        stats = ingest_runs(store, runs, fetch_jobs=fetch_jobs, verbose=verbose)
+        if verbose:
+            print(f"Ingest: {stats}")
+
+        data["runs"] = store.recent_runs(RECENT_RUNS_IN_SUMMARY)
+        data.update(store.totals())
+        data["monthly_summaries"] = store.monthly_summaries()
+        data["last_ingest"] = stats
+        save_cost_data(data)
+        return data
+    finally:
+        if own_store:
+            store.close()
 
 
 def show_report() -> None:
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-# Modified: 2026-02-08T02:00:00Z | Author: Claude Opus 4.5 | Change: Create schematic dashboard API
+# Modified: 2026-10-17T09:00:00Z | Author: COPILOT | Change: Track the last render per connection, not per view
 """
 SLATE Schematic API - Dashboard Integration
 
@@ -29,7 +29,9 @@ from slate.schematic_sdk import (
     DatabaseNode,
     FlowConnector,
     DashedConnector,
-    generate_from_system_state,
+    SCHEMATIC_CACHE,
+    RenderedSchematic,
+    build_system_state_engine,
     generate_from_tech_tree,
 )
 from slate.schematic_sdk.library import (
@@ -51,6 +53,10 @@ from slate.schematic_sdk.exporters import (
 
 router = APIRouter(prefix="/api/schematic", tags=["schematic"])
 
+# WebSocket update modes: "full" sends the whole SVG every time, "incremental"
+# sends only changed node attributes while the schematic structure is unchanged
+UPDATE_MODES = ("full", "incremental")
+
 
 # ── Request/Response Models ──────────────────────────────────────────────────
 
@@ -170,7 +176,7 @@ async def get_system_state_schematic(
         Live system architecture diagram
     """
     try:
-        svg = generate_from_system_state()
+        svg = SCHEMATIC_CACHE.render(build_system_state_engine()).svg
 
         if format == "base64":
             return {
@@ -243,6 +249,29 @@ async def get_live_status_schematic(
     Returns:
         Schematic with status-colored nodes
     """
+    services = request.services or {}
+    svg = SCHEMATIC_CACHE.render(build_live_status_engine(services)).svg
+
+    return {
+        "svg": svg,
+        "title": "SLATE Live Status",
+        "width": 900,
+        "height": 500,
+        "format": "svg",
+        "services": services,
+    }
+
+
+def build_live_status_engine(services: Dict[str, str]) -> SchematicEngine:
+    """
+    Build (without rendering) the live status schematic.
+
+    Args:
+        services: service_id -> status (active, pending, error, inactive)
+
+    Returns:
+        SchematicEngine with status-colored nodes
+    """
     status_map = {
         "active": ComponentStatus.ACTIVE,
         "pending": ComponentStatus.PENDING,
@@ -259,9 +288,6 @@ async def get_live_status_schematic(
     )
     engine = SchematicEngine(config)
 
-    # Map service statuses
-    services = request.services or {}
-
     # Add core components with status
     engine.add_node(slate_dashboard(status_map.get(services.get("dashboard", "active"), ComponentStatus.ACTIVE)))
     engine.add_node(slate_ollama(status_map.get(services.get("ollama", "active"), ComponentStatus.ACTIVE)))
@@ -276,16 +302,7 @@ async def get_live_status_schematic(
     engine.add_connector(FlowConnector(id="c3", from_node="ollama", to_node="gpu-cluster", label="CUDA"))
     engine.add_connector(DashedConnector(id="c4", from_node="ollama", to_node="chromadb", label="RAG"))
 
-    svg = engine.render_svg()
-
-    return {
-        "svg": svg,
-        "title": "SLATE Live Status",
-        "width": 900,
-        "height": 500,
-        "format": "svg",
-        "services": services,
-    }
+    return engine
 
 
 # ── Custom Schematic Endpoints ───────────────────────────────────────────────
@@ -356,7 +373,7 @@ async def get_system_widget() -> Dict[str, Any]:
     Returns:
         HTML-ready schematic widget
     """
-    svg = generate_from_system_state()
+    svg = SCHEMATIC_CACHE.render(build_system_state_engine()).svg
 
     return {
         "html": f'''<div class="schematic-widget" data-type="system-architecture">
@@ -413,10 +430,19 @@ async def get_compact_widget(
 # ── WebSocket for Live Updates ───────────────────────────────────────────────
 
 class SchematicWebSocketManager:
-    """Manage WebSocket connections for live schematic updates."""
+    """
+    Manage WebSocket connections for live schematic updates.
+
+    Each client renders every schematic it receives into a single container,
+    so the manager remembers per connection the render that container holds;
+    incremental patches are diffed against it. Any message carrying a full
+    SVG that did not come from the render cache (broadcasts, templates)
+    replaces the container, and the connection's render is forgotten.
+    """
 
     def __init__(self):
         self.active_connections: List[WebSocket] = []
+        self.rendered: Dict[WebSocket, RenderedSchematic] = {}
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
@@ -425,11 +451,26 @@ class SchematicWebSocketManager:
     def disconnect(self, websocket: WebSocket):
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
+        self.rendered.pop(websocket, None)
+
+    def remember(self, websocket: WebSocket, rendered: Optional[RenderedSchematic]):
+        """Record the render the client now displays (None: not a cached render)."""
+        if rendered is None:
+            self.rendered.pop(websocket, None)
+        else:
+            self.rendered[websocket] = rendered
+
+    async def send(self, websocket: WebSocket, message: Dict[str, Any],
+                   rendered: Optional[RenderedSchematic] = None):
+        """Send a message, tracking the client's render when it replaces or patches the SVG."""
+        await websocket.send_json(message)
+        if message.get("type") == "schematic_patch" or "svg" in message:
+            self.remember(websocket, rendered)
 
     async def broadcast(self, message: Dict[str, Any]):
-        for connection in self.active_connections:
+        for connection in list(self.active_connections):
             try:
-                await connection.send_json(message)
+                await self.send(connection, message)
             except Exception:
                 pass
 
@@ -437,40 +478,76 @@ class SchematicWebSocketManager:
 ws_manager = SchematicWebSocketManager()
 
 
+def schematic_message(
+    view: str,
+    rendered: RenderedSchematic,
+    previous: Optional[RenderedSchematic] = None,
+    mode: str = "full",
+    **extra: Any,
+) -> Dict[str, Any]:
+    """
+    WebSocket message for a rendered schematic.
+
+    In incremental mode, when the client already holds a render of the same
+    structure, only the changed node attributes are sent (schematic_patch);
+    otherwise the full SVG (schematic_update).
+    """
+    nodes = rendered.diff(previous) if mode == "incremental" else None
+    if nodes is None:
+        message = {"type": "schematic_update", "svg": rendered.svg}
+    else:
+        message = {"type": "schematic_patch", "nodes": nodes}
+    message.update(view=view, key=rendered.key, **extra)
+    return message
+
+
 @router.websocket("/ws/live")
 async def schematic_websocket(websocket: WebSocket):
     """
     WebSocket endpoint for live schematic updates.
 
-    Broadcasts schematic updates when system state changes.
+    Broadcasts schematic updates when system state changes. Connect with
+    ?mode=incremental (or send {"type": "set_mode", "mode": "incremental"})
+    to receive schematic_patch messages instead of full SVGs while only
+    node statuses change.
     """
     await ws_manager.connect(websocket)
+    mode = websocket.query_params.get("mode", "full")
+    if mode not in UPDATE_MODES:
+        mode = "full"
     try:
         # Send initial schematic
-        svg = generate_from_system_state()
-        await websocket.send_json({
-            "type": "schematic_update",
-            "svg": svg,
-            "title": "SLATE System Architecture",
-        })
+        rendered = SCHEMATIC_CACHE.render(build_system_state_engine())
+        await ws_manager.send(websocket, schematic_message(
+            "system", rendered, title="SLATE System Architecture"), rendered)
 
         # Listen for client messages (status requests, etc.)
         while True:
             data = await websocket.receive_json()
 
-            if data.get("type") == "request_update":
-                svg = generate_from_system_state()
-                await websocket.send_json({
-                    "type": "schematic_update",
-                    "svg": svg,
-                    "timestamp": data.get("timestamp"),
-                })
+            if data.get("type") == "set_mode":
+                if data.get("mode") in UPDATE_MODES:
+                    mode = data["mode"]
+                await websocket.send_json({"type": "mode", "mode": mode})
+
+            elif data.get("type") == "request_update":
+                rendered = SCHEMATIC_CACHE.render(build_system_state_engine())
+                await ws_manager.send(websocket, schematic_message(
+                    "system", rendered, ws_manager.rendered.get(websocket), data.get("mode", mode),
+                    timestamp=data.get("timestamp")), rendered)
+
+            elif data.get("type") == "request_live_status":
+                services = data.get("services") or {}
+                rendered = SCHEMATIC_CACHE.render(build_live_status_engine(services))
+                await ws_manager.send(websocket, schematic_message(
+                    "live-status", rendered, ws_manager.rendered.get(websocket), data.get("mode", mode),
+                    services=services, timestamp=data.get("timestamp")), rendered)
 
             elif data.get("type") == "request_template":
                 template_id = data.get("template_id", "system")
                 if template_id in TEMPLATES:
                     svg = build_from_template(template_id)
-                    await websocket.send_json({
+                    await ws_manager.send(websocket, {
                         "type": "template_update",
                         "template_id": template_id,
                         "svg": svg,
@@ -577,12 +654,14 @@ class SchematicWidget {
     }
 
     connectWebSocket() {
-        this.ws = new WebSocket(`ws://${window.location.host}/api/schematic/ws/live`);
+        this.ws = new WebSocket(`ws://${window.location.host}/api/schematic/ws/live?mode=incremental`);
 
         this.ws.onmessage = (event) => {
             const data = JSON.parse(event.data);
             if (data.type === 'schematic_update') {
                 this.updateSchematic(data.svg);
+            } else if (data.type === 'schematic_patch') {
+                this.patchSchematic(data.nodes);
             }
         };
 
@@ -598,6 +677,20 @@ class SchematicWidget {
         }
     }
 
+    patchSchematic(nodes) {
+        Object.entries(nodes || {}).forEach(([id, attrs]) => {
+            const node = this.container.querySelector(`.component[data-id="${CSS.escape(id)}"]`);
+            if (!node) return;
+            if (attrs.status) node.setAttribute('data-status', attrs.status);
+            if (attrs.status_color) {
+                node.querySelectorAll('.status-indicator').forEach(el => el.setAttribute('fill', attrs.status_color));
+            }
+            if (attrs.border) {
+                node.querySelectorAll('.outline').forEach(el => el.setAttribute('stroke', attrs.border));
+            }
+        });
+    }
+
     requestUpdate() {
         if (this.ws && this.ws.readyState === WebSocket.OPEN) {
             this.ws.send(JSON.stringify({
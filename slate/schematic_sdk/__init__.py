@@ -90,6 +90,15 @@ from .engine import (
     generate_system_diagram,
     generate_from_tech_tree,
     generate_from_system_state,
+    build_system_state_engine,
+)
+
+# Modified: 2026-10-17T08:00:00Z | Author: COPILOT | Change: Export render cache
+from .render_cache import (
+    SCHEMATIC_CACHE,
+    RenderedSchematic,
+    SchematicRenderCache,
+    schematic_keys,
 )
 
 # Modified: 2026-02-08T01:25:00Z | Author: COPILOT | Change: Add library and exporter imports
@@ -185,6 +194,13 @@ __all__ = [
     "generate_system_diagram",
     "generate_from_tech_tree",
     "generate_from_system_state",
+    "build_system_state_engine",
+
+    # Render cache
+    "SCHEMATIC_CACHE",
+    "RenderedSchematic",
+    "SchematicRenderCache",
+    "schematic_keys",
 
     # Library
     "TEMPLATES",
@@ -1,4 +1,4 @@
-# Modified: 2026-02-08T01:05:00Z | Author: COPILOT | Change: Generalize hardcoded GPU references
+# Modified: 2026-10-17T08:00:00Z | Author: COPILOT | Change: Split system-state engine construction from rendering
 """
 SLATE Schematic SDK - Main Engine
 
@@ -317,12 +317,12 @@ def generate_from_tech_tree(tech_tree_path: str = ".slate_tech_tree/tech_tree.js
     return engine.render_svg()
 
 
-def generate_from_system_state() -> str:
+def build_system_state_engine() -> SchematicEngine:
     """
-    Generate schematic from current SLATE system state.
+    Build (without rendering) the SLATE system architecture schematic.
 
     Returns:
-        SVG string
+        SchematicEngine with nodes and connections added
     """
     config = SchematicConfig(
         title="SLATE System Architecture",
@@ -363,4 +363,14 @@ def generate_from_system_state() -> str:
     engine.add_connector(FlowConnector(id="c9", from_node="scheduler", to_node="gpu"))
     engine.add_connector(FlowConnector(id="c10", from_node="ollama", to_node="chroma"))
 
-    return engine.render_svg()
+    return engine
+
+
+def generate_from_system_state() -> str:
+    """
+    Generate schematic from current SLATE system state.
+
+    Returns:
+        SVG string
+    """
+    return build_system_state_engine().render_svg()
@@ -1,3 +1,4 @@
+# Modified: 2026-10-17T07:00:00Z | Author: COPILOT | Change: Vectorized force-directed layout with Barnes-Hut mode
 """
 SLATE Schematic SDK - Layout Algorithms
 
@@ -7,11 +8,22 @@ Part of SLATE Generative UI protocols.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, List, Literal, Tuple
+from typing import Dict, List, Literal, Optional, Tuple
 import math
 
 from .components import Component, Connection, SchematicConfig
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+BARNES_HUT_MIN_NODES = 500     # "auto" switches from exact pairwise repulsion to Barnes-Hut here
+BARNES_HUT_MAX_DEPTH = 12
+BARNES_HUT_TOLERANCE = 0.01    # px per iteration; Barnes-Hut runs stop once every node moves less
+
 
 @dataclass
 class LayoutResult:
@@ -136,6 +148,19 @@ class ForceDirectedLayout(LayoutEngine):
     """
     Force-directed layout uses physics simulation.
     Best for: Network diagrams, integration maps.
+
+    Methods:
+        exact       NumPy pairwise repulsion; same floating-point operations
+                    in the same order as the pure-Python loop, so positions
+                    are identical to it
+        barnes_hut  NumPy quadtree approximation (cells whose width/distance
+                    is below theta act as one body), O(n log n) per iteration
+        python      the original pure-Python loop (used when NumPy is missing)
+        auto        exact below BARNES_HUT_MIN_NODES nodes, Barnes-Hut above
+
+    A tolerance > 0 stops the simulation early once no node moves more than
+    tolerance px in an iteration (default: off for exact/python, which keeps
+    their output unchanged; BARNES_HUT_TOLERANCE for Barnes-Hut).
     """
 
     def __init__(
@@ -144,13 +169,30 @@ class ForceDirectedLayout(LayoutEngine):
         repulsion_strength: float = 500,
         attraction_strength: float = 0.1,
         center_gravity: float = 0.1,
-        damping: float = 0.9
+        damping: float = 0.9,
+        method: Literal["auto", "exact", "barnes_hut", "python"] = "auto",
+        theta: float = 0.6,
+        tolerance: Optional[float] = None,
     ):
         self.iterations = iterations
         self.repulsion_strength = repulsion_strength
         self.attraction_strength = attraction_strength
         self.center_gravity = center_gravity
         self.damping = damping
+        self.method = method
+        self.theta = theta
+        self.tolerance = tolerance
+        self.iterations_run = 0
+
+    def resolve_method(self, node_count: int) -> str:
+        """Method actually used for a graph of node_count nodes."""
+        if not NUMPY_AVAILABLE:
+            if self.method in ("exact", "barnes_hut"):
+                raise ImportError(f"numpy is required for the {self.method!r} layout method")
+            return "python"
+        if self.method == "auto":
+            return "barnes_hut" if node_count >= BARNES_HUT_MIN_NODES else "exact"
+        return self.method
 
     def calculate_positions(
         self,
@@ -171,7 +213,6 @@ class ForceDirectedLayout(LayoutEngine):
         radius = min(config.width, config.height) / 3
 
         positions: Dict[str, List[float]] = {}
-        velocities: Dict[str, List[float]] = {}
 
         for i, comp in enumerate(components):
             if comp.position:
@@ -181,13 +222,46 @@ class ForceDirectedLayout(LayoutEngine):
                 x = center_x + radius * math.cos(angle) * random.uniform(0.5, 1.0)
                 y = center_y + radius * math.sin(angle) * random.uniform(0.5, 1.0)
                 positions[comp.id] = [x, y]
-            velocities[comp.id] = [0.0, 0.0]
 
         # Build edge lookup
         edges = [(c.from_node, c.to_node) for c in connections]
 
+        method = self.resolve_method(len(positions))
+        tolerance = self.tolerance
+        if tolerance is None:
+            tolerance = BARNES_HUT_TOLERANCE if method == "barnes_hut" else 0.0
+        if method == "python":
+            self._simulate_python(components, edges, positions, config, tolerance)
+        else:
+            self._simulate_numpy(edges, positions, config, tolerance, method == "barnes_hut")
+
+        # Convert to tuples
+        result_positions = {k: (v[0], v[1]) for k, v in positions.items()}
+
+        # Calculate bounds
+        xs = [p[0] for p in result_positions.values()]
+        ys = [p[1] for p in result_positions.values()]
+        bounds = (min(xs), min(ys), max(xs), max(ys))
+
+        return LayoutResult(positions=result_positions, bounds=bounds)
+
+    def _simulate_python(
+        self,
+        components: List[Component],
+        edges: List[Tuple[str, str]],
+        positions: Dict[str, List[float]],
+        config: SchematicConfig,
+        tolerance: float,
+    ) -> None:
+        """Pure-Python simulation, updating positions in place."""
+        center_x = config.width / 2
+        center_y = config.height / 2
+        velocities: Dict[str, List[float]] = {comp.id: [0.0, 0.0] for comp in components}
+
         # Simulation loop
+        self.iterations_run = 0
         for _ in range(self.iterations):
+            self.iterations_run += 1
             forces: Dict[str, List[float]] = {c.id: [0.0, 0.0] for c in components}
 
             # Repulsion between all nodes
@@ -230,7 +304,9 @@ class ForceDirectedLayout(LayoutEngine):
                 forces[comp.id][1] += dy * self.center_gravity
 
             # Apply forces with damping
+            moved = 0.0
             for comp in components:
+                old_x, old_y = positions[comp.id]
                 velocities[comp.id][0] = (velocities[comp.id][0] + forces[comp.id][0]) * self.damping
                 velocities[comp.id][1] = (velocities[comp.id][1] + forces[comp.id][1]) * self.damping
                 positions[comp.id][0] += velocities[comp.id][0]
@@ -240,16 +316,178 @@ class ForceDirectedLayout(LayoutEngine):
                 padding = config.padding + 50
                 positions[comp.id][0] = max(padding, min(config.width - padding, positions[comp.id][0]))
                 positions[comp.id][1] = max(padding, min(config.height - padding, positions[comp.id][1]))
+                moved = max(moved, abs(positions[comp.id][0] - old_x), abs(positions[comp.id][1] - old_y))
 
-        # Convert to tuples
-        result_positions = {k: (v[0], v[1]) for k, v in positions.items()}
+            if moved < tolerance:
+                break
 
-        # Calculate bounds
-        xs = [p[0] for p in result_positions.values()]
-        ys = [p[1] for p in result_positions.values()]
-        bounds = (min(xs), min(ys), max(xs), max(ys))
+    def _simulate_numpy(
+        self,
+        edges: List[Tuple[str, str]],
+        positions: Dict[str, List[float]],
+        config: SchematicConfig,
+        tolerance: float,
+        barnes_hut: bool,
+    ) -> None:
+        """Vectorized simulation, updating positions in place."""
+        ids = list(positions)
+        index = {node_id: i for i, node_id in enumerate(ids)}
+        pos = np.array([positions[node_id] for node_id in ids], dtype=np.float64)
+        vel = np.zeros_like(pos)
+        center = np.array([config.width / 2, config.height / 2])
+
+        # Edge endpoints interleaved (from, to, from, to, ...) so np.add.at
+        # accumulates in the same order as the per-edge loop
+        known = [(index[a], index[b]) for a, b in edges if a in index and b in index]
+        edge_from = np.array([a for a, _ in known], dtype=np.intp)
+        edge_to = np.array([b for _, b in known], dtype=np.intp)
+        edge_nodes = np.empty(2 * len(known), dtype=np.intp)
+        edge_nodes[0::2] = edge_from
+        edge_nodes[1::2] = edge_to
+        edge_forces = np.empty((2 * len(known), 2))
+
+        padding = config.padding + 50
+        low = np.array([padding, padding], dtype=np.float64)
+        high = np.array([config.width - padding, config.height - padding], dtype=np.float64)
+        repulsion = self._repulsion_barnes_hut if barnes_hut else self._repulsion_exact
+
+        self.iterations_run = 0
+        for _ in range(self.iterations):
+            self.iterations_run += 1
+            forces = repulsion(pos)
 
-        return LayoutResult(positions=result_positions, bounds=bounds)
+            # Attraction along edges
+            if len(known):
+                delta = pos[edge_to] - pos[edge_from]
+                dist = np.sqrt(delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1]) + 0.01
+                pull = (dist * self.attraction_strength)[:, None] * delta / dist[:, None]
+                edge_forces[0::2] = pull
+                edge_forces[1::2] = -pull
+                np.add.at(forces, edge_nodes, edge_forces)
+
+            # Center gravity
+            forces += (center - pos) * self.center_gravity
+
+            # Apply forces with damping, constrain to bounds
+            vel = (vel + forces) * self.damping
+            moved_to = np.maximum(low, np.minimum(high, pos + vel))
+            moved = float(np.abs(moved_to - pos).max())
+            pos = moved_to
+            if moved < tolerance:
+                break
+
+        for node_id, (x, y) in zip(ids, pos.tolist()):
+            positions[node_id] = [x, y]
+
+    def _repulsion_exact(self, pos: "np.ndarray") -> "np.ndarray":
+        """All-pairs repulsion; each node's terms are summed in index order like the Python loop."""
+        # Row j, column m holds the push of node j on node m. Reducing over
+        # the outer axis adds whole rows one after another, i.e. a strict
+        # left-to-right sum per node; the zero self-term changes nothing.
+        dx = pos[None, :, 0] - pos[:, None, 0]
+        dy = pos[None, :, 1] - pos[:, None, 1]
+        dist = dx * dx
+        dist += dy * dy
+        np.sqrt(dist, out=dist)
+        dist += 0.01
+        force = dist * dist
+        np.divide(self.repulsion_strength, force, out=force)
+        dx *= force
+        dx /= dist
+        dy *= force
+        dy /= dist
+        return np.stack([dx.sum(axis=0), dy.sum(axis=0)], axis=1)
+
+    def _repulsion_barnes_hut(self, pos: "np.ndarray") -> "np.ndarray":
+        """
+        Barnes-Hut repulsion over a quadtree built level by level.
+
+        Every (node, cell) pair of the current level is handled at once: a
+        cell is accepted as a single body at its centroid when it holds one
+        other node or width / distance < theta, otherwise its children are
+        examined at the next level. Cells at the deepest level always act as
+        one body (minus the node itself).
+        """
+        n = len(pos)
+        x, y = pos[:, 0], pos[:, 1]
+        x0, y0 = x.min(), y.min()
+        size = max(x.max() - x0, y.max() - y0, 1e-9) * (1 + 1e-9)
+        depth = max(1, min(BARNES_HUT_MAX_DEPTH, math.ceil(math.log2(max(n, 2)) / 2) + 2))
+
+        # Per level: cell of every node, node count, coordinate sums, children (CSR)
+        levels = []
+        for level in range(depth + 1):
+            k = 1 << level
+            ix = np.minimum(((x - x0) / size * k).astype(np.int64), k - 1)
+            iy = np.minimum(((y - y0) / size * k).astype(np.int64), k - 1)
+            _, node_cell, counts = np.unique(ix * k + iy, return_inverse=True, return_counts=True)
+            node_cell = node_cell.reshape(-1)
+            levels.append({
+                "node_cell": node_cell,
+                "counts": counts,
+                "sum_x": np.bincount(node_cell, weights=x, minlength=len(counts)),
+                "sum_y": np.bincount(node_cell, weights=y, minlength=len(counts)),
+                "width": size / k,
+            })
+        for level in range(depth):
+            parent = np.empty(len(levels[level + 1]["counts"]), dtype=np.intp)
+            parent[levels[level + 1]["node_cell"]] = levels[level]["node_cell"]
+            order = np.argsort(parent, kind="stable")
+            child_counts = np.bincount(parent, minlength=len(levels[level]["counts"]))
+            levels[level]["children"] = order
+            levels[level]["child_start"] = np.cumsum(child_counts) - child_counts
+            levels[level]["child_count"] = child_counts
+
+        fx = np.zeros(n)
+        fy = np.zeros(n)
+        pair_node = np.arange(n)
+        pair_cell = np.zeros(n, dtype=np.intp)
+        for level in range(depth + 1):
+            info = levels[level]
+            counts = info["counts"][pair_cell]
+            inside = info["node_cell"][pair_node] == pair_cell
+            mass = counts.astype(np.float64)
+            sum_x = info["sum_x"][pair_cell]
+            sum_y = info["sum_y"][pair_cell]
+            if level == depth:
+                accept = mass > inside  # drop cells holding only the node itself
+                own = inside & accept
+                sum_x = np.where(own, sum_x - x[pair_node], sum_x)
+                sum_y = np.where(own, sum_y - y[pair_node], sum_y)
+                mass = mass - inside
+            else:
+                keep = ~(inside & (counts == 1))
+                pair_node, pair_cell = pair_node[keep], pair_cell[keep]
+                counts, inside, mass = counts[keep], inside[keep], mass[keep]
+                sum_x, sum_y = sum_x[keep], sum_y[keep]
+                dx = sum_x / mass - x[pair_node]
+                dy = sum_y / mass - y[pair_node]
+                dist = np.sqrt(dx * dx + dy * dy) + 0.01
+                accept = ~inside & ((counts == 1) | (info["width"] < self.theta * dist))
+
+            node = pair_node[accept]
+            m = mass[accept]
+            dx = sum_x[accept] / m - x[node]
+            dy = sum_y[accept] / m - y[node]
+            dist = np.sqrt(dx * dx + dy * dy) + 0.01
+            force = self.repulsion_strength * m / (dist * dist)
+            fx -= np.bincount(node, weights=force * dx / dist, minlength=n)
+            fy -= np.bincount(node, weights=force * dy / dist, minlength=n)
+
+            if level == depth:
+                break
+            # Open the rejected cells: one pair per (node, child cell)
+            open_node, open_cell = pair_node[~accept], pair_cell[~accept]
+            fanout = info["child_count"][open_cell]
+            total = int(fanout.sum())
+            if not total:
+                break
+            first = np.repeat(info["child_start"][open_cell], fanout)
+            offset = np.arange(total) - np.repeat(np.cumsum(fanout) - fanout, fanout)
+            pair_node = np.repeat(open_node, fanout)
+            pair_cell = info["children"][first + offset]
+
+        return np.stack([fx, fy], axis=1)
 
 
 class GridLayout(LayoutEngine):
@@ -0,0 +1,180 @@
+# Modified: 2026-10-17T08:00:00Z | Author: COPILOT | Change: Render cache and status diffs for live schematics
+"""
+SLATE Schematic SDK - Render Cache
+
+Live views (dashboard WebSocket, /live-status) rebuild the same schematic
+over and over and usually only component statuses change. The cache keys
+every build three ways:
+
+- layout key     components (minus status), connections, layout engine
+                 and its parameters, canvas size: positions are reused
+                 whenever it matches, whatever the statuses or theme
+- structure key  layout key + theme, config and annotations: everything
+                 that is rendered except the component statuses
+- render key     structure key + statuses: the finished SVG is reused
+
+Two renders with the same structure key differ only in status-derived node
+attributes, so RenderedSchematic.diff() can describe an update as a small
+per-node patch instead of a new SVG document.
+Part of SLATE Generative UI protocols.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from inspect import signature
+from typing import Any, Dict, Optional, Tuple
+
+from .engine import SchematicEngine
+
+SCHEMATIC_CACHE_SIZE = 32
+
+
+def _digest(*parts: Any) -> str:
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def _layout_params(engine: SchematicEngine) -> Dict[str, Any]:
+    """Constructor parameters of the engine's layout algorithm, as currently set."""
+    layout = engine.layout_engine
+    params = signature(type(layout).__init__).parameters
+    return {name: getattr(layout, name, None) for name in params if name != "self"}
+
+
+def schematic_keys(engine: SchematicEngine) -> Tuple[str, str, str]:
+    """(layout key, structure key, render key) for the engine's current contents."""
+    config = engine.config
+    components = []
+    statuses = []
+    for comp in engine.components:
+        state = asdict(comp)
+        statuses.append(state.pop("status"))
+        components.append(state)
+    layout_key = _digest(
+        type(engine.layout_engine).__name__,
+        _layout_params(engine),
+        [config.width, config.height, config.padding],
+        components,
+        [(c.id, c.from_node, c.to_node) for c in engine.connections],
+        engine.positions,
+    )
+    structure_key = _digest(
+        layout_key,
+        engine.theme_manager.theme_name,
+        asdict(config),
+        [asdict(c) for c in engine.connections],
+        [asdict(a) for a in engine.annotations],
+    )
+    return layout_key, structure_key, _digest(structure_key, statuses)
+
+
+def node_attributes(engine: SchematicEngine) -> Dict[str, Dict[str, str]]:
+    """Status-dependent SVG attributes per rendered component."""
+    tm = engine.theme_manager
+    nodes = {}
+    for comp in engine.components:
+        if comp.id not in engine.positions:
+            continue
+        status = comp.status.value
+        nodes[comp.id] = {
+            "status": status,
+            "status_color": tm.get_status_color(status),
+            "border": tm.get_component_border(comp.type.value, status),
+        }
+    return nodes
+
+
+@dataclass
+class RenderedSchematic:
+    """A rendered SVG and the keys/attributes needed to diff later renders against it."""
+    svg: str
+    key: str
+    structure_key: str
+    nodes: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+    def diff(self, previous: Optional["RenderedSchematic"]) -> Optional[Dict[str, Dict[str, str]]]:
+        """
+        Node attributes that changed since previous.
+
+        Returns None when previous is missing or differs in anything besides
+        statuses (the client needs the full SVG), {} when nothing changed.
+        """
+        if previous is None or previous.structure_key != self.structure_key:
+            return None
+        changes = {}
+        for node_id, attrs in self.nodes.items():
+            before = previous.nodes.get(node_id, {})
+            changed = {name: value for name, value in attrs.items() if before.get(name) != value}
+            if changed:
+                changes[node_id] = changed
+        return changes
+
+
+class SchematicRenderCache:
+    """
+    LRU cache of layouts and rendered SVGs, safe to share between threads.
+
+    Usage:
+        cache = SchematicRenderCache()
+        rendered = cache.render(engine)       # RenderedSchematic
+        patch = rendered.diff(last_sent)      # None -> send rendered.svg
+    """
+
+    def __init__(self, max_entries: int = SCHEMATIC_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._layouts: "OrderedDict[str, Dict[str, tuple]]" = OrderedDict()
+        self._renders: "OrderedDict[str, RenderedSchematic]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"render_hits": 0, "layout_hits": 0, "layouts": 0, "renders": 0}
+
+    def _remember(self, table: OrderedDict, key: str, value: Any) -> None:
+        table[key] = value
+        table.move_to_end(key)
+        while len(table) > self.max_entries:
+            table.popitem(last=False)
+
+    def render(self, engine: SchematicEngine) -> RenderedSchematic:
+        """Render the engine, reusing a cached SVG or layout when its keys match."""
+        layout_key, structure_key, key = schematic_keys(engine)
+        with self._lock:
+            rendered = self._renders.get(key)
+            if rendered is not None:
+                self._renders.move_to_end(key)
+                self.stats["render_hits"] += 1
+                return rendered
+            positions = self._layouts.get(layout_key)
+            if positions is not None:
+                self._layouts.move_to_end(layout_key)
+                self.stats["layout_hits"] += 1
+
+        if positions is not None:
+            engine.positions = dict(positions)
+        else:
+            if not engine.positions and engine.components:
+                engine.apply_layout()
+            with self._lock:
+                self._remember(self._layouts, layout_key, dict(engine.positions))
+                self.stats["layouts"] += 1
+
+        rendered = RenderedSchematic(
+            svg=engine.render_svg(),
+            key=key,
+            structure_key=structure_key,
+            nodes=node_attributes(engine),
+        )
+        with self._lock:
+            self._remember(self._renders, key, rendered)
+            self.stats["renders"] += 1
+        return rendered
+
+    def clear(self) -> None:
+        with self._lock:
+            self._layouts.clear()
+            self._renders.clear()
+
+
+# Shared by the dashboard API and live views
+SCHEMATIC_CACHE = SchematicRenderCache()
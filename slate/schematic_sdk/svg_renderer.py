@@ -1,3 +1,4 @@
+# Modified: 2026-10-17T08:00:00Z | Author: COPILOT | Change: Mark status-dependent SVG attributes for incremental updates
 """
 SLATE Schematic SDK - SVG Renderer
 
@@ -197,7 +198,7 @@ class SVGRenderer:
 
         # Status indicator
         indicator = f'''
-      <circle cx="{rx + 12}" cy="{ry + 12}" r="5" fill="{status_color}"/>'''
+      <circle class="status-indicator" cx="{rx + 12}" cy="{ry + 12}" r="5" fill="{status_color}"/>'''
 
         # AI icon for AI nodes
         icon = ""
@@ -206,9 +207,9 @@ class SVGRenderer:
       <text x="{rx + width - 15}" y="{ry + 18}" font-family="{t.font_display}" font-size="14" fill="{c.primary}">&#129504;</text>'''
 
         return f'''
-    <g class="component" data-id="{comp.id}" data-type="{comp.type.value}">
+    <g class="component" data-id="{comp.id}" data-type="{comp.type.value}" data-status="{comp.status.value}">
       <rect x="{rx}" y="{ry}" width="{width}" height="{height}"
-            rx="{e.radius_md}" fill="{fill}" stroke="{border}" stroke-width="2"/>
+            rx="{e.radius_md}" class="outline" fill="{fill}" stroke="{border}" stroke-width="2"/>
       {indicator}{icon}
       <text x="{x}" y="{y - 2}" text-anchor="middle"
             font-family="{t.font_display}" font-size="{t.label_size}" font-weight="{t.weight_semibold}"
@@ -230,18 +231,18 @@ class SVGRenderer:
         ellipse_ry = 10
 
         return f'''
-    <g class="component" data-id="{comp.id}" data-type="database">
+    <g class="component" data-id="{comp.id}" data-type="database" data-status="{comp.status.value}">
       <!-- Cylinder body -->
       <path d="M {rx} {ry + ellipse_ry}
                L {rx} {ry + height - ellipse_ry}
                A {width/2} {ellipse_ry} 0 0 0 {rx + width} {ry + height - ellipse_ry}
                L {rx + width} {ry + ellipse_ry}
                A {width/2} {ellipse_ry} 0 0 0 {rx} {ry + ellipse_ry}"
-            fill="{fill}" stroke="{border}" stroke-width="2"/>
+            class="outline" fill="{fill}" stroke="{border}" stroke-width="2"/>
       <!-- Top ellipse -->
       <ellipse cx="{x}" cy="{ry + ellipse_ry}" rx="{width/2}" ry="{ellipse_ry}"
-               fill="{fill}" stroke="{border}" stroke-width="2"/>
-      <circle cx="{rx + 12}" cy="{ry + ellipse_ry + 8}" r="4" fill="{status_color}"/>
+               class="outline" fill="{fill}" stroke="{border}" stroke-width="2"/>
+      <circle class="status-indicator" cx="{rx + 12}" cy="{ry + ellipse_ry + 8}" r="4" fill="{status_color}"/>
       <text x="{x}" y="{y + 5}" text-anchor="middle"
             font-family="{t.font_display}" font-size="{t.label_size}" font-weight="{t.weight_semibold}"
             fill="{c.text_primary}">{html.escape(comp.label)}</text>
@@ -264,9 +265,9 @@ class SVGRenderer:
         points = f"{x - hw + indent},{y - hh} {x + hw - indent},{y - hh} {x + hw},{y} {x + hw - indent},{y + hh} {x - hw + indent},{y + hh} {x - hw},{y}"
 
         return f'''
-    <g class="component" data-id="{comp.id}" data-type="gpu">
-      <polygon points="{points}" fill="{fill}" stroke="{border}" stroke-width="2"/>
-      <circle cx="{x - hw + indent + 10}" cy="{y - hh + 12}" r="4" fill="{status_color}"/>
+    <g class="component" data-id="{comp.id}" data-type="gpu" data-status="{comp.status.value}">
+      <polygon points="{points}" class="outline" fill="{fill}" stroke="{border}" stroke-width="2"/>
+      <circle class="status-indicator" cx="{x - hw + indent + 10}" cy="{y - hh + 12}" r="4" fill="{status_color}"/>
       <text x="{x}" y="{y - 2}" text-anchor="middle"
             font-family="{t.font_display}" font-size="{t.label_size}" font-weight="{t.weight_semibold}"
             fill="{c.text_primary}">{html.escape(comp.label)}</text>
@@ -288,9 +289,9 @@ class SVGRenderer:
         points = f"{x - hw + skew},{y - hh} {x + hw + skew},{y - hh} {x + hw - skew},{y + hh} {x - hw - skew},{y + hh}"
 
         return f'''
-    <g class="component" data-id="{comp.id}" data-type="queue">
-      <polygon points="{points}" fill="{fill}" stroke="{border}" stroke-width="2"/>
-      <circle cx="{x - hw + skew + 10}" cy="{y - hh + 10}" r="4" fill="{status_color}"/>
+    <g class="component" data-id="{comp.id}" data-type="queue" data-status="{comp.status.value}">
+      <polygon points="{points}" class="outline" fill="{fill}" stroke="{border}" stroke-width="2"/>
+      <circle class="status-indicator" cx="{x - hw + skew + 10}" cy="{y - hh + 10}" r="4" fill="{status_color}"/>
       <text x="{x}" y="{y + 4}" text-anchor="middle"
             font-family="{t.font_display}" font-size="{t.label_size}" font-weight="{t.weight_semibold}"
             fill="{c.text_primary}">{html.escape(comp.label)}</text>
@@ -308,10 +309,10 @@ class SVGRenderer:
         ry = y - height / 2
 
         return f'''
-    <g class="component" data-id="{comp.id}" data-type="external">
+    <g class="component" data-id="{comp.id}" data-type="external" data-status="{comp.status.value}">
       <rect x="{rx}" y="{ry}" width="{width}" height="{height}"
             rx="{e.radius_md}" fill="none" stroke="{c.text_muted}" stroke-width="2" stroke-dasharray="5,5"/>
-      <circle cx="{rx + 12}" cy="{ry + 12}" r="4" fill="{status_color}"/>
+      <circle class="status-indicator" cx="{rx + 12}" cy="{ry + 12}" r="4" fill="{status_color}"/>
       <text x="{x}" y="{y}" text-anchor="middle"
             font-family="{t.font_display}" font-size="{t.label_size}" font-weight="{t.weight_semibold}"
             fill="{c.text_secondary}">{html.escape(comp.label)}</text>
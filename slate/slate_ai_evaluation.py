@@ -38,7 +38,6 @@ import subprocess
 import sys
 import statistics
 import time
-import urllib.request
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from pathlib import Path
@@ -48,6 +47,8 @@ from typing import Any, Optional
 WORKSPACE_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(WORKSPACE_ROOT))
 
+from slate.ollama_http import get_ollama_http  # noqa: E402
+
 if sys.platform == "win32":
     sys.stdout.reconfigure(encoding="utf-8", errors="replace")
     sys.stderr.reconfigure(encoding="utf-8", errors="replace")
@@ -191,22 +192,16 @@ class RegressionAlert:
 def _query_ollama(model: str, prompt: str, system: str = "",
                   temperature: float = 0.3, max_tokens: int = 512) -> dict:
     """Query Ollama and return raw response with timing."""
-    payload = json.dumps({
+    # Modified: 2026-10-16T14:00:00Z | Author: COPILOT | Change: Shared pooled keep-alive client
+    payload = {
         "model": model,
         "prompt": prompt,
         "system": system,
         "stream": False,
         "options": {"temperature": temperature, "num_predict": max_tokens},
-    }).encode()
-    req = urllib.request.Request(
-        f"{OLLAMA_URL}/api/generate",
-        data=payload,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
+    }
     start = time.time()
-    with urllib.request.urlopen(req, timeout=120) as resp:
-        data = json.loads(resp.read())
+    data = get_ollama_http(OLLAMA_URL).request("/api/generate", payload, timeout=120)
     elapsed = time.time() - start
     data["_elapsed"] = elapsed
     return data
@@ -215,9 +210,7 @@ def _query_ollama(model: str, prompt: str, system: str = "",
 def _get_available_models() -> list[str]:
     """Get list of available Ollama models."""
     try:
-        req = urllib.request.Request(f"{OLLAMA_URL}/api/tags", method="GET")
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            data = json.loads(resp.read())
+        data = get_ollama_http(OLLAMA_URL).request("/api/tags", timeout=5, retries=0)
         return [m.get("name", "") for m in data.get("models", [])]
     except Exception:
         return []
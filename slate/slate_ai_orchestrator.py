@@ -36,6 +36,8 @@ import hashlib
 WORKSPACE_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(WORKSPACE_ROOT))
 
+from slate.ollama_http import get_ollama_http  # noqa: E402
+
 # Configuration
 OLLAMA_URL = "http://127.0.0.1:11434"
 MODELS = {
@@ -63,51 +65,38 @@ class AITask:
 class OllamaClient:
     """Client for Ollama API."""
 
+    # Modified: 2026-10-16T14:00:00Z | Author: COPILOT | Change: HTTP API over the shared pooled client instead of spawning the ollama CLI per call
     def __init__(self):
         self.base_url = OLLAMA_URL
+        self._http = get_ollama_http(self.base_url)
         self.available = self._check_available()
         self.loaded_models = set()
 
     def _check_available(self) -> bool:
-        try:
-            result = subprocess.run(
-                ["ollama", "list"],
-                capture_output=True, text=True, timeout=10
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
+        return self._http.is_running(timeout=3)
 
     def list_models(self) -> List[str]:
         """List available models."""
         try:
-            result = subprocess.run(
-                ["ollama", "list"],
-                capture_output=True, text=True, timeout=10
-            )
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')[1:]  # Skip header
-                return [line.split()[0] for line in lines if line.strip()]
+            data = self._http.request("/api/tags", timeout=10, retries=0)
+            return [m.get("name", "") for m in data.get("models", []) if m.get("name")]
         except Exception:
-            pass
-        return []
+            return []
 
     def generate(self, model: str, prompt: str, system: str = "", timeout: int = 120) -> str:
         """Generate response from model."""
         if not self.available:
             return "[Ollama not available]"
 
-        full_prompt = f"{system}\n\n{prompt}" if system else prompt
+        data = {"model": model, "prompt": prompt, "stream": False, "keep_alive": "24h"}
+        if system:
+            data["system"] = system
 
         try:
-            result = subprocess.run(
-                ["ollama", "run", model, full_prompt],
-                capture_output=True, text=True, timeout=timeout
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-            return f"[Error: {result.stderr}]"
-        except subprocess.TimeoutExpired:
+            result = self._http.request("/api/generate", data, timeout=timeout)
+            self.loaded_models.add(model)
+            return result.get("response", "").strip()
+        except TimeoutError:
             return "[Timeout]"
         except Exception as e:
             return f"[Error: {e}]"
@@ -115,17 +104,14 @@ class OllamaClient:
     def warmup(self, model: str) -> bool:
         """Warmup a model by loading it."""
         try:
-            # Simple prompt to load model into memory
-            result = subprocess.run(
-                ["ollama", "run", model, "Hello"],
-                capture_output=True, text=True, timeout=60
-            )
-            if result.returncode == 0:
-                self.loaded_models.add(model)
-                return True
+            # Empty prompt loads the model into memory without generating
+            self._http.request("/api/generate",
+                               {"model": model, "prompt": "", "keep_alive": "24h", "stream": False},
+                               timeout=60)
+            self.loaded_models.add(model)
+            return True
         except Exception:
-            pass
-        return False
+            return False
 
 
 class CodebaseAnalyzer:
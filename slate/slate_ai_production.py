@@ -37,7 +37,6 @@ import os
 import subprocess
 import sys
 import time
-import urllib.request
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
@@ -47,6 +46,8 @@ from typing import Any, Optional
 WORKSPACE_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(WORKSPACE_ROOT))
 
+from slate.ollama_http import get_ollama_http  # noqa: E402
+
 if sys.platform == "win32":
     sys.stdout.reconfigure(encoding="utf-8", errors="replace")
     sys.stderr.reconfigure(encoding="utf-8", errors="replace")
@@ -193,21 +194,15 @@ def _get_gpu_info() -> list[dict]:
 
 def _query_ollama_health(model: str) -> dict:
     """Quick health query to Ollama."""
-    payload = json.dumps({
+    # Modified: 2026-10-16T14:00:00Z | Author: COPILOT | Change: Shared pooled keep-alive client
+    payload = {
         "model": model,
         "prompt": "Reply with OK",
         "stream": False,
         "options": {"temperature": 0.1, "num_predict": 5},
-    }).encode()
-    req = urllib.request.Request(
-        f"{OLLAMA_URL}/api/generate",
-        data=payload,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
+    }
     start = time.time()
-    with urllib.request.urlopen(req, timeout=60) as resp:
-        data = json.loads(resp.read())
+    data = get_ollama_http(OLLAMA_URL).request("/api/generate", payload, timeout=60)
     elapsed = time.time() - start
     data["_elapsed"] = elapsed
     return data
@@ -216,9 +211,7 @@ def _query_ollama_health(model: str) -> dict:
 def _get_ollama_models() -> list[str]:
     """Get available Ollama models."""
     try:
-        req = urllib.request.Request(f"{OLLAMA_URL}/api/tags", method="GET")
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            data = json.loads(resp.read())
+        data = get_ollama_http(OLLAMA_URL).request("/api/tags", timeout=5, retries=0)
         return [m.get("name", "") for m in data.get("models", [])]
     except Exception:
         return []
@@ -227,9 +220,7 @@ def _get_ollama_models() -> list[str]:
 def _get_running_models() -> list[dict]:
     """Get currently loaded models in Ollama."""
     try:
-        req = urllib.request.Request(f"{OLLAMA_URL}/api/ps", method="GET")
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            data = json.loads(resp.read())
+        data = get_ollama_http(OLLAMA_URL).request("/api/ps", timeout=5, retries=0)
         return data.get("models", [])
     except Exception:
         return []
@@ -508,9 +499,7 @@ class ReadinessAssessor:
 
         # 1. Ollama service
         try:
-            req = urllib.request.Request(f"{OLLAMA_URL}/api/tags", method="GET")
-            with urllib.request.urlopen(req, timeout=5) as resp:
-                data = json.loads(resp.read())
+            data = get_ollama_http(OLLAMA_URL).request("/api/tags", timeout=5, retries=0)
             model_count = len(data.get("models", []))
             checks.append(ReadinessCheck("ollama_service", True,
                                          f"Ollama running with {model_count} models"))
@@ -666,21 +655,14 @@ class ProductionManager:
             try:
                 start = time.time()
                 # Send a keepalive request to load the model
-                payload = json.dumps({
+                payload = {
                     "model": model,
                     "prompt": "warmup",
                     "stream": False,
                     "keep_alive": "24h",
                     "options": {"num_predict": 1},
-                }).encode()
-                req = urllib.request.Request(
-                    f"{OLLAMA_URL}/api/generate",
-                    data=payload,
-                    headers={"Content-Type": "application/json"},
-                    method="POST",
-                )
-                with urllib.request.urlopen(req, timeout=120) as resp:
-                    data = json.loads(resp.read())
+                }
+                get_ollama_http(OLLAMA_URL).request("/api/generate", payload, timeout=120)
                 elapsed = time.time() - start
                 results[model] = {
                     "status": "warmed",
@@ -14,12 +14,21 @@ Features:
 - Batch processing for similar task types
 - Dependency-aware sequencing
 - Rate limiting to prevent GPU memory exhaustion
+- Parallel execution: one worker pool per GPU (max_concurrent slots each),
+  dependencies tracked as a DAG with in-degree counters, and ready tasks
+  grouped by model so slots keep reusing resident models
+- Queue persistence as an append-only event log (task_queue_store): each
+  transition is one appended line, compacted into the queue file periodically
+- Model-affinity schedule mode: orders the queue into same-model batches
+  starting from the models Ollama already has loaded, prices each load by
+  MODEL_VRAM and reports swaps and load time (see slate_schedule_simulator.py)
 
 Usage:
     python slate/slate_ai_scheduler.py --status          # Show scheduler status
     python slate/slate_ai_scheduler.py --queue           # View task queue
     python slate/slate_ai_scheduler.py --run             # Run scheduled tasks
     python slate/slate_ai_scheduler.py --schedule        # Generate optimal schedule
+    python slate/slate_ai_scheduler.py --schedule --mode affinity  # Batch by resident model
     python slate/slate_ai_scheduler.py --add "task"      # Add task to queue
 """
 
@@ -29,18 +38,22 @@ import subprocess
 import sys
 import time
 import threading
-import urllib.request
+from collections import OrderedDict, defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from queue import PriorityQueue
 import heapq
 
 WORKSPACE_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(WORKSPACE_ROOT))
 
+from slate.ollama_http import get_ollama_http  # noqa: E402
+from slate.task_queue_store import TaskQueueStore  # noqa: E402
+
 if sys.platform == "win32":
     sys.stdout.reconfigure(encoding="utf-8", errors="replace")
     sys.stderr.reconfigure(encoding="utf-8", errors="replace")
@@ -128,6 +141,19 @@ MEMORY_THRESHOLDS = {
     "critical": 0.90, # 90% - pause new tasks
 }
 
+# Modified: 2026-10-16T22:00:00Z | Author: COPILOT | Change: Parallel executor tuning
+# A ready task whose model is already resident on a free GPU is treated as
+# this many priority levels more urgent, so slots batch same-model work
+# instead of reloading models, without starving much higher-priority tasks.
+MODEL_AFFINITY_BONUS = 3
+HEALTH_REFRESH_S = 5.0   # seconds between nvidia-smi health checks while dispatching
+
+# Modified: 2026-10-16T23:00:00Z | Author: COPILOT | Change: Model swap pricing for affinity scheduling
+DEFAULT_MODEL_VRAM_MB = 5000
+MODEL_LOAD_BASE_S = 1.0        # fixed cost of an Ollama model load (process + context setup)
+MODEL_LOAD_MB_PER_S = 2000.0   # weights streamed from disk into VRAM
+MODELS_CACHE_TTL_S = 30.0      # reuse /api/tags results this long between tasks
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # DATA CLASSES
@@ -227,6 +253,131 @@ class GPUHealthStatus:
         return self.health_state in ("healthy", "caution")
 
 
+# ═══════════════════════════════════════════════════════════════════════
+# MODEL RESIDENCY
+# ═══════════════════════════════════════════════════════════════════════
+
+def model_vram(model: Optional[str]) -> int:
+    """Approximate VRAM (MB) a model occupies once loaded."""
+    return MODEL_VRAM.get(model, DEFAULT_MODEL_VRAM_MB)
+
+
+def model_load_seconds(model: Optional[str]) -> float:
+    """Estimated time lost to loading a model that is not resident."""
+    return round(MODEL_LOAD_BASE_S + model_vram(model) / MODEL_LOAD_MB_PER_S, 3)
+
+
+def best_model(task_type: str, available_models: list[str]) -> Optional[str]:
+    """Preferred installed model for a task type (TASK_MODELS order, then any model)."""
+    for model in TASK_MODELS.get(task_type, ["mistral-nemo"]):
+        if model in available_models:
+            return model
+    return available_models[0] if available_models else None
+
+
+class ModelResidency:
+    """
+    Which models are loaded, bounded by a VRAM budget, evicted least recently used.
+
+    load() returns the priced cost of using a model next: zero for a hit,
+    model_load_seconds() plus any evictions for a swap.
+    """
+
+    def __init__(self, budget_mb: int, resident: Optional[list[str]] = None):
+        self.budget_mb = budget_mb
+        self.models: OrderedDict[str, int] = OrderedDict()  # oldest first
+        self.hits = 0
+        self.swaps = 0
+        self.evictions = 0
+        self.load_s = 0.0
+        for model in resident or []:
+            self._insert(model)
+
+    def __contains__(self, model: str) -> bool:
+        return model in self.models
+
+    def _insert(self, model: str) -> list[str]:
+        evicted = []
+        need = model_vram(model)
+        while self.models and sum(self.models.values()) + need > self.budget_mb:
+            evicted.append(self.models.popitem(last=False)[0])
+        self.models[model] = need
+        return evicted
+
+    def load(self, model: str) -> tuple[float, list[str]]:
+        """Use a model: (load seconds, evicted models)."""
+        if model in self.models:
+            self.models.move_to_end(model)
+            self.hits += 1
+            return 0.0, []
+        evicted = self._insert(model)
+        cost = model_load_seconds(model)
+        self.swaps += 1
+        self.evictions += len(evicted)
+        self.load_s = round(self.load_s + cost, 3)
+        return cost, evicted
+
+    def stats(self) -> dict:
+        uses = self.hits + self.swaps
+        return {
+            "swaps": self.swaps,
+            "hits": self.hits,
+            "hit_rate": round(self.hits / uses, 3) if uses else 0.0,
+            "evictions": self.evictions,
+            "load_s": self.load_s,
+            "resident": list(self.models),
+        }
+
+
+def plan_affinity_batches(tasks: list["AITask"], model_of: Callable[["AITask"], Optional[str]],
+                          residency: ModelResidency, completed: Optional[set] = None) -> list[dict]:
+    """
+    Order pending tasks into same-model batches that maximize resident-model hits.
+
+    Repeatedly picks, among models with dependency-ready tasks, the batch with
+    the best (priority - MODEL_AFFINITY_BONUS if resident, load cost) and runs
+    all of that model's ready tasks together. Tasks whose dependencies never
+    become satisfiable are left out; tasks with no model come last.
+    """
+    pending = {t.task_id: t for t in tasks}
+    done = set(completed or ())
+    batches = []
+    while pending:
+        ready: dict[Optional[str], list] = defaultdict(list)
+        for task in pending.values():
+            if all(d in done for d in task.dependencies):
+                ready[model_of(task)].append(task)
+        if not ready:
+            break
+
+        def batch_key(model):
+            if model is None:
+                return (float("inf"), 0.0, "")
+            priority = min(t.priority for t in ready[model])
+            if model in residency:
+                return (priority - MODEL_AFFINITY_BONUS, 0.0, model)
+            return (priority, model_load_seconds(model), model)
+
+        model = min(ready, key=batch_key)
+        batch = sorted(ready[model], key=lambda t: t.priority)
+        resident = model is not None and model in residency
+        load_s, evicted = residency.load(model) if model is not None else (0.0, [])
+        batches.append({
+            "model": model,
+            "task_types": sorted({t.task_type for t in batch}),
+            "task_count": len(batch),
+            "task_ids": [t.task_id for t in batch],
+            "priority": batch[0].priority,
+            "resident": resident,
+            "load_s": load_s,
+            "evicted": evicted,
+        })
+        for task in batch:
+            done.add(task.task_id)
+            del pending[task.task_id]
+    return batches
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # OLLAMA CLIENT
 # ═══════════════════════════════════════════════════════════════════════
@@ -236,23 +387,14 @@ class OllamaClient:
 
     def __init__(self):
         self.base_url = OLLAMA_URL
+        # Modified: 2026-10-16T14:00:00Z | Author: COPILOT | Change: Shared pooled keep-alive client
+        self._http = get_ollama_http(self.base_url)
 
     def _request(self, path: str, data: dict | None = None, timeout: int = 120) -> dict:
-        url = f"{self.base_url}{path}"
-        if data:
-            body = json.dumps(data).encode("utf-8")
-            req = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
-        else:
-            req = urllib.request.Request(url)
-        resp = urllib.request.urlopen(req, timeout=timeout)
-        return json.loads(resp.read().decode("utf-8"))
+        return self._http.request(path, data, timeout=timeout)
 
     def is_running(self) -> bool:
-        try:
-            self._request("/api/tags", timeout=3)
-            return True
-        except Exception:
-            return False
+        return self._http.is_running(timeout=3)
 
     def list_models(self) -> list[str]:
         try:
@@ -269,7 +411,8 @@ class OllamaClient:
             return []
 
     def generate(self, model: str, prompt: str, system: str = "",
-                 temperature: float = 0.7, max_tokens: int = 2048) -> dict:
+                 temperature: float = 0.7, max_tokens: int = 2048,
+                 gpu: Optional[int] = None) -> dict:
         data = {
             "model": model,
             "prompt": prompt,
@@ -279,6 +422,8 @@ class OllamaClient:
         }
         if system:
             data["system"] = system
+        if gpu is not None:
+            data["options"]["main_gpu"] = gpu
         return self._request("/api/generate", data, timeout=300)
 
 
@@ -296,9 +441,12 @@ class AIScheduler:
         self.completed_tasks: list[AITask] = []
         self.gpu_states: dict[int, GPUState] = {}
         self.state = self._load_state()
+        self._models_cache: tuple[float, list[str]] = (0.0, [])
+        self.store = TaskQueueStore(QUEUE_FILE)
         self._load_queue()
         self._init_gpu_states()
         self._task_counter = self.state.get("task_counter", 0)
+        self._sync_task_counter()
 
     def _load_state(self) -> dict:
         if STATE_FILE.exists():
@@ -319,42 +467,35 @@ class AIScheduler:
         STATE_FILE.write_text(json.dumps(self.state, indent=2, default=str), encoding="utf-8")
 
     def _load_queue(self):
-        """Load queue with file locking for safe concurrent access."""
-        if not QUEUE_FILE.exists():
-            return
-        from slate_core.file_lock import FileLock
-        lock = FileLock(QUEUE_FILE, timeout=5.0)
-        try:
-            with lock.acquire(exclusive=False):
-                data = json.loads(QUEUE_FILE.read_text(encoding="utf-8"))
-                self.task_queue = [AITask.from_dict(t) for t in data.get("pending", [])]
-                self.completed_tasks = [AITask.from_dict(t) for t in data.get("completed", [])]
-        except TimeoutError:
-            # Fallback: read without lock
-            try:
-                data = json.loads(QUEUE_FILE.read_text(encoding="utf-8"))
-                self.task_queue = [AITask.from_dict(t) for t in data.get("pending", [])]
-                self.completed_tasks = [AITask.from_dict(t) for t in data.get("completed", [])]
-            except Exception:
-                pass
-        except Exception:
-            pass
+        """Load the queue: snapshot plus replay of the event log (picks up other producers)."""
+        # Modified: 2026-10-16T23:30:00Z | Author: COPILOT | Change: Event-log backed queue store
+        pending, completed = self.store.load()
+        self.task_queue = [AITask.from_dict(t) for t in pending]
+        heapq.heapify(self.task_queue)
+        self.completed_tasks = [AITask.from_dict(t) for t in completed]
+
+    def _merge_queue(self):
+        """Adopt tasks other producers logged that this process has not seen."""
+        known = {t.task_id for t in self.task_queue} | {t.task_id for t in self.completed_tasks}
+        pending, completed = self.store.load()
+        for data in pending:
+            if data.get("task_id") not in known:
+                heapq.heappush(self.task_queue, AITask.from_dict(data))
+        self.completed_tasks.extend(AITask.from_dict(d) for d in completed if d.get("task_id") not in known)
+        self._sync_task_counter()
+
+    def _sync_task_counter(self):
+        """Never reissue a task id another producer already logged."""
+        suffixes = (t.task_id.rsplit("_", 1)[-1] for t in [*self.task_queue, *self.completed_tasks])
+        self._task_counter = max([self._task_counter, *(int(n) for n in suffixes if n.isdigit())])
+
+    def _log_tasks(self, *tasks: AITask):
+        """Persist task transitions as appended events (O(1) per task)."""
+        self.store.append(*(t.to_dict() for t in tasks))
 
     def _save_queue(self):
-        """Save queue with file locking for safe concurrent access."""
-        from slate_core.file_lock import FileLock
-        data = {
-            "pending": [t.to_dict() for t in self.task_queue],
-            "completed": [t.to_dict() for t in self.completed_tasks[-100:]],  # Keep last 100
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-        }
-        lock = FileLock(QUEUE_FILE, timeout=5.0)
-        try:
-            with lock.acquire():
-                QUEUE_FILE.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
-        except TimeoutError:
-            # Fallback: write without lock
-            QUEUE_FILE.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+        """Write a full queue snapshot now (compacts the event log)."""
+        self.store.compact()
 
     def _init_gpu_states(self):
         """Initialize GPU state tracking."""
@@ -462,7 +603,7 @@ class AIScheduler:
         )
 
         heapq.heappush(self.task_queue, task)
-        self._save_queue()
+        self._log_tasks(task)
         self._save_state()
 
         return task
@@ -540,21 +681,31 @@ class AIScheduler:
 
     def get_best_model(self, task_type: str, available_models: list[str]) -> Optional[str]:
         """Find the best model for a task type."""
-        preferred = TASK_MODELS.get(task_type, ["mistral-nemo"])
-
-        for model in preferred:
-            if model in available_models:
-                return model
-
-        # Fall back to any available model
-        if available_models:
-            return available_models[0]
-        return None
-
-    def generate_schedule(self) -> list[dict]:
-        """Generate an optimal execution schedule."""
+        return best_model(task_type, available_models)
+
+    def available_models(self, max_age: float = MODELS_CACHE_TTL_S) -> list[str]:
+        """Installed Ollama models, cached for max_age seconds (empty lists are not cached)."""
+        fetched_at, models = self._models_cache
+        if models and time.monotonic() - fetched_at < max_age:
+            return models
+        models = self.ollama.list_models()
+        self._models_cache = (time.monotonic(), models)
+        return models
+
+    def resident_models(self) -> list[str]:
+        """Models Ollama currently has loaded (/api/ps)."""
+        return [m.get("name") for m in self.ollama.running_models() if m.get("name")]
+
+    def generate_schedule(self, mode: str = "type") -> list[dict]:
+        """Generate an optimal execution schedule.
+
+        mode="type" groups tasks by type in type-priority order; mode="affinity"
+        batches by model starting from the resident models (see plan_affinity_batches).
+        """
+        if mode == "affinity":
+            return self.generate_affinity_schedule()
         schedule = []
-        available_models = self.ollama.list_models()
+        available_models = self.available_models()
 
         # Group tasks by type for batch processing
         task_groups: dict[str, list[AITask]] = {}
@@ -581,6 +732,22 @@ class AIScheduler:
 
         return schedule
 
+    def generate_affinity_schedule(self) -> list[dict]:
+        """Same-model batches ordered to maximize hits on already-loaded models."""
+        available = self.available_models()
+        residency = ModelResidency(sum(s.vram_total_mb for s in self.gpu_states.values()),
+                                   self.resident_models())
+        done = {t.task_id for t in self.completed_tasks if t.status == TaskStatus.COMPLETED}
+        pending = [t for t in self.task_queue if t.status == TaskStatus.PENDING]
+        batches = plan_affinity_batches(pending, lambda t: best_model(t.task_type, available),
+                                        residency, done)
+        for batch in batches:
+            batch["task_type"] = ", ".join(batch["task_types"])
+            batch["estimated_vram_mb"] = model_vram(batch["model"])
+            batch["gpu"] = (self.get_best_gpu(batch["task_types"][0], batch["estimated_vram_mb"])
+                            if batch["model"] else None)
+        return batches
+
     def run_task(self, task: AITask) -> bool:
         """Execute a single task with GPU health checking."""
         # Pre-flight GPU health check
@@ -590,7 +757,7 @@ class AIScheduler:
             if not healthy_gpus:
                 task.status = TaskStatus.PENDING
                 task.error = "All GPUs thermal/memory throttled"
-                self._save_queue()
+                self._log_tasks(task)
                 return False
             for gid, status in health.items():
                 if status.health_state in ("throttle", "pause"):
@@ -599,11 +766,10 @@ class AIScheduler:
 
         task.status = TaskStatus.RUNNING
         task.started_at = datetime.now(timezone.utc).isoformat()
-        self._save_queue()
+        self._log_tasks(task)
 
         try:
-            available_models = self.ollama.list_models()
-            model = self.get_best_model(task.task_type, available_models)
+            model = self.get_best_model(task.task_type, self.available_models())
 
             if not model:
                 task.status = TaskStatus.FAILED
@@ -611,42 +777,50 @@ class AIScheduler:
                 return False
 
             task.assigned_model = model
-            gpu = self.get_best_gpu(task.task_type, MODEL_VRAM.get(model, 5000))
+            gpu = self.get_best_gpu(task.task_type, model_vram(model))
             task.assigned_gpu = gpu
 
-            # Build prompt
-            system_prompt = f"You are SLATE AI assistant. Task type: {task.task_type}"
-            prompt = task.description
-            if task.payload:
-                prompt += f"\n\nContext:\n{json.dumps(task.payload, indent=2)}"
-
             # Execute
+            prompt, system_prompt = self._build_prompt(task)
             result = self.ollama.generate(model, prompt, system=system_prompt)
-
-            task.result = result.get("response", "")
-            task.status = TaskStatus.COMPLETED
-            task.completed_at = datetime.now(timezone.utc).isoformat()
-
-            # Update stats
-            self.state["total_executed"] = self.state.get("total_executed", 0) + 1
-            model_usage = self.state.setdefault("model_usage", {})
-            model_usage[model] = model_usage.get(model, 0) + 1
-
+            self._record_success(task, result)
             return True
 
         except Exception as e:
-            task.status = TaskStatus.FAILED
-            task.error = str(e)
-            task.completed_at = datetime.now(timezone.utc).isoformat()
-            self.state["total_failed"] = self.state.get("total_failed", 0) + 1
+            self._record_failure(task, str(e))
             return False
 
         finally:
-            self._save_queue()
+            self._log_tasks(task)
             self._save_state()
 
+    def _build_prompt(self, task: AITask) -> tuple[str, str]:
+        """(prompt, system prompt) for a task."""
+        system_prompt = f"You are SLATE AI assistant. Task type: {task.task_type}"
+        prompt = task.description
+        if task.payload:
+            prompt += f"\n\nContext:\n{json.dumps(task.payload, indent=2)}"
+        return prompt, system_prompt
+
+    def _record_success(self, task: AITask, result: dict):
+        task.result = result.get("response", "")
+        task.status = TaskStatus.COMPLETED
+        task.completed_at = datetime.now(timezone.utc).isoformat()
+
+        # Update stats
+        self.state["total_executed"] = self.state.get("total_executed", 0) + 1
+        model_usage = self.state.setdefault("model_usage", {})
+        model_usage[task.assigned_model] = model_usage.get(task.assigned_model, 0) + 1
+
+    def _record_failure(self, task: AITask, error: str):
+        task.status = TaskStatus.FAILED
+        task.error = error
+        task.completed_at = datetime.now(timezone.utc).isoformat()
+        self.state["total_failed"] = self.state.get("total_failed", 0) + 1
+
     def run_scheduled(self, max_tasks: int = 10) -> dict:
-        """Run scheduled tasks in optimal order."""
+        """Run scheduled tasks in optimal order, concurrently across GPU slots."""
+        # Modified: 2026-10-16T22:00:00Z | Author: COPILOT | Change: Dispatch through ParallelTaskExecutor
         print()
         print("=" * 70)
         print("  SLATE AI Scheduler - Running Tasks")
@@ -656,55 +830,19 @@ class AIScheduler:
         if not self.ollama.is_running():
             return {"success": False, "error": "Ollama not running"}
 
-        executed = 0
-        failed = 0
-
-        # Sort queue by priority
-        heapq.heapify(self.task_queue)
-
-        while self.task_queue and executed < max_tasks:
-            task = heapq.heappop(self.task_queue)
-
-            if task.status != TaskStatus.PENDING:
-                continue
-
-            # Check dependencies
-            if task.dependencies:
-                deps_complete = all(
-                    any(c.task_id == dep_id and c.status == TaskStatus.COMPLETED
-                        for c in self.completed_tasks)
-                    for dep_id in task.dependencies
-                )
-                if not deps_complete:
-                    heapq.heappush(self.task_queue, task)  # Re-queue
-                    continue
-
-            print(f"  [{executed + 1}] Running: {task.task_type} - {task.description[:50]}...")
-
-            success = self.run_task(task)
-            self.completed_tasks.append(task)
-
-            if success:
-                executed += 1
-                print(f"       [OK] Completed with {task.assigned_model} on GPU {task.assigned_gpu}")
-            else:
-                failed += 1
-                print(f"       [!] Failed: {task.error}")
+        self._merge_queue()  # tasks other producers appended since startup
+        result = ParallelTaskExecutor(self).run(max_tasks=max_tasks)
 
         self.state["last_run"] = datetime.now(timezone.utc).isoformat()
         self._save_state()
-        self._save_queue()
 
         print()
-        print(f"  Executed: {executed}, Failed: {failed}, Remaining: {len(self.task_queue)}")
+        print(f"  Executed: {result['executed']}, Failed: {result['failed']}, "
+              f"Remaining: {result['remaining']} ({result['elapsed_s']}s, "
+              f"{result['model_switches']} model loads, ~{result['load_s']}s loading)")
         print("=" * 70)
 
-        return {
-            "success": True,
-            "executed": executed,
-            "failed": failed,
-            "remaining": len(self.task_queue),
-        }
+        return result
 
     def print_status(self):
         """Print scheduler status."""
@@ -771,6 +909,201 @@ class AIScheduler:
         print("=" * 70)
 
 
+# ═══════════════════════════════════════════════════════════════════════
+# PARALLEL EXECUTOR
+# ═══════════════════════════════════════════════════════════════════════
+
+class ParallelTaskExecutor:
+    """
+    Runs an AIScheduler's pending tasks concurrently across GPU slots.
+
+    - One thread pool per GPU, sized by GPU_CONFIG[gpu]["max_concurrent"]
+    - Dependencies form a DAG: each task holds an in-degree counter of
+      unfinished dependencies and becomes ready when it drops to zero
+    - Ready tasks are bucketed by model; a free slot prefers a model that is
+      already resident on its GPU (MODEL_AFFINITY_BONUS), then priority
+    - All task/state bookkeeping happens on the dispatching thread; workers
+      only call Ollama
+    """
+
+    def __init__(self, scheduler: "AIScheduler", gpu_config: Optional[dict] = None):
+        self.scheduler = scheduler
+        self.gpu_config = gpu_config or GPU_CONFIG
+        self.slots = {gid: max(1, cfg.get("max_concurrent", 1)) for gid, cfg in self.gpu_config.items()}
+        self.active = {gid: 0 for gid in self.gpu_config}
+        self.resident = {gid: ModelResidency(self._vram_total(gid)) for gid in self.gpu_config}
+        self.per_gpu = {gid: 0 for gid in self.gpu_config}
+        self._health_checked = 0.0
+        self._paused: set = set()
+        self._seq = 0
+
+    # ── Placement ──────────────────────────────────────────────────────
+
+    def _refresh_health(self):
+        now = time.monotonic()
+        if now - self._health_checked < HEALTH_REFRESH_S:
+            return
+        self._health_checked = now
+        health = self.scheduler.get_gpu_health()
+        self._paused = {gid for gid, status in health.items() if not status.can_accept_task}
+
+    def _vram_total(self, gpu: int) -> int:
+        state = self.scheduler.gpu_states.get(gpu)
+        return state.vram_total_mb if state else self.gpu_config[gpu].get("vram_mb", 0)
+
+    def _next_placement(self, ready: dict[str, list]) -> Optional[tuple[int, str]]:
+        """Best (gpu, model) for the next dispatch, or None if no slot/task fits."""
+        best = None
+        for gpu in self.gpu_config:
+            if self.active[gpu] >= self.slots[gpu] or gpu in self._paused:
+                continue
+            preferred = self.gpu_config[gpu].get("preferred_tasks", [])
+            for model, heap in ready.items():
+                if model_vram(model) > self.resident[gpu].budget_mb:
+                    continue
+                priority, _, task = heap[0]
+                resident = model in self.resident[gpu]
+                key = (priority - (MODEL_AFFINITY_BONUS if resident else 0),
+                       task.task_type not in preferred, self.active[gpu], gpu)
+                if best is None or key < best[0]:
+                    best = (key, gpu, model)
+        return (best[1], best[2]) if best else None
+
+    @property
+    def model_switches(self) -> int:
+        return sum(r.swaps for r in self.resident.values())
+
+    # ── Execution ──────────────────────────────────────────────────────
+
+    def _execute(self, task: AITask, model: str, gpu: int) -> dict:
+        prompt, system_prompt = self.scheduler._build_prompt(task)
+        return self.scheduler.ollama.generate(model, prompt, system=system_prompt, gpu=gpu)
+
+    def _push_ready(self, ready: dict[str, list], task: AITask, model: str):
+        self._seq += 1
+        heapq.heappush(ready.setdefault(model, []), (task.priority, self._seq, task))
+
+    def run(self, max_tasks: int = 10) -> dict:
+        sched = self.scheduler
+        start = time.perf_counter()
+        tasks = {t.task_id: t for t in sched.task_queue if t.status == TaskStatus.PENDING}
+        done_ids = {t.task_id for t in sched.completed_tasks if t.status == TaskStatus.COMPLETED}
+
+        # DAG: in-degree = dependencies not yet completed; edges dep -> dependents
+        indegree: dict[str, int] = {}
+        dependents: dict[str, list[str]] = defaultdict(list)
+        for tid, task in tasks.items():
+            waiting_on = [d for d in task.dependencies if d not in done_ids]
+            indegree[tid] = len(waiting_on)
+            for dep in waiting_on:
+                dependents[dep].append(tid)
+
+        available_models = sched.available_models()
+        model_for: dict[str, Optional[str]] = {}
+        ready: dict[str, list] = {}
+        failed: list[AITask] = []
+        changed: list[AITask] = []   # transitions not yet appended to the queue log
+
+        def make_ready(task: AITask):
+            if task.task_type not in model_for:
+                model_for[task.task_type] = sched.get_best_model(task.task_type, available_models)
+            model = model_for[task.task_type]
+            if model is None:
+                sched._record_failure(task, "No suitable model available")
+                failed.append(task)
+                changed.append(task)
+            else:
+                self._push_ready(ready, task, model)
+
+        for tid, task in tasks.items():
+            if indegree[tid] == 0:
+                make_ready(task)
+
+        executed = 0
+        dispatched = 0
+        running: dict = {}
+        throttled = False
+        pools = {gid: ThreadPoolExecutor(max_workers=n, thread_name_prefix=f"slate-gpu{gid}")
+                 for gid, n in self.slots.items()}
+        try:
+            while True:
+                self._refresh_health()
+                while dispatched < max_tasks and ready:
+                    placement = self._next_placement(ready)
+                    if placement is None:
+                        break
+                    gpu, model = placement
+                    _, _, task = heapq.heappop(ready[model])
+                    if not ready[model]:
+                        del ready[model]
+                    self.resident[gpu].load(model)
+                    task.status = TaskStatus.RUNNING
+                    task.started_at = datetime.now(timezone.utc).isoformat()
+                    task.assigned_model = model
+                    task.assigned_gpu = gpu
+                    dispatched += 1
+                    self.active[gpu] += 1
+                    print(f"  [{dispatched}] Running: {task.task_type} - {task.description[:50]}... "
+                          f"({model} on GPU {gpu})")
+                    running[pools[gpu].submit(self._execute, task, model, gpu)] = (task, gpu)
+                    changed.append(task)
+                sched._log_tasks(*changed)
+                changed.clear()
+
+                if not running:
+                    throttled = bool(ready) and dispatched < max_tasks and len(self._paused) > 0
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    task, gpu = running.pop(future)
+                    self.active[gpu] -= 1
+                    self.per_gpu[gpu] += 1
+                    error = future.exception()
+                    if error is None:
+                        sched._record_success(task, future.result())
+                        executed += 1
+                        print(f"       [OK] {task.task_id} completed with {task.assigned_model} on GPU {gpu}")
+                        for child in dependents.pop(task.task_id, []):
+                            indegree[child] -= 1
+                            if indegree[child] == 0:
+                                make_ready(tasks[child])
+                    else:
+                        sched._record_failure(task, str(error))
+                        failed.append(task)
+                        print(f"       [!] {task.task_id} failed: {task.error}")
+                    sched.completed_tasks.append(task)
+                    changed.append(task)
+                sched._log_tasks(*changed)
+                changed.clear()
+        finally:
+            for pool in pools.values():
+                pool.shutdown(wait=True)
+
+        for task in failed:
+            if task not in sched.completed_tasks:
+                sched.completed_tasks.append(task)
+        sched.task_queue = [t for t in sched.task_queue if t.status == TaskStatus.PENDING]
+        heapq.heapify(sched.task_queue)
+        # Still pending with unfinished inputs (failed, missing or cyclic dependencies)
+        blocked = sorted(tid for tid, n in indegree.items() if n > 0 and tasks[tid].status == TaskStatus.PENDING)
+
+        result = {
+            "success": True,
+            "executed": executed,
+            "failed": len(failed),
+            "remaining": len(sched.task_queue),
+            "blocked": blocked,
+            "elapsed_s": round(time.perf_counter() - start, 3),
+            "model_switches": self.model_switches,
+            "load_s": round(sum(r.load_s for r in self.resident.values()), 3),
+            "per_gpu": self.per_gpu,
+        }
+        if throttled:
+            result["error"] = "All GPUs thermal/memory throttled"
+        return result
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # CLI
 # ═══════════════════════════════════════════════════════════════════════
@@ -781,6 +1114,8 @@ def main():
     parser.add_argument("--queue", action="store_true", help="View task queue")
     parser.add_argument("--run", action="store_true", help="Run scheduled tasks")
     parser.add_argument("--schedule", action="store_true", help="Generate optimal schedule")
+    parser.add_argument("--mode", choices=["type", "affinity"], default="type",
+                        help="Schedule mode: group by task type or batch by resident model")
     parser.add_argument("--add", type=str, help="Add task to queue (format: type:description)")
     parser.add_argument("--max-tasks", type=int, default=10, help="Max tasks to run")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
@@ -808,13 +1143,17 @@ def main():
             print(json.dumps(result, indent=2))
 
     elif args.schedule:
-        schedule = scheduler.generate_schedule()
+        schedule = scheduler.generate_schedule(mode=args.mode)
         if args.json:
             print(json.dumps(schedule, indent=2))
         else:
             print("\nOptimal Schedule:")
             for item in schedule:
                 print(f"  {item['task_type']}: {item['task_count']} tasks -> {item['model']} on GPU {item['gpu']}")
+            if args.mode == "affinity":
+                loads = [b for b in schedule if b["model"] and not b["resident"]]
+                print(f"\n  Model loads: {len(loads)} (~{sum(b['load_s'] for b in loads):.1f}s), "
+                      f"resident hits: {sum(1 for b in schedule if b['resident'])}")
 
     elif args.queue:
         if args.json:
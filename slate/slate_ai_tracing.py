@@ -21,31 +21,42 @@ Features:
 - Trace export: JSON file, console, OTLP (configurable)
 - Inference cost estimation (local compute time → equivalent cost)
 - Latency histograms and P50/P95/P99 percentiles
+- Buffered export: a background thread batches JSONL writes and snapshots
+  metrics periodically, keeping per-call overhead in microseconds
+- Streaming trace queries across days via slate_trace_query.TraceStore
 
 Usage:
     python slate/slate_ai_tracing.py --status       # Tracing status & metrics
     python slate/slate_ai_tracing.py --report        # Generate trace report
     python slate/slate_ai_tracing.py --export json   # Export all traces to JSON
     python slate/slate_ai_tracing.py --reset          # Clear trace history
+    python slate/slate_ai_tracing.py --bench 10000    # Per-call tracing overhead
+    python slate/slate_trace_query.py --days 7 --group-by model   # Query trace history
 """
 
 import argparse
+import atexit
 import json
 import os
+import queue
 import subprocess
 import sys
-import statistics
+import threading
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field, asdict
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 # Modified: 2026-02-07T14:10:00Z | Author: COPILOT | Change: workspace setup
 WORKSPACE_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(WORKSPACE_ROOT))
 
+from slate.quantile_sketch import QuantileSketch  # noqa: E402
+from slate.slate_trace_query import TraceStore, read_tail  # noqa: E402
+from slate_core.file_lock import atomic_json_update  # noqa: E402
+
 if sys.platform == "win32":
     sys.stdout.reconfigure(encoding="utf-8", errors="replace")
     sys.stderr.reconfigure(encoding="utf-8", errors="replace")
@@ -54,6 +65,16 @@ TRACE_DIR = WORKSPACE_ROOT / "slate_logs" / "traces"
 TRACE_STATE_FILE = WORKSPACE_ROOT / ".slate_trace_state.json"
 METRICS_FILE = TRACE_DIR / "metrics.json"
 
+# Modified: 2026-10-16T16:00:00Z | Author: COPILOT | Change: Background batched trace export
+# Trace records are queued on the inference hot path and written by a
+# background thread; the queue is bounded so tracing can never block inference.
+TRACE_QUEUE_SIZE = 10000          # records; overflow is dropped and counted
+TRACE_BATCH_SIZE = 256            # records per writelines() flush
+TRACE_FLUSH_INTERVAL = 1.0        # seconds before a partial batch is flushed
+METRICS_SNAPSHOT_INTERVAL = 10.0  # seconds between metrics.json rewrites
+GPU_SNAPSHOT_TTL = 5.0            # seconds a cached nvidia-smi snapshot stays fresh
+METRICS_WINDOW_DAYS = 30          # daily percentile windows retained in metrics.json
+
 # OpenTelemetry setup — graceful import
 _otel_available = False
 try:
@@ -96,6 +117,7 @@ class InferenceTrace:
     model_routing_reason: str = ""
     temperature: float = 0.7
     max_tokens: int = 2048
+    ttft_ms: Optional[float] = None  # time to first token (streaming inference only)
 
     def to_dict(self) -> dict:
         return asdict(self)
@@ -103,14 +125,35 @@ class InferenceTrace:
 
 @dataclass
 class ModelMetrics:
-    """Aggregated metrics for a single model."""
+    """Aggregated metrics for a single model (or task type)."""
+    # Modified: 2026-10-16T17:00:00Z | Author: COPILOT | Change: Constant-size quantile sketches replace raw sample lists
     model: str
     total_calls: int = 0
     total_tokens: int = 0
     total_latency_ms: float = 0.0
     error_count: int = 0
-    latencies_ms: list = field(default_factory=list)
-    tokens_per_sec_values: list = field(default_factory=list)
+    latency_sketch: QuantileSketch = field(default_factory=QuantileSketch)
+    tps_sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    def record(self, latency_ms: float, tokens_per_sec: float, tokens: int, error: bool):
+        """Add one inference to the totals and sketches."""
+        self.total_calls += 1
+        self.total_tokens += tokens
+        self.total_latency_ms += latency_ms
+        self.latency_sketch.add(latency_ms)
+        self.tps_sketch.add(tokens_per_sec)
+        if error:
+            self.error_count += 1
+
+    def merge(self, other: "ModelMetrics") -> "ModelMetrics":
+        """Fold another ModelMetrics (e.g. from another process or day) into this one."""
+        self.total_calls += other.total_calls
+        self.total_tokens += other.total_tokens
+        self.total_latency_ms += other.total_latency_ms
+        self.error_count += other.error_count
+        self.latency_sketch.merge(other.latency_sketch)
+        self.tps_sketch.merge(other.tps_sketch)
+        return self
 
     @property
     def avg_latency_ms(self) -> float:
@@ -118,31 +161,19 @@ class ModelMetrics:
 
     @property
     def avg_tokens_per_sec(self) -> float:
-        if not self.tokens_per_sec_values:
-            return 0.0
-        return statistics.mean(self.tokens_per_sec_values)
+        return self.tps_sketch.mean
 
     @property
     def p50_latency_ms(self) -> float:
-        if not self.latencies_ms:
-            return 0.0
-        return statistics.median(self.latencies_ms)
+        return self.latency_sketch.quantile(0.50)
 
     @property
     def p95_latency_ms(self) -> float:
-        if not self.latencies_ms:
-            return 0.0
-        sorted_l = sorted(self.latencies_ms)
-        idx = int(len(sorted_l) * 0.95)
-        return sorted_l[min(idx, len(sorted_l) - 1)]
+        return self.latency_sketch.quantile(0.95)
 
     @property
     def p99_latency_ms(self) -> float:
-        if not self.latencies_ms:
-            return 0.0
-        sorted_l = sorted(self.latencies_ms)
-        idx = int(len(sorted_l) * 0.99)
-        return sorted_l[min(idx, len(sorted_l) - 1)]
+        return self.latency_sketch.quantile(0.99)
 
     @property
     def error_rate(self) -> float:
@@ -153,6 +184,7 @@ class ModelMetrics:
             "model": self.model,
             "total_calls": self.total_calls,
             "total_tokens": self.total_tokens,
+            "total_latency_ms": round(self.total_latency_ms, 1),
             "error_count": self.error_count,
             "error_rate": round(self.error_rate, 4),
             "avg_latency_ms": round(self.avg_latency_ms, 1),
@@ -162,6 +194,84 @@ class ModelMetrics:
             "avg_tokens_per_sec": round(self.avg_tokens_per_sec, 1),
         }
 
+    def to_state(self) -> dict:
+        """to_dict() plus the serialized sketches, for metrics.json."""
+        return {
+            **self.to_dict(),
+            "sketches": {
+                "latency_ms": self.latency_sketch.to_dict(),
+                "tokens_per_sec": self.tps_sketch.to_dict(),
+            },
+        }
+
+    @classmethod
+    def from_state(cls, name: str, data: dict) -> "ModelMetrics":
+        sketches = data.get("sketches", {})
+        return cls(
+            model=name,
+            total_calls=data.get("total_calls", 0),
+            total_tokens=data.get("total_tokens", 0),
+            total_latency_ms=data.get("total_latency_ms", 0.0),
+            error_count=data.get("error_count", 0),
+            latency_sketch=QuantileSketch.from_dict(sketches.get("latency_ms")),
+            tps_sketch=QuantileSketch.from_dict(sketches.get("tokens_per_sec")),
+        )
+
+
+@dataclass
+class MetricsRollup:
+    """Per-model, per-task-type and per-day metrics; mergeable and serializable."""
+    models: dict = field(default_factory=dict)      # model -> ModelMetrics
+    task_types: dict = field(default_factory=dict)  # task_type -> ModelMetrics
+    windows: dict = field(default_factory=dict)     # "YYYY-MM-DD" -> model -> ModelMetrics
+    total_traces: int = 0
+
+    def record(self, model: str, task_type: str, day: str, latency_ms: float,
+               tokens_per_sec: float, tokens: int, error: bool):
+        self.total_traces += 1
+        for table, key in ((self.models, model), (self.task_types, task_type),
+                           (self.windows.setdefault(day, {}), model)):
+            if key not in table:
+                table[key] = ModelMetrics(model=key)
+            table[key].record(latency_ms, tokens_per_sec, tokens, error)
+
+    def merge(self, other: "MetricsRollup") -> "MetricsRollup":
+        self.total_traces += other.total_traces
+        for mine, theirs in ((self.models, other.models), (self.task_types, other.task_types)):
+            for key, mm in theirs.items():
+                mine.setdefault(key, ModelMetrics(model=key)).merge(mm)
+        for day, per_model in other.windows.items():
+            window = self.windows.setdefault(day, {})
+            for key, mm in per_model.items():
+                window.setdefault(key, ModelMetrics(model=key)).merge(mm)
+        self.prune_windows()
+        return self
+
+    def prune_windows(self, keep_days: Optional[int] = None):
+        """Drop daily windows beyond the retention limit (oldest first)."""
+        keep_days = METRICS_WINDOW_DAYS if keep_days is None else keep_days
+        for day in sorted(self.windows)[:-keep_days or None]:
+            del self.windows[day]
+
+    def to_state(self) -> dict:
+        return {
+            "total_traces": self.total_traces,
+            "models": {k: mm.to_state() for k, mm in self.models.items()},
+            "task_types": {k: mm.to_state() for k, mm in self.task_types.items()},
+            "windows": {day: {k: mm.to_state() for k, mm in per_model.items()}
+                        for day, per_model in sorted(self.windows.items())},
+        }
+
+    @classmethod
+    def from_state(cls, data: dict) -> "MetricsRollup":
+        return cls(
+            models={k: ModelMetrics.from_state(k, v) for k, v in data.get("models", {}).items()},
+            task_types={k: ModelMetrics.from_state(k, v) for k, v in data.get("task_types", {}).items()},
+            windows={day: {k: ModelMetrics.from_state(k, v) for k, v in per_model.items()}
+                     for day, per_model in data.get("windows", {}).items()},
+            total_traces=data.get("total_traces", 0),
+        )
+
 
 # ── GPU Snapshot ────────────────────────────────────────────────────────
 
@@ -202,24 +312,40 @@ class JSONFileExporter:
         with open(self.filepath, "a", encoding="utf-8") as f:
             f.write(json.dumps(trace_record.to_dict(), default=str) + "\n")
 
-    def read_all(self) -> list[dict]:
-        """Read all trace records."""
+    def export_batch(self, trace_records: list[InferenceTrace]):
+        """Append several trace records with a single open/writelines."""
+        # Records are flat dataclasses; vars() avoids asdict()'s recursive deep copy
+        lines = [json.dumps(vars(r), default=str) + "\n" for r in trace_records]
+        with open(self.filepath, "a", encoding="utf-8") as f:
+            f.writelines(lines)
+
+    def iter_records(self) -> Iterator[dict]:
+        """Stream trace records one line at a time."""
         if not self.filepath.exists():
-            return []
-        records = []
+            return
         with open(self.filepath, "r", encoding="utf-8") as f:
             for line in f:
                 line = line.strip()
                 if line:
                     try:
-                        records.append(json.loads(line))
+                        yield json.loads(line)
                     except json.JSONDecodeError:
                         continue
-        return records
+
+    def read_all(self) -> list[dict]:
+        """Read all trace records."""
+        return list(self.iter_records())
+
+    def tail(self, limit: int) -> list[dict]:
+        """Last `limit` records, read backwards from the end of the file."""
+        return read_tail(self.filepath, limit)
 
 
 # ── Tracer ──────────────────────────────────────────────────────────────
 
+_WAKE = object()  # queued by flush()/close() to wake the export thread immediately
+
+
 class SlateAITracer:
     """
     Central tracing system for SLATE AI inference.
@@ -230,15 +356,21 @@ class SlateAITracer:
 
     # Modified: 2026-02-07T14:10:00Z | Author: COPILOT | Change: AI tracing system core
 
-    def __init__(self, enable_otel: bool = True, enable_console: bool = False):
-        TRACE_DIR.mkdir(parents=True, exist_ok=True)
+    def __init__(self, enable_otel: bool = True, enable_console: bool = False,
+                 trace_dir: Optional[Path] = None):
+        """trace_dir overrides TRACE_DIR for traces and metrics.json (benchmarks, tests)."""
+        self.trace_dir = Path(trace_dir) if trace_dir else TRACE_DIR
+        self.trace_dir.mkdir(parents=True, exist_ok=True)
 
         # JSON file exporter (always active)
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        self.json_exporter = JSONFileExporter(TRACE_DIR / f"traces_{today}.jsonl")
+        self.json_exporter = JSONFileExporter(self.trace_dir / f"traces_{today}.jsonl")
+        self.store = TraceStore(self.trace_dir)
 
-        # Aggregated metrics
-        self.model_metrics: dict[str, ModelMetrics] = {}
+        # Aggregated metrics (path bound now; snapshots are written later by the export thread)
+        self.metrics_file = self.trace_dir / METRICS_FILE.name if trace_dir else METRICS_FILE
+        self.metrics = MetricsRollup()    # everything known (loaded + this process)
+        self._pending = MetricsRollup()   # recorded since the last metrics.json merge
         self._load_metrics()
 
         # OpenTelemetry tracer
@@ -261,31 +393,192 @@ class SlateAITracer:
         # Counter
         self._trace_count = 0
 
+        # Background export state (worker thread starts on first trace)
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=TRACE_QUEUE_SIZE)
+        self._worker: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._atexit_registered = False  # close() is registered once, not per worker restart
+        self._metrics_dirty = False
+        self._last_snapshot = time.monotonic()
+        self._gpu_cache: dict[int, tuple[float, dict]] = {}
+        self._gpu_wanted: set[int] = set()
+        self._export_stats = {"exported": 0, "dropped": 0, "batches": 0,
+                              "metrics_snapshots": 0, "export_errors": 0}
+
+    # ── Background export ───────────────────────────────────────────────
+
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            with self._lock:
+                if self._worker is None or not self._worker.is_alive():
+                    self._stop.clear()
+                    self._worker = threading.Thread(
+                        target=self._export_loop, name="slate-trace-export", daemon=True
+                    )
+                    self._worker.start()
+                    if not self._atexit_registered:
+                        atexit.register(self.close)
+                        self._atexit_registered = True
+
+    def _export_loop(self):
+        """Drain the queue in batches; refresh GPU snapshots and metrics between batches."""
+        while not (self._stop.is_set() and self._queue.empty()):
+            batch = []
+            deadline = time.monotonic() + TRACE_FLUSH_INTERVAL
+            while len(batch) < TRACE_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _WAKE:
+                    self._queue.task_done()
+                    break
+                batch.append(item)
+            self._write_batch(batch)
+            self._background_tick()
+
+    def _write_batch(self, batch: list[InferenceTrace]):
+        if not batch:
+            return
+        try:
+            self.json_exporter.export_batch(batch)
+            with self._lock:
+                self._export_stats["exported"] += len(batch)
+                self._export_stats["batches"] += 1
+        except Exception:
+            with self._lock:
+                self._export_stats["export_errors"] += 1
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    def _background_tick(self, force_snapshot: bool = False):
+        """Slow work kept off the hot path: nvidia-smi refreshes and metrics.json rewrites."""
+        with self._lock:
+            wanted, self._gpu_wanted = self._gpu_wanted, set()
+        for gpu_index in wanted:
+            snapshot = get_gpu_snapshot(gpu_index)
+            with self._lock:
+                self._gpu_cache[gpu_index] = (time.monotonic(), snapshot)
+
+        due = time.monotonic() - self._last_snapshot >= METRICS_SNAPSHOT_INTERVAL
+        if self._metrics_dirty and (due or force_snapshot):
+            try:
+                self._save_metrics()
+                with self._lock:
+                    self._export_stats["metrics_snapshots"] += 1
+            except Exception:
+                with self._lock:
+                    self._export_stats["export_errors"] += 1
+
+    def _gpu_snapshot(self, gpu_index: int) -> dict:
+        """Cached GPU snapshot; a stale or missing entry is refreshed in the background."""
+        cached = self._gpu_cache.get(gpu_index)
+        if cached is None or time.monotonic() - cached[0] > GPU_SNAPSHOT_TTL:
+            with self._lock:
+                self._gpu_wanted.add(gpu_index)
+        if cached is None:
+            return {"gpu_index": gpu_index, "memory_used_mb": 0,
+                    "memory_total_mb": 0, "utilization_pct": 0}
+        return cached[1]
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Block until queued traces are written and metrics are snapshotted.
+
+        Returns False if the queue could not be drained within timeout.
+        """
+        drained = True
+        if self._worker is not None and self._worker.is_alive():
+            try:
+                self._queue.put_nowait(_WAKE)  # flush the partial batch now
+            except queue.Full:
+                pass
+            deadline = time.monotonic() + timeout
+            while self._queue.unfinished_tasks and time.monotonic() < deadline:
+                time.sleep(0.005)
+            drained = not self._queue.unfinished_tasks
+        else:
+            # No worker (never started or already closed): write what is left inline
+            pending = []
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _WAKE:
+                    self._queue.task_done()
+                else:
+                    pending.append(item)
+            self._write_batch(pending)
+        self._background_tick(force_snapshot=True)
+        return drained
+
+    def close(self):
+        """Flush pending traces and stop the export thread."""
+        worker = self._worker
+        if worker is not None and worker.is_alive():
+            self._stop.set()
+            try:
+                self._queue.put_nowait(_WAKE)
+            except queue.Full:
+                pass  # worker is busy draining; it will see _stop after this batch
+            worker.join(timeout=TRACE_FLUSH_INTERVAL + 5)
+        self.flush()
+
+    def get_export_stats(self) -> dict:
+        """Exporter counters plus current queue depth."""
+        with self._lock:
+            stats = dict(self._export_stats)
+        stats["queued"] = self._queue.qsize()
+        stats["worker_alive"] = bool(self._worker and self._worker.is_alive())
+        return stats
+
+    @property
+    def model_metrics(self) -> dict[str, ModelMetrics]:
+        """All-time metrics per model."""
+        return self.metrics.models
+
     def _load_metrics(self):
-        """Load persisted metrics."""
-        if METRICS_FILE.exists():
+        """Load persisted metrics (totals and percentile sketches)."""
+        if self.metrics_file.exists():
             try:
-                data = json.loads(METRICS_FILE.read_text(encoding="utf-8"))
-                for model, m in data.get("models", {}).items():
-                    mm = ModelMetrics(model=model)
-                    mm.total_calls = m.get("total_calls", 0)
-                    mm.total_tokens = m.get("total_tokens", 0)
-                    mm.total_latency_ms = m.get("total_latency_ms", 0)
-                    mm.error_count = m.get("error_count", 0)
-                    # Don't load raw arrays to keep memory bounded
-                    self.model_metrics[model] = mm
+                data = json.loads(self.metrics_file.read_text(encoding="utf-8"))
+                self.metrics = MetricsRollup.from_state(data)
             except Exception:
                 pass
 
     def _save_metrics(self):
-        """Persist aggregated metrics."""
-        METRICS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        data = {
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-            "total_traces": self._trace_count,
-            "models": {name: mm.to_dict() for name, mm in self.model_metrics.items()},
-        }
-        METRICS_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        """Merge metrics recorded since the last snapshot into metrics.json.
+
+        The file is read, merged and rewritten under a file lock, so several
+        processes tracing at once accumulate into one set of totals and sketches.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, MetricsRollup()
+            self._metrics_dirty = False
+            self._last_snapshot = time.monotonic()
+
+        merged = {}
+
+        def merge(data: dict) -> dict:
+            rollup = MetricsRollup.from_state(data).merge(pending)
+            merged["rollup"] = rollup
+            return {"updated_at": datetime.now(timezone.utc).isoformat(), **rollup.to_state()}
+
+        try:
+            atomic_json_update(self.metrics_file, merge)
+        except Exception:
+            with self._lock:
+                self._pending = pending.merge(self._pending)
+                self._metrics_dirty = True
+            raise
+        with self._lock:
+            # Pick up other processes' data, plus anything recorded while writing
+            self.metrics = merged["rollup"].merge(self._pending)
 
     def trace_inference(
         self,
@@ -299,14 +592,21 @@ class SlateAITracer:
         max_tokens: int = 2048,
         routing_reason: str = "",
         error: Optional[str] = None,
+        ttft: Optional[float] = None,
     ) -> InferenceTrace:
         """
         Record an inference trace.
 
         Called by the MLOrchestrator after each inference call.
         Creates both an OTel span and a JSON trace record.
+        ttft is the time to first token in seconds, for streamed inference.
+
+        The record is queued for the background exporter; file writes,
+        metrics.json snapshots and nvidia-smi calls happen off this path.
         """
-        self._trace_count += 1
+        with self._lock:
+            self._trace_count += 1
+            trace_count = self._trace_count
         now = datetime.now(timezone.utc)
 
         # Extract token counts from Ollama response
@@ -320,12 +620,12 @@ class SlateAITracer:
         eval_time_s = eval_duration_ns / 1e9
         tok_per_sec = completion_tokens / max(eval_time_s, 0.001) if completion_tokens else 0.0
 
-        # GPU snapshot
-        gpu = get_gpu_snapshot(gpu_index)
+        # GPU snapshot (cached; refreshed by the export thread)
+        gpu = self._gpu_snapshot(gpu_index)
 
         # Generate IDs
-        trace_id = f"slate-{now.strftime('%Y%m%d%H%M%S')}-{self._trace_count:04d}"
-        span_id = f"inf-{self._trace_count:06d}"
+        trace_id = f"slate-{now.strftime('%Y%m%d%H%M%S')}-{trace_count:04d}"
+        span_id = f"inf-{trace_count:06d}"
 
         status = "error" if error else "success"
 
@@ -351,29 +651,24 @@ class SlateAITracer:
             model_routing_reason=routing_reason,
             temperature=temperature,
             max_tokens=max_tokens,
+            ttft_ms=round(ttft * 1000, 1) if ttft is not None else None,
         )
 
-        # Export to JSON
-        self.json_exporter.export_trace(trace_record)
-
-        # Update aggregated metrics
-        if model not in self.model_metrics:
-            self.model_metrics[model] = ModelMetrics(model=model)
-        mm = self.model_metrics[model]
-        mm.total_calls += 1
-        mm.total_tokens += total_tokens
-        mm.total_latency_ms += trace_record.latency_ms
-        mm.latencies_ms.append(trace_record.latency_ms)
-        mm.tokens_per_sec_values.append(tok_per_sec)
-        if error:
-            mm.error_count += 1
-        # Keep arrays bounded
-        if len(mm.latencies_ms) > 1000:
-            mm.latencies_ms = mm.latencies_ms[-500:]
-        if len(mm.tokens_per_sec_values) > 1000:
-            mm.tokens_per_sec_values = mm.tokens_per_sec_values[-500:]
-
-        self._save_metrics()
+        # Queue for the JSON exporter (dropped, never blocking, when full)
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(trace_record)
+        except queue.Full:
+            with self._lock:
+                self._export_stats["dropped"] += 1
+
+        # Update aggregated metrics (per model, per task type, per UTC day)
+        day = now.date().isoformat()
+        with self._lock:
+            for rollup in (self.metrics, self._pending):
+                rollup.record(model, task_type, day, trace_record.latency_ms,
+                              tok_per_sec, total_tokens, bool(error))
+            self._metrics_dirty = True
 
         # OpenTelemetry span
         if self.otel_tracer:
@@ -396,6 +691,8 @@ class SlateAITracer:
                     "gpu.memory_total_mb": gpu["memory_total_mb"],
                 },
             ) as span:
+                if trace_record.ttft_ms is not None:
+                    span.set_attribute("ai.ttft_ms", trace_record.ttft_ms)
                 if error:
                     span.set_status(trace.StatusCode.ERROR, error)
                     span.record_exception(Exception(error))
@@ -417,12 +714,45 @@ class SlateAITracer:
                 "models_tracked": len(self.model_metrics),
             },
             "models": {name: mm.to_dict() for name, mm in self.model_metrics.items()},
+            "task_types": {name: mm.to_dict() for name, mm in self.metrics.task_types.items()},
         }
 
+    def get_percentiles(self, model: Optional[str] = None, days: Optional[int] = None) -> dict:
+        """Latency percentiles merged across daily windows.
+
+        model=None merges all models; days=None uses the all-time sketches
+        (for one model) or every retained window.
+        """
+        merged = ModelMetrics(model=model or "all")
+        cutoff = ""
+        if days:
+            cutoff = (datetime.now(timezone.utc).date() - timedelta(days=days - 1)).isoformat()
+        with self._lock:
+            if days is None and model is not None:
+                merged.merge(self.metrics.models.get(model, ModelMetrics(model=model)))
+            else:
+                for day, per_model in self.metrics.windows.items():
+                    if day < cutoff:
+                        continue
+                    for name, mm in per_model.items():
+                        if model is None or name == model:
+                            merged.merge(mm)
+        return merged.to_dict()
+
     def get_recent_traces(self, limit: int = 20) -> list[dict]:
         """Get recent trace records."""
-        all_traces = self.json_exporter.read_all()
-        return all_traces[-limit:]
+        self.flush()
+        return self.json_exporter.tail(limit)
+
+    def query_traces(self, **filters) -> Iterator[dict]:
+        """Stream trace records across all days (filters as TraceStore.query)."""
+        self.flush()
+        return self.store.query(**filters)
+
+    def aggregate_traces(self, group_by: Optional[str] = "model", **filters) -> dict[str, dict]:
+        """Latency percentiles per group from the raw trace files (see TraceStore.aggregate)."""
+        self.flush()
+        return self.store.aggregate(group_by=group_by, **filters)
 
     def generate_report(self) -> str:
         """Generate a human-readable trace report."""
@@ -455,6 +785,18 @@ class SlateAITracer:
                 f"{mm_dict['error_rate']:>5.1%}"
             )
 
+        # Last 7 days, recomputed from the trace files
+        weekly = self.aggregate_traces(group_by="model", days=7)
+        if weekly:
+            lines.extend(["", "  Last 7 Days (from traces):",
+                          f"  {'Model':<28} {'Calls':>6} {'P50Lat':>8} {'P95Lat':>8} {'P99Lat':>8} {'Err%':>6}",
+                          "  " + "-" * 74])
+            for name, row in weekly.items():
+                lines.append(
+                    f"  {name:<28} {row['count']:>6} {row['p50']:>7.0f}ms "
+                    f"{row['p95']:>7.0f}ms {row['p99']:>7.0f}ms {row['error_rate']:>5.1%}"
+                )
+
         # Recent traces
         recent = self.get_recent_traces(5)
         if recent:
@@ -472,12 +814,18 @@ class SlateAITracer:
 
     def reset(self):
         """Clear all trace data."""
-        if METRICS_FILE.exists():
-            METRICS_FILE.unlink()
-        # Clear JSONL trace files
-        for f in TRACE_DIR.glob("traces_*.jsonl"):
-            f.unlink()
-        self.model_metrics.clear()
+        self.flush()
+        if self.metrics_file.exists():
+            self.metrics_file.unlink()
+        # Clear JSONL trace files, compacted days and their indexes
+        for pattern in ("traces_*.jsonl", "traces_*.jsonl.gz", "traces_*.idx"):
+            for f in self.store.trace_dir.glob(pattern):
+                f.unlink()
+        self.store.reset()
+        with self._lock:
+            self.metrics = MetricsRollup()
+            self._pending = MetricsRollup()
+            self._metrics_dirty = False
         self._trace_count = 0
         print("  Trace data cleared.")
 
@@ -495,6 +843,32 @@ def get_tracer() -> SlateAITracer:
     return _global_tracer
 
 
+def benchmark_trace_overhead(n: int = 10000, trace_dir: Optional[Path] = None) -> dict:
+    """Measure the hot-path cost of trace_inference (queueing, not disk I/O)."""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tracer = SlateAITracer(enable_otel=False, trace_dir=Path(trace_dir or tmp))
+        tracer._gpu_cache[0] = (float("inf"), {"gpu_index": 0, "memory_used_mb": 0,
+                                               "memory_total_mb": 0, "utilization_pct": 0})
+        result = {"response": "ok", "eval_count": 20, "prompt_eval_count": 40,
+                  "eval_duration": 400_000_000}
+        start = time.perf_counter()
+        for _ in range(n):
+            tracer.trace_inference("bench-model", "general", "bench prompt", result, 0.4)
+        hot_path = time.perf_counter() - start
+        tracer.close()
+        total = time.perf_counter() - start
+        written = len(tracer.json_exporter.read_all())
+    return {
+        "calls": n,
+        "per_call_us": round(hot_path / n * 1e6, 2),
+        "total_with_flush_s": round(total, 3),
+        "records_written": written,
+        **tracer.get_export_stats(),
+    }
+
+
 # ── CLI ─────────────────────────────────────────────────────────────────
 
 def main():
@@ -504,8 +878,13 @@ def main():
     parser.add_argument("--export", choices=["json"], help="Export traces to file")
     parser.add_argument("--reset", action="store_true", help="Clear trace history")
     parser.add_argument("--recent", type=int, default=10, help="Show N recent traces")
+    parser.add_argument("--bench", type=int, metavar="N", help="Benchmark per-call tracing overhead")
     args = parser.parse_args()
 
+    if args.bench:
+        print(json.dumps(benchmark_trace_overhead(args.bench), indent=2))
+        return
+
     tracer = SlateAITracer()
 
     if args.reset:
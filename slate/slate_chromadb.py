@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 # Modified: 2026-02-06T22:30:00Z | Author: COPILOT | Change: ChromaDB vector store integration for SLATE
+# Modified: 2026-10-16T11:00:00Z | Author: COPILOT | Change: Batched embedding + pipelined per-file indexing
+# Modified: 2026-10-16T12:00:00Z | Author: COPILOT | Change: Consult content-addressed embedding cache
 """
 SLATE ChromaDB Integration — Persistent Vector Store for Codebase Embeddings
 =============================================================================
@@ -19,8 +21,10 @@ Features:
 - Persistent local storage (survives restarts)
 - Collection-per-domain (code, docs, tasks, workflows)
 - Semantic search with metadata filtering
-- Batch embedding via Ollama nomic-embed-text
+- Batch embedding via Ollama nomic-embed-text (list input, EMBED_BATCH_SIZE per request)
+- Pipelined indexing: read/chunk/embed on a worker pool, collection writes in order
 - Incremental index updates (only changed files)
+- Embedding cache: unchanged chunks of a changed file reuse stored vectors
 
 Security:
 - Local-only: ChromaDB in-process (no server, no network)
@@ -31,6 +35,7 @@ Usage:
     python slate/slate_chromadb.py --index            # Index codebase
     python slate/slate_chromadb.py --search "query"   # Semantic search
     python slate/slate_chromadb.py --reset             # Reset all collections
+    python slate/slate_chromadb.py --index --batch-size 64 --workers 8
 """
 
 import argparse
@@ -38,6 +43,7 @@ import hashlib
 import json
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -50,9 +56,20 @@ if sys.platform == "win32":
     sys.stdout.reconfigure(encoding="utf-8", errors="replace")
     sys.stderr.reconfigure(encoding="utf-8", errors="replace")
 
+from slate.embedding_cache import is_block_start  # noqa: E402
+
 CHROMADB_DIR = WORKSPACE_ROOT / "slate_memory" / "chromadb"
 STATE_FILE = WORKSPACE_ROOT / ".slate_chromadb_state.json"
 
+EMBED_MODEL = "nomic-embed-text:latest"
+EMBED_DIM = 768
+# Chunks per /api/embed request and files processed concurrently while indexing
+EMBED_BATCH_SIZE = 32
+INDEX_WORKERS = 4
+
+# Path fragments never indexed (gitignored / generated directories)
+SKIP_DIRS = ["actions-runner", "__pycache__", ".venv", "node_modules", "slate_work", ".git"]
+
 # Collection definitions
 COLLECTIONS = {
     "slate_code": {
@@ -87,12 +104,15 @@ class SlateChromaDB:
 
     # Modified: 2026-02-06T22:30:00Z | Author: COPILOT | Change: ChromaDB integration core
 
-    def __init__(self):
+    def __init__(self, batch_size: int = EMBED_BATCH_SIZE, workers: int = INDEX_WORKERS):
         self.workspace = WORKSPACE_ROOT
+        self.batch_size = max(1, batch_size)
+        self.workers = max(1, workers)
         self.db_path = CHROMADB_DIR
         self.db_path.mkdir(parents=True, exist_ok=True)
         self._client = None
         self._ollama = None
+        self._embedding_cache = None
         self.state = self._load_state()
 
     @property
@@ -118,6 +138,14 @@ class SlateChromaDB:
             self._ollama = OllamaClient()
         return self._ollama
 
+    @property
+    def embedding_cache(self):
+        """Lazy-load the shared content-addressed embedding cache."""
+        if self._embedding_cache is None:
+            from slate.embedding_cache import get_embedding_cache
+            self._embedding_cache = get_embedding_cache()
+        return self._embedding_cache
+
     def _load_state(self) -> dict:
         """Load indexing state."""
         if STATE_FILE.exists():
@@ -145,14 +173,22 @@ class SlateChromaDB:
         return hashlib.sha256(content).hexdigest()[:16]
 
     def _chunk_text(self, text: str, max_chars: int = 500) -> list[str]:
-        """Split text into overlapping chunks by lines."""
+        """Split text into overlapping chunks by lines.
+
+        Chunks also end at a top-level block start once half full, which keeps
+        boundaries stable across edits so unchanged chunks hit the embedding cache.
+        """
         lines = text.split("\n")
         chunks = []
         current: list[str] = []
         current_len = 0
 
         for line in lines:
-            if current_len + len(line) > max_chars and current:
+            if current and current_len >= max_chars // 2 and is_block_start(line):
+                chunks.append("\n".join(current))
+                current = []
+                current_len = 0
+            elif current_len + len(line) > max_chars and current:
                 chunks.append("\n".join(current))
                 # Keep last 2 lines for overlap
                 overlap = current[-2:] if len(current) >= 2 else current
@@ -167,15 +203,25 @@ class SlateChromaDB:
         return chunks or [text[:max_chars]]
 
     def _embed_batch(self, texts: list[str]) -> list[list[float]]:
-        """Generate embeddings for a batch of texts via Ollama."""
-        embeddings = []
-        for text in texts:
+        """Generate embeddings for texts, reusing cached vectors for unchanged chunks."""
+        return self.embedding_cache.embed_with_cache(EMBED_MODEL, texts, self._embed_uncached)
+
+    def _embed_uncached(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for texts via Ollama, batch_size inputs per request."""
+        embeddings: list[list[float]] = []
+        for start in range(0, len(texts), self.batch_size):
+            batch = texts[start:start + self.batch_size]
             try:
-                emb = self.ollama.embed("nomic-embed-text:latest", text)
-                embeddings.append(emb)
+                embeddings.extend(self.ollama.embed_batch(EMBED_MODEL, batch))
             except Exception:
-                # Return zero vector on failure
-                embeddings.append([0.0] * 768)
+                # Batch rejected: retry one by one so a single bad chunk
+                # only costs its own vector
+                for text in batch:
+                    try:
+                        embeddings.append(self.ollama.embed(EMBED_MODEL, text))
+                    except Exception:
+                        # Return zero vector on failure
+                        embeddings.append([0.0] * EMBED_DIM)
         return embeddings
 
     # ------------------------------------------------------------------
@@ -217,87 +263,117 @@ class SlateChromaDB:
     # Indexing
     # ------------------------------------------------------------------
 
+    def _collect_files(self, config: dict) -> list[tuple[Path, str, str, str]]:
+        """List (path, rel_path, extension, directory) candidates for a collection."""
+        files = []
+        for dir_name in config["dirs"]:
+            dir_path = self.workspace / dir_name
+            if not dir_path.exists():
+                continue
+            for ext in config["extensions"]:
+                for file_path in dir_path.rglob(f"*{ext}"):
+                    rel_path = str(file_path.relative_to(self.workspace))
+                    # Skip files in gitignored directories
+                    if any(skip in rel_path for skip in SKIP_DIRS):
+                        continue
+                    files.append((file_path, rel_path, ext, dir_name))
+        return files
+
+    def _prepare_file(self, file_path: Path, chunk_size: int) -> tuple[list[str], list[list[float]]]:
+        """Read, chunk and embed one file (runs on the indexing worker pool)."""
+        content = file_path.read_text(encoding="utf-8", errors="replace")
+        chunks = self._chunk_text(content, max_chars=chunk_size)
+        return chunks, self._embed_batch(chunks)
+
     def index_collection(self, collection_name: str, incremental: bool = True) -> dict:
-        """Index files into a specific collection."""
+        """Index files into a specific collection.
+
+        Reading, chunking and embedding run on a pool of ``workers`` threads so
+        Ollama always has requests queued; ChromaDB writes happen on the calling
+        thread in file order. At most ``2 * workers`` files are in flight.
+        """
         if collection_name not in COLLECTIONS:
             return {"error": f"Unknown collection: {collection_name}"}
 
         config = COLLECTIONS[collection_name]
         collection = self.get_or_create_collection(collection_name)
         chunk_size = config.get("chunk_size", 500)
+        start = time.perf_counter()
 
         files_indexed = 0
         files_skipped = 0
         chunks_added = 0
 
-        for dir_name in config["dirs"]:
-            dir_path = self.workspace / dir_name
-            if not dir_path.exists():
-                continue
+        pending = []
+        for file_path, rel_path, ext, dir_name in self._collect_files(config):
+            # Incremental: skip unchanged files
+            if incremental:
+                current_hash = self._file_hash(file_path)
+                stored_hash = self.state["file_hashes"].get(rel_path)
+                if stored_hash == current_hash:
+                    files_skipped += 1
+                    continue
+                self.state["file_hashes"][rel_path] = current_hash
+            pending.append((file_path, rel_path, ext, dir_name))
 
-            for ext in config["extensions"]:
-                for file_path in dir_path.rglob(f"*{ext}"):
-                    rel_path = str(file_path.relative_to(self.workspace))
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            window: list = []
+            queue = iter(pending)
 
-                    # Skip files in gitignored directories
-                    if any(skip in rel_path for skip in [
-                        "actions-runner", "__pycache__", ".venv", "node_modules",
-                        "slate_work", ".git"
-                    ]):
-                        continue
+            def submit_next() -> None:
+                item = next(queue, None)
+                if item is not None:
+                    window.append((item, pool.submit(self._prepare_file, item[0], chunk_size)))
 
-                    # Incremental: skip unchanged files
-                    if incremental:
-                        current_hash = self._file_hash(file_path)
-                        stored_hash = self.state["file_hashes"].get(rel_path)
-                        if stored_hash == current_hash:
-                            files_skipped += 1
-                            continue
-                        self.state["file_hashes"][rel_path] = current_hash
+            for _ in range(self.workers * 2):
+                submit_next()
 
-                    try:
-                        content = file_path.read_text(encoding="utf-8", errors="replace")
-                        chunks = self._chunk_text(content, max_chars=chunk_size)
-
-                        # Delete existing entries for this file
-                        try:
-                            collection.delete(where={"file_path": rel_path})
-                        except Exception:
-                            pass
-
-                        # Embed and add chunks
-                        ids = [f"{rel_path}::{i}" for i in range(len(chunks))]
-                        metadatas = [
-                            {
-                                "file_path": rel_path,
-                                "chunk_index": i,
-                                "total_chunks": len(chunks),
-                                "extension": ext,
-                                "directory": dir_name,
-                            }
-                            for i in range(len(chunks))
-                        ]
-
-                        embeddings = self._embed_batch(chunks)
-                        collection.add(
-                            ids=ids,
-                            documents=chunks,
-                            embeddings=embeddings,
-                            metadatas=metadatas,
-                        )
-
-                        files_indexed += 1
-                        chunks_added += len(chunks)
-
-                    except Exception as e:
-                        print(f"  Skip {rel_path}: {e}")
+            while window:
+                (file_path, rel_path, ext, dir_name), future = window.pop(0)
+                submit_next()
+                try:
+                    chunks, embeddings = future.result()
 
+                    # Delete existing entries for this file
+                    try:
+                        collection.delete(where={"file_path": rel_path})
+                    except Exception:
+                        pass
+
+                    ids = [f"{rel_path}::{i}" for i in range(len(chunks))]
+                    metadatas = [
+                        {
+                            "file_path": rel_path,
+                            "chunk_index": i,
+                            "total_chunks": len(chunks),
+                            "extension": ext,
+                            "directory": dir_name,
+                        }
+                        for i in range(len(chunks))
+                    ]
+
+                    collection.add(
+                        ids=ids,
+                        documents=chunks,
+                        embeddings=embeddings,
+                        metadatas=metadatas,
+                    )
+
+                    files_indexed += 1
+                    chunks_added += len(chunks)
+
+                except Exception as e:
+                    print(f"  Skip {rel_path}: {e}")
+
+        elapsed = time.perf_counter() - start
         return {
             "collection": collection_name,
             "files_indexed": files_indexed,
             "files_skipped": files_skipped,
             "chunks_added": chunks_added,
             "total_in_collection": collection.count(),
+            "elapsed_s": round(elapsed, 3),
+            "chunks_per_sec": round(chunks_added / elapsed, 1) if elapsed > 0 else 0.0,
         }
 
     def index_all(self, incremental: bool = True) -> dict:
@@ -305,6 +381,7 @@ class SlateChromaDB:
         results = {}
         total_files = 0
         total_chunks = 0
+        start = time.perf_counter()
 
         for name in COLLECTIONS:
             print(f"  Indexing {name}...")
@@ -313,6 +390,7 @@ class SlateChromaDB:
             total_files += result.get("files_indexed", 0)
             total_chunks += result.get("chunks_added", 0)
 
+        elapsed = time.perf_counter() - start
         self.state["total_indexed"] = total_files
         self.state["total_chunks"] = total_chunks
         ts = datetime.now(timezone.utc).isoformat()
@@ -328,6 +406,8 @@ class SlateChromaDB:
             "total_chunks": total_chunks,
             "incremental": incremental,
             "timestamp": ts,
+            "elapsed_s": round(elapsed, 3),
+            "chunks_per_sec": round(total_chunks / elapsed, 1) if elapsed > 0 else 0.0,
         }
 
     # ------------------------------------------------------------------
@@ -338,7 +418,7 @@ class SlateChromaDB:
                n_results: int = 10, where: dict | None = None) -> list[dict]:
         """Semantic search across collections."""
         # Embed the query
-        query_embedding = self.ollama.embed("nomic-embed-text:latest", query)
+        query_embedding = self.ollama.embed(EMBED_MODEL, query)
 
         all_results: list[dict] = []
 
@@ -416,7 +496,7 @@ class SlateChromaDB:
                 ) if self.db_path.exists() else 0,
                 "collections": collections,
                 "total_documents": total_docs,
-                "embedding_model": "nomic-embed-text:latest",
+                "embedding_model": EMBED_MODEL,
                 "embedding_available": ollama_ok,
                 "last_full_index": self.state.get("last_full_index"),
                 "last_incremental": self.state.get("last_incremental"),
@@ -479,9 +559,11 @@ def main():
     parser.add_argument("--collection", type=str, help="Search in specific collection")
     parser.add_argument("--n", type=int, default=5, help="Number of results")
     parser.add_argument("--reset", action="store_true", help="Reset all collections")
+    parser.add_argument("--batch-size", type=int, default=EMBED_BATCH_SIZE, help="Chunks per embed request")
+    parser.add_argument("--workers", type=int, default=INDEX_WORKERS, help="Files embedded concurrently")
     args = parser.parse_args()
 
-    db = SlateChromaDB()
+    db = SlateChromaDB(batch_size=args.batch_size, workers=args.workers)
 
     if args.reset:
         print("Resetting all ChromaDB collections...")
@@ -496,7 +578,8 @@ def main():
         if args.json:
             print(json.dumps(result, indent=2))
         else:
-            print(f"\n  Indexed {result['total_files']} files, {result['total_chunks']} chunks")
+            print(f"\n  Indexed {result['total_files']} files, {result['total_chunks']} chunks "
+                  f"in {result['elapsed_s']}s ({result['chunks_per_sec']} chunks/s)")
             for name, r in result["collections"].items():
                 print(f"    {name}: {r['files_indexed']} new, {r.get('files_skipped', 0)} skipped, {r['total_in_collection']} total")
             print()
@@ -333,21 +333,10 @@ def generate_metrics() -> dict[str, Any]:
 
 def sync_to_tasks() -> int:
     """Sync actionable discussions to the task queue."""
-    tasks_file = WORKSPACE_ROOT / "current_tasks.json"
+    from slate_core.task_store import get_task_store
 
-    # Load current tasks
-    if tasks_file.exists():
-        try:
-            with _get_lock(tasks_file):
-                data = json.loads(tasks_file.read_text())
-                tasks = data.get("tasks", []) if isinstance(data, dict) else data
-        except (json.JSONDecodeError, OSError):
-            tasks = []
-    else:
-        tasks = []
-
-    # Get existing discussion task IDs
-    existing_ids = {t.get("id", "") for t in tasks if "discussion" in t.get("id", "")}
+    store = get_task_store(WORKSPACE_ROOT / "current_tasks.json")
+    new_tasks = []
 
     # Find actionable discussions (Ideas, Feature requests, Bug reports)
     discussions = get_discussions()
@@ -358,7 +347,7 @@ def sync_to_tasks() -> int:
         cat_name = d.get("category", {}).get("name", "").lower()
         if any(ac in cat_name for ac in actionable_categories):
             task_id = f"discussion-{d['number']}"
-            if task_id not in existing_ids:
+            if store.get(task_id) is None:
                 task = {
                     "id": task_id,
                     "title": f"[Discussion #{d['number']}] {d['title']}",
@@ -370,13 +359,12 @@ def sync_to_tasks() -> int:
                     "created_at": d.get("createdAt", ""),
                     "assigned_to": "workflow",
                 }
-                tasks.append(task)
+                new_tasks.append(task)
                 added += 1
                 print(f"Added task: {task_id} - {d['title']}")
 
     if added > 0:
-        with _get_lock(tasks_file):
-            tasks_file.write_text(json.dumps({"tasks": tasks}, indent=2))
+        store.add_many(new_tasks)
         print(f"Synced {added} discussions to task queue")
     else:
         print("No new actionable discussions found")
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# Modified: 2026-10-17T07:00:00Z | Author: COPILOT | Change: Benchmark for the vectorized force-directed layout
+"""
+SLATE Layout Benchmark — ForceDirectedLayout at 10 / 100 / 1000 Nodes
+======================================================================
+
+Lays out seeded random service graphs (1.5 edges per node) with each
+ForceDirectedLayout method and reports seconds per layout:
+
+- python      the original pure-Python O(n^2) loop
+- exact       NumPy pairwise repulsion (must match python to the last bit)
+- barnes_hut  NumPy quadtree approximation, early stopping on convergence
+
+For barnes_hut the benchmark also reports the median relative error of the
+repulsion forces against exact, measured on the exact layout's final
+positions (whole layouts are not compared: the simulation is chaotic, so
+tiny force differences end in different, equally valid, layouts).
+
+Usage:
+    python slate/slate_layout_benchmark.py                   # 10, 100, 1000 nodes
+    python slate/slate_layout_benchmark.py --nodes 10,100,1000,3000 --python-max 1000 --json
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+WORKSPACE_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(WORKSPACE_ROOT))
+
+from slate.schematic_sdk.components import FlowConnector, SchematicConfig, ServiceNode  # noqa: E402
+from slate.schematic_sdk.layout import NUMPY_AVAILABLE, ForceDirectedLayout  # noqa: E402
+
+DEFAULT_NODES = (10, 100, 1000)
+DEFAULT_PYTHON_MAX = 300   # the pure-Python loop takes ~40 s at 1000 nodes
+METHODS = ("python", "exact", "barnes_hut")
+
+
+def synthetic_graph(nodes: int, seed: int = 7) -> tuple[list, list]:
+    """Service nodes with int(1.5 * nodes) random flow connectors."""
+    rng = random.Random(seed)
+    components = [ServiceNode(id=f"n{i}", label=f"Node {i}") for i in range(nodes)]
+    connections = [
+        FlowConnector(id=f"e{i}", from_node=f"n{rng.randrange(nodes)}", to_node=f"n{rng.randrange(nodes)}")
+        for i in range(int(nodes * 1.5))
+    ]
+    return components, connections
+
+
+def _timed_layout(method: str, components: list, connections: list, config: SchematicConfig,
+                  iterations: int) -> tuple[dict, dict]:
+    layout = ForceDirectedLayout(iterations=iterations, method=method)
+    t0 = time.perf_counter()
+    result = layout.calculate_positions(components, connections, config)
+    elapsed = time.perf_counter() - t0
+    return {"seconds": round(elapsed, 4), "iterations": layout.iterations_run}, result.positions
+
+
+def _force_error(positions: dict) -> float:
+    """Median relative error of Barnes-Hut repulsion vs exact at the given positions."""
+    import numpy as np
+    pos = np.array(list(positions.values()), dtype=np.float64)
+    layout = ForceDirectedLayout()
+    exact = layout._repulsion_exact(pos)
+    approx = layout._repulsion_barnes_hut(pos)
+    norm = np.linalg.norm(exact, axis=1)
+    err = np.linalg.norm(exact - approx, axis=1)[norm > 0] / norm[norm > 0]
+    return float(np.median(err)) if len(err) else 0.0
+
+
+def run_benchmark(nodes: int, iterations: int = 100, python_max: int = DEFAULT_PYTHON_MAX,
+                  seed: int = 7) -> dict:
+    """Time every available method on one graph size."""
+    components, connections = synthetic_graph(nodes, seed)
+    config = SchematicConfig()
+    row: dict = {"nodes": nodes, "edges": len(connections)}
+    positions: dict[str, Optional[dict]] = {}
+    for method in METHODS:
+        if method != "python" and not NUMPY_AVAILABLE:
+            row[method] = None
+            continue
+        if method == "python" and nodes > python_max:
+            row[method] = None
+            continue
+        row[method], positions[method] = _timed_layout(method, components, connections, config, iterations)
+
+    if positions.get("python") and positions.get("exact"):
+        row["exact_matches_python"] = positions["python"] == positions["exact"]
+    if positions.get("exact") and row.get("barnes_hut"):
+        row["barnes_hut"]["force_error"] = round(_force_error(positions["exact"]), 4)
+    for method in ("exact", "barnes_hut"):
+        if row.get(method) and row.get("python") and row[method]["seconds"]:
+            row[method]["speedup"] = round(row["python"]["seconds"] / row[method]["seconds"], 1)
+    return row
+
+
+def run_suite(node_counts=DEFAULT_NODES, **kwargs) -> list[dict]:
+    return [run_benchmark(n, **kwargs) for n in node_counts]
+
+
+def print_results(rows: list[dict]):
+    def cell(entry: Optional[dict]) -> str:
+        return f"{entry['seconds']:>9.3f}" if entry else f"{'skipped':>9}"
+
+    print()
+    print("=" * 78)
+    print("  SLATE Layout Benchmark - ForceDirectedLayout (seconds per layout)")
+    print("=" * 78)
+    print(f"  {'Nodes':>6} {'Edges':>6} {'python':>9} {'exact':>9} {'barnes_hut':>11} "
+          f"{'BH iters':>9} {'BH force err':>13}  identical")
+    print("  " + "-" * 74)
+    for row in rows:
+        bh = row.get("barnes_hut")
+        print(f"  {row['nodes']:>6} {row['edges']:>6} {cell(row.get('python'))} {cell(row.get('exact'))} "
+              f"{cell(bh):>11} {bh['iterations'] if bh else '-':>9} "
+              f"{bh.get('force_error', '-') if bh else '-':>13}  {row.get('exact_matches_python', '-')}")
+    print("=" * 78)
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="SLATE force-directed layout benchmark")
+    parser.add_argument("--nodes", default=",".join(map(str, DEFAULT_NODES)),
+                        help="Comma-separated graph sizes (default: 10,100,1000)")
+    parser.add_argument("--iterations", type=int, default=100, help="Simulation iterations")
+    parser.add_argument("--python-max", type=int, default=DEFAULT_PYTHON_MAX,
+                        help="Largest graph to run the pure-Python loop on")
+    parser.add_argument("--seed", type=int, default=7, help="Graph seed")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    counts = [int(n) for n in args.nodes.split(",") if n.strip()]
+    rows = run_suite(counts, iterations=args.iterations, python_max=args.python_max, seed=args.seed)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_results(rows)
+
+
+if __name__ == "__main__":
+    main()
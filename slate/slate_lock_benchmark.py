@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# Modified: 2026-10-17T01:00:00Z | Author: COPILOT | Change: Contention benchmark for slate_core.file_lock
+"""
+SLATE Lock Benchmark — FileLock Acquire Latency and Throughput Under Contention
+================================================================================
+
+Starts N worker processes that all hammer one FileLock at the same moment
+and measures, per acquisition, how long the caller waited for the lock.
+Each exclusive critical section does a read-modify-write of a counter file,
+so a lock that lets two writers in at once shows up as lost updates.
+
+Modes:
+    exclusive   every acquisition is a write lock
+    shared      every acquisition is a read lock (readers should not queue)
+    mixed       one write per --write-every acquisitions, reads otherwise
+
+Wait strategies:
+    blocking    FileLock(timeout=None): waiters sleep in flock()
+    timeout     FileLock(timeout=30): non-blocking retries with back-off
+
+Usage:
+    python slate/slate_lock_benchmark.py                       # 1, 4, 16 processes
+    python slate/slate_lock_benchmark.py --processes 1,4,16 --mode mixed --json
+    python slate/slate_lock_benchmark.py --wait timeout --hold-ms 1
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+WORKSPACE_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(WORKSPACE_ROOT))
+
+from slate_core.file_lock import FileLock  # noqa: E402
+
+DEFAULT_PROCESSES = (1, 4, 16)
+DEFAULT_ITERATIONS = 500
+MODES = ("exclusive", "shared", "mixed")
+WAITS = {"blocking": None, "timeout": 30.0}
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _worker(lock_path: str, counter_path: str, iterations: int, mode: str, write_every: int,
+            hold_s: float, timeout: Optional[float], start, results) -> None:
+    """One contending process: wait for the start signal, then acquire `iterations` times."""
+    lock = FileLock(lock_path, timeout=timeout)
+    counter = Path(counter_path)
+    waits: list[float] = []
+    writes = 0
+    start.wait()
+    for i in range(iterations):
+        exclusive = mode == "exclusive" or (mode == "mixed" and i % write_every == 0)
+        t0 = time.perf_counter()
+        with lock.acquire(exclusive=exclusive):
+            waits.append(time.perf_counter() - t0)
+            if exclusive:
+                value = int(counter.read_text() or 0)
+                counter.write_text(str(value + 1))
+                writes += 1
+            if hold_s:
+                time.sleep(hold_s)
+    results.put((waits, writes))
+
+
+def run_benchmark(processes: int, iterations: int = DEFAULT_ITERATIONS, mode: str = "exclusive",
+                  wait: str = "blocking", hold_ms: float = 0.0, write_every: int = 10,
+                  workdir: Optional[Path] = None) -> dict:
+    """Measure one contention level; latencies in milliseconds."""
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        lock_path = Path(tmp) / "bench.json"
+        counter_path = Path(tmp) / "counter.txt"
+        counter_path.write_text("0")
+
+        start = mp.Event()
+        results = mp.Queue()
+        workers = [
+            mp.Process(target=_worker, args=(str(lock_path), str(counter_path), iterations, mode,
+                                             write_every, hold_ms / 1000.0, WAITS[wait], start, results))
+            for _ in range(processes)
+        ]
+        for proc in workers:
+            proc.start()
+        time.sleep(0.05 + 0.01 * processes)  # let every worker reach start.wait()
+        t0 = time.perf_counter()
+        start.set()
+        collected = [results.get(timeout=600) for _ in workers]
+        wall_s = time.perf_counter() - t0
+        for proc in workers:
+            proc.join(timeout=30)
+        counted = int(counter_path.read_text() or 0)
+
+    waits = sorted(w for worker_waits, _ in collected for w in worker_waits)
+    writes = sum(n for _, n in collected)
+    acquisitions = len(waits)
+    ms = [w * 1000 for w in waits]
+    return {
+        "processes": processes,
+        "mode": mode,
+        "wait": wait,
+        "acquisitions": acquisitions,
+        "wall_s": round(wall_s, 4),
+        "throughput_per_s": round(acquisitions / wall_s, 1) if wall_s else 0.0,
+        "latency_ms": {
+            "mean": round(sum(ms) / acquisitions, 4) if acquisitions else 0.0,
+            "p50": round(_percentile(ms, 50), 4),
+            "p95": round(_percentile(ms, 95), 4),
+            "p99": round(_percentile(ms, 99), 4),
+            "max": round(ms[-1], 4) if ms else 0.0,
+        },
+        "writes": writes,
+        "lost_updates": writes - counted,
+    }
+
+
+def run_suite(process_counts=DEFAULT_PROCESSES, **kwargs) -> list[dict]:
+    return [run_benchmark(n, **kwargs) for n in process_counts]
+
+
+def print_results(rows: list[dict]):
+    print()
+    print("=" * 86)
+    print(f"  SLATE Lock Benchmark - FileLock contention ({rows[0]['mode']}, {rows[0]['wait']} wait)")
+    print("=" * 86)
+    print(f"  {'Procs':>5} {'Acquires':>9} {'Wall s':>8} {'Acq/s':>10} {'p50 ms':>9} "
+          f"{'p95 ms':>9} {'p99 ms':>9} {'max ms':>9} {'Lost':>5}")
+    print("  " + "-" * 82)
+    for row in rows:
+        lat = row["latency_ms"]
+        print(f"  {row['processes']:>5} {row['acquisitions']:>9} {row['wall_s']:>8.3f} "
+              f"{row['throughput_per_s']:>10.0f} {lat['p50']:>9.3f} {lat['p95']:>9.3f} "
+              f"{lat['p99']:>9.3f} {lat['max']:>9.3f} {row['lost_updates']:>5}")
+    print("=" * 86)
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="SLATE FileLock contention benchmark")
+    parser.add_argument("--processes", default=",".join(map(str, DEFAULT_PROCESSES)),
+                        help="Comma-separated process counts (default: 1,4,16)")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS, help="Acquisitions per process")
+    parser.add_argument("--mode", choices=MODES, default="exclusive", help="Lock mix")
+    parser.add_argument("--wait", choices=list(WAITS), default="blocking", help="Wait strategy")
+    parser.add_argument("--hold-ms", type=float, default=0.0, help="Time spent holding each lock")
+    parser.add_argument("--write-every", type=int, default=10, help="Mixed mode: one write per N acquisitions")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    counts = [int(n) for n in args.processes.split(",") if n.strip()]
+    rows = run_suite(counts, iterations=args.iterations, mode=args.mode, wait=args.wait,
+                     hold_ms=args.hold_ms, write_every=args.write_every)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_results(rows)
+
+
+if __name__ == "__main__":
+    main()
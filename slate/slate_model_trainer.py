@@ -26,8 +26,6 @@ import json
 import subprocess
 import sys
 import time
-import urllib.request
-import urllib.error
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -35,6 +33,8 @@ from pathlib import Path
 WORKSPACE_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(WORKSPACE_ROOT))
 
+from slate.ollama_http import get_ollama_http  # noqa: E402
+
 if sys.platform == "win32":
     sys.stdout.reconfigure(encoding="utf-8", errors="replace")
     sys.stderr.reconfigure(encoding="utf-8", errors="replace")
@@ -118,23 +118,12 @@ class SlateModelTrainer:
     def _ollama_request(self, path: str, data: dict | None = None,
                         timeout: int = 120) -> dict:
         """Make a request to Ollama API."""
-        url = f"{OLLAMA_BASE}{path}"
-        if data:
-            body = json.dumps(data).encode("utf-8")
-            req = urllib.request.Request(url, data=body,
-                                        headers={"Content-Type": "application/json"})
-        else:
-            req = urllib.request.Request(url)
-        resp = urllib.request.urlopen(req, timeout=timeout)
-        return json.loads(resp.read().decode("utf-8"))
+        # Modified: 2026-10-16T14:00:00Z | Author: COPILOT | Change: Shared pooled keep-alive client
+        return get_ollama_http(OLLAMA_BASE).request(path, data, timeout=timeout)
 
     def _ollama_running(self) -> bool:
         """Check if Ollama is running."""
-        try:
-            self._ollama_request("/api/tags", timeout=3)
-            return True
-        except Exception:
-            return False
+        return get_ollama_http(OLLAMA_BASE).is_running(timeout=3)
 
     def _get_available_models(self) -> set[str]:
         """Get set of available model names."""
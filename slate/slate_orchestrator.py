@@ -557,24 +557,39 @@ class SlateOrchestrator:
         Args:
             skip_dashboard_check: If True, skip the HTTP health check of the dashboard.
                 Used when called FROM the dashboard itself to avoid recursive self-connection.
+
+        Long-running callers (the dashboard) should read the background
+        snapshot from slate.status_snapshot instead of calling this per request.
         """
         # Modified: 2026-02-07T12:00:00Z | Author: COPILOT | Change: Add Docker daemon status to orchestrator status
-        result = {
-            "orchestrator": {"running": False, "pid": None, "mode": self.mode},
-            "runner": {"running": False, "status": "unknown"},
-            "dashboard": {"running": False, "port": 8080},
-            "workflow": {"task_count": 0, "healthy": False},
-            "file_watcher": {"running": False, "mode": self.mode},
-            "docker": {"available": False, "daemon_running": False, "containers": 0},
+        # Modified: 2026-10-16T20:00:00Z | Author: COPILOT | Change: Split into per-section checks for the snapshot service
+        return {
+            name: check()
+            for name, (check, _interval) in self.status_sections(skip_dashboard_check).items()
+        }
+
+    def status_sections(self, skip_dashboard_check: bool = False) -> Dict[str, tuple]:
+        """Status sections as name -> (check function, refresh interval seconds)."""
+        return {
+            "orchestrator": (self._status_orchestrator, 5.0),
+            "runner": (self._status_runner, 30.0),
+            "dashboard": (lambda: self._status_dashboard(skip_dashboard_check), 10.0),
+            "workflow": (self._status_workflow, 15.0),
+            "file_watcher": (self._status_file_watcher, 5.0),
+            "docker": (self._status_docker, 30.0),
         }
 
-        # Check orchestrator
+    def _status_orchestrator(self) -> Dict[str, Any]:
+        result = {"running": False, "pid": None, "mode": self.mode}
         existing_pid = self._check_existing()
         if existing_pid:
-            result["orchestrator"]["running"] = True
-            result["orchestrator"]["pid"] = existing_pid
+            result["running"] = True
+            result["pid"] = existing_pid
+        return result
 
-        # Check runner via GitHub API
+    def _status_runner(self) -> Dict[str, Any]:
+        """Check runner via GitHub API."""
+        result = {"running": False, "status": "unknown"}
         try:
             from slate.slate_runner_manager import SlateRunnerManager
             manager = SlateRunnerManager()
@@ -587,66 +602,74 @@ class SlateOrchestrator:
             )
             if check.returncode == 0:
                 data = json.loads(check.stdout)
-                result["runner"]["running"] = data.get("status") == "online"
-                result["runner"]["status"] = data.get("status", "unknown")
-                result["runner"]["busy"] = data.get("busy", False)
+                result["running"] = data.get("status") == "online"
+                result["status"] = data.get("status", "unknown")
+                result["busy"] = data.get("busy", False)
         except Exception:
             pass
+        return result
 
-        # Check dashboard
+    def _status_dashboard(self, skip_dashboard_check: bool = False) -> Dict[str, Any]:
         # Modified: 2026-02-07T07:30:00Z | Author: COPILOT | Change: Use http.client for robust health check
+        result = {"running": False, "port": 8080}
         if skip_dashboard_check:
             # When called from the dashboard itself, assume it's running
-            result["dashboard"]["running"] = True
+            result["running"] = True
         else:
             try:
                 import http.client
                 conn = http.client.HTTPConnection("127.0.0.1", 8080, timeout=3)
                 conn.request("GET", "/health")
                 resp = conn.getresponse()
-                result["dashboard"]["running"] = resp.status == 200
+                result["running"] = resp.status == 200
                 conn.close()
             except Exception:
                 pass
+        return result
 
-        # Check workflow
+    def _status_workflow(self) -> Dict[str, Any]:
+        result = {"task_count": 0, "healthy": False}
         try:
             from slate.slate_workflow_manager import SlateWorkflowManager
             manager = SlateWorkflowManager()
             analysis = manager.analyze_tasks()
-            result["workflow"]["task_count"] = analysis.get("total", 0)
-            result["workflow"]["healthy"] = not analysis.get("needs_attention", True)
-            result["workflow"]["in_progress"] = analysis.get("by_status", {}).get("in-progress", 0)
+            result["task_count"] = analysis.get("total", 0)
+            result["healthy"] = not analysis.get("needs_attention", True)
+            result["in_progress"] = analysis.get("by_status", {}).get("in-progress", 0)
         except Exception:
             pass
+        return result
 
-        # Check file watcher (dev mode)
+    def _status_file_watcher(self) -> Dict[str, Any]:
+        """Check file watcher (dev mode)."""
+        result = {"running": False, "mode": self.mode}
         if self._dev_reload_manager:
             try:
                 watcher_status = self._dev_reload_manager.status()
-                result["file_watcher"]["running"] = watcher_status.get("watcher", {}).get("running", False)
-                result["file_watcher"]["registry"] = watcher_status.get("registry", {})
+                result["running"] = watcher_status.get("watcher", {}).get("running", False)
+                result["registry"] = watcher_status.get("registry", {})
             except Exception:
                 pass
+        return result
 
+    def _status_docker(self) -> Dict[str, Any]:
         # Modified: 2026-02-07T12:00:00Z | Author: COPILOT | Change: Add Docker daemon status integration
-        # Check Docker daemon
+        result = {"available": False, "daemon_running": False, "containers": 0}
         try:
             from slate.slate_docker_daemon import SlateDockerDaemon
             docker_daemon = SlateDockerDaemon()
             detection = docker_daemon.detect()
-            result["docker"]["available"] = detection.get("installed", False)
-            result["docker"]["daemon_running"] = detection.get("daemon_running", False)
-            result["docker"]["version"] = detection.get("version")
-            result["docker"]["gpu_runtime"] = detection.get("gpu_runtime", False)
+            result["available"] = detection.get("installed", False)
+            result["daemon_running"] = detection.get("daemon_running", False)
+            result["version"] = detection.get("version")
+            result["gpu_runtime"] = detection.get("gpu_runtime", False)
             if detection["daemon_running"]:
                 containers = docker_daemon.list_containers()
                 running = [c for c in containers if c["state"].lower() == "running"]
-                result["docker"]["containers"] = len(containers)
-                result["docker"]["running"] = len(running)
+                result["containers"] = len(containers)
+                result["running"] = len(running)
         except Exception:
             pass
-
         return result
 
     def print_status(self):
@@ -18,9 +18,7 @@ Usage:
 """
 
 import argparse
-import contextlib
 import json
-import msvcrt
 import os
 import subprocess
 import sys
@@ -38,30 +36,7 @@ if sys.platform == "win32":
 WORKSPACE_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(WORKSPACE_ROOT))
 
-
-@contextlib.contextmanager
-def file_lock(filepath: Path, timeout: float = 10.0):
-    """Simple file lock context manager for Windows."""
-    lock_path = filepath.with_suffix(filepath.suffix + ".lock")
-    lock_file = None
-    try:
-        lock_file = open(lock_path, "w", encoding="utf-8")
-        msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
-        yield
-    except OSError:
-        # Lock failed, proceed anyway
-        yield
-    finally:
-        if lock_file:
-            try:
-                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
-            except OSError:
-                pass
-            lock_file.close()
-            try:
-                lock_path.unlink()
-            except OSError:
-                pass
+from slate_core.task_store import get_task_store  # noqa: E402
 
 # Constants
 GH_CLI = r"C:\Program Files\GitHub CLI\gh.exe"
@@ -196,21 +171,18 @@ def add_item_to_project(project_number: int, title: str) -> tuple[bool, str]:
 
 
 def load_tasks() -> dict[str, Any]:
-    """Load current_tasks.json with file locking."""
+    """Load current_tasks.json through the task store."""
+    # Modified: 2026-10-17T00:00:00Z | Author: COPILOT | Change: Read/write through slate_core.task_store
     if not TASKS_FILE.exists():
         return {"tasks": [], "created_at": datetime.now(timezone.utc).isoformat()}
-
-    with file_lock(TASKS_FILE):
-        with open(TASKS_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+    return get_task_store(TASKS_FILE).read_document()
 
 
 def save_tasks(data: dict[str, Any]) -> None:
-    """Save current_tasks.json with file locking."""
-    with file_lock(TASKS_FILE):
-        data["last_updated"] = datetime.now(timezone.utc).isoformat()
-        with open(TASKS_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+    """Save current_tasks.json: only changed tasks are written, then the JSON is re-exported."""
+    store = get_task_store(TASKS_FILE)
+    store.write_document(data)
+    store.flush()
 
 
 def sync_kanban_to_tasks() -> dict[str, int]:
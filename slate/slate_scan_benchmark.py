@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# Modified: 2026-10-17T04:00:00Z | Author: COPILOT | Change: Throughput benchmark for the single-pass ScanEngine
+"""
+SLATE Scan Benchmark — PII / Secret Scanning Throughput
+========================================================
+
+Scans a corpus of text files (default: the repository's tracked text files)
+and reports MB/s for:
+
+- pii_engine        pii_scanner.scan_text (one combined locator pass per document,
+                    each pattern re-tried only inside the spans it finds)
+- pii_legacy        the previous scan_text: one finditer per pattern, every
+                    allowlist pattern searched per match
+- training_engine   SecretScanner.scan_and_redact (secrets + PII in one pass,
+                    verification pass only when something was found)
+- training_legacy   the previous scan_and_redact: secret search per pattern,
+                    one sub() per pattern, PII scan, PII redaction re-scan,
+                    then a secret re-check
+- grep              `grep -E -c` with the PII patterns translated to POSIX ERE,
+                    as a native-code reference (only when grep is on PATH)
+
+Usage:
+    python slate/slate_scan_benchmark.py                 # scan the repository
+    python slate/slate_scan_benchmark.py --root docs --repeat 3 --json
+"""
+
+import argparse
+import json
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+WORKSPACE_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(WORKSPACE_ROOT))
+
+from slate.pii_scanner import ALLOWLIST_PATTERNS, PII_PATTERNS, PIIMatch, scan_text  # noqa: E402
+from slate.slate_training_pipeline import (  # noqa: E402
+    SECRET_PATTERNS,
+    TRAINING_FILE_EXTENSIONS,
+    SecretScanner,
+)
+
+MAX_FILE_BYTES = 2_000_000
+
+
+def load_corpus(root: Path = WORKSPACE_ROOT) -> list[tuple[Path, str]]:
+    """Tracked text files under root (all text files when root is not a git checkout)."""
+    try:
+        listed = subprocess.run(["git", "ls-files", "-z"], cwd=root, capture_output=True,
+                                text=True, timeout=60)
+        paths = [root / p for p in listed.stdout.split("\0") if p] if listed.returncode == 0 else []
+    except (OSError, subprocess.SubprocessError):
+        paths = []
+    if not paths:
+        paths = [p for p in root.rglob("*") if ".git" not in p.parts]
+
+    corpus = []
+    for path in paths:
+        if path.suffix not in TRAINING_FILE_EXTENSIONS or not path.is_file():
+            continue
+        try:
+            if path.stat().st_size > MAX_FILE_BYTES:
+                continue
+            corpus.append((path, path.read_text(encoding="utf-8")))
+        except (OSError, UnicodeDecodeError):
+            continue
+    return corpus
+
+
+def legacy_scan_text(text: str) -> list[PIIMatch]:
+    """Previous scan_text: every pattern over the whole text, allowlist per match."""
+    matches = []
+    for pii_type, pattern in PII_PATTERNS.items():
+        for match in pattern.finditer(text):
+            if not any(allow.search(match.group()) for allow in ALLOWLIST_PATTERNS):
+                matches.append(PIIMatch(pii_type, match.group(), match.start(), match.end()))
+    return matches
+
+
+def legacy_scan_and_redact(content: str) -> str:
+    """Previous SecretScanner.scan_and_redact, reduced to its scanning work."""
+    findings = [p for p in SECRET_PATTERNS if p.search(content)]
+    redacted = content
+    if findings:
+        for pattern in SECRET_PATTERNS:
+            redacted = pattern.sub("[REDACTED_SECRET]", redacted)
+    pii = legacy_scan_text(content)
+    if pii:
+        for match in sorted(legacy_scan_text(redacted), key=lambda m: m.start, reverse=True):
+            redacted = redacted[:match.start] + f"[REDACTED:{match.pii_type.upper()}]" + redacted[match.end:]
+    if findings or pii:
+        any(p.search(redacted) for p in SECRET_PATTERNS)
+    return redacted
+
+
+def to_ere(pattern: str) -> Optional[str]:
+    """Best-effort Python regex -> POSIX ERE (GNU grep); None when not translatable."""
+    if re.search(r"\(\?[=!<]", pattern):
+        return None
+    ere = pattern.replace("(?:", "(")
+    ere = ere.replace(r"\d", "[0-9]").replace(r"\s", "[[:space:]]")
+    return ere
+
+
+def grep_throughput(paths: list[Path], total_bytes: int, repeat: int = 1) -> Optional[dict]:
+    """Time `grep -E -i -c` over the corpus with the translatable PII patterns."""
+    grep = shutil.which("grep")
+    if not grep or not paths:
+        return None
+    patterns = [e for e in (to_ere(p.pattern) for p in PII_PATTERNS.values()) if e]
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as fh:
+        fh.write("\n".join(patterns) + "\n")
+        pattern_file = fh.name
+    try:
+        best = None
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            proc = subprocess.run([grep, "-E", "-i", "-c", "-f", pattern_file, *map(str, paths)],
+                                  capture_output=True, text=True)
+            elapsed = time.perf_counter() - t0
+            if proc.returncode > 1:
+                return None
+            best = elapsed if best is None else min(best, elapsed)
+        lines = sum(int(line.rsplit(":", 1)[-1]) for line in proc.stdout.splitlines() if ":" in line)
+    finally:
+        Path(pattern_file).unlink(missing_ok=True)
+    return {"seconds": round(best, 4), "mb_per_s": round(total_bytes / 1e6 / best, 1) if best else 0.0,
+            "patterns": len(patterns), "matching_lines": lines}
+
+
+def _timed(fn, texts: list[str], total_bytes: int, repeat: int) -> dict:
+    best = None
+    found = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        results = [fn(text) for text in texts]
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+        found = sum(len(r) if isinstance(r, list) else 0 for r in results)
+    return {"seconds": round(best, 4), "mb_per_s": round(total_bytes / 1e6 / best, 2) if best else 0.0,
+            "matches": found}
+
+
+def run_benchmark(root: Path = WORKSPACE_ROOT, repeat: int = 1, use_grep: bool = True) -> dict:
+    corpus = load_corpus(root)
+    texts = [text for _, text in corpus]
+    total_bytes = sum(len(text.encode("utf-8")) for text in texts)
+    scanner = SecretScanner()
+
+    result = {
+        "files": len(corpus),
+        "bytes": total_bytes,
+        "pii_engine": _timed(scan_text, texts, total_bytes, repeat),
+        "pii_legacy": _timed(legacy_scan_text, texts, total_bytes, repeat),
+        "training_engine": _timed(scanner.scan_and_redact, texts, total_bytes, repeat),
+        "training_legacy": _timed(legacy_scan_and_redact, texts, total_bytes, repeat),
+        "grep": grep_throughput([p for p, _ in corpus], total_bytes, repeat) if use_grep else None,
+    }
+    result["pii_speedup"] = round(result["pii_legacy"]["seconds"] / result["pii_engine"]["seconds"], 2) \
+        if result["pii_engine"]["seconds"] else 0.0
+    result["training_speedup"] = round(
+        result["training_legacy"]["seconds"] / result["training_engine"]["seconds"], 2) \
+        if result["training_engine"]["seconds"] else 0.0
+    return result
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="SLATE PII/secret scan benchmark")
+    parser.add_argument("--root", type=Path, default=WORKSPACE_ROOT, help="Corpus root directory")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per variant (best time is kept)")
+    parser.add_argument("--no-grep", action="store_true", help="Skip the grep -E reference")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    result = run_benchmark(args.root.resolve(), args.repeat, use_grep=not args.no_grep)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print()
+    print("=" * 64)
+    print("  SLATE Scan Benchmark - PII / secret scanning throughput")
+    print("=" * 64)
+    print(f"  Corpus: {result['files']} files, {result['bytes'] / 1e6:.2f} MB")
+    for key, label in (("pii_engine", "PII engine"), ("pii_legacy", "PII legacy"),
+                       ("training_engine", "Training engine"), ("training_legacy", "Training legacy")):
+        row = result[key]
+        print(f"  {label:17} {row['seconds']:8.3f} s  {row['mb_per_s']:8.2f} MB/s")
+    grep = result["grep"]
+    if grep:
+        print(f"  {'grep -E':17} {grep['seconds']:8.3f} s  {grep['mb_per_s']:8.1f} MB/s  "
+              f"({grep['patterns']} patterns)")
+    print(f"  Speed-up: PII {result['pii_speedup']:.2f}x  Training {result['training_speedup']:.2f}x")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
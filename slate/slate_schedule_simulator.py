@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# Modified: 2026-10-16T23:00:00Z | Author: COPILOT | Change: Model-swap simulator for AI scheduler orderings
+"""
+SLATE Schedule Simulator — Model Swap Benchmark for AIScheduler Orderings
+==========================================================================
+
+Replays a queue trace through a simulated Ollama model cache (VRAM budget,
+LRU eviction, loads priced by MODEL_VRAM) and compares how many model swaps
+and how much load time each scheduling policy costs. Tasks arrive in trace
+order and at most --window of them are queued at once; each policy picks
+the next task from that queue:
+
+- priority     heap order, as run_scheduled() executed one task at a time
+- type_groups  generate_schedule() default: highest-priority task type first
+- affinity     generate_schedule(mode="affinity"): same-model batches,
+               resident models first (plan_affinity_batches)
+
+"inversions" counts, over all picks, the more urgent tasks that were queued
+but passed over: the price paid for fewer swaps.
+
+Trace inputs:
+    .slate_task_queue.json             scheduler queue (snapshot plus its .log event log)
+    tasks.json / tasks.jsonl           list of AITask dicts
+    slate_logs/traces/                 slate_ai_tracing day files (model taken from each record)
+
+Usage:
+    python slate/slate_schedule_simulator.py                          # replay the scheduler queue
+    python slate/slate_schedule_simulator.py --trace slate_logs/traces --days 7
+    python slate/slate_schedule_simulator.py --synthetic 500 --seed 7 --json
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Callable, Optional
+
+WORKSPACE_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(WORKSPACE_ROOT))
+
+from slate.slate_ai_scheduler import (  # noqa: E402
+    GPU_CONFIG,
+    QUEUE_FILE,
+    TASK_MODELS,
+    TASK_PRIORITY,
+    AITask,
+    ModelResidency,
+    best_model,
+    plan_affinity_batches,
+)
+from slate.task_queue_store import TaskQueueStore  # noqa: E402
+
+DEFAULT_TASK_SECONDS = 5.0
+DEFAULT_WINDOW = 10   # tasks queued at a time, like run_scheduled(max_tasks=10)
+# Relative frequency of task types in synthetic traces
+SYNTHETIC_MIX = {
+    "code_generation": 5, "code_review": 3, "analysis": 3, "planning": 2, "documentation": 2,
+    "summarization": 4, "classification": 2, "quick": 4, "embedding": 2, "general": 1,
+}
+
+ModelOf = Callable[[AITask], Optional[str]]
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# TRACES
+# ═══════════════════════════════════════════════════════════════════════
+
+def _task_from_record(record: dict, index: int) -> AITask:
+    if "task_id" in record:
+        task = AITask.from_dict(record)
+    else:  # slate_ai_tracing record: the model it actually ran on is known
+        task_type = record.get("task_type") or "general"
+        task = AITask(priority=TASK_PRIORITY.get(task_type, 10),
+                      task_id=record.get("trace_id") or f"trace_{index:06d}",
+                      task_type=task_type, description="",
+                      assigned_model=record.get("model"))
+    task.dependencies = list(task.dependencies or [])
+    return task
+
+
+def load_trace(path: Path, days: Optional[int] = None) -> list[AITask]:
+    """Tasks in arrival order from a queue file, task list (JSON/JSONL) or trace directory."""
+    path = Path(path)
+    if path.is_dir():
+        from slate.slate_trace_query import TraceStore
+        return [_task_from_record(r, i) for i, r in enumerate(TraceStore(path).query(days=days))]
+
+    text = path.read_text(encoding="utf-8")
+    try:
+        data = json.loads(text)
+        if isinstance(data, dict):  # scheduler queue snapshot + event log: history first, then pending
+            pending, completed = TaskQueueStore(path).load()
+            records = completed + pending
+        else:
+            records = list(data)
+    except json.JSONDecodeError:
+        records = []
+        for line in text.splitlines():
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return [_task_from_record(r, i) for i, r in enumerate(records) if isinstance(r, dict)]
+
+
+def synthetic_trace(count: int, seed: int = 0, burst: int = 3) -> list[AITask]:
+    """Interleaved task stream: short bursts of one type from several producers."""
+    rng = random.Random(seed)
+    types, weights = zip(*SYNTHETIC_MIX.items())
+    tasks: list[AITask] = []
+    while len(tasks) < count:
+        task_type = rng.choices(types, weights)[0]
+        for _ in range(min(rng.randint(1, burst), count - len(tasks))):
+            tasks.append(AITask(priority=TASK_PRIORITY.get(task_type, 10),
+                                task_id=f"sim_{len(tasks):06d}", task_type=task_type,
+                                description=f"synthetic {task_type}"))
+    return tasks
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# POLICIES
+# ═══════════════════════════════════════════════════════════════════════
+# A policy picks the next task to run from the tasks currently queued.
+
+def pick_priority(queue: list[AITask], model_of: ModelOf, residency: ModelResidency,
+                  completed: set) -> AITask:
+    """Heap order: priority, then arrival."""
+    return min(queue, key=lambda t: t.priority)
+
+
+def pick_type_groups(queue: list[AITask], model_of: ModelOf, residency: ModelResidency,
+                     completed: set) -> AITask:
+    """generate_schedule(mode="type"): first task of the highest-priority task type."""
+    return min(queue, key=lambda t: TASK_PRIORITY.get(t.task_type, 10))
+
+
+def pick_affinity(queue: list[AITask], model_of: ModelOf, residency: ModelResidency,
+                  completed: set) -> AITask:
+    """generate_schedule(mode="affinity"): head of the first same-model batch."""
+    planning = ModelResidency(residency.budget_mb, list(residency.models))
+    batches = plan_affinity_batches(queue, model_of, planning, completed)
+    if not batches:  # everything queued waits on something outside the window
+        return pick_priority(queue, model_of, residency, completed)
+    head = batches[0]["task_ids"][0]
+    return next(t for t in queue if t.task_id == head)
+
+
+POLICIES = {
+    "priority": pick_priority,
+    "type_groups": pick_type_groups,
+    "affinity": pick_affinity,
+}
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# SIMULATION
+# ═══════════════════════════════════════════════════════════════════════
+
+def simulate(tasks: list[AITask], policy: str, model_of: ModelOf, residency: ModelResidency,
+             window: int = 0, task_seconds: float = DEFAULT_TASK_SECONDS) -> dict:
+    """
+    Replay a trace: up to `window` tasks are queued at a time (0 = the whole
+    trace at once); each time one finishes, the next arrival joins the queue.
+    """
+    pick = POLICIES[policy]
+    known = {t.task_id for t in tasks}
+    # Dependencies outside the trace are treated as already satisfied
+    completed = {d for t in tasks for d in t.dependencies if d not in known}
+    arrivals = iter(tasks)
+    queue: list[AITask] = []
+    inversions = 0
+    unplaced = 0
+    ran = 0
+
+    def refill():
+        while not window or len(queue) < window:
+            task = next(arrivals, None)
+            if task is None:
+                return
+            queue.append(task)
+
+    refill()
+    while queue:
+        task = pick(queue, model_of, residency, completed)
+        inversions += sum(1 for q in queue if q.priority < task.priority)
+        queue.remove(task)
+        completed.add(task.task_id)
+        refill()
+        model = model_of(task)
+        if model is None:
+            unplaced += 1
+            continue
+        residency.load(model)
+        ran += 1
+
+    stats = residency.stats()
+    total_s = ran * task_seconds + stats["load_s"]
+    stats.update({
+        "tasks": len(tasks),
+        "unplaced": unplaced,
+        "inversions": inversions,
+        "total_s": round(total_s, 3),
+        "load_share": round(stats["load_s"] / total_s, 3) if total_s else 0.0,
+    })
+    del stats["resident"]
+    return stats
+
+
+def default_budget_mb() -> int:
+    """Largest single-GPU VRAM: a model is loaded onto one GPU."""
+    return max(cfg["vram_mb"] for cfg in GPU_CONFIG.values())
+
+
+def compare(tasks: list[AITask], models: Optional[list[str]] = None, budget_mb: Optional[int] = None,
+            resident: Optional[list[str]] = None, window: int = DEFAULT_WINDOW,
+            task_seconds: float = DEFAULT_TASK_SECONDS, policies: Optional[list[str]] = None) -> dict[str, dict]:
+    """Simulate every policy over the same trace and starting cache."""
+    if models is None:
+        models = sorted({m for candidates in TASK_MODELS.values() for m in candidates})
+    budget_mb = budget_mb or default_budget_mb()
+
+    def model_of(task: AITask) -> Optional[str]:
+        return task.assigned_model or best_model(task.task_type, models)
+
+    return {name: simulate(tasks, name, model_of, ModelResidency(budget_mb, resident), window, task_seconds)
+            for name in policies or list(POLICIES)}
+
+
+def print_comparison(results: dict[str, dict]):
+    print()
+    print("=" * 78)
+    print("  SLATE Schedule Simulator - Model Swaps by Policy")
+    print("=" * 78)
+    print(f"  {'Policy':<13} {'Tasks':>6} {'Swaps':>6} {'Hit%':>6} {'Evict':>6} "
+          f"{'Load s':>8} {'Load%':>6} {'Inversions':>11}")
+    print("  " + "-" * 74)
+    for name, row in results.items():
+        print(f"  {name:<13} {row['tasks']:>6} {row['swaps']:>6} {row['hit_rate']:>6.0%} "
+              f"{row['evictions']:>6} {row['load_s']:>8.1f} {row['load_share']:>6.1%} {row['inversions']:>11}")
+    baseline = results.get("priority")
+    affinity = results.get("affinity")
+    if baseline and affinity and baseline["swaps"]:
+        saved = baseline["swaps"] - affinity["swaps"]
+        print(f"\n  affinity vs priority: {saved} fewer swaps ({saved / baseline['swaps']:.0%}), "
+              f"{baseline['load_s'] - affinity['load_s']:.1f}s less loading")
+    print("=" * 78)
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="SLATE Schedule Simulator")
+    parser.add_argument("--trace", type=Path, default=None,
+                        help="Queue file, task list (JSON/JSONL) or trace directory (default: scheduler queue)")
+    parser.add_argument("--days", type=int, help="With a trace directory: only the last N days")
+    parser.add_argument("--synthetic", type=int, metavar="N", help="Generate N synthetic tasks instead")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for --synthetic")
+    parser.add_argument("--budget-mb", type=int, help="VRAM budget for resident models (default: largest GPU)")
+    parser.add_argument("--resident", default="", help="Comma-separated models loaded at the start")
+    parser.add_argument("--models", default="", help="Comma-separated installed models (default: all known)")
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW,
+                        help="Tasks queued at a time while replaying (0 = whole trace)")
+    parser.add_argument("--task-seconds", type=float, default=DEFAULT_TASK_SECONDS,
+                        help="Simulated inference time per task")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        tasks = synthetic_trace(args.synthetic, seed=args.seed)
+    else:
+        trace = args.trace or QUEUE_FILE
+        if not trace.exists():
+            print(f"Trace not found: {trace} (use --synthetic N)")
+            sys.exit(1)
+        tasks = load_trace(trace, days=args.days)
+
+    split = lambda s: [m.strip() for m in s.split(",") if m.strip()]  # noqa: E731
+    results = compare(tasks, models=split(args.models) or None, budget_mb=args.budget_mb,
+                      resident=split(args.resident), window=args.window, task_seconds=args.task_seconds)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_comparison(results)
+
+
+if __name__ == "__main__":
+    main()
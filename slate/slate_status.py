@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # ═══════════════════════════════════════════════════════════════════════════════
 # CELL: slate_status [python]
-# Author: COPILOT | Created: 2026-02-06T00:30:00Z | Modified: 2026-02-06T00:30:00Z
+# Author: COPILOT | Created: 2026-02-06T00:30:00Z | Modified: 2026-10-17T09:00:00Z
 # Purpose: Quick status check for SLATE system
 # ═══════════════════════════════════════════════════════════════════════════════
 """
@@ -9,17 +9,33 @@ SLATE Status Checker
 ====================
 Quick system status check.
 
+Probes (nvidia-smi, ollama, psutil, torch) run concurrently through a
+StatusCollector. Each probe has its own deadline and cache TTL, so a
+status call costs at most the slowest probe's deadline and usually
+nothing at all: static facts (Python, torch version) are probed once,
+volatile ones (memory, GPU) every few seconds. A probe that misses its
+deadline keeps running in the background and its last known value (or
+an "unavailable"/"unknown" placeholder) is returned, marked in "probes".
+
 Usage:
     python slate/slate_status.py --quick
     python slate/slate_status.py --json
+    python slate/slate_status.py --probes     # Per-probe latency / cache state
 """
 
 import argparse
 import json
+import math
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import Callable, Optional
 
 try:
     import psutil
@@ -27,6 +43,9 @@ try:
 except ImportError:
     HAS_PSUTIL = False
 
+CPU_SAMPLE_INTERVAL = 0.1  # shortest window a non-blocking cpu_percent() read is trusted over
+_cpu_sampled_at: Optional[float] = None  # monotonic time of the last cpu_percent() read
+
 
 def get_python_info():
     """Get Python version info."""
@@ -64,18 +83,31 @@ def get_gpu_info():
         return {"available": False, "count": 0, "gpus": []}
 
 
-def get_system_info():
-    """Get system resource info."""
+def get_system_info(cpu_interval: Optional[float] = 0.1):
+    """Get system resource info.
+
+    cpu_interval=None reports CPU use since the previous call instead of
+    blocking to sample (the collector's mode, since it polls regularly).
+    Without a previous call at least CPU_SAMPLE_INTERVAL ago that figure
+    is meaningless (~0% in a one-shot CLI run), so it blocks that long.
+    """
+    global _cpu_sampled_at
     if not HAS_PSUTIL:
         return {"available": False}
 
+    if cpu_interval is None and (_cpu_sampled_at is None
+                                 or time.monotonic() - _cpu_sampled_at < CPU_SAMPLE_INTERVAL):
+        cpu_interval = CPU_SAMPLE_INTERVAL
+    cpu_percent = psutil.cpu_percent(interval=cpu_interval)
+    _cpu_sampled_at = time.monotonic()
+
     mem = psutil.virtual_memory()
     disk = psutil.disk_usage(str(Path.cwd()))
 
     return {
         "available": True,
         "cpu_count": psutil.cpu_count(),
-        "cpu_percent": psutil.cpu_percent(interval=0.1),
+        "cpu_percent": cpu_percent,
         "memory_total_gb": round(mem.total / (1024**3), 1),
         "memory_available_gb": round(mem.available / (1024**3), 1),
         "memory_percent": mem.percent,
@@ -118,16 +150,122 @@ def get_ollama_info():
         return {"available": False, "model_count": 0}
 
 
-def get_status():
-    """Get full system status."""
-    return {
-        "timestamp": datetime.now().isoformat(),
-        "python": get_python_info(),
-        "gpu": get_gpu_info(),
-        "system": get_system_info(),
-        "pytorch": get_pytorch_info(),
-        "ollama": get_ollama_info()
-    }
+# Modified: 2026-10-16T19:00:00Z | Author: COPILOT | Change: Concurrent probes with per-probe deadline and TTL
+@dataclass
+class Probe:
+    """One status source with its own freshness and latency budget."""
+    name: str
+    fn: Callable[[], dict]
+    ttl: float          # seconds a result stays fresh (math.inf = once per process)
+    deadline: float     # seconds a status call waits for a fresh result
+    fallback: dict      # returned when the probe has never completed in time
+
+
+def _default_probes() -> list[Probe]:
+    # Lambdas resolve the module-level functions at call time (patchable in tests)
+    return [
+        Probe("python", lambda: get_python_info(), math.inf, 1.0, {"version": "?", "ok": False}),
+        Probe("gpu", lambda: get_gpu_info(), 5.0, 3.0, {"available": False, "count": 0, "gpus": []}),
+        Probe("system", lambda: get_system_info(cpu_interval=None), 2.0, 1.0, {"available": False}),
+        # installed=None: unknown, the import did not finish in time (torch may be installed)
+        Probe("pytorch", lambda: get_pytorch_info(), math.inf, 5.0, {"installed": None}),
+        Probe("ollama", lambda: get_ollama_info(), 10.0, 3.0, {"available": False, "model_count": 0}),
+    ]
+
+
+class StatusCollector:
+    """Runs status probes concurrently with per-probe deadlines and TTL caching.
+
+    A probe is started only if its cached value is stale and it is not
+    already running, so a hung nvidia-smi never accumulates threads; its
+    late result still lands in the cache for the next call.
+    """
+
+    def __init__(self, probes: Optional[list[Probe]] = None):
+        self.probes = {p.name: p for p in (probes or _default_probes())}
+        self._executor = ThreadPoolExecutor(max_workers=len(self.probes),
+                                            thread_name_prefix="slate-status")
+        self._lock = threading.Lock()
+        self._cache: dict[str, tuple[dict, float, float]] = {}  # name -> (value, stored_at, latency_ms)
+        self._running: dict[str, Future] = {}
+
+    def _run_probe(self, probe: Probe) -> dict:
+        start = time.perf_counter()
+        try:
+            value = probe.fn()
+        except Exception as e:
+            value = {**probe.fallback, "error": str(e)}
+        with self._lock:
+            self._cache[probe.name] = (value, time.monotonic(), (time.perf_counter() - start) * 1000)
+            self._running.pop(probe.name, None)
+        return value
+
+    def collect(self, force: bool = False) -> dict:
+        """Status dict keyed by probe name, plus "probes" timing/cache metadata."""
+        start = time.monotonic()
+        waiting: dict[str, Future] = {}
+        meta: dict[str, dict] = {}
+        result: dict = {"timestamp": datetime.now().isoformat()}
+
+        with self._lock:
+            for name, probe in self.probes.items():
+                cached = self._cache.get(name)
+                if cached and not force and start - cached[1] < probe.ttl:
+                    result[name] = cached[0]
+                    meta[name] = {"cached": True, "latency_ms": round(cached[2], 1),
+                                  "age_s": round(start - cached[1], 1)}
+                    continue
+                future = self._running.get(name)
+                if future is None:
+                    future = self._running[name] = self._executor.submit(self._run_probe, probe)
+                waiting[name] = future
+
+        for name in sorted(waiting, key=lambda n: self.probes[n].deadline):
+            probe = self.probes[name]
+            remaining = max(0.0, start + probe.deadline - time.monotonic())
+            try:
+                result[name] = waiting[name].result(timeout=remaining)
+                with self._lock:
+                    latency = self._cache[name][2]
+                meta[name] = {"cached": False, "latency_ms": round(latency, 1)}
+            except FutureTimeout:
+                with self._lock:
+                    cached = self._cache.get(name)
+                result[name] = cached[0] if cached else dict(probe.fallback)
+                meta[name] = {"cached": bool(cached), "timed_out": True,
+                              "latency_ms": round((time.monotonic() - start) * 1000, 1)}
+                if cached:
+                    meta[name]["age_s"] = round(start - cached[1], 1)
+
+        result["probes"] = {name: meta[name] for name in self.probes}
+        result["collect_ms"] = round((time.monotonic() - start) * 1000, 1)
+        return result
+
+    def invalidate(self, name: Optional[str] = None):
+        """Drop one cached probe result (or all)."""
+        with self._lock:
+            if name is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(name, None)
+
+
+_collector: Optional[StatusCollector] = None
+_collector_lock = threading.Lock()
+
+
+def get_status_collector() -> StatusCollector:
+    """Get or create the process-wide status collector."""
+    global _collector
+    with _collector_lock:
+        if _collector is None:
+            _collector = StatusCollector()
+        return _collector
+
+
+def get_status(force: bool = False):
+    """Get full system status (probes run concurrently, results cached per probe)."""
+    return get_status_collector().collect(force=force)
 
 
 def print_quick_status(status: dict):
@@ -169,6 +307,8 @@ def print_quick_status(status: dict):
     if pt.get("installed"):
         cuda_status = f"CUDA {pt['cuda_version']}" if pt.get("cuda_available") else "CPU"
         print(f"  PyTorch:  {OK} {pt['version']} ({cuda_status})")
+    elif pt.get("installed") is None:
+        print(f"  PyTorch:  {NONE} Unknown ({pt.get('error', 'probe timed out')})")
     else:
         print(f"  PyTorch:  {NONE} Not installed")
 
@@ -189,6 +329,7 @@ def main():
     parser = argparse.ArgumentParser(description="SLATE Status Checker")
     parser.add_argument("--quick", action="store_true", help="Quick status")
     parser.add_argument("--json", action="store_true", help="JSON output")
+    parser.add_argument("--probes", action="store_true", help="Show per-probe latency and cache state")
     args = parser.parse_args()
 
     status = get_status()
@@ -197,6 +338,11 @@ def main():
         print(json.dumps(status, indent=2))
     else:
         print_quick_status(status)
+    if args.probes and not args.json:
+        for name, meta in status["probes"].items():
+            state = "timed out" if meta.get("timed_out") else ("cached" if meta["cached"] else "fresh")
+            print(f"  {name:<10} {meta['latency_ms']:>8.1f}ms  {state}")
+        print(f"  {'total':<10} {status['collect_ms']:>8.1f}ms")
 
     return 0
 
@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+# Modified: 2026-10-16T18:00:00Z | Author: COPILOT | Change: Indexed streaming query engine over daily trace files
+"""
+SLATE Trace Query — Indexed Streaming Queries Over Daily JSONL Traces
+======================================================================
+
+Queries the rotated traces_YYYY-MM-DD.jsonl files written by
+slate_ai_tracing without loading them into memory. Records are streamed
+block by block; a sidecar index per day file records, for every block of
+BLOCK_RECORDS lines, its byte range, timestamp range, model / task-type
+counts and error count, so filtered queries seek straight to the blocks
+that can match and skip the rest.
+
+Old days can be compacted to traces_YYYY-MM-DD.jsonl.gz, written as one
+gzip member per block. The file stays readable with any gzip tool, and
+the index keeps pointing at individual members so compacted days remain
+seekable.
+
+Files:
+    slate_logs/traces/traces_<day>.jsonl          live day (append-only)
+    slate_logs/traces/traces_<day>.jsonl.gz       compacted day
+    slate_logs/traces/traces_<day>.jsonl[.gz].idx sidecar block index
+
+Usage:
+    from slate.slate_trace_query import TraceStore
+
+    store = TraceStore()
+    store.aggregate(group_by="model", days=7)          # p50/p95/p99 per model
+    list(store.query(model="slate-coder", errors_only=True, limit=20))
+
+    python slate/slate_trace_query.py --days 7 --group-by model
+    python slate/slate_trace_query.py --model slate-fast --errors --limit 20
+    python slate/slate_trace_query.py --compact       # gzip days before today
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+# Modified: 2026-10-16T18:00:00Z | Author: COPILOT | Change: workspace setup
+WORKSPACE_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(WORKSPACE_ROOT))
+
+from slate.quantile_sketch import QuantileSketch  # noqa: E402
+
+TRACE_DIR = WORKSPACE_ROOT / "slate_logs" / "traces"
+
+BLOCK_RECORDS = 512          # trace lines per index block / gzip member
+INDEX_VERSION = 1
+COMPACT_IDLE_SECONDS = 3600  # only compact files nobody has appended to for this long
+TAIL_CHUNK_BYTES = 64 * 1024
+
+_DAY_FILE = re.compile(r"^traces_(\d{4}-\d{2}-\d{2})\.jsonl(\.gz)?$")
+
+TimeBound = Union[str, datetime, None]
+
+
+def _iso(bound: TimeBound) -> Optional[str]:
+    """Normalize a datetime/ISO bound to the UTC isoformat traces are stamped with."""
+    if bound is None:
+        return None
+    if isinstance(bound, str):
+        bound = datetime.fromisoformat(bound.replace("Z", "+00:00"))
+    if bound.tzinfo is None:
+        bound = bound.replace(tzinfo=timezone.utc)
+    return bound.astimezone(timezone.utc).isoformat()
+
+
+def _is_error(record: dict) -> bool:
+    return record.get("status", "success") != "success"
+
+
+@dataclass
+class TraceFilter:
+    """Record predicate that can also rule out whole index blocks."""
+    model: Optional[str] = None
+    task_type: Optional[str] = None
+    since: Optional[str] = None   # inclusive, UTC isoformat
+    until: Optional[str] = None   # exclusive, UTC isoformat
+    errors_only: bool = False
+
+    def matches_day(self, day: str) -> bool:
+        if self.since and day < self.since[:10]:
+            return False
+        if self.until and day > self.until[:10]:
+            return False
+        return True
+
+    def matches_block(self, block: dict) -> bool:
+        if self.model and self.model not in block["models"]:
+            return False
+        if self.task_type and self.task_type not in block["task_types"]:
+            return False
+        if self.errors_only and not block["errors"]:
+            return False
+        if block["count"]:
+            if self.since and block["ts_max"] < self.since:
+                return False
+            if self.until and block["ts_min"] >= self.until:
+                return False
+        return True
+
+    def matches(self, record: dict) -> bool:
+        if self.model and record.get("model") != self.model:
+            return False
+        if self.task_type and record.get("task_type") != self.task_type:
+            return False
+        if self.errors_only and not _is_error(record):
+            return False
+        ts = record.get("timestamp", "")
+        if self.since and ts < self.since:
+            return False
+        if self.until and ts >= self.until:
+            return False
+        return True
+
+
+def _new_block(offset: int) -> dict:
+    return {"offset": offset, "length": 0, "count": 0, "ts_min": "", "ts_max": "",
+            "models": {}, "task_types": {}, "errors": 0}
+
+
+def _add_to_block(block: dict, record: dict):
+    block["count"] += 1
+    ts = str(record.get("timestamp", ""))
+    if not block["ts_min"] or ts < block["ts_min"]:
+        block["ts_min"] = ts
+    if ts > block["ts_max"]:
+        block["ts_max"] = ts
+    for key, counts in (("model", block["models"]), ("task_type", block["task_types"])):
+        value = str(record.get(key, ""))
+        counts[value] = counts.get(value, 0) + 1
+    if _is_error(record):
+        block["errors"] += 1
+
+
+def _parse(line: bytes) -> Optional[dict]:
+    try:
+        record = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def read_tail(path: Path, limit: int) -> list[dict]:
+    """Last `limit` records of a JSONL file, read backwards in chunks."""
+    if limit <= 0 or not path.exists():
+        return []
+    records: list[dict] = []
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        carry = b""
+        while pos > 0 and len(records) < limit:
+            step = min(TAIL_CHUNK_BYTES, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + carry).split(b"\n")
+            carry = lines.pop(0) if pos > 0 else b""
+            for line in reversed(lines):
+                record = _parse(line) if line.strip() else None
+                if record is not None:
+                    records.append(record)
+                    if len(records) >= limit:
+                        break
+    records.reverse()
+    return records
+
+
+class TraceStore:
+    """Streaming, index-assisted access to a directory of daily trace files."""
+
+    def __init__(self, trace_dir: Optional[Path] = None, block_records: int = BLOCK_RECORDS):
+        self.trace_dir = Path(trace_dir or TRACE_DIR)
+        self.block_records = block_records
+        self._indexes: dict[Path, dict] = {}
+        self.stats = Counter()
+
+    # ── Files & indexes ─────────────────────────────────────────────────
+
+    def day_files(self) -> list[tuple[str, Path, bool]]:
+        """(day, path, compressed) for every trace file, oldest first."""
+        found = []
+        if self.trace_dir.exists():
+            for path in self.trace_dir.iterdir():
+                m = _DAY_FILE.match(path.name)
+                if m:
+                    found.append((m.group(1), path, bool(m.group(2))))
+        # A compacted day can gain a live file again if a writer outlived compaction
+        found.sort(key=lambda item: (item[0], not item[2]))
+        return found
+
+    def reset(self):
+        """Forget cached indexes; call after trace files were deleted or replaced."""
+        self._indexes.clear()
+
+    @staticmethod
+    def index_path(path: Path) -> Path:
+        return path.with_name(path.name + ".idx")
+
+    def _load_index(self, path: Path) -> Optional[dict]:
+        index = self._indexes.get(path)
+        if index is None:
+            try:
+                index = json.loads(self.index_path(path).read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                return None
+            if index.get("version") != INDEX_VERSION:
+                return None
+        return index
+
+    def _save_index(self, path: Path, index: dict):
+        self._indexes[path] = index
+        target = self.index_path(path)
+        tmp = target.with_name(target.name + ".tmp")
+        try:
+            tmp.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, target)
+        except OSError:
+            pass  # read-only trace dir: keep the index in memory only
+
+    def index(self, path: Path, compressed: bool = False) -> dict:
+        """Block index for a day file, extended incrementally as the file grows."""
+        size = path.stat().st_size
+        index = self._load_index(path)
+        if index is not None and index["size"] == size:
+            self._indexes[path] = index
+            return index
+        if compressed:
+            index = self._index_gzip(path, size)
+        else:
+            index = self._index_jsonl(path, size, index)
+        self._save_index(path, index)
+        return index
+
+    def _index_jsonl(self, path: Path, size: int, index: Optional[dict]) -> dict:
+        blocks: list[dict] = []
+        start = 0
+        if index is not None and index["size"] < size:
+            blocks = index["blocks"]
+            start = index["size"]
+            if blocks and blocks[-1]["count"] < self.block_records:
+                start = blocks.pop()["offset"]  # reopen the partial tail block
+        self.stats["index_builds"] += 1
+
+        block = _new_block(start)
+        pos = start
+        with open(path, "rb") as f:
+            f.seek(start)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # a writer is mid-append; index it next time
+                pos += len(line)
+                record = _parse(line) if line.strip() else None
+                if record is not None:
+                    _add_to_block(block, record)
+                block["length"] = pos - block["offset"]
+                if block["count"] >= self.block_records:
+                    blocks.append(block)
+                    block = _new_block(pos)
+        if block["length"]:
+            blocks.append(block)
+        return {"version": INDEX_VERSION, "size": pos, "compressed": False, "blocks": blocks}
+
+    def _index_gzip(self, path: Path, size: int) -> dict:
+        """Fallback for a .gz written by something other than compact(): one block."""
+        self.stats["index_builds"] += 1
+        block = _new_block(0)
+        with gzip.open(path, "rb") as f:
+            for line in f:
+                record = _parse(line) if line.strip() else None
+                if record is not None:
+                    _add_to_block(block, record)
+        block["length"] = size
+        return {"version": INDEX_VERSION, "size": size, "compressed": True, "blocks": [block]}
+
+    def _block_lines(self, path: Path, block: dict, compressed: bool) -> Iterator[bytes]:
+        self.stats["blocks_read"] += 1
+        if compressed and block["offset"] == 0 and block["length"] == path.stat().st_size:
+            with gzip.open(path, "rb") as f:
+                yield from f
+            return
+        with open(path, "rb") as f:
+            f.seek(block["offset"])
+            raw = f.read(block["length"])
+        if compressed:
+            raw = gzip.decompress(raw)
+        yield from raw.splitlines()
+
+    # ── Queries ─────────────────────────────────────────────────────────
+
+    def _filter(self, model=None, task_type=None, since: TimeBound = None,
+                until: TimeBound = None, errors_only=False, days: Optional[int] = None) -> TraceFilter:
+        if days and since is None:
+            since = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+        return TraceFilter(model=model, task_type=task_type, since=_iso(since),
+                           until=_iso(until), errors_only=errors_only)
+
+    def query(self, model: Optional[str] = None, task_type: Optional[str] = None,
+              since: TimeBound = None, until: TimeBound = None, errors_only: bool = False,
+              days: Optional[int] = None, limit: Optional[int] = None) -> Iterator[dict]:
+        """Stream matching records oldest first; `days` is a shorthand for since=now-days."""
+        flt = self._filter(model, task_type, since, until, errors_only, days)
+        yielded = 0
+        for day, path, compressed in self.day_files():
+            if not flt.matches_day(day):
+                continue
+            for block in self.index(path, compressed)["blocks"]:
+                if not flt.matches_block(block):
+                    self.stats["blocks_skipped"] += 1
+                    continue
+                for line in self._block_lines(path, block, compressed):
+                    record = _parse(line) if line.strip() else None
+                    if record is not None and flt.matches(record):
+                        yield record
+                        yielded += 1
+                        if limit is not None and yielded >= limit:
+                            return
+
+    def aggregate(self, group_by: Optional[str] = "model", value: str = "latency_ms",
+                  **filters) -> dict[str, dict]:
+        """Count / error rate / mean / P50 / P95 / P99 of `value` per group.
+
+        group_by is a record field ("model", "task_type", "status"), "day",
+        or None for a single "all" group. Memory is one sketch per group.
+        """
+        groups: dict[str, dict] = {}
+        for record in self.query(**filters):
+            if group_by is None:
+                key = "all"
+            elif group_by == "day":
+                key = str(record.get("timestamp", ""))[:10]
+            else:
+                key = str(record.get(group_by, ""))
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = {"sketch": QuantileSketch(), "errors": 0}
+            if _is_error(record):
+                group["errors"] += 1
+            try:
+                group["sketch"].add(float(record.get(value) or 0.0))
+            except (TypeError, ValueError):
+                group["sketch"].add(0.0)
+
+        result = {}
+        for key in sorted(groups):
+            sketch, errors = groups[key]["sketch"], groups[key]["errors"]
+            result[key] = {
+                "count": sketch.count,
+                "errors": errors,
+                "error_rate": round(errors / max(sketch.count, 1), 4),
+                "mean": round(sketch.mean, 1),
+                "p50": round(sketch.quantile(0.50), 1),
+                "p95": round(sketch.quantile(0.95), 1),
+                "p99": round(sketch.quantile(0.99), 1),
+                "max": round(sketch.max, 1),
+            }
+        return result
+
+    def count(self, **filters) -> int:
+        """Number of matching records; unfiltered counts come from the index alone."""
+        if not any(filters.values()):
+            return sum(b["count"] for _, path, gz in self.day_files()
+                       for b in self.index(path, gz)["blocks"])
+        return sum(1 for _ in self.query(**filters))
+
+    def tail(self, limit: int = 20) -> list[dict]:
+        """Most recent records across days, without indexing or loading whole files."""
+        records: list[dict] = []
+        for _, path, compressed in reversed(self.day_files()):
+            if len(records) >= limit:
+                break
+            if compressed:
+                blocks = self.index(path, compressed)["blocks"]
+                older: list[dict] = []
+                for block in reversed(blocks):
+                    lines = list(self._block_lines(path, block, compressed))
+                    older = [r for r in map(_parse, lines) if r is not None] + older
+                    if len(older) + len(records) >= limit:
+                        break
+                records = older + records
+            else:
+                records = read_tail(path, limit - len(records)) + records
+        return records[-limit:] if limit > 0 else []
+
+    # ── Compaction ──────────────────────────────────────────────────────
+
+    def compact(self, keep_days: int = 1, idle_seconds: float = COMPACT_IDLE_SECONDS) -> dict:
+        """Gzip live day files older than `keep_days`, one gzip member per block.
+
+        Files modified within `idle_seconds` are left alone, since a
+        long-running tracer keeps appending to the file of the day it started.
+        """
+        cutoff = (datetime.now(timezone.utc).date() - timedelta(days=keep_days - 1)).isoformat()
+        summary = {"days": [], "bytes_before": 0, "bytes_after": 0}
+        now = time.time()
+        for day, path, compressed in self.day_files():
+            if compressed or day >= cutoff or now - path.stat().st_mtime < idle_seconds:
+                continue
+            before, after = self._compact_file(path)
+            summary["days"].append(day)
+            summary["bytes_before"] += before
+            summary["bytes_after"] += after
+        return summary
+
+    def _compact_file(self, path: Path) -> tuple[int, int]:
+        index = self.index(path, False)
+        gz_path = path.with_name(path.name + ".gz")
+        # Append to an existing archive (indexing it first if it has no sidecar)
+        gz_index = self.index(gz_path, True) if gz_path.exists() else None
+        blocks = list(gz_index["blocks"]) if gz_index else []
+        offset = gz_path.stat().st_size if gz_index else 0
+
+        tmp = gz_path.with_name(gz_path.name + ".tmp")
+        with open(tmp, "wb") as out:
+            if gz_index:
+                with open(gz_path, "rb") as existing:
+                    while chunk := existing.read(1 << 20):
+                        out.write(chunk)
+            with open(path, "rb") as src:
+                for block in index["blocks"]:
+                    src.seek(block["offset"])
+                    member = gzip.compress(src.read(block["length"]), mtime=0)
+                    out.write(member)
+                    blocks.append({**block, "offset": offset, "length": len(member)})
+                    offset += len(member)
+        os.replace(tmp, gz_path)
+        self._save_index(gz_path, {"version": INDEX_VERSION, "size": offset,
+                                   "compressed": True, "blocks": blocks})
+
+        before = index["size"]
+        path.unlink()
+        self.index_path(path).unlink(missing_ok=True)
+        self._indexes.pop(path, None)
+        return before, offset - (gz_index["size"] if gz_index else 0)
+
+
+# ── CLI ─────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="SLATE Trace Query")
+    parser.add_argument("--dir", type=Path, default=None, help="Trace directory")
+    parser.add_argument("--model", help="Only this model")
+    parser.add_argument("--task-type", help="Only this task type")
+    parser.add_argument("--since", help="ISO start time (inclusive)")
+    parser.add_argument("--until", help="ISO end time (exclusive)")
+    parser.add_argument("--days", type=int, help="Only the last N days")
+    parser.add_argument("--errors", action="store_true", help="Only failed inferences")
+    parser.add_argument("--group-by", choices=["model", "task_type", "status", "day", "none"],
+                        help="Aggregate latency percentiles per group")
+    parser.add_argument("--limit", type=int, default=20, help="Max records to list")
+    parser.add_argument("--compact", action="store_true", help="Gzip day files before today")
+    args = parser.parse_args()
+
+    store = TraceStore(args.dir)
+    if args.compact:
+        print(json.dumps(store.compact(), indent=2))
+        return
+
+    filters = {"model": args.model, "task_type": args.task_type, "since": args.since,
+               "until": args.until, "errors_only": args.errors, "days": args.days}
+    if args.group_by:
+        group_by = None if args.group_by == "none" else args.group_by
+        rows = store.aggregate(group_by=group_by, **filters)
+        print(f"  {'Group':<28} {'Count':>7} {'Err%':>6} {'P50':>8} {'P95':>8} {'P99':>8}")
+        print("  " + "-" * 70)
+        for key, row in rows.items():
+            print(f"  {key:<28} {row['count']:>7} {row['error_rate']:>5.1%} "
+                  f"{row['p50']:>6.0f}ms {row['p95']:>6.0f}ms {row['p99']:>6.0f}ms")
+        return
+
+    for record in store.query(limit=args.limit, **filters):
+        print(f"  {record.get('timestamp', '?')[:19]} [{record.get('status', '?'):>7}] "
+              f"{record.get('model', '?'):<24} {record.get('latency_ms', 0):>7.0f}ms "
+              f"{record.get('task_type', '?')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-# Modified: 2026-02-07T15:00:00Z | Author: Claude | Change: Secure AI training pipeline with secret filtering
+# Modified: 2026-10-17T06:00:00Z | Author: COPILOT | Change: Batched, HEAD-keyed git history index
 """
 SLATE Secure AI Training Pipeline
 ==================================
@@ -14,8 +14,15 @@ Security Protocol:
 - Commit message sanitization
 - NO external distribution - local training only
 
+Incremental collection (--incremental) scans files in a process pool and
+caches each file's scan result by git blob SHA, so a re-collection only
+rescans files whose content changed. Samples stream into sharded JSONL
+under .slate_training/samples/ instead of one training_data.json.
+
 Usage:
     python slate/slate_training_pipeline.py --collect          # Collect training data
+    python slate/slate_training_pipeline.py --collect --incremental [--workers N]
+                                                               # Parallel, cached, sharded JSONL
     python slate/slate_training_pipeline.py --validate         # Validate data is secret-free
     python slate/slate_training_pipeline.py --prepare          # Prepare for training
     python slate/slate_training_pipeline.py --train            # Execute training
@@ -25,13 +32,16 @@ Usage:
 import argparse
 import hashlib
 import json
+import os
 import re
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 WORKSPACE_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(WORKSPACE_ROOT))
@@ -42,16 +52,15 @@ if sys.platform == "win32":
 
 # Import SLATE security modules
 try:
-    from slate.pii_scanner import scan_text, redact_text
     from slate.action_guard import ActionGuard
 except ImportError:
     # Fallback if modules not available
-    def scan_text(text): return []
-    def redact_text(text): return text, []
     class ActionGuard:
         def validate_action(self, *args):
             return type('obj', (object,), {'allowed': True})()
 
+from slate.pii_scanner import ALLOWLIST_PATTERNS, PII_PATTERNS, PIIMatch, ScanEngine  # noqa: E402
+
 # ═══════════════════════════════════════════════════════════════════════
 # CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════════
@@ -60,6 +69,19 @@ TRAINING_DIR = WORKSPACE_ROOT / ".slate_training"
 TRAINING_DATA_FILE = TRAINING_DIR / "training_data.json"
 MODELFILE_DIR = TRAINING_DIR / "modelfiles"
 STATE_FILE = TRAINING_DIR / "pipeline_state.json"
+SAMPLES_DIR = TRAINING_DIR / "samples"
+SAMPLES_MANIFEST = SAMPLES_DIR / "manifest.json"
+SCAN_CACHE_FILE = TRAINING_DIR / "scan_cache.jsonl"
+SCAN_CACHE_VERSION = 2
+HISTORY_INDEX_FILE = TRAINING_DIR / "history_index.json"
+HISTORY_INDEX_VERSION = 1
+# NUL-separated fields cannot collide with anything in a commit subject or path
+GIT_LOG_FORMAT = "%x1e%H%x00%an%x00%ae%x00%ad%x00%s"
+SHARD_SAMPLES = 1000          # samples per JSONL shard
+PARALLEL_MIN_FILES = 16       # fewer cache misses than this are scanned in-process
+MIN_FILE_CHARS = 50
+MIN_DOCSTRING_CHARS = 20
+DOCSTRING_PATTERN = re.compile(r'"""(.*?)"""', re.DOTALL)
 OLLAMA_URL = "http://127.0.0.1:11434"
 
 # Secret patterns to ALWAYS filter
@@ -91,6 +113,15 @@ SECRET_PATTERNS = [
     re.compile(r'(?:PASSWORD|SECRET|TOKEN|API_KEY|PRIVATE_KEY)\s*=\s*["\'][^"\']{8,}["\']', re.I),
 ]
 
+SECRET_TYPES = {f"secret_pattern_{i}": pattern for i, pattern in enumerate(SECRET_PATTERNS)}
+
+# Where a secret and PII overlap, the redaction starting first (the secret on
+# a tie) covers both; the PII allowlist (example.com, private IPs, ...) never
+# exempts a secret
+SECRET_ENGINE = ScanEngine(SECRET_TYPES)
+SECURITY_ENGINE = ScanEngine({**SECRET_TYPES, **PII_PATTERNS}, ALLOWLIST_PATTERNS,
+                             allowlisted_types=PII_PATTERNS)
+
 # Files to ALWAYS exclude from training
 EXCLUDED_FILE_PATTERNS = [
     r'\.env$', r'\.env\.[a-z]+$',
@@ -159,44 +190,42 @@ class SecretScanner:
 
     def contains_secrets(self, content: str) -> list[str]:
         """Check if content contains any secrets. Returns list of pattern names."""
-        findings = []
-        for i, pattern in enumerate(SECRET_PATTERNS):
-            if pattern.search(content):
-                findings.append(f"secret_pattern_{i}")
-        return findings
+        return list(dict.fromkeys(m.pii_type for m in SECRET_ENGINE.finditer(content)))
+
+    @staticmethod
+    def _redaction(match: PIIMatch) -> str:
+        if match.pii_type in SECRET_TYPES:
+            return "[REDACTED_SECRET]"
+        return f"[REDACTED:{match.pii_type.upper()}]"
 
     def scan_and_redact(self, content: str) -> SecurityScanResult:
-        """Scan content and redact any secrets/PII."""
+        """
+        Scan content and redact any secrets/PII.
+
+        One pass finds secrets and PII together; only content that had
+        findings gets a second pass to verify the redacted text is clean.
+        """
         self._scan_count += 1
 
         result = SecurityScanResult(is_safe=True, redacted_content=content)
+        matches = SECURITY_ENGINE.scan(content)
+        if not matches:
+            return result
 
-        # Check for secrets
-        secret_findings = self.contains_secrets(content)
+        secret_findings = list(dict.fromkeys(m.pii_type for m in matches if m.pii_type in SECRET_TYPES))
+        pii_matches = [m for m in matches if m.pii_type not in SECRET_TYPES]
         if secret_findings:
             result.secrets_found = len(secret_findings)
             result.warnings.extend([f"Secret detected: {f}" for f in secret_findings])
             self._secrets_blocked += len(secret_findings)
-
-            # Redact secrets
-            redacted = content
-            for pattern in SECRET_PATTERNS:
-                redacted = pattern.sub("[REDACTED_SECRET]", redacted)
-            result.redacted_content = redacted
-            result.is_safe = False
-
-        # Check for PII
-        pii_matches = scan_text(content)
         if pii_matches:
             result.pii_found = len(pii_matches)
             result.warnings.extend([f"PII detected: {m.pii_type}" for m in pii_matches])
-            result.redacted_content, _ = redact_text(result.redacted_content)
 
-        # Re-check redacted content is safe
-        if result.secrets_found > 0 or result.pii_found > 0:
-            remaining_secrets = self.contains_secrets(result.redacted_content)
-            result.is_safe = len(remaining_secrets) == 0
+        result.redacted_content, _ = SECURITY_ENGINE.redact(content, matches, self._redaction)
 
+        # Re-check redacted content is safe
+        result.is_safe = not self.contains_secrets(result.redacted_content)
         return result
 
     def is_file_excluded(self, file_path: str) -> bool:
@@ -214,6 +243,359 @@ class SecretScanner:
         }
 
 
+def content_type_for(file_path: Path) -> str:
+    """Training content type from a file's extension."""
+    if file_path.suffix in {'.md', '.rst', '.txt'}:
+        return "documentation"
+    if file_path.suffix in {'.yml', '.yaml', '.json', '.toml'}:
+        return "config"
+    return "code"
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# INCREMENTAL COLLECTION
+# ═══════════════════════════════════════════════════════════════════════
+
+_worker_scanner: Optional[SecretScanner] = None
+
+
+def scan_blob(file_path: str) -> dict:
+    """
+    Scan one file for incremental collection (runs in pool workers).
+
+    The result depends on the file's content plus whether its name ends in
+    .py (docstrings are only extracted from Python files); scan_key() folds
+    both into the cache key so renamed or copied files still reuse it.
+    """
+    global _worker_scanner
+    if _worker_scanner is None:
+        _worker_scanner = SecretScanner()
+    scanner = _worker_scanner
+
+    try:
+        content = Path(file_path).read_text(encoding="utf-8", errors="replace")
+    except OSError as e:
+        return {"error": str(e)}
+
+    entry: dict[str, Any] = {"content": None, "secrets": 0, "docstrings": []}
+    if len(content.strip()) < MIN_FILE_CHARS:
+        entry["skipped"] = "too small"
+    else:
+        scan_result = scanner.scan_and_redact(content)
+        entry["secrets"] = scan_result.secrets_found
+        if scan_result.is_safe:
+            sample = TrainingSample(source="file", content=scan_result.redacted_content, content_type="")
+            entry.update(content=sample.content, hash=sample.hash, tokens=sample.tokens_estimated)
+        else:
+            entry["skipped"] = "unredactable secrets"
+
+    if file_path.endswith(".py"):
+        for doc in DOCSTRING_PATTERN.findall(content):
+            doc = doc.strip()
+            if len(doc) < MIN_DOCSTRING_CHARS:
+                continue
+            scan_result = scanner.scan_and_redact(doc)
+            entry["secrets"] += scan_result.secrets_found
+            entry["docstrings"].append(scan_result.redacted_content)
+    return entry
+
+
+def scan_key(file_path: Path, sha: str) -> str:
+    """BlobScanCache key for a tracked file: its blob SHA, tagged for .py names."""
+    return f"{sha}:py" if str(file_path).endswith(".py") else sha
+
+
+def scanner_fingerprint() -> str:
+    """Changes whenever a cached scan result could differ for the same content."""
+    digest = hashlib.sha1(f"v{SCAN_CACHE_VERSION}|{MIN_FILE_CHARS}|{MIN_DOCSTRING_CHARS}".encode())
+    for pattern in (*SECURITY_ENGINE.patterns.values(), *ALLOWLIST_PATTERNS, DOCSTRING_PATTERN):
+        digest.update(f"{pattern.flags}:{pattern.pattern}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+class BlobScanCache:
+    """scan_blob results keyed by scan_key (git blob SHA + .py flag), stored as JSONL."""
+
+    def __init__(self, path: Path = SCAN_CACHE_FILE, fingerprint: Optional[str] = None):
+        self.path = Path(path)
+        self.fingerprint = fingerprint or scanner_fingerprint()
+        self.entries: dict[str, dict] = {}
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                header = json.loads(fh.readline() or "{}")
+                if header.get("fingerprint") != self.fingerprint:
+                    return  # scanner changed: every result is stale
+                for line in fh:
+                    if line.strip():
+                        record = json.loads(line)
+                        self.entries[record.pop("sha")] = record
+        except (OSError, json.JSONDecodeError):
+            self.entries.clear()
+
+    def get(self, sha: str) -> Optional[dict]:
+        return self.entries.get(sha)
+
+    def put(self, sha: str, entry: dict):
+        self.entries[sha] = entry
+
+    def save(self, live: Optional[set] = None):
+        """Rewrite the cache, keeping only `live` SHAs when given."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write(json.dumps({"fingerprint": self.fingerprint, "version": SCAN_CACHE_VERSION}) + "\n")
+            for sha, entry in self.entries.items():
+                if live is None or sha in live:
+                    fh.write(json.dumps({"sha": sha, **entry}, ensure_ascii=False) + "\n")
+        os.replace(tmp, self.path)
+
+
+class ShardedSampleWriter:
+    """
+    Streams samples into samples-NNNNN.jsonl shards plus a manifest.json.
+
+    Shards are written to a sibling staging directory that replaces the
+    previous samples directory only on close(), so readers never see a
+    half-written collection.
+    """
+
+    def __init__(self, directory: Path = SAMPLES_DIR, shard_samples: int = SHARD_SAMPLES):
+        self.directory = Path(directory)
+        self.shard_samples = max(1, shard_samples)
+        self._staging = self.directory.with_name(self.directory.name + ".partial")
+        shutil.rmtree(self._staging, ignore_errors=True)
+        self._staging.mkdir(parents=True)
+        self._fh = None
+        self._in_shard = 0
+        self.shards: list[str] = []
+        self.total = 0
+        self.by_type: dict[str, int] = {}
+        self.by_source: dict[str, int] = {}
+
+    def write(self, sample: TrainingSample):
+        if self._fh is None or self._in_shard >= self.shard_samples:
+            self._next_shard()
+        self._fh.write(json.dumps({
+            "source": sample.source,
+            "content": sample.content,
+            "content_type": sample.content_type,
+            "file_path": sample.file_path,
+            "commit_hash": sample.commit_hash,
+            "tokens_estimated": sample.tokens_estimated,
+            "hash": sample.hash,
+        }, ensure_ascii=False) + "\n")
+        self._in_shard += 1
+        self.total += 1
+        self.by_type[sample.content_type] = self.by_type.get(sample.content_type, 0) + 1
+        self.by_source[sample.source] = self.by_source.get(sample.source, 0) + 1
+
+    def _next_shard(self):
+        if self._fh is not None:
+            self._fh.close()
+        name = f"samples-{len(self.shards):05d}.jsonl"
+        self.shards.append(name)
+        self._fh = open(self._staging / name, "w", encoding="utf-8")
+        self._in_shard = 0
+
+    def close(self, **manifest) -> dict:
+        """Finish the last shard, write the manifest and publish the directory."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        manifest = {
+            "total_samples": self.total,
+            "by_type": self.by_type,
+            "by_source": self.by_source,
+            "shards": self.shards,
+            **manifest,
+        }
+        (self._staging / SAMPLES_MANIFEST.name).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        previous = self.directory.with_name(self.directory.name + ".old")
+        shutil.rmtree(previous, ignore_errors=True)
+        if self.directory.exists():
+            os.replace(self.directory, previous)
+        os.replace(self._staging, self.directory)
+        shutil.rmtree(previous, ignore_errors=True)
+        return manifest
+
+
+def iter_training_samples(training_dir: Path = TRAINING_DIR) -> Iterator[dict]:
+    """Samples of the most recent collection, sharded JSONL or legacy JSON."""
+    manifest_path = training_dir / SAMPLES_DIR.name / SAMPLES_MANIFEST.name
+    legacy_path = training_dir / TRAINING_DATA_FILE.name
+    if _newest(manifest_path, legacy_path) is manifest_path:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        for shard in manifest.get("shards", []):
+            with open(manifest_path.parent / shard, encoding="utf-8") as fh:
+                for line in fh:
+                    if line.strip():
+                        yield json.loads(line)
+    elif legacy_path.exists():
+        yield from json.loads(legacy_path.read_text(encoding="utf-8")).get("samples", [])
+
+
+def load_training_summary(training_dir: Path = TRAINING_DIR) -> Optional[dict]:
+    """Counts of the most recent collection (without its samples), or None."""
+    manifest_path = training_dir / SAMPLES_DIR.name / SAMPLES_MANIFEST.name
+    legacy_path = training_dir / TRAINING_DATA_FILE.name
+    newest = _newest(manifest_path, legacy_path)
+    if newest is None:
+        return None
+    data = json.loads(newest.read_text(encoding="utf-8"))
+    data.pop("samples", None)
+    return data
+
+
+def _newest(*paths: Path) -> Optional[Path]:
+    existing = [p for p in paths if p.exists()]
+    return max(existing, key=lambda p: p.stat().st_mtime) if existing else None
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# GIT HISTORY INDEX
+# ═══════════════════════════════════════════════════════════════════════
+
+def _parse_log_record(raw: bytes) -> Optional[dict]:
+    fields = raw.decode("utf-8", errors="replace").split("\0")
+    if len(fields) < 5:
+        return None
+    files = [f.lstrip("\n") for f in fields[5:]]
+    return {
+        "hash": fields[0],
+        "author": fields[1],
+        "email": fields[2],
+        "date": fields[3],
+        "message": fields[4],
+        "files": [f for f in files if f],
+    }
+
+
+def iter_git_log(workspace: Path, args: list[str], name_only: bool = True,
+                 timeout: int = 600) -> Iterator[dict]:
+    """
+    Stream `git log` as commit dicts (newest first), parsing while git runs.
+
+    Each dict has hash, author, email, date (ISO), message (subject) and,
+    with name_only, the files the commit touched.
+    """
+    cmd = ["git", "log", "-z", "--date=iso", f"--format={GIT_LOG_FORMAT}"]
+    if name_only:
+        cmd.append("--name-only")
+    try:
+        proc = subprocess.Popen(cmd + args, cwd=str(workspace), stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL)
+    except OSError:
+        return
+    buffer = b""
+    try:
+        for chunk in iter(lambda: proc.stdout.read(1 << 16), b""):
+            buffer += chunk
+            *records, buffer = buffer.split(b"\x1e")
+            for raw in records:
+                commit = _parse_log_record(raw) if raw else None
+                if commit:
+                    yield commit
+        commit = _parse_log_record(buffer) if buffer else None
+        if commit:
+            yield commit
+    finally:
+        proc.stdout.close()
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+class GitHistoryIndex:
+    """
+    Commit history of every file in the repository, built from one
+    `git log --name-only` pass and cached on disk keyed by HEAD.
+
+    When HEAD moves forward only the new commits (`<indexed>..HEAD`) are
+    read; a HEAD that is not a descendant of the indexed one (reset,
+    rebase, branch switch) triggers a full rebuild.
+    """
+
+    def __init__(self, workspace: Path, index_path: Optional[Path] = None):
+        self.workspace = Path(workspace)
+        # Default to the indexed repo's own .slate_training so repos never share an index
+        self.index_path = (Path(index_path) if index_path
+                           else self.workspace / TRAINING_DIR.name / HISTORY_INDEX_FILE.name)
+        self.head = ""
+        self.commits: list[dict] = []           # oldest first; position is the commit id
+        self.files: dict[str, list[int]] = {}   # path -> commit ids, oldest first
+        self._loaded = False
+
+    def _git(self, *args: str) -> subprocess.CompletedProcess:
+        return subprocess.run(["git", *args], capture_output=True, text=True, timeout=60,
+                              cwd=str(self.workspace), encoding="utf-8", errors="replace")
+
+    def _load(self):
+        self._loaded = True
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get("version") != HISTORY_INDEX_VERSION:
+            return
+        keys = ("hash", "author", "email", "date", "message")
+        self.head = data.get("head", "")
+        self.commits = [dict(zip(keys, row)) for row in data.get("commits", [])]
+        self.files = data.get("files", {})
+
+    def _save(self):
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": HISTORY_INDEX_VERSION,
+            "head": self.head,
+            "commits": [[c["hash"], c["author"], c["email"], c["date"], c["message"]] for c in self.commits],
+            "files": self.files,
+        }
+        tmp = self.index_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.index_path)
+
+    def refresh(self) -> dict:
+        """Bring the index up to date with HEAD; returns what was done."""
+        if not self._loaded:
+            self._load()
+        result = self._git("rev-parse", "--verify", "--quiet", "HEAD")
+        head = result.stdout.strip() if result.returncode == 0 else ""
+        if head == self.head:
+            return {"mode": "cached", "head": head, "new_commits": 0}
+
+        incremental = bool(self.head and head) and self._git(
+            "merge-base", "--is-ancestor", self.head, head).returncode == 0
+        if not incremental:
+            self.commits, self.files = [], {}
+        new = list(iter_git_log(self.workspace, [f"{self.head}..{head}" if incremental else head])) if head else []
+
+        for commit in reversed(new):
+            commit_id = len(self.commits)
+            for path in commit.pop("files"):
+                self.files.setdefault(path, []).append(commit_id)
+            self.commits.append(commit)
+        self.head = head
+        self._save()
+        return {"mode": "incremental" if incremental else "full", "head": head, "new_commits": len(new)}
+
+    def file_history(self, rel_path: str, limit: int = 10) -> list[dict]:
+        """Latest `limit` commits touching rel_path, newest first (hash, message, date)."""
+        ids = self.files.get(rel_path, [])
+        return [
+            {"hash": c["hash"][:12], "message": c["message"], "date": c["date"][:10]}
+            for c in (self.commits[i] for i in reversed(ids[-limit:] if limit else ids))
+        ]
+
+    def stats(self) -> dict:
+        return {"head": self.head, "commits": len(self.commits), "files": len(self.files)}
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # GIT INGESTION
 # ═══════════════════════════════════════════════════════════════════════
@@ -221,9 +603,19 @@ class SecretScanner:
 class GitIngester:
     """Ingests entire git repository for training."""
 
-    def __init__(self, workspace: Path):
+    def __init__(self, workspace: Path, history_path: Optional[Path] = None):
         self.workspace = workspace
         self.scanner = SecretScanner()
+        self._history_path = history_path
+        self._history: Optional["GitHistoryIndex"] = None
+
+    @property
+    def history(self) -> "GitHistoryIndex":
+        """Per-file history index, brought up to date with HEAD on first use."""
+        if self._history is None:
+            self._history = GitHistoryIndex(self.workspace, self._history_path)
+            self._history.refresh()
+        return self._history
 
     def _run_git(self, args: list[str], timeout: int = 60) -> str:
         """Run a git command."""
@@ -250,50 +642,46 @@ class GitIngester:
                         files.append(file_path)
         return files
 
+    def get_tracked_blobs(self) -> list[tuple[Path, str]]:
+        """
+        Training files with their git blob SHA (`git ls-files -s`). Files
+        modified in the working tree are hashed the way git would, so the
+        SHA always identifies the content that will be read.
+        """
+        modified = set(filter(None, self._run_git(["ls-files", "-m", "-z"]).split("\0")))
+        blobs = []
+        for record in self._run_git(["ls-files", "-s", "-z"]).split("\0"):
+            meta, _, rel = record.partition("\t")
+            if not rel or len(meta.split()) < 3:
+                continue
+            file_path = self.workspace / rel
+            if file_path.suffix.lower() not in TRAINING_FILE_EXTENSIONS:
+                continue
+            if self.scanner.is_file_excluded(str(file_path)) or not file_path.is_file():
+                continue
+            sha = meta.split()[1]
+            if rel in modified:
+                data = file_path.read_bytes()
+                sha = hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+            blobs.append((file_path, sha))
+        return blobs
+
     def get_commit_history(self, limit: int = 500) -> list[dict]:
         """Get commit history with messages."""
-        output = self._run_git([
-            "log", f"--max-count={limit}",
-            "--format=%H|||%s|||%an|||%ae|||%ad",
-            "--date=iso"
-        ])
-        commits = []
-        for line in output.split('\n'):
-            if not line.strip():
-                continue
-            parts = line.split("|||")
-            if len(parts) >= 5:
-                commit = {
-                    "hash": parts[0][:12],
-                    "message": parts[1],
-                    "author": parts[2],
-                    "email": parts[3],
-                    "date": parts[4],
-                }
-                commits.append(commit)
-        return commits
+        return [
+            {
+                "hash": commit["hash"][:12],
+                "message": commit["message"],
+                "author": commit["author"],
+                "email": commit["email"],
+                "date": commit["date"],
+            }
+            for commit in iter_git_log(self.workspace, [f"--max-count={limit}"], name_only=False)
+        ]
 
     def get_file_history(self, file_path: Path, limit: int = 10) -> list[dict]:
-        """Get change history for a specific file."""
-        rel_path = file_path.relative_to(self.workspace)
-        output = self._run_git([
-            "log", f"--max-count={limit}",
-            "--format=%H|||%s|||%ad",
-            "--date=short", "--",
-            str(rel_path)
-        ])
-        history = []
-        for line in output.split('\n'):
-            if not line.strip():
-                continue
-            parts = line.split("|||")
-            if len(parts) >= 3:
-                history.append({
-                    "hash": parts[0][:12],
-                    "message": parts[1],
-                    "date": parts[2],
-                })
-        return history
+        """Get change history for a specific file (newest first)."""
+        return self.history.file_history(file_path.relative_to(self.workspace).as_posix(), limit)
 
     def collect_code_samples(self) -> list[TrainingSample]:
         """Collect code samples from all tracked files."""
@@ -310,33 +698,26 @@ class GitIngester:
                 content = file_path.read_text(encoding="utf-8", errors="replace")
 
                 # Skip empty or very small files
-                if len(content.strip()) < 50:
+                if len(content.strip()) < MIN_FILE_CHARS:
                     continue
 
                 # Security scan
                 scan_result = self.scanner.scan_and_redact(content)
 
-                # Use redacted content if secrets found
-                safe_content = scan_result.redacted_content if not scan_result.is_safe else content
+                # Redacted content (identical to content when nothing was found)
+                safe_content = scan_result.redacted_content
 
                 # Skip if still unsafe after redaction
-                if self.scanner.contains_secrets(safe_content):
+                if not scan_result.is_safe:
                     print(f"    [!] Skipping {file_path.name} - contains unredactable secrets")
                     continue
 
-                # Determine content type
-                content_type = "code"
-                if file_path.suffix in {'.md', '.rst', '.txt'}:
-                    content_type = "documentation"
-                elif file_path.suffix in {'.yml', '.yaml', '.json', '.toml'}:
-                    content_type = "config"
-
                 rel_path = str(file_path.relative_to(self.workspace))
 
                 samples.append(TrainingSample(
                     source="file",
                     content=safe_content,
-                    content_type=content_type,
+                    content_type=content_type_for(file_path),
                     file_path=rel_path,
                 ))
 
@@ -387,12 +768,9 @@ class GitIngester:
                 content = py_file.read_text(encoding="utf-8", errors="replace")
 
                 # Extract docstrings (triple-quoted strings at module/function/class level)
-                docstring_pattern = re.compile(r'"""(.*?)"""', re.DOTALL)
-                matches = docstring_pattern.findall(content)
-
-                for doc in matches:
+                for doc in DOCSTRING_PATTERN.findall(content):
                     doc = doc.strip()
-                    if len(doc) < 20:  # Skip tiny docstrings
+                    if len(doc) < MIN_DOCSTRING_CHARS:  # Skip tiny docstrings
                         continue
 
                     # Security scan
@@ -529,6 +907,99 @@ class TrainingPipeline:
 
         return training_data
 
+    def collect_training_data_incremental(self, workers: Optional[int] = None,
+                                          shard_samples: int = SHARD_SAMPLES) -> dict:
+        """
+        Collect training data, rescanning only files whose blob changed.
+
+        Cache misses are scanned in a process pool (in-process when there are
+        fewer than PARALLEL_MIN_FILES); samples stream into sharded JSONL.
+        """
+        print()
+        print("=" * 70)
+        print("  SLATE Incremental Training Data Collection")
+        print("=" * 70)
+        print()
+
+        blobs = self.ingester.get_tracked_blobs()
+        cache = BlobScanCache(self.training_dir / SCAN_CACHE_FILE.name)
+        entries: dict[str, dict] = {}
+        misses: dict[str, Path] = {}
+        for file_path, sha in blobs:
+            key = scan_key(file_path, sha)
+            cached = cache.get(key)
+            if cached is not None:
+                entries[key] = cached
+            else:
+                misses.setdefault(key, file_path)
+
+        print(f"[1/3] Scanning files: {len(blobs)} tracked, {len(misses)} changed")
+        if misses:
+            paths = [str(p) for p in misses.values()]
+            if len(paths) < PARALLEL_MIN_FILES or workers == 1:
+                entries.update(zip(misses, map(scan_blob, paths)))
+            else:
+                workers = workers or os.cpu_count() or 1
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    chunksize = max(1, len(paths) // (workers * 4))
+                    entries.update(zip(misses, pool.map(scan_blob, paths, chunksize=chunksize)))
+            for key in misses:
+                if not entries[key].get("error"):  # read errors are retried next time
+                    cache.put(key, entries[key])
+        cache.save(live=set(entries))
+
+        writer = ShardedSampleWriter(self.training_dir / SAMPLES_DIR.name, shard_samples)
+        secrets_blocked = 0
+        skipped = 0
+        for file_path, sha in blobs:
+            entry = entries[scan_key(file_path, sha)]
+            secrets_blocked += entry.get("secrets", 0)
+            if entry.get("error"):
+                print(f"    [!] Error processing {file_path.name}: {entry['error']}")
+                continue
+            rel_path = file_path.relative_to(self.workspace).as_posix()
+            if entry.get("content") is not None:
+                writer.write(TrainingSample(
+                    source="file", content=entry["content"], content_type=content_type_for(file_path),
+                    file_path=rel_path, tokens_estimated=entry["tokens"], hash=entry["hash"],
+                ))
+            elif entry.get("skipped") == "unredactable secrets":
+                skipped += 1
+                print(f"    [!] Skipping {file_path.name} - contains unredactable secrets")
+            for doc in entry.get("docstrings", []):
+                writer.write(TrainingSample(
+                    source="docstring", content=doc, content_type="documentation", file_path=rel_path,
+                ))
+
+        print("[2/3] Collecting commit messages...")
+        for sample in self.ingester.collect_commit_messages():
+            writer.write(sample)
+
+        print("[3/3] Writing shards...")
+        cache_hits = sum(1 for file_path, sha in blobs if scan_key(file_path, sha) not in misses)
+        collected_at = datetime.now(timezone.utc).isoformat()
+        manifest = writer.close(
+            collected_at=collected_at,
+            scanner_stats={
+                "total_scans": len(misses),
+                "secrets_blocked": secrets_blocked,
+                "cache_hits": cache_hits,
+                "files_skipped": skipped,
+            },
+        )
+
+        self.state["last_collection"] = collected_at
+        self.state["total_samples"] = manifest["total_samples"]
+        self._save_state()
+
+        print()
+        print("=" * 70)
+        print(f"  Collection Complete: {manifest['total_samples']} samples in {len(manifest['shards'])} shard(s)")
+        print(f"  Files rescanned: {len(misses)}  Cached: {cache_hits}")
+        print(f"  Data saved to: {writer.directory}")
+        print("=" * 70)
+        return manifest
+
     def validate_training_data(self) -> dict:
         """Validate training data is free of secrets."""
         print()
@@ -537,11 +1008,10 @@ class TrainingPipeline:
         print("=" * 70)
         print()
 
-        if not TRAINING_DATA_FILE.exists():
+        if load_training_summary(self.training_dir) is None:
             return {"valid": False, "error": "No training data found. Run --collect first."}
 
-        training_data = json.loads(TRAINING_DATA_FILE.read_text(encoding="utf-8"))
-        samples = training_data.get("samples", [])
+        samples = iter_training_samples(self.training_dir)
 
         scanner = SecretScanner()
         issues = []
@@ -583,15 +1053,13 @@ class TrainingPipeline:
 
     def prepare_modelfile(self, base_model: str = "mistral-nemo") -> Path:
         """Prepare Modelfile for custom model training."""
-        if not TRAINING_DATA_FILE.exists():
+        summary = load_training_summary(self.training_dir)
+        if summary is None:
             raise ValueError("No training data. Run --collect first.")
 
-        training_data = json.loads(TRAINING_DATA_FILE.read_text(encoding="utf-8"))
-        samples = training_data.get("samples", [])
-
         # Extract key patterns for system prompt
         file_patterns = {}
-        for sample in samples:
+        for sample in iter_training_samples(self.training_dir):
             if sample.get("file_path"):
                 parts = sample["file_path"].split("/")
                 if parts:
@@ -605,7 +1073,7 @@ class TrainingPipeline:
 
 # SLATE Custom Model - Trained on local codebase
 # Generated: {datetime.now(timezone.utc).isoformat()}
-# Samples: {len(samples)}
+# Samples: {summary.get("total_samples", 0)}
 # SECURITY: No secrets or PII included
 
 SYSTEM """You are SLATE AI, a specialized assistant for the SLATE project.
@@ -710,8 +1178,8 @@ PARAMETER top_p 0.9
         print(f"  Models trained: {', '.join(self.state.get('models_trained', [])) or 'None'}")
         print()
 
-        if TRAINING_DATA_FILE.exists():
-            training_data = json.loads(TRAINING_DATA_FILE.read_text(encoding="utf-8"))
+        training_data = load_training_summary(self.training_dir)
+        if training_data is not None:
             print("  Training Data Summary:")
             print(f"    Code samples: {training_data.get('by_type', {}).get('code', 0)}")
             print(f"    Documentation: {training_data.get('by_type', {}).get('documentation', 0)}")
@@ -731,6 +1199,9 @@ PARAMETER top_p 0.9
 def main():
     parser = argparse.ArgumentParser(description="SLATE Secure AI Training Pipeline")
     parser.add_argument("--collect", action="store_true", help="Collect training data from git")
+    parser.add_argument("--incremental", action="store_true",
+                        help="With --collect: parallel, blob-cached collection into sharded JSONL")
+    parser.add_argument("--workers", type=int, default=None, help="Scan processes for --incremental")
     parser.add_argument("--validate", action="store_true", help="Validate training data is secret-free")
     parser.add_argument("--prepare", action="store_true", help="Prepare Modelfile for training")
     parser.add_argument("--train", action="store_true", help="Train custom model")
@@ -742,7 +1213,10 @@ def main():
     pipeline = TrainingPipeline()
 
     if args.collect:
-        result = pipeline.collect_training_data()
+        if args.incremental:
+            result = pipeline.collect_training_data_incremental(workers=args.workers)
+        else:
+            result = pipeline.collect_training_data()
         if args.json:
             print(json.dumps({
                 "samples_collected": result["total_samples"],
@@ -37,6 +37,8 @@ from pathlib import Path
 WORKSPACE_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(WORKSPACE_ROOT))
 
+from slate_core.task_store import get_task_store  # noqa: E402
+
 # Force UTF-8
 if sys.platform == "win32":
     sys.stdout.reconfigure(encoding="utf-8", errors="replace")
@@ -156,17 +158,12 @@ class UnifiedAutonomousLoop:
         return unique
 
     def _discover_from_task_file(self) -> list[dict]:
-        """Load pending tasks from current_tasks.json."""
+        """Load pending tasks from current_tasks.json (status index of the task store)."""
         if not TASK_FILE.exists():
             return []
         try:
-            data = json.loads(TASK_FILE.read_text(encoding="utf-8"))
-            pending = [
-                t for t in data.get("tasks", [])
-                if t.get("status") in ("pending", "in_progress")
-                and not self._is_stale(t)
-            ]
-            return pending
+            tasks = get_task_store(TASK_FILE).list(status=("pending", "in_progress"))
+            return [t for t in tasks if not self._is_stale(t)]
         except Exception as e:
             self._log(f"Error reading task file: {e}", "WARN")
             return []
@@ -686,27 +683,19 @@ class UnifiedAutonomousLoop:
         return applied
 
     def _update_task_status(self, task_id: str, status: str, error: str = ""):
-        """Update task status in current_tasks.json."""
+        """Update task status in current_tasks.json (point update in the task store)."""
         if not TASK_FILE.exists():
             return
         try:
-            data = json.loads(TASK_FILE.read_text(encoding="utf-8"))
-            for task in data.get("tasks", []):
-                if task.get("id") == task_id:
-                    task["status"] = status
-                    now = datetime.now(timezone.utc).isoformat()
-                    if status == "in_progress":
-                        task["started_at"] = now
-                        task["started_by"] = "autonomous_loop"
-                    elif status == "completed":
-                        task["completed_at"] = now
-                        task["completed_by"] = "autonomous_loop"
-                    elif status == "failed":
-                        task["failed_at"] = now
-                        task["error"] = error
-                    break
-            data["last_updated"] = datetime.now(timezone.utc).isoformat()
-            TASK_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            fields = {"status": status}
+            now = datetime.now(timezone.utc).isoformat()
+            if status == "in_progress":
+                fields.update(started_at=now, started_by="autonomous_loop")
+            elif status == "completed":
+                fields.update(completed_at=now, completed_by="autonomous_loop")
+            elif status == "failed":
+                fields.update(failed_at=now, error=error)
+            get_task_store(TASK_FILE).update(task_id, **fields)
         except Exception as e:
             self._log(f"Failed to update task status: {e}", "ERROR")
 
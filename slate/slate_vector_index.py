@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# Modified: 2026-10-16T13:00:00Z | Author: COPILOT | Change: NumPy vector index for the flat-file fallback
+"""
+SLATE Vector Index — Self-Contained Semantic Search Without ChromaDB
+=====================================================================
+
+When chromadb is not installed, MLOrchestrator.index_codebase falls back to a
+flat-file index. This module gives that mode real vectors and search:
+
+    slate_memory/embeddings/vector_index/
+        vectors.npy   float32 [n, dim], L2-normalized, loaded memory-mapped
+        meta.json     sidecar: row ids, documents, metadata, file hashes
+
+Search is a normalized dot product (cosine similarity) over the matrix with
+top-k selection via argpartition. Rows are appended per file and deleted by
+file path (tombstoned, compacted on save).
+
+The search API mirrors SlateChromaDB: search / search_code / search_docs /
+find_similar_code, returning the same result dicts.
+
+Usage:
+    python slate/slate_vector_index.py --status
+    python slate/slate_vector_index.py --search "task queue locking"
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# Modified: 2026-10-16T13:00:00Z | Author: COPILOT | Change: workspace setup
+WORKSPACE_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(WORKSPACE_ROOT))
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+VECTOR_INDEX_DIR = WORKSPACE_ROOT / "slate_memory" / "embeddings" / "vector_index"
+VECTORS_FILE = "vectors.npy"
+META_FILE = "meta.json"
+EMBED_MODEL = "nomic-embed-text:latest"
+
+# Collection assignment by extension (mirrors SlateChromaDB collection names)
+EXTENSION_COLLECTIONS = {
+    ".py": "slate_code",
+    ".md": "slate_docs",
+    ".yml": "slate_workflows",
+    ".yaml": "slate_workflows",
+}
+
+
+def collection_for(rel_path: str) -> str:
+    """Collection name for a workspace-relative file path."""
+    return EXTENSION_COLLECTIONS.get(Path(rel_path).suffix.lower(), "slate_config")
+
+
+class SlateVectorIndex:
+    """NumPy-backed vector store with the SlateChromaDB search API."""
+
+    def __init__(self, index_dir: Path = VECTOR_INDEX_DIR,
+                 embed_fn: Optional[Callable[[str], list[float]]] = None):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required for SlateVectorIndex")
+        self.index_dir = Path(index_dir)
+        self._embed_fn = embed_fn
+        self._vectors = np.zeros((0, 0), dtype=np.float32)
+        self._pending: list = []
+        self._rows: list[dict] = []
+        self._alive: list[bool] = []
+        self._by_file: dict[str, list[int]] = {}
+        self._by_id: dict[str, int] = {}
+        self._filter_masks: dict[tuple, Any] = {}
+        self.file_hashes: dict[str, str] = {}
+        self.dim = 0
+        self.load()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def load(self):
+        """Load the matrix (memory-mapped) and metadata sidecar, if present."""
+        vec_path = self.index_dir / VECTORS_FILE
+        meta_path = self.index_dir / META_FILE
+        if not (vec_path.exists() and meta_path.exists()):
+            return
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            vectors = np.load(vec_path, mmap_mode="r")
+        except Exception:
+            return
+        rows = meta.get("rows", [])
+        if len(rows) != vectors.shape[0]:
+            return  # Sidecar out of sync with matrix: start fresh
+        self._vectors = vectors
+        self._rows = rows
+        self._alive = [True] * len(rows)
+        self.dim = int(meta.get("dim", vectors.shape[1] if vectors.ndim == 2 else 0))
+        self.file_hashes = meta.get("file_hashes", {})
+        self._reindex_rows()
+
+    def save(self):
+        """Compact deleted rows and write matrix + sidecar atomically."""
+        matrix = self._matrix()
+        keep = [i for i, alive in enumerate(self._alive) if alive]
+        if len(keep) != len(self._rows):
+            matrix = matrix[keep] if keep else np.zeros((0, self.dim), dtype=np.float32)
+            self._rows = [self._rows[i] for i in keep]
+            self._alive = [True] * len(self._rows)
+            self._reindex_rows()
+        # Detach from the memory map before replacing the file (required on Windows)
+        self._vectors = np.array(matrix, dtype=np.float32, copy=True)
+        del matrix
+
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        vec_tmp = self.index_dir / (VECTORS_FILE + ".tmp")
+        meta_tmp = self.index_dir / (META_FILE + ".tmp")
+        with open(vec_tmp, "wb") as f:
+            np.save(f, self._vectors)
+        meta_tmp.write_text(json.dumps({
+            "dim": self.dim,
+            "model": EMBED_MODEL,
+            "rows": self._rows,
+            "file_hashes": self.file_hashes,
+        }), encoding="utf-8")
+        os.replace(vec_tmp, self.index_dir / VECTORS_FILE)
+        os.replace(meta_tmp, self.index_dir / META_FILE)
+
+    def _reindex_rows(self):
+        self._filter_masks = {}
+        self._by_file = {}
+        self._by_id = {}
+        for i, row in enumerate(self._rows):
+            if not self._alive[i]:
+                continue
+            self._by_id[row["id"]] = i
+            path = row["metadata"].get("file_path")
+            if path is not None:
+                self._by_file.setdefault(path, []).append(i)
+
+    def _matrix(self):
+        """Current matrix with pending appends folded in."""
+        if self._pending:
+            parts = ([self._vectors] if self._vectors.shape[0] else []) + self._pending
+            self._vectors = np.concatenate(parts, axis=0)
+            self._pending = []
+        return self._vectors
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def add(self, ids: list[str], embeddings: list[list[float]],
+            documents: list[str], metadatas: list[dict]):
+        """Append rows (same argument names as a ChromaDB collection.add)."""
+        if not ids:
+            return
+        block = np.asarray(embeddings, dtype=np.float32)
+        if block.ndim != 2 or block.shape[0] != len(ids):
+            raise ValueError("embeddings must be a [len(ids), dim] matrix")
+        if self.dim and block.shape[1] != self.dim:
+            raise ValueError(f"dimension mismatch: index {self.dim}, got {block.shape[1]}")
+        if not self.dim:
+            self.dim = int(block.shape[1])
+            if self._vectors.shape[0] == 0:
+                self._vectors = np.zeros((0, self.dim), dtype=np.float32)
+        norms = np.linalg.norm(block, axis=1, keepdims=True)
+        block = block / np.where(norms == 0, 1.0, norms)
+
+        for doc_id in ids:
+            if doc_id in self._by_id:
+                self._tombstone(self._by_id[doc_id])
+
+        self._filter_masks = {}
+        base = len(self._rows)
+        for offset, doc_id in enumerate(ids):
+            metadata = dict(metadatas[offset])
+            self._rows.append({"id": doc_id, "document": documents[offset], "metadata": metadata})
+            self._alive.append(True)
+            self._by_id[doc_id] = base + offset
+            path = metadata.get("file_path")
+            if path is not None:
+                self._by_file.setdefault(path, []).append(base + offset)
+        self._pending.append(block)
+
+    def _tombstone(self, row: int):
+        self._alive[row] = False
+        meta = self._rows[row]["metadata"]
+        self._by_id.pop(self._rows[row]["id"], None)
+        path = meta.get("file_path")
+        if path in self._by_file:
+            self._by_file[path] = [i for i in self._by_file[path] if i != row]
+            if not self._by_file[path]:
+                del self._by_file[path]
+
+    def delete_file(self, file_path: str) -> int:
+        """Delete every row of a file. Returns the number of rows removed."""
+        rows = self._by_file.pop(file_path, [])
+        for row in rows:
+            self._alive[row] = False
+            self._by_id.pop(self._rows[row]["id"], None)
+        self.file_hashes.pop(file_path, None)
+        return len(rows)
+
+    def indexed_files(self) -> list[str]:
+        return list(self._by_file)
+
+    def count(self) -> int:
+        return sum(self._alive)
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+
+    def _mask(self, where: Optional[dict]):
+        """Alive rows matching every equality filter in where.
+
+        Per-(key, value) masks are cached until rows are added, so repeated
+        collection-filtered searches don't rescan metadata.
+        """
+        mask = np.fromiter(self._alive, dtype=bool, count=len(self._alive))
+        for key, value in (where or {}).items():
+            cache_key = (key, json.dumps(value, sort_keys=True, default=str))
+            match = self._filter_masks.get(cache_key)
+            if match is None:
+                match = np.fromiter(
+                    (row["metadata"].get(key) == value for row in self._rows),
+                    dtype=bool, count=len(self._rows),
+                )
+                self._filter_masks[cache_key] = match
+            mask &= match
+        return mask
+
+    def query(self, query_embedding: list[float], n_results: int = 10,
+              where: Optional[dict] = None) -> list[dict]:
+        """Top-k rows by cosine similarity to query_embedding."""
+        matrix = self._matrix()
+        if matrix.shape[0] == 0 or n_results <= 0:
+            return []
+        q = np.asarray(query_embedding, dtype=np.float32)
+        if q.shape[0] != matrix.shape[1]:
+            raise ValueError(f"query dimension {q.shape[0]} != index dimension {matrix.shape[1]}")
+        norm = float(np.linalg.norm(q))
+        if norm:
+            q = q / norm
+
+        scores = matrix @ q
+        mask = self._mask(where)
+        k = min(n_results, int(mask.sum()))
+        if k == 0:
+            return []
+        scores = np.where(mask, scores, -np.inf)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        results = []
+        for i in top:
+            row = self._rows[int(i)]
+            score = float(scores[i])
+            results.append({
+                "id": row["id"],
+                "collection": row["metadata"].get("collection", collection_for(row["metadata"].get("file_path", ""))),
+                "document": row["document"],
+                "metadata": row["metadata"],
+                "distance": 1.0 - score,
+                "score": score,
+            })
+        return results
+
+    def _embed(self, text: str) -> list[float]:
+        if self._embed_fn is None:
+            from slate.ml_orchestrator import OllamaClient
+            client = OllamaClient()
+            self._embed_fn = lambda t: client.embed(EMBED_MODEL, t)
+        return self._embed_fn(text)
+
+    def search(self, query: str, collection_name: str | None = None,
+               n_results: int = 10, where: dict | None = None) -> list[dict]:
+        """Semantic search (same signature and result shape as SlateChromaDB.search)."""
+        filters = dict(where or {})
+        if collection_name:
+            filters["collection"] = collection_name
+        return self.query(self._embed(query), n_results=n_results, where=filters)
+
+    def search_code(self, query: str, n_results: int = 5) -> list[dict]:
+        """Search specifically in code."""
+        return self.search(query, collection_name="slate_code", n_results=n_results)
+
+    def search_docs(self, query: str, n_results: int = 5) -> list[dict]:
+        """Search specifically in documentation."""
+        return self.search(query, collection_name="slate_docs", n_results=n_results)
+
+    def find_similar_code(self, code_snippet: str, n_results: int = 5) -> list[dict]:
+        """Find code similar to a given snippet."""
+        return self.search(code_snippet, collection_name="slate_code", n_results=n_results)
+
+    def get_status(self) -> dict:
+        """Get index status."""
+        vec_path = self.index_dir / VECTORS_FILE
+        return {
+            "available": True,
+            "backend": "numpy",
+            "index_dir": str(self.index_dir),
+            "rows": self.count(),
+            "files": len(self._by_file),
+            "dim": self.dim,
+            "size_mb": round(vec_path.stat().st_size / (1024 * 1024), 2) if vec_path.exists() else 0,
+        }
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="SLATE NumPy Vector Index")
+    parser.add_argument("--status", action="store_true", help="Show index status")
+    parser.add_argument("--search", type=str, help="Semantic search query")
+    parser.add_argument("--collection", type=str, help="Search in specific collection")
+    parser.add_argument("--n", type=int, default=5, help="Number of results")
+    args = parser.parse_args()
+
+    index = SlateVectorIndex()
+    if args.search:
+        for i, r in enumerate(index.search(args.search, args.collection, args.n), 1):
+            preview = r["document"][:120].replace("\n", " ")
+            print(f"  [{i}] {r['metadata'].get('file_path')} (chunk {r['metadata'].get('chunk_index')}) — score: {r['score']:.3f}")
+            print(f"      {preview}...")
+    else:
+        print(json.dumps(index.get_status(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
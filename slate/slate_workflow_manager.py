@@ -29,10 +29,7 @@ from typing import Any, Dict, List, Optional
 WORKSPACE_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(WORKSPACE_ROOT))
 
-try:
-    import filelock
-except ImportError:
-    filelock = None  # Graceful degradation
+from slate_core.task_store import get_task_store  # noqa: E402
 
 
 class SlateWorkflowManager:
@@ -64,26 +61,18 @@ class SlateWorkflowManager:
             self.ARCHIVE_FILE.write_text('{"archived": [], "last_archive": null}')
 
     def _load_tasks(self) -> Dict[str, Any]:
-        """Load current tasks with file locking."""
-        if not self.TASK_FILE.exists():
-            return {"tasks": [], "created_at": datetime.now(timezone.utc).isoformat()}
-
-        if filelock:
-            lock = filelock.FileLock(str(self.TASK_FILE) + ".lock", timeout=10)
-            with lock:
-                return json.loads(self.TASK_FILE.read_text(encoding="utf-8"))
-        else:
-            return json.loads(self.TASK_FILE.read_text(encoding="utf-8"))
+        """Load current tasks from the task store."""
+        # Modified: 2026-10-17T00:00:00Z | Author: COPILOT | Change: Read through slate_core.task_store
+        data = get_task_store(self.TASK_FILE).read_document()
+        if not data["tasks"] and not self.TASK_FILE.exists():
+            data.setdefault("created_at", datetime.now(timezone.utc).isoformat())
+        return data
 
     def _save_tasks(self, data: Dict[str, Any]):
-        """Save tasks with file locking."""
-        data["last_updated"] = datetime.now(timezone.utc).isoformat()
-        if filelock:
-            lock = filelock.FileLock(str(self.TASK_FILE) + ".lock", timeout=10)
-            with lock:
-                self.TASK_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
-        else:
-            self.TASK_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        """Save tasks: only changed rows are written; the JSON export is refreshed immediately."""
+        store = get_task_store(self.TASK_FILE)
+        store.write_document(data)
+        store.flush()
 
     def _archive_tasks(self, tasks: List[Dict[str, Any]], reason: str):
         """Archive removed tasks for audit trail."""
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# ═══════════════════════════════════════════════════════════════════════════════
+# CELL: status_snapshot [python]
+# Author: COPILOT | Created: 2026-10-16T20:00:00Z
+# Purpose: Background-refreshed orchestrator status snapshot with delta push
+# ═══════════════════════════════════════════════════════════════════════════════
+"""
+Status Snapshot Service
+=======================
+Long-lived, in-memory snapshot of SlateOrchestrator status.
+
+SlateOrchestrator.status() shells out to gh, re-reads the task file and
+queries Docker on every call. The dashboard calls it on every WebSocket
+connect and refresh, so each of those waited seconds. This service
+instead refreshes every section on its own schedule in a background
+thread and serves the latest snapshot from memory:
+
+- Per-section intervals: runner / docker every 30s, orchestrator pid every 5s, ...
+- Slow sections never delay fast ones (small worker pool, one refresh per section at a time)
+- snapshot() is a dict copy, so reads take microseconds
+- Age metadata: "meta" holds refreshed_at / age_s / refresh_ms / error per section
+- Deltas: subscribers are called with {"section", "data", "meta"} only when a section's value changes
+
+Usage:
+    from slate.status_snapshot import get_status_snapshot_service
+
+    service = get_status_snapshot_service()      # starts the refresher thread
+    service.snapshot()                           # in-memory, never blocks
+    unsubscribe = service.subscribe(lambda delta: print(delta["section"]))
+
+    python slate/status_snapshot.py --watch 60   # print deltas for 60 seconds
+"""
+
+import argparse
+import copy
+import json
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Modified: 2026-10-16T20:00:00Z | Author: COPILOT | Change: workspace setup
+WORKSPACE_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(WORKSPACE_ROOT))
+
+logger = logging.getLogger("slate.status_snapshot")
+
+MAX_REFRESH_WORKERS = 4
+Section = Tuple[Callable[[], Dict[str, Any]], float]  # (check function, interval seconds)
+Subscriber = Callable[[Dict[str, Any]], None]
+
+
+class StatusSnapshotService:
+    """
+    Refreshes status sections in the background and serves them from memory.
+
+    Attributes:
+        sections: name -> (check function, refresh interval in seconds)
+    """
+
+    def __init__(self, sections: Dict[str, Section], clock: Callable[[], float] = time.monotonic):
+        self.sections = dict(sections)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._values: Dict[str, Dict[str, Any]] = {name: {} for name in self.sections}
+        self._meta: Dict[str, Dict[str, Any]] = {name: {"refreshed_at": None} for name in self.sections}
+        self._stored_at: Dict[str, float] = {}
+        self._due: Dict[str, float] = {name: 0.0 for name in self.sections}
+        self._in_flight: Dict[str, Future] = {}  # section -> its running refresh
+        self._subscribers: Dict[int, Subscriber] = {}
+        self._next_sub_id = 0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pool = ThreadPoolExecutor(max_workers=min(MAX_REFRESH_WORKERS, len(self.sections) or 1),
+                                        thread_name_prefix="slate-snapshot")
+
+    # ── Lifecycle ──────────────────────────────────────────────────────
+
+    def start(self) -> "StatusSnapshotService":
+        """Start the scheduler thread (idempotent)."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="slate-snapshot-scheduler",
+                                                daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until every section has been refreshed at least once."""
+        return self._ready.wait(timeout)
+
+    def _run(self):
+        while not self._stop.is_set():
+            now = self._clock()
+            with self._lock:
+                for name in [n for n, t in self._due.items() if t <= now and n not in self._in_flight]:
+                    self._in_flight[name] = self._pool.submit(self._refresh_section, name)
+            with self._lock:
+                pending = [t for n, t in self._due.items() if n not in self._in_flight]
+            delay = max(0.0, min(pending) - self._clock()) if pending else 1.0
+            self._wake.wait(timeout=min(delay, 1.0))
+            self._wake.clear()
+
+    # ── Refresh ────────────────────────────────────────────────────────
+
+    def _refresh_section(self, name: str):
+        check, interval = self.sections[name]
+        start = time.perf_counter()
+        error = None
+        try:
+            value = check()
+        except Exception as e:
+            value = None
+            error = str(e)
+            logger.debug("status section %s failed: %s", name, e)
+        refresh_ms = round((time.perf_counter() - start) * 1000, 1)
+
+        with self._lock:
+            changed = value is not None and value != self._values[name]
+            if value is not None:
+                self._values[name] = value
+                self._stored_at[name] = self._clock()
+            meta = self._meta[name]
+            meta["refresh_ms"] = refresh_ms
+            meta["error"] = error
+            if value is not None:
+                meta["refreshed_at"] = datetime.now(timezone.utc).isoformat()
+            self._due[name] = self._clock() + interval
+            self._in_flight.pop(name, None)
+            if len(self._stored_at) == len(self.sections):
+                self._ready.set()
+            subscribers = list(self._subscribers.values()) if changed else []
+            delta = {"section": name, "data": copy.deepcopy(value), "meta": dict(meta)} if changed else None
+        self._wake.set()
+
+        for callback in subscribers:
+            try:
+                callback(delta)
+            except Exception as e:
+                logger.debug("status subscriber failed: %s", e)
+
+    def refresh(self, name: Optional[str] = None, wait: bool = False, timeout: float = 30.0):
+        """Schedule an immediate refresh of one section (or all); optionally wait for it.
+
+        With wait=True a section that is already refreshing is awaited rather
+        than started a second time, so a check never runs concurrently with itself.
+        """
+        names = [name] if name else list(self.sections)
+        if wait:
+            futures = []
+            with self._lock:
+                for n in names:
+                    if n not in self._in_flight:
+                        self._in_flight[n] = self._pool.submit(self._refresh_section, n)
+                    futures.append(self._in_flight[n])
+            for f in futures:
+                f.result(timeout=timeout)
+            return
+        with self._lock:
+            for n in names:
+                self._due[n] = 0.0
+        self._wake.set()
+
+    # ── Reads ──────────────────────────────────────────────────────────
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Latest value of every section plus per-section age metadata."""
+        now = self._clock()
+        with self._lock:
+            result = copy.deepcopy(self._values)
+            meta = {}
+            for name, m in self._meta.items():
+                stored = self._stored_at.get(name)
+                meta[name] = {**m, "age_s": round(now - stored, 1) if stored is not None else None}
+        result["meta"] = meta
+        return result
+
+    def subscribe(self, callback: Subscriber) -> Callable[[], None]:
+        """Register a delta callback (runs on a refresh thread); returns an unsubscribe function."""
+        with self._lock:
+            sub_id = self._next_sub_id
+            self._next_sub_id += 1
+            self._subscribers[sub_id] = callback
+
+        def unsubscribe():
+            with self._lock:
+                self._subscribers.pop(sub_id, None)
+        return unsubscribe
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "sections": {n: {"interval_s": iv, **self._meta[n]} for n, (_, iv) in self.sections.items()},
+                "subscribers": len(self._subscribers),
+                "running": bool(self._thread and self._thread.is_alive()),
+            }
+
+
+_service: Optional[StatusSnapshotService] = None
+_service_lock = threading.Lock()
+
+
+def get_status_snapshot_service(skip_dashboard_check: bool = True) -> StatusSnapshotService:
+    """Get (and start) the process-wide orchestrator status snapshot service.
+
+    skip_dashboard_check defaults to True because the main consumer is the
+    dashboard itself, which must not health-check its own port.
+    """
+    global _service
+    with _service_lock:
+        if _service is None:
+            from slate.slate_orchestrator import SlateOrchestrator
+            orch = SlateOrchestrator()
+            _service = StatusSnapshotService(orch.status_sections(skip_dashboard_check)).start()
+        return _service
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="SLATE Status Snapshot Service")
+    parser.add_argument("--watch", type=float, metavar="SECONDS", help="Print status deltas for N seconds")
+    args = parser.parse_args()
+
+    service = get_status_snapshot_service(skip_dashboard_check=False)
+    if args.watch:
+        service.subscribe(lambda d: print(json.dumps({d["section"]: d["data"]}, default=str), flush=True))
+        time.sleep(args.watch)
+    else:
+        service.wait_ready(timeout=30)
+        print(json.dumps(service.snapshot(), indent=2, default=str))
+    service.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# Modified: 2026-10-17T01:00:00Z | Author: COPILOT | Change: Share one FileLock per store
+"""
+SLATE Task Queue Store — Append-Only Event Log With Periodic Compaction
+========================================================================
+
+Persists AIScheduler tasks as an append-only log of task-state events next
+to the queue snapshot. A transition (queued, running, completed, failed)
+appends one JSON line instead of rewriting the whole queue file:
+
+    .slate_task_queue.json   snapshot: {"pending": [...], "completed": [...]}
+    .slate_task_queue.log    events since the snapshot, one task dict per line
+
+- Ordering: appends and compaction hold the queue's exclusive FileLock, so
+  log line order is one total order shared by every producer (autonomous
+  loop, dashboard, CLI); the last event for a task wins
+- Recovery: load() = snapshot + replay of the log. A torn final line from a
+  crashed writer is skipped
+- Compaction: once the log passes COMPACT_LOG_BYTES the merged state is
+  written to a temp file, swapped in with os.replace, then the log is
+  truncated. Events are whole-task upserts, so a crash between the two
+  steps only replays events the snapshot already contains
+
+Usage:
+    from slate.task_queue_store import TaskQueueStore
+
+    store = TaskQueueStore(QUEUE_FILE)
+    store.append(task.to_dict())            # O(1) per transition
+    pending, completed = store.load()
+
+    python slate/task_queue_store.py --stats      # Snapshot / log sizes
+    python slate/task_queue_store.py --compact    # Fold the log into the snapshot
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Union
+
+# Modified: 2026-10-16T23:30:00Z | Author: COPILOT | Change: workspace setup
+WORKSPACE_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(WORKSPACE_ROOT))
+
+from slate_core.file_lock import FileLock  # noqa: E402
+
+DEFAULT_QUEUE_FILE = WORKSPACE_ROOT / ".slate_task_queue.json"
+COMPACT_LOG_BYTES = 256 * 1024
+KEEP_COMPLETED = 100          # finished tasks kept in the snapshot
+LOCK_TIMEOUT_S = 10.0
+PENDING_STATUSES = {"pending", "queued", "running"}
+
+
+class TaskQueueStore:
+    """
+    Snapshot + append-only event log for a task queue.
+
+    Attributes:
+        path: snapshot JSON file (same format the scheduler always wrote)
+        log_path: event log (path with a .log suffix)
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_QUEUE_FILE,
+                 compact_bytes: int = COMPACT_LOG_BYTES, keep_completed: int = KEEP_COMPLETED,
+                 durable: bool = False):
+        self.path = Path(path)
+        self.log_path = self.path.with_suffix(".log")
+        self.compact_bytes = compact_bytes
+        self.keep_completed = keep_completed
+        self.durable = durable            # fsync every append (power-loss safety)
+        self._thread_lock = threading.Lock()
+        self._file_lock = FileLock(self.path, timeout=LOCK_TIMEOUT_S)
+        self.stats = {"appends": 0, "compactions": 0, "replayed": 0, "torn_lines": 0}
+
+    def _lock(self) -> FileLock:
+        return self._file_lock
+
+    # ── Writes ─────────────────────────────────────────────────────────
+
+    def append(self, *tasks: dict) -> None:
+        """Record the current state of one or more tasks."""
+        if not tasks:
+            return
+        lines = "".join(json.dumps(t, separators=(",", ":"), default=str) + "\n" for t in tasks)
+        with self._thread_lock, self._lock().acquire():
+            with open(self.log_path, "a+b") as f:
+                if f.tell() and (f.seek(-1, os.SEEK_END), f.read(1))[1] != b"\n":
+                    lines = "\n" + lines  # close a torn line left by a crashed writer
+                f.write(lines.encode("utf-8"))
+                f.flush()
+                if self.durable:
+                    os.fsync(f.fileno())
+                size = f.tell()
+            self.stats["appends"] += len(tasks)
+            if size >= self.compact_bytes:
+                self._compact_locked()
+
+    def compact(self) -> dict:
+        """Fold the log into the snapshot and truncate it."""
+        with self._thread_lock, self._lock().acquire():
+            return self._compact_locked()
+
+    def _compact_locked(self) -> dict:
+        pending, completed = self._read_locked()
+        data = {
+            "pending": pending,
+            "completed": completed,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+        os.replace(tmp, self.path)
+        # Crash here: the log is replayed over a snapshot that already holds its events
+        with open(self.log_path, "wb"):
+            pass
+        self.stats["compactions"] += 1
+        return {"pending": len(pending), "completed": len(completed)}
+
+    # ── Reads ──────────────────────────────────────────────────────────
+
+    def load(self) -> tuple[list[dict], list[dict]]:
+        """(pending, completed) task dicts: snapshot plus replayed log."""
+        try:
+            with self._thread_lock, self._lock().acquire(exclusive=False):
+                return self._read_locked()
+        except TimeoutError:
+            # A stuck writer must not keep the scheduler from starting; the
+            # log is append-only, so an unlocked read at worst misses a torn tail
+            return self._read_locked()
+
+    def _read_locked(self) -> tuple[list[dict], list[dict]]:
+        tasks: dict[str, dict] = {}
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                for t in data.get("completed", []) + data.get("pending", []):
+                    tasks[t.get("task_id", "")] = t
+            except (json.JSONDecodeError, OSError):
+                pass
+
+        for task in self._replay():
+            task_id = task.get("task_id", "")
+            tasks.pop(task_id, None)   # re-insert: order follows the latest event
+            tasks[task_id] = task
+
+        pending = [t for t in tasks.values() if t.get("status", "pending") in PENDING_STATUSES]
+        completed = [t for t in tasks.values() if t.get("status", "pending") not in PENDING_STATUSES]
+        return pending, completed[-self.keep_completed:] if self.keep_completed else []
+
+    def _replay(self):
+        if not self.log_path.exists():
+            return
+        with open(self.log_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    task = json.loads(line)
+                except json.JSONDecodeError:
+                    self.stats["torn_lines"] += 1
+                    continue
+                if isinstance(task, dict):
+                    self.stats["replayed"] += 1
+                    yield task
+
+    def info(self) -> dict:
+        def size(p: Path) -> int:
+            return p.stat().st_size if p.exists() else 0
+        pending, completed = self.load()
+        return {
+            "snapshot": str(self.path),
+            "snapshot_bytes": size(self.path),
+            "log_bytes": size(self.log_path),
+            "pending": len(pending),
+            "completed": len(completed),
+            **self.stats,
+        }
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="SLATE Task Queue Store")
+    parser.add_argument("--file", type=Path, default=DEFAULT_QUEUE_FILE, help="Queue snapshot file")
+    parser.add_argument("--stats", action="store_true", help="Show snapshot / log sizes")
+    parser.add_argument("--compact", action="store_true", help="Fold the log into the snapshot")
+    args = parser.parse_args()
+
+    store = TaskQueueStore(args.file)
+    if args.compact:
+        print(json.dumps(store.compact(), indent=2))
+    else:
+        print(json.dumps(store.info(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
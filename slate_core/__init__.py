@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
-# Modified: 2025-07-09T12:10:00Z | Author: COPILOT
-# Change: Add plugins subpackage export for agent registry
+# Modified: 2026-10-17T00:00:00Z | Author: COPILOT
+# Change: Export the indexed task store
 """
 SLATE Core Infrastructure
 =========================
@@ -11,11 +11,13 @@ Modules:
 - gpu_scheduler: GPU resource management for dual-GPU setup
 - memory: Constitution and memory storage
 - plugins: Dynamic agent registry with kernel-style load/unload
+- task_store: Indexed SQLite task store behind current_tasks.json
 """
 
 from .file_lock import FileLock, file_lock
 from .gpu_scheduler import GPUScheduler, get_available_gpu
 from .memory import ConstitutionMemory, get_constitution
+from .task_store import TaskStore, get_task_store
 
 __all__ = [
     "FileLock",
@@ -24,6 +26,8 @@ __all__ = [
     "get_available_gpu",
     "ConstitutionMemory",
     "get_constitution",
+    "TaskStore",
+    "get_task_store",
     "plugins",
 ]
 
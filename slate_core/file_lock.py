@@ -13,6 +13,11 @@ The primary use case is atomic access to current_tasks.json to prevent race
 conditions when multiple processes (dashboard, runner, workflow manager) are
 reading and writing simultaneously.
 
+Locks are taken on a sibling "<file>.lock" that is created once and never
+deleted. On Unix waiters block in flock() (or poll with back-off when a
+timeout is set), and shared locks are held by any number of readers at
+once. Windows falls back to exclusive msvcrt byte-range locks.
+
 Usage:
     from slate_core.file_lock import FileLock, file_lock
 
@@ -31,65 +36,123 @@ Usage:
         pass
 """
 
-# Modified: 2025-07-09T12:00:00Z | Author: COPILOT
-# Change: Fix fcntl import to be conditional on Unix only
+# Modified: 2026-10-17T01:00:00Z | Author: COPILOT
+# Change: Blocking flock waits, concurrent shared readers, stable lock inode
 import json
 import os
 import threading
 import time
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Generator, Optional, TextIO, Union
+from typing import Any, Dict, Generator, List, Optional, TextIO, Union
+
+POLL_MIN_S = 0.0005   # first back-off step while polling against a timeout
 
 # Windows compatibility
 if os.name == "nt":
     import msvcrt
 
-    def lock_file(f: TextIO, exclusive: bool = True) -> None:
-        """Lock a file on Windows."""
-        msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK if exclusive else msvcrt.LK_NBRLCK, 1)
+    SHARED_LOCKS = False  # msvcrt byte-range locks are exclusive only
 
-    def unlock_file(f: TextIO) -> None:
-        """Unlock a file on Windows."""
+    def _try_lock(fd: int, exclusive: bool) -> bool:
+        os.lseek(fd, 0, os.SEEK_SET)
         try:
-            f.seek(0)
-            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
-        except Exception:
-            pass
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def _lock_blocking(fd: int, exclusive: bool) -> None:
+        delay = POLL_MIN_S
+        while not _try_lock(fd, exclusive):
+            time.sleep(delay)
+            delay = min(delay * 2, 0.05)
+
+    def _unlock(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
 else:
     import fcntl
 
-    def lock_file(f: TextIO, exclusive: bool = True) -> None:
-        """Lock a file on Unix."""
-        fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+    SHARED_LOCKS = True
+
+    def _try_lock(fd: int, exclusive: bool) -> bool:
+        try:
+            fcntl.flock(fd, (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+
+    def _lock_blocking(fd: int, exclusive: bool) -> None:
+        # Sleeps in the kernel until the lock is free: no polling, no wake-up lag
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+    def _unlock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def lock_file(f: TextIO, exclusive: bool = True) -> None:
+    """Lock an open file, waiting until the lock is granted."""
+    _lock_blocking(f.fileno(), exclusive)
+
 
-    def unlock_file(f: TextIO) -> None:
-        """Unlock a file on Unix."""
-        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+def unlock_file(f: TextIO) -> None:
+    """Unlock a file locked with lock_file()."""
+    try:
+        _unlock(f.fileno())
+    except OSError:
+        pass
+
+
+def _wait_for_lock(fd: int, exclusive: bool, timeout: Optional[float], max_interval: float) -> bool:
+    """Take the lock on fd; False if timeout expires first."""
+    if _try_lock(fd, exclusive):
+        return True  # uncontended: one syscall
+    if timeout is None:
+        _lock_blocking(fd, exclusive)
+        return True
+    # Bounded wait without signals (SIGALRM is process-wide and main-thread only):
+    # non-blocking retries with exponential back-off capped at max_interval
+    deadline = time.monotonic() + timeout
+    delay = POLL_MIN_S
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        if _try_lock(fd, exclusive):
+            return True
+        delay = min(delay * 2, max_interval)
 
 
 class FileLock:
     """
-    Thread-safe and process-safe file lock.
+    Thread-safe and process-safe reader/writer file lock.
+
+    Every acquire opens its own descriptor on the lock file, so threads of
+    one process exclude each other exactly like separate processes do, and
+    one FileLock instance can be shared between threads. Shared (read)
+    locks are held concurrently; exclusive (write) locks are alone. The
+    lock file is never removed: deleting it would let a waiter holding the
+    old inode and a newcomer creating a new one both "own" the lock.
 
     Attributes:
         path: Path to the file being locked
-        timeout: Maximum time to wait for lock (seconds)
-        retry_interval: Time between lock attempts (seconds)
+        timeout: Maximum time to wait for lock (seconds); None waits indefinitely
+        retry_interval: Longest back-off between attempts while waiting with a timeout
     """
 
     def __init__(
         self,
         path: Union[str, Path],
-        timeout: float = 10.0,
-        retry_interval: float = 0.1
+        timeout: Optional[float] = 10.0,
+        retry_interval: float = 0.05
     ):
         self.path = Path(path)
         self.lock_path = self.path.with_suffix(self.path.suffix + ".lock")
         self.timeout = timeout
         self.retry_interval = retry_interval
-        self._lock = threading.Lock()
-        self._file: Optional[TextIO] = None
+        self._local = threading.local()
 
     @contextmanager
     def acquire(self, exclusive: bool = True) -> Generator[None, None, None]:
@@ -106,59 +169,41 @@ class FileLock:
         Raises:
             TimeoutError: If lock cannot be acquired within timeout.
         """
-        with self._lock:
-            start_time = time.time()
-            while True:
-                try:
-                    # Create lock file
-                    self._file = open(self.lock_path, "w")
-                    lock_file(self._file, exclusive)
-                    break
-                except (IOError, OSError) as e:
-                    if self._file:
-                        self._file.close()
-                        self._file = None
-
-                    elapsed = time.time() - start_time
-                    if elapsed >= self.timeout:
-                        raise TimeoutError(
-                            f"Could not acquire lock on {self.path} "
-                            f"within {self.timeout}s"
-                        ) from e
-
-                    time.sleep(self.retry_interval)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            acquired = _wait_for_lock(fd, exclusive or not SHARED_LOCKS, self.timeout, self.retry_interval)
+        except BaseException:
+            os.close(fd)
+            raise
+        if not acquired:
+            os.close(fd)
+            raise TimeoutError(f"Could not acquire lock on {self.path} within {self.timeout}s")
 
         try:
             yield
         finally:
-            self._release()
-
-    def _release(self) -> None:
-        """Release the file lock."""
-        if self._file:
             try:
-                unlock_file(self._file)
-                self._file.close()
-            except Exception:
-                pass
-            finally:
-                self._file = None
-
-            # Remove lock file
-            try:
-                self.lock_path.unlink()
-            except Exception:
+                _unlock(fd)
+            except OSError:
                 pass
+            os.close(fd)  # closing drops the lock even if the unlock failed
 
     def __enter__(self) -> "FileLock":
-        """Enter context manager."""
-        self._context = self.acquire()
-        self._context.__enter__()
+        """Enter context manager (exclusive)."""
+        context = self.acquire()
+        context.__enter__()
+        self._contexts.append(context)
         return self
 
     def __exit__(self, *args) -> None:
         """Exit context manager."""
-        self._context.__exit__(*args)
+        self._contexts.pop().__exit__(*args)
+
+    @property
+    def _contexts(self) -> List[Any]:
+        if not hasattr(self._local, "contexts"):
+            self._local.contexts = []
+        return self._local.contexts
 
 
 @contextmanager
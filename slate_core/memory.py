@@ -11,7 +11,13 @@ Manages constitution, persistent memory, and learning storage for SLATE.
 
 Features:
 - Constitution loading and caching
-- Key-value memory store
+- Key-value memory store, held in memory with a sorted key index
+- Throttled writes: set()/delete() are flushed at most once per
+  FLUSH_DELAY_S (the first change of a burst starts the timer), with an
+  atomic rename, so bulk remember() loops write once or a few times
+- Cross-process invalidation: the store file's mtime/size is re-checked at
+  most every INVALIDATE_CHECK_S; a flush merges other processes' writes
+  under the store's FileLock before replacing the file
 - Session memory
 - ChromaDB integration for vector storage
 
@@ -26,20 +32,35 @@ Usage:
     memory = ConstitutionMemory()
     memory.set("user_preference", "dark_mode")
     value = memory.get("user_preference")
+    memory.flush()  # optional: pending writes are also flushed at exit
 """
 
+# Modified: 2026-10-17T02:00:00Z | Author: COPILOT | Change: In-memory key index, coalesced atomic writes
+import atexit
+import bisect
 import json
 import os
+import sys
 import threading
 import time
+import weakref
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 WORKSPACE_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(WORKSPACE_ROOT))
+
+from slate_core.file_lock import FileLock  # noqa: E402
+
 CONSTITUTION_PATH = WORKSPACE_ROOT / ".specify" / "memory" / "constitution.md"
 MEMORY_DIR = WORKSPACE_ROOT / ".specify" / "memory"
 MEMORY_STORE_PATH = MEMORY_DIR / "memory_store.json"
+FLUSH_DELAY_S = 0.5          # at most one store write per this many seconds of set()/delete()
+INVALIDATE_CHECK_S = 0.25    # how often reads look for writes by other processes
+LOCK_TIMEOUT_S = 10.0
+
+_DELETED = object()
 
 
 class ConstitutionMemory:
@@ -47,17 +68,31 @@ class ConstitutionMemory:
     SLATE memory management system.
 
     Provides persistent key-value storage and constitution access.
+
+    Attributes:
+        store_path: JSON file backing the key-value store
+        flush_delay: seconds from the first unflushed change to the flush; 0 writes through on every change
     """
 
-    def __init__(self):
-        self._lock = threading.Lock()
-        self._cache: Dict[str, Any] = {}
+    def __init__(self, store_path: Union[str, Path, None] = None, flush_delay: float = FLUSH_DELAY_S):
+        self._lock = threading.RLock()
+        self._cache: Dict[str, Any] = {}          # full store contents
+        self._keys: List[str] = []                # sorted public keys (no "_" prefix)
+        self._pending: Dict[str, Any] = {}        # changes not yet on disk (_DELETED marks deletes)
+        self._signature: Optional[str] = None     # mtime/size of the file last read or written
+        self._loaded = False
+        self._last_check = 0.0
+        self._timer: Optional[threading.Timer] = None
         self._constitution: Optional[str] = None
         self._last_constitution_load: float = 0
         self.CONSTITUTION_TTL = 300  # 5 minutes
+        self.store_path = Path(store_path) if store_path else MEMORY_STORE_PATH
+        self.flush_delay = flush_delay
+        self.stats = {"writes": 0, "reloads": 0}
 
         # Ensure memory directory exists
-        MEMORY_DIR.mkdir(parents=True, exist_ok=True)
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        _open_memories.add(self)
 
     def get_constitution(self, force_reload: bool = False) -> str:
         """
@@ -123,11 +158,8 @@ class ConstitutionMemory:
             Stored value or default.
         """
         with self._lock:
-            if key in self._cache:
-                return self._cache[key]
-
-            store = self._load_store()
-            return store.get(key, default)
+            self._refresh()
+            return self._cache.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -138,11 +170,12 @@ class ConstitutionMemory:
             value: Value to store (must be JSON-serializable).
         """
         with self._lock:
+            self._refresh()
+            if key not in self._cache:
+                self._index_add(key)
             self._cache[key] = value
-            store = self._load_store()
-            store[key] = value
-            store["_updated_at"] = datetime.now(timezone.utc).isoformat()
-            self._save_store(store)
+            self._pending[key] = value
+        self._schedule_flush()
 
     def delete(self, key: str) -> bool:
         """
@@ -155,15 +188,14 @@ class ConstitutionMemory:
             True if key was deleted.
         """
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-
-            store = self._load_store()
-            if key in store:
-                del store[key]
-                self._save_store(store)
-                return True
-            return False
+            self._refresh()
+            if key not in self._cache:
+                return False
+            del self._cache[key]
+            self._index_remove(key)
+            self._pending[key] = _DELETED
+        self._schedule_flush()
+        return True
 
     def list_keys(self, prefix: Optional[str] = None) -> List[str]:
         """
@@ -175,13 +207,12 @@ class ConstitutionMemory:
         Returns:
             List of keys.
         """
-        store = self._load_store()
-        keys = [k for k in store.keys() if not k.startswith("_")]
-
-        if prefix:
-            keys = [k for k in keys if k.startswith(prefix)]
-
-        return sorted(keys)
+        with self._lock:
+            self._refresh()
+            if not prefix:
+                return list(self._keys)
+            start, end = self._prefix_range(prefix)
+            return self._keys[start:end]
 
     def clear(self, prefix: Optional[str] = None) -> int:
         """
@@ -194,36 +225,119 @@ class ConstitutionMemory:
             Number of keys cleared.
         """
         with self._lock:
-            store = self._load_store()
-            if prefix:
-                keys_to_delete = [k for k in store.keys()
-                                 if k.startswith(prefix) and not k.startswith("_")]
-            else:
-                keys_to_delete = [k for k in store.keys() if not k.startswith("_")]
-
+            self._refresh()
+            start, end = self._prefix_range(prefix) if prefix else (0, len(self._keys))
+            keys_to_delete = self._keys[start:end]
+            del self._keys[start:end]
             for key in keys_to_delete:
-                del store[key]
-                if key in self._cache:
-                    del self._cache[key]
+                del self._cache[key]
+                self._pending[key] = _DELETED
+        if keys_to_delete:
+            self._schedule_flush()
+        return len(keys_to_delete)
 
-            self._save_store(store)
-            return len(keys_to_delete)
+    def flush(self) -> bool:
+        """Write pending changes now; returns False if there were none."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return False
+            with FileLock(self.store_path, timeout=LOCK_TIMEOUT_S).acquire():
+                # Another process may have written since we last looked: merge, ours win
+                if self._file_signature() != self._signature:
+                    self._reload()
+                self._cache["_updated_at"] = datetime.now(timezone.utc).isoformat()
+                tmp = self.store_path.with_name(f"{self.store_path.name}.{os.getpid()}.tmp")
+                tmp.write_text(json.dumps(self._cache, indent=2, default=str), encoding="utf-8")
+                os.replace(tmp, self.store_path)
+                self._signature = self._file_signature()
+            self._pending.clear()
+            self.stats["writes"] += 1
+            return True
+
+    # ── Internals ──────────────────────────────────────────────────────
+
+    def _file_signature(self) -> Optional[str]:
+        try:
+            st = self.store_path.stat()
+        except OSError:
+            return None
+        return f"{st.st_mtime_ns}:{st.st_size}"
+
+    def _refresh(self) -> None:
+        """Load on first use; afterwards pick up other processes' writes (throttled)."""
+        now = time.monotonic()
+        if self._loaded and now - self._last_check < INVALIDATE_CHECK_S:
+            return
+        self._last_check = now
+        if not self._loaded or self._file_signature() != self._signature:
+            self._reload()
+
+    def _reload(self) -> None:
+        """Re-read the store file and re-apply changes not yet flushed."""
+        signature = self._file_signature()
+        store = self._load_store()
+        for key, value in self._pending.items():
+            if value is _DELETED:
+                store.pop(key, None)
+            else:
+                store[key] = value
+        self._cache = store
+        self._keys = sorted(k for k in store if not k.startswith("_"))
+        self._signature = signature
+        self._loaded = True
+        self.stats["reloads"] += 1
 
     def _load_store(self) -> Dict[str, Any]:
         """Load memory store from file."""
-        if not MEMORY_STORE_PATH.exists():
+        if not self.store_path.exists():
             return {}
         try:
-            return json.loads(MEMORY_STORE_PATH.read_text(encoding="utf-8"))
+            data = json.loads(self.store_path.read_text(encoding="utf-8"))
+            return data if isinstance(data, dict) else {}
         except (json.JSONDecodeError, IOError):
             return {}
 
-    def _save_store(self, store: Dict[str, Any]) -> None:
-        """Save memory store to file."""
-        MEMORY_STORE_PATH.write_text(
-            json.dumps(store, indent=2, default=str),
-            encoding="utf-8"
-        )
+    def _index_add(self, key: str) -> None:
+        if not key.startswith("_"):
+            bisect.insort(self._keys, key)
+
+    def _index_remove(self, key: str) -> None:
+        if not key.startswith("_"):
+            i = bisect.bisect_left(self._keys, key)
+            if i < len(self._keys) and self._keys[i] == key:
+                del self._keys[i]
+
+    def _prefix_range(self, prefix: str) -> tuple:
+        start = bisect.bisect_left(self._keys, prefix)
+        end = start
+        while end < len(self._keys) and self._keys[end].startswith(prefix):
+            end += 1
+        return start, end
+
+    def _schedule_flush(self) -> None:
+        if self.flush_delay <= 0:
+            self.flush()
+            return
+        with self._lock:
+            if self._timer is None:
+                self._timer = threading.Timer(self.flush_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+
+_open_memories: "weakref.WeakSet[ConstitutionMemory]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_memories():
+    for memory in list(_open_memories):
+        try:
+            memory.flush()
+        except Exception:
+            pass
 
 
 # Global instance
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-# Modified: 2026-02-08T06:00:00Z | Author: COPILOT | Change: Create dynamic agent plugin registry
+# Modified: 2026-10-17T03:00:00Z | Author: COPILOT | Change: Export the compiled routing index
 """
 SLATE Core Plugins — Dynamic Agent Registry
 =============================================
@@ -24,6 +24,7 @@ from .agent_registry import (
     AgentState,
     get_agent_registry,
 )
+from .routing_index import PatternMatcher, RoutingIndex
 
 __all__ = [
     "AgentBase",
@@ -31,5 +32,7 @@ __all__ = [
     "AgentInfo",
     "AgentRegistry",
     "AgentState",
+    "PatternMatcher",
+    "RoutingIndex",
     "get_agent_registry",
 ]
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-# Modified: 2026-02-08T06:00:00Z | Author: COPILOT | Change: Create kernel-style agent registry
+# Modified: 2026-10-17T03:00:00Z | Author: COPILOT | Change: Route through a compiled capability index
 """
 SLATE Agent Registry — Kernel-Style Module System
 ===================================================
@@ -10,6 +10,7 @@ Features:
 - Runtime agent registration and discovery
 - Hot-load / hot-unload without process restart
 - Health check + fallback routing
+- Lock-free routing through a compiled capability index (routing_index.py)
 - Dependency tracking between agents
 - ChromaDB persistence for agent skill embeddings
 - Callback hooks for agent lifecycle events
@@ -33,6 +34,7 @@ Security:
 
 import importlib
 import importlib.util
+import itertools
 import json
 import logging
 import sys
@@ -53,6 +55,13 @@ WORKSPACE_ROOT = Path(__file__).parent.parent.parent
 if str(WORKSPACE_ROOT) not in sys.path:
     sys.path.insert(0, str(WORKSPACE_ROOT))
 
+from slate_core.plugins.routing_index import RoutingIndex  # noqa: E402
+
+# Bumped when code outside a registry replaces an AgentInfo.instance directly;
+# each registry rebuilds its routing index once it sees a new value
+_direct_instance_edits = itertools.count(1)
+_direct_instance_edit = 0
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Agent State Machine
@@ -192,6 +201,13 @@ class AgentInfo:
     instance: Optional[AgentBase] = None
     load_error: Optional[str] = None
 
+    def __setattr__(self, name, value):
+        replacing = name == "instance" and name in self.__dict__  # not the __init__ assignment
+        object.__setattr__(self, name, value)
+        if replacing:
+            global _direct_instance_edit
+            _direct_instance_edit = next(_direct_instance_edits)
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Agent Registry (kernel module manager)
@@ -204,6 +220,8 @@ class AgentRegistry:
     Provides routing by pattern matching against agent capabilities.
     """
 
+    ROUTABLE_STATES = (AgentState.ACTIVE, AgentState.DEGRADED)
+
     def __init__(self, agents_dir: Optional[Path] = None):
         self._agents_dir = agents_dir or (WORKSPACE_ROOT / "slate_core" / "plugins" / "agents")
         self._agents: Dict[str, AgentInfo] = {}
@@ -211,6 +229,9 @@ class AgentRegistry:
         self._lifecycle_callbacks: List[Callable[[str, AgentState, AgentState], None]] = []
         self._fallback_routes: Dict[str, str] = {}  # agent_id -> fallback_agent_id
         self._state_file = WORKSPACE_ROOT / ".slate_agent_registry.json"
+        self._generation = 0              # bumped whenever this registry swaps an instance
+        self._seen_direct_edit = -1       # _direct_instance_edit the index was built at
+        self._routing_index = RoutingIndex([], self.ROUTABLE_STATES, generation=-1)
 
     # ─── Discovery ────────────────────────────────────────────────────────
 
@@ -347,10 +368,11 @@ class AgentRegistry:
             instance._loaded_at = datetime.now(timezone.utc).isoformat()
 
             with self._lock:
-                info.instance = instance
+                self._set_instance(info, instance)
                 info.state = AgentState.ACTIVE
                 info.load_error = None
                 self._fire_lifecycle(agent_id, AgentState.LOADING, AgentState.ACTIVE)
+                self.rebuild_routing_index()
 
             logger.info("Loaded agent %s (%s v%s)", agent_id, info.name, info.version)
             return True
@@ -398,9 +420,10 @@ class AgentRegistry:
                 except Exception as e:
                     logger.warning("Error in %s.on_unload(): %s", agent_id, e)
 
-            info.instance = None
+            self._set_instance(info, None)
             info.state = AgentState.UNLOADED
             self._fire_lifecycle(agent_id, AgentState.UNLOADING, AgentState.UNLOADED)
+            self.rebuild_routing_index()
 
             logger.info("Unloaded agent %s", agent_id)
             return True
@@ -419,6 +442,22 @@ class AgentRegistry:
 
     # ─── Routing ──────────────────────────────────────────────────────────
 
+    def _set_instance(self, info: AgentInfo, instance: Optional[AgentBase]):
+        """Swap an agent instance and invalidate only this registry's routing index."""
+        object.__setattr__(info, "instance", instance)
+        self._generation += 1
+
+    def rebuild_routing_index(self) -> RoutingIndex:
+        """Recompile the capability index from the loaded agents and publish it."""
+        with self._lock:
+            self._seen_direct_edit = _direct_instance_edit
+            generation = self._generation
+            agents = [(agent_id, info, info.instance)
+                      for agent_id, info in list(self._agents.items()) if info.instance]
+            index = RoutingIndex(agents, self.ROUTABLE_STATES, generation=generation)
+            self._routing_index = index
+        return index
+
     def route_task(self, task: dict) -> Optional[str]:
         """Route a task to the best agent based on capabilities.
 
@@ -428,30 +467,11 @@ class AgentRegistry:
         desc = task.get("description", "").lower()
         combined = f"{title} {desc}"
 
-        best_agent: Optional[str] = None
-        best_priority: int = 999
-        best_confidence: float = 0.0
-
-        with self._lock:
-            for agent_id, info in self._agents.items():
-                if info.state not in (AgentState.ACTIVE, AgentState.DEGRADED):
-                    continue
-
-                instance = info.instance
-                if not instance:
-                    continue
-
-                for cap in instance.capabilities():
-                    match_count = sum(1 for p in cap.patterns if p in combined)
-                    if match_count > 0:
-                        confidence = match_count / max(len(cap.patterns), 1)
-                        higher_conf = confidence > best_confidence
-                        same_conf = (confidence == best_confidence
-                                     and cap.priority < best_priority)
-                        if higher_conf or same_conf:
-                            best_agent = agent_id
-                            best_priority = cap.priority
-                            best_confidence = confidence
+        # Lock-free: the published index is immutable; agent states are read live
+        index = self._routing_index
+        if index.generation != self._generation or self._seen_direct_edit != _direct_instance_edit:
+            index = self.rebuild_routing_index()
+        best_agent = index.route(combined)
 
         # Check fallback if primary agent is degraded
         if best_agent:
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# Modified: 2026-10-17T03:00:00Z | Author: COPILOT | Change: Compiled capability index for AgentRegistry routing
+"""
+SLATE Routing Index — Compiled Multi-Pattern Capability Matcher
+================================================================
+AgentRegistry.route_task used to test every pattern of every capability of
+every agent against the task text (`p in text`), under the registry lock.
+RoutingIndex compiles all patterns into one Aho-Corasick automaton, finds
+every pattern that occurs in the text in a single pass over it, and scores
+only the capabilities those patterns belong to.
+
+Routing semantics are unchanged:
+- a pattern matches when it is a substring of the lowercased title + description
+- confidence = matched patterns / patterns of the capability
+- highest confidence wins; ties go to the lower priority value, then to
+  the agent and capability seen first
+
+An index is immutable once built (the transition cache it fills while
+matching only ever gains entries that are already implied by the trie), so
+AgentRegistry publishes a new one on load / unload / reload and routers
+read the current one without taking the lock.
+"""
+
+from collections import Counter, deque
+from itertools import chain
+from math import lcm
+from typing import Any, Collection, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+
+class PatternMatcher:
+    """Aho-Corasick automaton over a fixed set of literal patterns."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = []
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+
+        for pattern in patterns:
+            if not pattern:
+                continue
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    outputs.append([])
+                node = nxt
+            outputs[node].append(len(self.patterns))
+            self.patterns.append(pattern)
+
+        # Failure links, breadth first; outputs inherit along them
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(ch, 0)
+                outputs[child].extend(outputs[fail[child]])
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs: List[Tuple[int, ...]] = [tuple(o) for o in outputs]
+        self._alphabet: FrozenSet[str] = frozenset(ch for p in self.patterns for ch in p)
+        # Memoized DFA transitions: one dict lookup per character once warm
+        self._delta: List[Dict[str, int]] = [dict(g) for g in goto]
+
+    def _transition(self, node: int, ch: str) -> int:
+        goto, fail = self._goto, self._fail
+        while True:
+            nxt = goto[node].get(ch)
+            if nxt is not None:
+                return nxt
+            if node == 0:
+                return 0
+            node = fail[node]
+
+    def find(self, text: str) -> set:
+        """Ids of the distinct patterns that occur in text."""
+        delta, outputs, alphabet = self._delta, self._outputs, self._alphabet
+        found: set = set()
+        node = 0
+        for ch in text:
+            nxt = delta[node].get(ch)
+            if nxt is None:
+                if ch not in alphabet:
+                    node = 0
+                    continue
+                nxt = self._transition(node, ch)
+                delta[node][ch] = nxt
+            node = nxt
+            out = outputs[node]
+            if out:
+                found.update(out)
+        return found
+
+
+class RoutingIndex:
+    """
+    Capabilities of a set of loaded agents, compiled for routing.
+
+    Attributes:
+        generation: instance generation the index was built from
+        agent_count / capability_count / pattern_count: index size
+    """
+
+    def __init__(self, agents: Iterable[Tuple[str, Any, Any]], routable_states: Collection = (),
+                 generation: int = 0):
+        """agents: (agent_id, AgentInfo, AgentBase instance) in registry order."""
+        self.generation = generation
+        self.routable_states = frozenset(routable_states)
+        # capability slot -> (agent_id, info, priority, pattern count)
+        self._caps: List[Tuple[str, Any, int, int]] = []
+        self._always: List[int] = []                  # slot once per empty pattern (matches any text)
+        pattern_ids: Dict[str, int] = {}
+        pattern_slots: List[List[int]] = []           # pattern id -> slots, repeated per occurrence
+        agent_ids = set()
+
+        for agent_id, info, instance in agents:
+            agent_ids.add(agent_id)
+            for cap in instance.capabilities():
+                slot = len(self._caps)
+                self._caps.append((agent_id, info, cap.priority, len(cap.patterns)))
+                for pattern in cap.patterns:
+                    if not pattern:
+                        self._always.append(slot)
+                        continue
+                    pid = pattern_ids.setdefault(pattern, len(pattern_ids))
+                    if pid == len(pattern_slots):
+                        pattern_slots.append([])
+                    pattern_slots[pid].append(slot)
+
+        self._matcher = PatternMatcher(pattern_ids)
+        self._pattern_slots: List[Tuple[int, ...]] = [tuple(s) for s in pattern_slots]
+
+        # Rank slots by one exact integer: matches * (L / patterns) is confidence
+        # scaled by the LCM of the pattern counts, and the low digits (tie < T)
+        # order equal confidences by priority, then by slot
+        sizes = [max(n, 1) for _, _, _, n in self._caps]
+        scale = lcm(*sizes) if sizes else 1
+        priority_rank = {p: i for i, p in enumerate(sorted({c[2] for c in self._caps}))}
+        n_slots = len(self._caps)
+        self._tie_base = max(len(priority_rank) * n_slots, 1)
+        self._weights = [scale // n * self._tie_base for n in sizes]
+        self._ties = [priority_rank[c[2]] * n_slots + slot for slot, c in enumerate(self._caps)]
+        self.agent_count = len(agent_ids)
+        self.capability_count = len(self._caps)
+        self.pattern_count = len(pattern_ids)
+
+    def route(self, text: str) -> Optional[str]:
+        """Best agent for already-lowercased task text, or None."""
+        pattern_slots = self._pattern_slots
+        counts = Counter(chain(self._always, *(pattern_slots[pid] for pid in self._matcher.find(text))))
+        if not counts:
+            return None
+
+        weights, ties, caps = self._weights, self._ties, self._caps
+        best = max(n * weights[slot] - ties[slot] for slot, n in counts.items())
+        slot = (-best) % self._tie_base % len(caps)
+        if caps[slot][1].state in self.routable_states:
+            return caps[slot][0]
+        # Best capability belongs to an unroutable agent: take the next best routable one
+        for slot in sorted(counts, key=lambda s: ties[s] - counts[s] * weights[s]):
+            if caps[slot][1].state in self.routable_states:
+                return caps[slot][0]
+        return None
+
+    def stats(self) -> dict:
+        return {
+            "generation": self.generation,
+            "agents": self.agent_count,
+            "capabilities": self.capability_count,
+            "patterns": self.pattern_count,
+        }
@@ -0,0 +1,538 @@
+#!/usr/bin/env python3
+# ═══════════════════════════════════════════════════════════════════════════════
+# CELL: task_store [python]
+# Author: COPILOT | Created: 2026-10-17T00:00:00Z
+# Purpose: Indexed SQLite task store behind current_tasks.json
+# ═══════════════════════════════════════════════════════════════════════════════
+"""
+Task Store Module
+=================
+Indexed, point-updatable storage for the SLATE task list.
+
+current_tasks.json used to be read and rewritten in full by every module
+that touched a task. TaskStore keeps the tasks in SQLite (WAL mode) next to
+the JSON file and treats the JSON as an export:
+
+- Point updates: update("task-id", status="completed") rewrites one row
+- Indexes on status and assigned_to for list()/counts()
+- Readers never block: WAL readers see the last committed state
+- Change notifications: subscribe() for in-process callbacks, and
+  changes_since(seq) for other processes polling the shared change log
+- JSON compatibility: the JSON file is re-exported atomically, throttled
+  to once per EXPORT_DELAY_S (the first write of a burst starts the timer,
+  later writes ride along), and at exit. Edits made to the JSON
+  by tools that still rewrite it directly are merged back in on the next
+  access; rows changed locally since the last export win over the file
+
+Files:
+    current_tasks.json        exported task list (same format as before)
+    .current_tasks.sqlite     the store (+ -wal / -shm)
+
+Usage:
+    from slate_core.task_store import get_task_store
+
+    store = get_task_store()
+    store.add({"title": "Fix flaky test", "status": "pending"})
+    store.update(task_id, status="in-progress", started_at=now)
+    store.list(status="pending", assigned_to="workflow")
+    unsubscribe = store.subscribe(lambda changes: print(changes))
+
+    python slate_core/task_store.py --stats
+    python slate_core/task_store.py --list --status pending
+"""
+
+import argparse
+import atexit
+import json
+import os
+import sqlite3
+import sys
+import threading
+import uuid
+import weakref
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+WORKSPACE_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(WORKSPACE_ROOT))
+
+from slate_core.file_lock import FileLock  # noqa: E402
+
+TASKS_FILE = WORKSPACE_ROOT / "current_tasks.json"
+EXPORT_DELAY_S = 1.0        # at most one JSON export per this many seconds of writes
+CHANGE_LOG_KEEP = 10000     # rows kept in the cross-process change log
+LOCK_TIMEOUT_S = 10.0
+
+ChangeCallback = Callable[[List[Dict[str, Any]]], None]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id          TEXT PRIMARY KEY,
+    position    REAL NOT NULL,
+    status      TEXT,
+    assigned_to TEXT,
+    rev         INTEGER NOT NULL,
+    dirty       INTEGER NOT NULL DEFAULT 0,
+    data        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
+CREATE INDEX IF NOT EXISTS idx_tasks_assigned ON tasks(assigned_to);
+CREATE INDEX IF NOT EXISTS idx_tasks_position ON tasks(position);
+CREATE TABLE IF NOT EXISTS tombstones (id TEXT PRIMARY KEY, rev INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS changes (
+    seq     INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id TEXT NOT NULL,
+    op      TEXT NOT NULL,
+    status  TEXT,
+    ts      TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _dumps(task: Dict[str, Any]) -> str:
+    return json.dumps(task, sort_keys=True, default=str)
+
+
+class TaskStore:
+    """
+    SQLite-backed task list with a JSON export.
+
+    Attributes:
+        json_path: exported current_tasks.json
+        db_path: SQLite database (defaults to .<json stem>.sqlite beside the JSON)
+        export_delay: seconds from the first unexported write to the export; 0 exports on every write
+    """
+
+    def __init__(self, json_path: Union[str, Path] = TASKS_FILE, db_path: Union[str, Path, None] = None,
+                 export_delay: float = EXPORT_DELAY_S):
+        self.json_path = Path(json_path)
+        self.db_path = Path(db_path) if db_path else self.json_path.with_name(f".{self.json_path.stem}.sqlite")
+        self.export_delay = export_delay
+        self._lock = threading.RLock()
+        self._subscribers: Dict[int, ChangeCallback] = {}
+        self._next_sub_id = 0
+        self._timer: Optional[threading.Timer] = None
+        self.stats = {"writes": 0, "exports": 0, "imports": 0}
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), timeout=LOCK_TIMEOUT_S,
+                                     check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        _open_stores.add(self)
+
+    # ── Internals ──────────────────────────────────────────────────────
+
+    def _json_lock(self) -> FileLock:
+        # Same lock slate_core.file_lock users take on current_tasks.json
+        return FileLock(self.json_path, timeout=LOCK_TIMEOUT_S)
+
+    @contextmanager
+    def _write(self):
+        """Serialized write transaction; yields a change recorder."""
+        changes: List[Dict[str, Any]] = []
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                def record(task_id: str, op: str, status: Optional[str]) -> int:
+                    ts = _now()
+                    seq = self._conn.execute(
+                        "INSERT INTO changes (task_id, op, status, ts) VALUES (?, ?, ?, ?)",
+                        (task_id, op, status, ts)).lastrowid
+                    changes.append({"seq": seq, "task_id": task_id, "op": op, "status": status, "ts": ts})
+                    return seq
+                yield record
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        if changes:
+            self.stats["writes"] += 1
+            self._notify(changes)
+
+    def _meta(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, key: str, value: str):
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def _json_signature(self) -> Optional[str]:
+        try:
+            st = self.json_path.stat()
+        except OSError:
+            return None
+        return f"{st.st_mtime_ns}:{st.st_size}"
+
+    def _put(self, record, task: Dict[str, Any], position: float, op: str, dirty: int = 1):
+        seq = record(task["id"], op, task.get("status"))
+        self._conn.execute(
+            "INSERT OR REPLACE INTO tasks (id, position, status, assigned_to, rev, dirty, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (task["id"], position, task.get("status"), task.get("assigned_to"), seq, dirty, _dumps(task)))
+
+    def _next_position(self) -> float:
+        row = self._conn.execute("SELECT MAX(position) FROM tasks").fetchone()
+        return (row[0] if row[0] is not None else -1) + 1
+
+    def _sync(self):
+        """Merge edits other tools made directly to the JSON file."""
+        signature = self._json_signature()
+        if signature is None or signature == self._meta("json_signature"):
+            return
+        try:
+            with self._json_lock().acquire(exclusive=False):
+                signature = self._json_signature()
+                data = json.loads(self.json_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError, TimeoutError):
+            return  # half-written by a legacy writer; retry on the next access
+        self._import(data, signature)
+
+    def _import(self, data: Union[Dict[str, Any], List[Dict[str, Any]]], signature: Optional[str]):
+        shape = "list" if isinstance(data, list) else "dict"
+        incoming = data if isinstance(data, list) else data.get("tasks", [])
+        extra = {} if isinstance(data, list) else {k: v for k, v in data.items() if k != "tasks"}
+        with self._write() as record:
+            rows = {r[0]: (r[1], r[2]) for r in self._conn.execute("SELECT id, dirty, data FROM tasks")}
+            tombstoned = {r[0] for r in self._conn.execute("SELECT id FROM tombstones")}
+            seen = set()
+            for position, task in enumerate(t for t in incoming if isinstance(t, dict)):
+                task = dict(task)
+                task.setdefault("id", uuid.uuid4().hex[:8])
+                seen.add(task["id"])
+                current = rows.get(task["id"])
+                if task["id"] in tombstoned or (current and current[0]):
+                    continue  # deleted or changed here since the last export: local wins
+                if current and current[1] == _dumps(task):
+                    self._conn.execute("UPDATE tasks SET position = ? WHERE id = ?", (position, task["id"]))
+                    continue
+                self._put(record, task, position, "import", dirty=0)
+            for task_id, (dirty, _) in rows.items():
+                if task_id not in seen and not dirty:
+                    self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+                    record(task_id, "import_delete", None)
+            self._set_meta("json_extra", json.dumps(extra, default=str))
+            self._set_meta("json_shape", shape)
+            if signature:
+                self._set_meta("json_signature", signature)
+        self.stats["imports"] += 1
+
+    def _schedule_export(self):
+        if self.export_delay <= 0:
+            self.flush()
+            return
+        with self._lock:
+            if self._timer is None:
+                self._timer = threading.Timer(self.export_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _notify(self, changes: List[Dict[str, Any]]):
+        for callback in list(self._subscribers.values()):
+            try:
+                callback(changes)
+            except Exception:
+                pass
+
+    # ── Reads ──────────────────────────────────────────────────────────
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._sync()
+            row = self._conn.execute("SELECT data FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def list(self, status: Union[str, Iterable[str], None] = None, assigned_to: Optional[str] = None,
+             limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Tasks in list order, optionally filtered through the status / assignee indexes."""
+        clauses, params = [], []
+        if status is not None:
+            statuses = [status] if isinstance(status, str) else list(status)
+            clauses.append(f"status IN ({', '.join('?' * len(statuses))})")
+            params.extend(statuses)
+        if assigned_to is not None:
+            clauses.append("assigned_to = ?")
+            params.append(assigned_to)
+        sql = "SELECT data FROM tasks"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY position"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            self._sync()
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def counts(self) -> Dict[str, int]:
+        """Number of tasks per status."""
+        with self._lock:
+            self._sync()
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall()
+        return {status or "unknown": n for status, n in rows}
+
+    def read_document(self) -> Dict[str, Any]:
+        """The full JSON document ({"tasks": [...], ...}) as current_tasks.json holds it."""
+        with self._lock:
+            tasks = self.list()
+            extra = json.loads(self._meta("json_extra", "{}"))
+        return {"tasks": tasks, **extra}
+
+    # ── Writes ─────────────────────────────────────────────────────────
+
+    def add(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """Append a task (id and created_at are filled in when missing)."""
+        task = dict(task)
+        task.setdefault("id", uuid.uuid4().hex[:8])
+        task.setdefault("created_at", _now())
+        with self._lock:
+            self._sync()
+            with self._write() as record:
+                exists = self._conn.execute("SELECT position FROM tasks WHERE id = ?", (task["id"],)).fetchone()
+                self._put(record, task, exists[0] if exists else self._next_position(),
+                          "update" if exists else "add")
+        self._schedule_export()
+        return task
+
+    def add_many(self, tasks: Iterable[Dict[str, Any]], skip_existing: bool = True) -> int:
+        """Append several tasks in one transaction; returns how many were added."""
+        added = 0
+        with self._lock:
+            self._sync()
+            with self._write() as record:
+                position = self._next_position()
+                for task in tasks:
+                    task = dict(task)
+                    task.setdefault("id", uuid.uuid4().hex[:8])
+                    task.setdefault("created_at", _now())
+                    if skip_existing and self._conn.execute(
+                            "SELECT 1 FROM tasks WHERE id = ?", (task["id"],)).fetchone():
+                        continue
+                    self._put(record, task, position, "add")
+                    position += 1
+                    added += 1
+        if added:
+            self._schedule_export()
+        return added
+
+    def update(self, task_id: str, **fields: Any) -> Optional[Dict[str, Any]]:
+        """Merge fields into one task; returns the updated task or None if it does not exist."""
+        with self._lock:
+            self._sync()
+            with self._write() as record:
+                row = self._conn.execute("SELECT position, data FROM tasks WHERE id = ?", (task_id,)).fetchone()
+                if row is None:
+                    return None
+                task = json.loads(row[1])
+                task.update(fields)
+                task["id"] = task_id
+                self._put(record, task, row[0], "update")
+        self._schedule_export()
+        return task
+
+    def delete(self, task_id: str) -> bool:
+        with self._lock:
+            self._sync()
+            with self._write() as record:
+                deleted = self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,)).rowcount
+                if deleted:
+                    seq = record(task_id, "delete", None)
+                    self._conn.execute("INSERT OR REPLACE INTO tombstones (id, rev) VALUES (?, ?)", (task_id, seq))
+        if deleted:
+            self._schedule_export()
+        return bool(deleted)
+
+    def write_document(self, data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Dict[str, int]:
+        """Replace the whole task list (legacy save path); only rows that differ are written."""
+        incoming = data if isinstance(data, list) else data.get("tasks", [])
+        extra = {} if isinstance(data, list) else {k: v for k, v in data.items() if k not in ("tasks", "last_updated")}
+        summary = {"written": 0, "deleted": 0}
+        with self._lock:
+            self._sync()
+            with self._write() as record:
+                rows = {r[0]: (r[1], r[2]) for r in self._conn.execute("SELECT id, position, data FROM tasks")}
+                seen = set()
+                for position, task in enumerate(incoming):
+                    task = dict(task)
+                    task.setdefault("id", uuid.uuid4().hex[:8])
+                    seen.add(task["id"])
+                    current = rows.get(task["id"])
+                    if current and current[1] == _dumps(task):
+                        if current[0] != position:
+                            self._conn.execute("UPDATE tasks SET position = ?, dirty = 1 WHERE id = ?",
+                                               (position, task["id"]))
+                        continue
+                    self._put(record, task, position, "update" if current else "add")
+                    summary["written"] += 1
+                for task_id in rows.keys() - seen:
+                    self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+                    seq = record(task_id, "delete", None)
+                    self._conn.execute("INSERT OR REPLACE INTO tombstones (id, rev) VALUES (?, ?)", (task_id, seq))
+                    summary["deleted"] += 1
+                if not isinstance(data, list):
+                    merged = {**json.loads(self._meta("json_extra", "{}")), **extra}
+                    self._set_meta("json_extra", json.dumps(merged, default=str))
+                    self._set_meta("json_shape", "dict")
+                else:
+                    self._set_meta("json_shape", "list")
+            # Ordering-only and metadata-only changes still need an export
+            self._set_meta("export_pending", "1")
+        self._schedule_export()
+        return summary
+
+    # ── JSON export ────────────────────────────────────────────────────
+
+    def flush(self) -> bool:
+        """Export to the JSON file now if anything changed since the last export."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._sync()
+            dirty = self._conn.execute(
+                "SELECT EXISTS(SELECT 1 FROM tasks WHERE dirty = 1) OR EXISTS(SELECT 1 FROM tombstones)"
+            ).fetchone()[0]
+            if not dirty and self._meta("export_pending") != "1" and self.json_path.exists():
+                return False
+            self.export_json()
+            return True
+
+    def export_json(self, path: Union[str, Path, None] = None) -> Path:
+        """Write the task list as JSON (atomic replace); the default path marks the store clean."""
+        target = Path(path) if path else self.json_path
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                last_seq = self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM changes").fetchone()[0]
+                tasks = [json.loads(r[0]) for r in self._conn.execute("SELECT data FROM tasks ORDER BY position")]
+                extra = json.loads(self._meta("json_extra", "{}"))
+                shape = self._meta("json_shape", "dict")
+            finally:
+                self._conn.execute("COMMIT")
+            document: Any = tasks if shape == "list" else {"tasks": tasks, **extra, "last_updated": _now()}
+            text = json.dumps(document, indent=2, default=str)
+            if target != self.json_path:
+                target.write_text(text, encoding="utf-8")
+                return target
+
+            with self._json_lock().acquire():
+                tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+                tmp.write_text(text, encoding="utf-8")
+                os.replace(tmp, target)
+                signature = self._json_signature()
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("UPDATE tasks SET dirty = 0 WHERE dirty = 1 AND rev <= ?", (last_seq,))
+                self._conn.execute("DELETE FROM tombstones WHERE rev <= ?", (last_seq,))
+                self._conn.execute("DELETE FROM changes WHERE seq <= ?", (last_seq - CHANGE_LOG_KEEP,))
+                self._set_meta("json_signature", signature or "")
+                self._set_meta("export_pending", "0")
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self.stats["exports"] += 1
+        return target
+
+    # ── Change notifications ───────────────────────────────────────────
+
+    def subscribe(self, callback: ChangeCallback) -> Callable[[], None]:
+        """Call callback(changes) after each committed write in this process; returns an unsubscribe function."""
+        with self._lock:
+            sub_id = self._next_sub_id
+            self._next_sub_id += 1
+            self._subscribers[sub_id] = callback
+
+        def unsubscribe():
+            with self._lock:
+                self._subscribers.pop(sub_id, None)
+        return unsubscribe
+
+    def changes_since(self, seq: int = 0, limit: int = 1000) -> List[Dict[str, Any]]:
+        """Committed changes from every process after seq (poll with the last seq seen)."""
+        with self._lock:
+            self._sync()
+            rows = self._conn.execute(
+                "SELECT seq, task_id, op, status, ts FROM changes WHERE seq > ? ORDER BY seq LIMIT ?",
+                (seq, limit)).fetchall()
+        return [dict(zip(("seq", "task_id", "op", "status", "ts"), r)) for r in rows]
+
+    def last_seq(self) -> int:
+        with self._lock:
+            self._sync()
+            return self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM changes").fetchone()[0]
+
+    def info(self) -> Dict[str, Any]:
+        counts = self.counts()
+        return {
+            "json": str(self.json_path),
+            "db": str(self.db_path),
+            "tasks": sum(counts.values()),
+            "by_status": counts,
+            "last_seq": self.last_seq(),
+            **self.stats,
+        }
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._conn.close()
+        _open_stores.discard(self)
+
+
+_open_stores: "weakref.WeakSet[TaskStore]" = weakref.WeakSet()
+_stores: Dict[Path, TaskStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_task_store(json_path: Union[str, Path, None] = None) -> TaskStore:
+    """Get the shared TaskStore for a task file (defaults to current_tasks.json)."""
+    path = Path(json_path or TASKS_FILE).resolve()
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = TaskStore(path)
+        return _stores[path]
+
+
+@atexit.register
+def _flush_open_stores():
+    for store in list(_open_stores):
+        try:
+            store.flush()
+        except Exception:
+            pass
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="SLATE Task Store")
+    parser.add_argument("--file", type=Path, default=TASKS_FILE, help="Task JSON file")
+    parser.add_argument("--stats", action="store_true", help="Show counts and store info")
+    parser.add_argument("--list", action="store_true", help="List tasks")
+    parser.add_argument("--status", help="Filter --list by status")
+    parser.add_argument("--assigned-to", help="Filter --list by assignee")
+    parser.add_argument("--export", action="store_true", help="Re-export the JSON file now")
+    args = parser.parse_args()
+
+    store = get_task_store(args.file)
+    if args.export:
+        print(store.export_json())
+    elif args.list:
+        for task in store.list(status=args.status, assigned_to=args.assigned_to):
+            print(f"  {task.get('id', '?'):<28} {task.get('status', '?'):<12} "
+                  f"{str(task.get('assigned_to', '')):<14} {task.get('title', '')[:60]}")
+    else:
+        print(json.dumps(store.info(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
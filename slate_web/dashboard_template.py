@@ -4053,7 +4053,7 @@ def build_template_js() -> str:
             if (schematicWs && schematicWs.readyState === WebSocket.OPEN) return;
 
             try {
-                schematicWs = new WebSocket(`ws://${window.location.host}/api/schematic/ws/live`);
+                schematicWs = new WebSocket(`ws://${window.location.host}/api/schematic/ws/live?mode=incremental`);
 
                 schematicWs.onopen = () => {
                     schematicReconnectAttempts = 0;
@@ -4063,11 +4063,20 @@ def build_template_js() -> str:
                 schematicWs.onmessage = (event) => {
                     try {
                         const data = JSON.parse(event.data);
+                        const container = document.getElementById('schematic-svg-container');
                         if (data.type === 'schematic_update') {
-                            const container = document.getElementById('schematic-svg-container');
                             if (container && data.svg) {
                                 container.innerHTML = data.svg;
                             }
+                        } else if (data.type === 'schematic_patch' && container) {
+                            // Only node statuses changed: update them in place
+                            Object.entries(data.nodes || {}).forEach(([id, attrs]) => {
+                                const node = container.querySelector(`.component[data-id="${CSS.escape(id)}"]`);
+                                if (!node) return;
+                                if (attrs.status) node.setAttribute('data-status', attrs.status);
+                                if (attrs.status_color) node.querySelectorAll('.status-indicator').forEach(el => el.setAttribute('fill', attrs.status_color));
+                                if (attrs.border) node.querySelectorAll('.outline').forEach(el => el.setAttribute('stroke', attrs.border));
+                            });
                         }
                     } catch (e) {}
                 };
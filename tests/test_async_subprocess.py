@@ -0,0 +1,163 @@
+# Modified: 2026-10-16T09:00:00Z | Author: COPILOT | Change: Add test coverage for async_subprocess module
+"""
+Tests for slate/async_subprocess.py — non-blocking execution, timeouts,
+per-binary concurrency limits, cancellation and event-loop responsiveness.
+"""
+
+import asyncio
+import subprocess
+import sys
+import time
+
+import pytest
+
+from slate.async_subprocess import (
+    AsyncSubprocessExecutor,
+    BINARY_LIMITS,
+    DEFAULT_CONCURRENCY,
+    binary_key,
+    get_executor,
+    run_async,
+)
+
+PY = sys.executable
+
+
+def _sleep_cmd(seconds: float) -> list:
+    return [PY, "-c", f"import time; time.sleep({seconds})"]
+
+
+class TestBinaryKey:
+    """Tests for binary_key normalization."""
+
+    def test_plain_name(self):
+        assert binary_key(["gh", "pr", "list"]) == "gh"
+
+    def test_windows_path(self):
+        assert binary_key(["C:/tools/.tools/gh.exe", "api"]) == "gh"
+
+    def test_unix_path(self):
+        assert binary_key(["/usr/bin/nvidia-smi"]) == "nvidia-smi"
+
+    def test_empty(self):
+        assert binary_key([]) == ""
+
+
+class TestConstants:
+    """Tests for module-level configuration."""
+
+    def test_gh_limited(self):
+        assert BINARY_LIMITS["gh"] >= 1
+
+    def test_default_concurrency_positive(self):
+        assert DEFAULT_CONCURRENCY >= 1
+
+    def test_global_executor_singleton(self):
+        assert get_executor() is get_executor()
+
+
+class TestRun:
+    """Tests for AsyncSubprocessExecutor.run."""
+
+    def test_captures_stdout(self):
+        result = asyncio.run(run_async([PY, "-c", "print('hello')"]))
+        assert isinstance(result, subprocess.CompletedProcess)
+        assert result.returncode == 0
+        assert result.stdout.strip() == "hello"
+
+    def test_captures_stderr_and_returncode(self):
+        code = "import sys; sys.stderr.write('bad'); sys.exit(3)"
+        result = asyncio.run(run_async([PY, "-c", code]))
+        assert result.returncode == 3
+        assert "bad" in result.stderr
+
+    def test_passes_input(self):
+        code = "import sys; print(sys.stdin.read().upper())"
+        result = asyncio.run(run_async([PY, "-c", code], input="abc"))
+        assert result.stdout.strip() == "ABC"
+
+    def test_bytes_mode(self):
+        result = asyncio.run(run_async([PY, "-c", "print('x')"], text=False))
+        assert isinstance(result.stdout, bytes)
+
+    def test_missing_binary_raises(self):
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(run_async(["definitely-not-a-real-binary-xyz"]))
+
+    def test_timeout_kills_process(self):
+        executor = AsyncSubprocessExecutor()
+        start = time.perf_counter()
+        with pytest.raises(subprocess.TimeoutExpired):
+            asyncio.run(executor.run(_sleep_cmd(10), timeout=0.3))
+        assert time.perf_counter() - start < 5
+        stats = executor.stats()[binary_key([PY])]
+        assert stats["timeouts"] == 1
+        assert stats["in_flight"] == 0
+
+    def test_cancellation_kills_process(self):
+        executor = AsyncSubprocessExecutor()
+
+        async def scenario():
+            task = asyncio.create_task(executor.run(_sleep_cmd(10)))
+            await asyncio.sleep(0.3)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        start = time.perf_counter()
+        asyncio.run(scenario())
+        assert time.perf_counter() - start < 5
+        assert executor.stats()[binary_key([PY])]["cancelled"] == 1
+
+    def test_reusable_across_event_loops(self):
+        executor = AsyncSubprocessExecutor()
+        for _ in range(2):
+            result = asyncio.run(executor.run([PY, "-c", "pass"]))
+            assert result.returncode == 0
+
+
+class TestConcurrency:
+    """Tests for per-binary concurrency limits and loop responsiveness."""
+
+    def test_limit_serializes_calls(self):
+        key = binary_key([PY])
+        executor = AsyncSubprocessExecutor(limits={key: 1})
+
+        async def scenario():
+            await asyncio.gather(*(executor.run(_sleep_cmd(0.3)) for _ in range(3)))
+
+        start = time.perf_counter()
+        asyncio.run(scenario())
+        assert time.perf_counter() - start >= 0.85
+
+    def test_event_loop_stays_responsive(self):
+        """Load test: loop tick latency stays flat while 20 slow calls run."""
+        key = binary_key([PY])
+        executor = AsyncSubprocessExecutor(limits={key: 20})
+        lags = []
+
+        async def ticker(stop: asyncio.Event):
+            while not stop.is_set():
+                before = time.perf_counter()
+                await asyncio.sleep(0.01)
+                lags.append(time.perf_counter() - before - 0.01)
+
+        async def scenario():
+            stop = asyncio.Event()
+            tick = asyncio.create_task(ticker(stop))
+            results = await asyncio.gather(*(executor.run(_sleep_cmd(1.0)) for _ in range(20)))
+            stop.set()
+            await tick
+            return results
+
+        start = time.perf_counter()
+        results = asyncio.run(scenario())
+        elapsed = time.perf_counter() - start
+
+        assert all(r.returncode == 0 for r in results)
+        # Concurrent, not serial (20 x 1s)
+        assert elapsed < 10
+        lags.sort()
+        p99 = lags[int(len(lags) * 0.99) - 1]
+        assert p99 < 0.25
+        assert executor.stats()[key]["calls"] == 20
@@ -0,0 +1,113 @@
+# Modified: 2026-10-16T12:00:00Z | Author: COPILOT | Change: Add test coverage for embedding_cache module
+"""
+Tests for slate/embedding_cache.py — content keys, float32 round trip,
+cache hits/misses, persistence and the block-start chunk boundary helper.
+"""
+
+import threading
+
+import pytest
+
+from slate.embedding_cache import EmbeddingCache, is_block_start, text_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = EmbeddingCache(tmp_path / "cache.sqlite")
+    yield c
+    c.close()
+
+
+class Recorder:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t)), 0.5] for t in texts]
+
+
+class TestHelpers:
+    def test_text_key_is_sha256(self):
+        assert len(text_key("abc")) == 64
+        assert text_key("abc") == text_key("abc")
+        assert text_key("abc") != text_key("abd")
+
+    def test_block_start(self):
+        assert is_block_start("def foo():")
+        assert is_block_start("class Bar:")
+        assert is_block_start("# Heading")
+        assert not is_block_start("    return x")
+        assert not is_block_start("")
+        assert not is_block_start(")")
+
+
+class TestEmbeddingCache:
+    def test_miss_then_hit(self, cache):
+        embed = Recorder()
+        first = cache.embed_with_cache("m", ["a", "bb"], embed)
+        second = cache.embed_with_cache("m", ["a", "bb"], embed)
+        assert first == second == [[1.0, 0.5], [2.0, 0.5]]
+        assert embed.calls == [["a", "bb"]]
+        assert cache.hits == 2 and cache.misses == 2
+
+    def test_only_missing_embedded(self, cache):
+        embed = Recorder()
+        cache.embed_with_cache("m", ["a", "b"], embed)
+        out = cache.embed_with_cache("m", ["a", "c", "b"], embed)
+        assert embed.calls[-1] == ["c"]
+        assert len(out) == 3
+
+    def test_duplicates_embedded_once(self, cache):
+        embed = Recorder()
+        out = cache.embed_with_cache("m", ["x", "x", "x"], embed)
+        assert embed.calls == [["x"]]
+        assert len(out) == 3
+
+    def test_model_scoped(self, cache):
+        embed = Recorder()
+        cache.embed_with_cache("m1", ["a"], embed)
+        cache.embed_with_cache("m2", ["a"], embed)
+        assert len(embed.calls) == 2
+
+    def test_float32_round_trip(self, cache):
+        cache.put_many("m", ["t"], [[0.1, -2.5, 3.0]])
+        vec = cache.get_many("m", ["t"])[0]
+        assert vec == pytest.approx([0.1, -2.5, 3.0], rel=1e-6)
+
+    def test_zero_vectors_not_stored(self, cache):
+        assert cache.put_many("m", ["a", "b"], [[0.0, 0.0], []]) == 0
+        assert cache.get_many("m", ["a", "b"]) == [None, None]
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "c.sqlite"
+        EmbeddingCache(path).put_many("m", ["a"], [[1.0]])
+        assert EmbeddingCache(path).get_many("m", ["a"]) == [[1.0]]
+
+    def test_large_lookup(self, cache):
+        texts = [f"chunk {i}" for i in range(1200)]
+        cache.put_many("m", texts, [[float(i + 1)] for i in range(1200)])
+        out = cache.get_many("m", texts)
+        assert out[0] == [1.0] and out[-1] == [1200.0]
+
+    def test_clear_and_stats(self, cache):
+        cache.put_many("m", ["a", "b"], [[1.0], [2.0]])
+        cache.put_many("n", ["a"], [[1.0]])
+        stats = cache.stats()
+        assert stats["entries"] == 3
+        assert stats["models"] == {"m": 2, "n": 1}
+        cache.clear("m")
+        assert cache.stats()["entries"] == 1
+        cache.clear()
+        assert cache.stats()["entries"] == 0
+
+    def test_thread_safe(self, cache):
+        def worker(n):
+            cache.embed_with_cache("m", [f"t{n}-{i}" for i in range(20)], Recorder())
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert cache.stats()["entries"] == 160
@@ -0,0 +1,114 @@
+# Modified: 2026-10-17T01:00:00Z | Author: COPILOT | Change: Add test coverage for file_lock module
+"""
+Tests for slate_core/file_lock.py — exclusive/shared semantics across
+threads, timeouts, the persistent lock inode and the JSON helpers.
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from slate_core.file_lock import FileLock, atomic_json_read, atomic_json_update
+
+
+@pytest.fixture
+def target(tmp_path):
+    return tmp_path / "tasks.json"
+
+
+def _hold(lock, exclusive, entered, release):
+    with lock.acquire(exclusive=exclusive):
+        entered.set()
+        release.wait(5)
+
+
+class TestSemantics:
+    @pytest.mark.skipif(os.name == "nt", reason="msvcrt locks are exclusive only")
+    def test_shared_readers_are_concurrent(self, target):
+        lock = FileLock(target, timeout=1)
+        entered, release = threading.Event(), threading.Event()
+        holder = threading.Thread(target=_hold, args=(lock, False, entered, release))
+        holder.start()
+        assert entered.wait(2)
+        start = time.perf_counter()
+        with lock.acquire(exclusive=False):
+            assert time.perf_counter() - start < 0.5
+        release.set()
+        holder.join()
+
+    def test_writer_excludes_threads_sharing_an_instance(self, target):
+        lock = FileLock(target, timeout=0.2)
+        entered, release = threading.Event(), threading.Event()
+        holder = threading.Thread(target=_hold, args=(lock, True, entered, release))
+        holder.start()
+        assert entered.wait(2)
+        for exclusive in (True, False):
+            with pytest.raises(TimeoutError):
+                with lock.acquire(exclusive=exclusive):
+                    pass
+        release.set()
+        holder.join()
+        with lock.acquire():
+            pass
+
+    def test_blocking_wait_wakes_on_release(self, target):
+        lock = FileLock(target, timeout=None)
+        entered, release = threading.Event(), threading.Event()
+        holder = threading.Thread(target=_hold, args=(lock, True, entered, release))
+        holder.start()
+        assert entered.wait(2)
+        threading.Timer(0.1, release.set).start()
+        start = time.perf_counter()
+        with lock.acquire():
+            waited = time.perf_counter() - start
+        holder.join()
+        assert 0.05 < waited < 2
+
+    def test_counter_with_many_threads(self, target):
+        counter = target.with_name("counter.txt")
+        counter.write_text("0")
+        lock = FileLock(target, timeout=None)
+
+        def bump():
+            for _ in range(50):
+                with lock:
+                    counter.write_text(str(int(counter.read_text()) + 1))
+
+        threads = [threading.Thread(target=bump) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert counter.read_text() == "400"
+
+
+class TestLockFile:
+    def test_lock_file_inode_is_stable(self, target):
+        lock = FileLock(target)
+        with lock.acquire():
+            inode = os.stat(lock.lock_path).st_ino
+        assert lock.lock_path.exists()
+        with lock.acquire(exclusive=False):
+            assert os.stat(lock.lock_path).st_ino == inode
+
+    def test_timeout_releases_descriptor(self, target):
+        holder = FileLock(target)
+        waiter = FileLock(target, timeout=0.05)
+        with holder.acquire():
+            for _ in range(3):
+                with pytest.raises(TimeoutError):
+                    with waiter.acquire():
+                        pass
+        with waiter.acquire():
+            pass
+
+
+class TestJsonHelpers:
+    def test_update_and_read(self, target):
+        atomic_json_update(target, lambda d: {**d, "tasks": [{"id": "a"}]})
+        assert atomic_json_read(target) == {"tasks": [{"id": "a"}]}
+
+    def test_read_missing(self, target):
+        assert atomic_json_read(target) == {}
@@ -0,0 +1,118 @@
+# Modified: 2026-10-17T02:00:00Z | Author: COPILOT | Change: Add test coverage for memory module
+"""
+Tests for slate_core/memory.py — the in-memory key index, coalesced
+atomic writes and pick-up of writes made by other processes.
+"""
+
+import json
+import time
+
+import pytest
+
+from slate_core import memory as memory_mod
+from slate_core.memory import ConstitutionMemory
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return tmp_path / "memory_store.json"
+
+
+@pytest.fixture
+def make_memory(store_path, monkeypatch):
+    monkeypatch.setattr(memory_mod, "INVALIDATE_CHECK_S", 0.0)
+    made = []
+
+    def make(flush_delay=60.0):
+        mem = ConstitutionMemory(store_path, flush_delay=flush_delay)
+        made.append(mem)
+        return mem
+
+    yield make
+    for mem in made:
+        mem.flush()
+
+
+def _write_external(path, data):
+    time.sleep(0.01)  # distinct mtime for the change signature
+    path.write_text(json.dumps(data))
+
+
+class TestKeyValue:
+    def test_set_get_delete(self, make_memory):
+        mem = make_memory()
+        mem.set("a", 1)
+        assert mem.get("a") == 1
+        assert mem.delete("a") is True
+        assert mem.delete("a") is False
+        assert mem.get("a", "missing") == "missing"
+
+    def test_prefix_index(self, make_memory):
+        mem = make_memory()
+        for key in ["user.theme", "agent.alpha", "user.lang", "_internal", "users", "agent.beta"]:
+            mem.set(key, key)
+        assert mem.list_keys() == ["agent.alpha", "agent.beta", "user.lang", "user.theme", "users"]
+        assert mem.list_keys("user.") == ["user.lang", "user.theme"]
+        assert mem.list_keys("zzz") == []
+        mem.delete("user.lang")
+        assert mem.list_keys("user") == ["user.theme", "users"]
+
+    def test_clear_prefix(self, make_memory):
+        mem = make_memory()
+        for key in ["a.1", "a.2", "b.1"]:
+            mem.set(key, 1)
+        assert mem.clear("a.") == 2
+        assert mem.list_keys() == ["b.1"]
+        assert mem.clear() == 1
+        assert mem.list_keys() == []
+
+
+class TestWrites:
+    def test_writes_are_coalesced(self, make_memory, store_path):
+        mem = make_memory()
+        for i in range(200):
+            mem.set(f"k{i:03d}", i)
+        assert not store_path.exists()
+        assert mem.flush() is True
+        assert mem.flush() is False
+        data = json.loads(store_path.read_text())
+        assert data["k199"] == 199 and "_updated_at" in data
+        assert mem.stats["writes"] == 1
+
+    def test_throttled_flush(self, make_memory, store_path):
+        mem = make_memory(flush_delay=0.05)
+        mem.set("a", 1)
+        time.sleep(0.3)
+        assert json.loads(store_path.read_text())["a"] == 1
+
+    def test_write_through(self, make_memory, store_path):
+        mem = make_memory(flush_delay=0)
+        mem.set("a", 1)
+        mem.delete("a")
+        assert "a" not in json.loads(store_path.read_text())
+        assert not list(store_path.parent.glob("*.tmp"))
+
+
+class TestCrossProcess:
+    def test_external_write_is_picked_up(self, make_memory, store_path):
+        mem = make_memory()
+        assert mem.get("x") is None
+        _write_external(store_path, {"x": 1, "y": 2})
+        assert mem.get("x") == 1
+        assert mem.list_keys() == ["x", "y"]
+
+    def test_flush_merges_other_writers(self, make_memory, store_path):
+        first, second = make_memory(), make_memory()
+        first.set("a", 1)
+        second.set("b", 2)
+        first.flush()
+        second.flush()
+        data = json.loads(store_path.read_text())
+        assert data["a"] == 1 and data["b"] == 2
+
+    def test_pending_changes_survive_reload(self, make_memory, store_path):
+        mem = make_memory()
+        mem.set("mine", 1)
+        _write_external(store_path, {"theirs": 2, "mine": 0})
+        assert mem.get("mine") == 1
+        assert mem.get("theirs") == 2
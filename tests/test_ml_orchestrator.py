@@ -1,9 +1,11 @@
 # Modified: 2026-02-07T13:35:00Z | Author: COPILOT | Change: Add test coverage for ml_orchestrator module
 """
 Tests for slate/ml_orchestrator.py — model routing, GPU strategy,
-OllamaClient basics, constants.
+OllamaClient basics, constants, streaming inference.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -86,3 +88,154 @@ class TestModelRouting:
 
     def test_planning_uses_planner(self):
         assert "planner" in MODEL_ROUTING["planning"].lower()
+
+
+# ── Cached Embedding ────────────────────────────────────────────────────
+
+
+class TestEmbedChunks:
+    """Tests for MLOrchestrator.embed_chunks with the shared embedding cache."""
+
+    def test_only_uncached_chunks_reach_ollama(self, tmp_path):
+        from slate.embedding_cache import EmbeddingCache
+        from slate.ml_orchestrator import MLOrchestrator
+
+        orch = MLOrchestrator.__new__(MLOrchestrator)
+        orch.state = {"total_embeddings": 0}
+        orch.ollama = MagicMock()
+        orch.ollama.embed_batch.side_effect = lambda model, texts: [[1.0, float(len(t))] for t in texts]
+        cache = EmbeddingCache(tmp_path / "cache.sqlite")
+
+        with patch("slate.embedding_cache.get_embedding_cache", return_value=cache):
+            orch.embed_chunks(["a", "bb"])
+            vectors = orch.embed_chunks(["a", "bb", "ccc"])
+
+        assert vectors[2] == [1.0, 3.0]
+        assert orch.ollama.embed_batch.call_args_list[-1].args[1] == ["ccc"]
+        assert orch.state["total_embeddings"] == 3
+
+
+class TestFlatFileFallbackIndex:
+    """index_codebase without ChromaDB keeps searchable vectors."""
+
+    def test_fallback_builds_searchable_index(self, tmp_path):
+        pytest.importorskip("numpy")
+        import slate.ml_orchestrator as ml
+        import slate.slate_vector_index as vi
+        from slate.embedding_cache import EmbeddingCache
+
+        ws = tmp_path / "ws"
+        (ws / "slate").mkdir(parents=True)
+        (ws / "slate" / "gpu.py").write_text("def gpu_scheduler():\n    return 'gpu gpu gpu'\n")
+        (ws / "slate" / "queue.py").write_text("def task_queue():\n    return 'queue queue'\n")
+
+        def fake_embed(model, texts):
+            return [[1.0 + t.count("gpu"), 1.0 + t.count("queue")] for t in texts]
+
+        orch = ml.MLOrchestrator.__new__(ml.MLOrchestrator)
+        orch.workspace = ws
+        orch.state = {"total_embeddings": 0, "last_index": None}
+        orch.ollama = MagicMock()
+        orch.ollama.embed_batch.side_effect = fake_embed
+        cache = EmbeddingCache(tmp_path / "cache.sqlite")
+
+        with patch("slate.slate_chromadb.SlateChromaDB", side_effect=ImportError), \
+             patch("slate.embedding_cache.get_embedding_cache", return_value=cache), \
+             patch.object(ml, "EMBEDDINGS_DIR", tmp_path / "emb"), \
+             patch.object(ml, "STATE_FILE", tmp_path / "state.json"), \
+             patch.object(vi, "VECTOR_INDEX_DIR", tmp_path / "vi"), \
+             patch.object(vi.SlateVectorIndex.__init__, "__defaults__", (tmp_path / "vi", None)):
+            first = orch.index_codebase(dirs=["slate"], extensions=[".py"])
+            second = orch.index_codebase(dirs=["slate"], extensions=[".py"])
+
+        assert first["vector_index"]["rows"] == 2
+        assert second["files_skipped"] == 2
+        index = vi.SlateVectorIndex(tmp_path / "vi", embed_fn=lambda q: [1.0, 5.0])
+        assert index.search_code("queue")[0]["metadata"]["file_path"].endswith("queue.py")
+
+
+# ── Streaming Inference ─────────────────────────────────────────────────
+
+
+class FakeStreamingOllama:
+    """generate_stream stand-in yielding one chunk per word."""
+
+    def __init__(self, words, fail_after=None):
+        self.words = words
+        self.fail_after = fail_after
+
+    def generate_stream(self, model, prompt, **kwargs):
+        for i, word in enumerate(self.words):
+            if self.fail_after is not None and i == self.fail_after:
+                raise RuntimeError("model crashed")
+            yield {"response": word, "done": False}
+        yield {"response": "", "done": True, "eval_count": len(self.words),
+               "eval_duration": 2_000_000_000}
+
+
+@pytest.fixture
+def streaming_orch(tmp_path):
+    import slate.ml_orchestrator as ml
+
+    def make(words, fail_after=None):
+        orch = ml.MLOrchestrator.__new__(ml.MLOrchestrator)
+        orch.state = {"total_inferences": 0, "model_stats": {}}
+        orch.ollama = FakeStreamingOllama(words, fail_after)
+        orch.get_model_for_task = lambda task_type: "slate-fast:latest"
+        return orch
+
+    tracer = MagicMock()
+    with patch.object(ml, "STATE_FILE", tmp_path / "state.json"), \
+         patch.object(ml, "_get_inference_tracer", return_value=tracer):
+        yield make, tracer
+
+
+class TestInferStream:
+    """Tests for MLOrchestrator.infer_stream / infer_stream_async."""
+
+    def test_yields_tokens_and_fills_summary(self, streaming_orch):
+        make, tracer = streaming_orch
+        orch = make(["Hello", " world"])
+        summary = {}
+        assert list(orch.infer_stream("hi", summary=summary)) == ["Hello", " world"]
+        assert summary["response"] == "Hello world"
+        assert summary["tokens"] == 2
+        assert summary["ttft"] >= 0
+        assert orch.state["model_stats"]["slate-fast:latest"]["calls"] == 1
+
+    def test_traces_time_to_first_token(self, streaming_orch):
+        make, tracer = streaming_orch
+        list(make(["a", "b"]).infer_stream("hi"))
+        kwargs = tracer.trace_inference.call_args.kwargs
+        assert kwargs["ttft"] is not None
+        assert kwargs["result"]["response"] == "ab"
+        assert kwargs["error"] is None
+
+    def test_early_close_still_records(self, streaming_orch):
+        make, tracer = streaming_orch
+        orch = make(["a", "b", "c"])
+        stream = orch.infer_stream("hi")
+        assert next(stream) == "a"
+        stream.close()
+        assert orch.state["total_inferences"] == 1
+        assert tracer.trace_inference.call_args.kwargs["result"]["response"] == "a"
+
+    def test_error_mid_stream_raises_after_partial_output(self, streaming_orch):
+        make, tracer = streaming_orch
+        tokens = []
+        with pytest.raises(RuntimeError, match="model crashed"):
+            for token in make(["a", "b", "c"], fail_after=2).infer_stream("hi"):
+                tokens.append(token)
+        assert tokens == ["a", "b"]
+        assert tracer.trace_inference.call_args.kwargs["error"] == "model crashed"
+
+    def test_async_stream(self, streaming_orch):
+        make, tracer = streaming_orch
+        orch = make(["x", "y", "z"])
+        summary = {}
+
+        async def collect():
+            return [t async for t in orch.infer_stream_async("hi", summary=summary)]
+
+        assert asyncio.run(collect()) == ["x", "y", "z"]
+        assert summary["response"] == "xyz"
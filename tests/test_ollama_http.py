@@ -0,0 +1,326 @@
+# Modified: 2026-10-16T14:00:00Z | Author: COPILOT | Change: Add test coverage for ollama_http pooled client
+"""
+Tests for slate/ollama_http.py — keep-alive connection reuse, stale socket
+recovery, per-endpoint timeouts, retry/backoff, urllib-compatible errors,
+NDJSON streaming, the async variant and the connection-overhead benchmark. Ollama is replaced
+by a local HTTP/1.1 mock server that records client connections.
+"""
+
+import asyncio
+import json
+import socket
+import struct
+import threading
+import time
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from slate.ml_orchestrator import OllamaClient
+from slate.ollama_http import (
+    ENDPOINT_TIMEOUTS,
+    AsyncOllamaHTTPClient,
+    OllamaHTTPClient,
+    benchmark_connection_overhead,
+    endpoint_timeout,
+    get_ollama_http,
+    iterate_in_thread,
+)
+
+
+class MockOllamaHandler(BaseHTTPRequestHandler):
+    """Mock Ollama API speaking HTTP/1.1 keep-alive."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # like Ollama's Go server; avoids delayed-ACK stalls
+    connections = set()
+    requests = 0
+    busy_responses = 0      # number of upcoming requests answered with 503
+    lock = threading.Lock()
+
+    def _reply(self, status: int, payload: dict):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self):
+        with MockOllamaHandler.lock:
+            MockOllamaHandler.connections.add(self.client_address)
+            MockOllamaHandler.requests += 1
+            busy = MockOllamaHandler.busy_responses > 0
+            if busy:
+                MockOllamaHandler.busy_responses -= 1
+        length = int(self.headers.get("Content-Length") or 0)
+        data = json.loads(self.rfile.read(length)) if length else {}
+        if busy:
+            self._reply(503, {"error": "server busy"})
+        elif self.path == "/api/tags":
+            self._reply(200, {"models": [{"name": "slate-fast:latest"}]})
+        elif self.path == "/api/generate" and data.get("stream"):
+            self._stream(data)
+        elif self.path == "/api/generate":
+            if data.get("model") == "slow":
+                time.sleep(0.5)
+            self._reply(200, {"response": f"echo {data.get('prompt', '')}", "done": True})
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def _stream(self, data: dict):
+        """Chunked NDJSON like Ollama's streaming /api/generate."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        words = data.get("prompt", "").split()
+        for i, word in enumerate(words):
+            if i and data.get("model") == "slow":
+                time.sleep(0.2)
+            line = json.dumps({"response": word + " ", "done": False}).encode() + b"\n"
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+            self.wfile.flush()
+        line = json.dumps({"response": "", "done": True, "eval_count": len(words),
+                           "eval_duration": 1_000_000}).encode() + b"\n"
+        self.wfile.write(b"%x\r\n%s\r\n0\r\n\r\n" % (len(line), line))
+
+    do_GET = _handle
+    do_POST = _handle
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    MockOllamaHandler.connections = set()
+    MockOllamaHandler.requests = 0
+    MockOllamaHandler.busy_responses = 0
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), MockOllamaHandler)
+    srv.daemon_threads = True
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv, f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def url(server):
+    return server[1]
+
+
+class TestEndpointTimeouts:
+    def test_known_endpoints(self):
+        assert endpoint_timeout("/api/tags") == ENDPOINT_TIMEOUTS["/api/tags"]
+        assert endpoint_timeout("/api/generate") > endpoint_timeout("/api/tags")
+
+    def test_unknown_endpoint_uses_default(self):
+        assert endpoint_timeout("/api/unknown") > 0
+
+    def test_rejects_non_http_url(self):
+        with pytest.raises(ValueError):
+            OllamaHTTPClient("ftp://host")
+
+
+class TestPooling:
+    def test_reuses_one_connection(self, url):
+        client = OllamaHTTPClient(url)
+        for _ in range(20):
+            assert client.request("/api/tags")["models"][0]["name"] == "slate-fast:latest"
+        stats = client.stats()
+        assert stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 19
+        assert len(MockOllamaHandler.connections) == 1
+
+    def test_post_json(self, url):
+        client = OllamaHTTPClient(url)
+        assert client.request("/api/generate", {"model": "m", "prompt": "hi"})["response"] == "echo hi"
+
+    def test_concurrent_requests_bounded_idle_pool(self, url):
+        client = OllamaHTTPClient(url, pool_size=2)
+        threads = [threading.Thread(target=client.request, args=("/api/tags",)) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert client.stats()["requests"] == 8
+        assert client.stats()["idle_connections"] <= 2
+
+    def test_stale_connection_is_redialed(self, server):
+        srv, url = server
+        client = OllamaHTTPClient(url)
+        client.request("/api/tags")
+        # Simulate the server dropping the idle keep-alive socket
+        conn, _ = client._idle[0]
+        conn.sock.close()
+        conn.sock = None
+        client._idle[0] = (conn, time.monotonic())
+        assert client.request("/api/tags")["models"]
+        assert client.stats()["connections_opened"] == 2
+
+    def test_shared_client_per_base_url(self, url):
+        assert get_ollama_http(url) is get_ollama_http(url + "/")
+        assert OllamaClient(base_url=url)._http is get_ollama_http(url)
+
+
+class TestErrors:
+    def test_http_error_keeps_urllib_contract(self, url):
+        with pytest.raises(urllib.error.HTTPError) as exc:
+            OllamaHTTPClient(url).request("/api/missing")
+        assert exc.value.code == 404
+
+    def test_connection_refused_raises_urlerror(self):
+        client = OllamaHTTPClient("http://127.0.0.1:1", retries=1, backoff=0.01)
+        with pytest.raises(urllib.error.URLError):
+            client.request("/api/tags")
+        assert client.stats()["retries"] == 1
+
+    def test_is_running_offline_is_fast(self):
+        client = OllamaHTTPClient("http://127.0.0.1:1", backoff=1.0)
+        start = time.perf_counter()
+        assert client.is_running() is False
+        assert time.perf_counter() - start < 1.0
+
+    def test_busy_is_retried_with_backoff(self, url):
+        MockOllamaHandler.busy_responses = 2
+        client = OllamaHTTPClient(url, retries=2, backoff=0.01)
+        assert client.request("/api/generate", {"model": "m", "prompt": "x"})["done"] is True
+        assert client.stats()["retries"] == 2
+
+    def test_busy_gives_up_after_retries(self, url):
+        MockOllamaHandler.busy_responses = 5
+        client = OllamaHTTPClient(url, retries=1, backoff=0.01)
+        with pytest.raises(urllib.error.HTTPError) as exc:
+            client.request("/api/tags")
+        assert exc.value.code == 503
+
+    def test_post_reset_after_send_not_retried(self):
+        """A POST whose connection dies after the body went out may be running; never resend it."""
+        listener = socket.socket()
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(8)
+        received = []
+
+        def serve():
+            while True:
+                try:
+                    sock, _ = listener.accept()
+                except OSError:
+                    return
+                data = b""
+                while b"\r\n\r\n" not in data:
+                    data += sock.recv(4096)
+                head, _, rest = data.partition(b"\r\n\r\n")
+                length = int(head.lower().split(b"content-length:")[1].split(b"\r\n")[0])
+                while len(rest) < length:
+                    rest += sock.recv(4096)
+                received.append(rest)
+                # RST instead of FIN, like a crashed or restarted server
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+                sock.close()
+
+        threading.Thread(target=serve, daemon=True).start()
+        client = OllamaHTTPClient(f"http://127.0.0.1:{listener.getsockname()[1]}",
+                                  retries=3, backoff=0.01)
+        try:
+            with pytest.raises(urllib.error.URLError):
+                client.request("/api/generate", {"model": "m", "prompt": "x"})
+        finally:
+            listener.close()
+        assert len(received) == 1
+        assert client.stats()["retries"] == 0
+
+    def test_post_timeout_not_retried(self, url):
+        client = OllamaHTTPClient(url, retries=3, backoff=0.01)
+        with pytest.raises(TimeoutError):
+            client.request("/api/generate", {"model": "slow", "prompt": "x"}, timeout=0.1)
+        assert client.stats()["retries"] == 0
+        assert MockOllamaHandler.requests == 1
+
+
+class TestStreaming:
+    def test_yields_chunks_in_order(self, url):
+        client = OllamaHTTPClient(url)
+        chunks = list(client.stream("/api/generate", {"model": "m", "prompt": "a b c", "stream": True}))
+        assert "".join(c["response"] for c in chunks) == "a b c "
+        assert chunks[-1]["done"] is True
+
+    def test_first_chunk_arrives_before_completion(self, url):
+        client = OllamaHTTPClient(url)
+        start = time.perf_counter()
+        stream = client.stream("/api/generate", {"model": "slow", "prompt": "a b c d", "stream": True})
+        next(stream)
+        first = time.perf_counter() - start
+        list(stream)
+        total = time.perf_counter() - start
+        assert first < 0.2 < total - first
+
+    def test_connection_reused_after_full_stream(self, url):
+        client = OllamaHTTPClient(url)
+        for _ in range(3):
+            list(client.stream("/api/generate", {"model": "m", "prompt": "x y", "stream": True}))
+        client.request("/api/tags")
+        assert client.stats()["connections_opened"] == 1
+
+    def test_early_close_discards_connection(self, url):
+        client = OllamaHTTPClient(url)
+        stream = client.stream("/api/generate", {"model": "slow", "prompt": "a b c", "stream": True})
+        next(stream)
+        stream.close()
+        assert client.stats()["idle_connections"] == 0
+        assert client.request("/api/tags")["models"]
+
+
+class TestAsyncClient:
+    def test_stream_thread_fallback(self, url):
+        async def run():
+            client = AsyncOllamaHTTPClient(url, use_aiohttp=False)
+            return [c async for c in client.stream(
+                "/api/generate", {"model": "m", "prompt": "p q", "stream": True})]
+
+        chunks = asyncio.run(run())
+        assert [c["response"] for c in chunks] == ["p ", "q ", ""]
+
+    def test_iterate_in_thread_propagates_errors(self):
+        def failing():
+            yield 1
+            raise ValueError("boom")
+
+        async def run():
+            seen = []
+            with pytest.raises(ValueError):
+                async for item in iterate_in_thread(failing):
+                    seen.append(item)
+            return seen
+
+        assert asyncio.run(run()) == [1]
+
+    def test_thread_fallback(self, url):
+        async def run():
+            client = AsyncOllamaHTTPClient(url, use_aiohttp=False)
+            results = await asyncio.gather(*(client.request("/api/tags") for _ in range(5)))
+            await client.close()
+            return results
+
+        results = asyncio.run(run())
+        assert all(r["models"] for r in results)
+
+
+class TestConnectionOverhead:
+    def test_pooled_opens_one_connection_vs_one_per_call(self, url):
+        result = benchmark_connection_overhead(url, n=30)
+        assert result["pooled_connections_opened"] == 1
+        # urllib opened a connection per call; the pool reused its single socket
+        assert len(MockOllamaHandler.connections) == 31
+        assert result["pooled_per_call_ms"] > 0
+        assert result["urllib_per_call_ms"] > 0
+
+    def test_ml_orchestrator_client_reuses_connection(self, url):
+        client = OllamaClient(base_url=url)
+        before = client._http.stats()["connections_opened"]
+        for _ in range(10):
+            client.list_models()
+        assert client._http.stats()["connections_opened"] - before <= 1
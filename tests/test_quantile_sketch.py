@@ -0,0 +1,113 @@
+# Modified: 2026-10-16T17:00:00Z | Author: COPILOT | Change: Add test coverage for quantile_sketch module
+"""
+Tests for slate/quantile_sketch.py — relative-error quantiles, bounded
+size, exact merging and JSON round-trips.
+"""
+
+import json
+import random
+
+import pytest
+
+from slate.quantile_sketch import QuantileSketch
+
+
+def exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+@pytest.fixture
+def samples():
+    rng = random.Random(42)
+    return [rng.lognormvariate(6, 1.2) for _ in range(50000)]
+
+
+class TestAccuracy:
+    @pytest.mark.parametrize("q", [0.5, 0.9, 0.95, 0.99, 0.999])
+    def test_relative_error_within_alpha(self, samples, q):
+        sketch = QuantileSketch(alpha=0.01)
+        for v in samples:
+            sketch.add(v)
+        assert sketch.quantile(q) == pytest.approx(exact_quantile(samples, q), rel=0.011)
+
+    def test_empty(self):
+        sketch = QuantileSketch()
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.mean == 0.0
+
+    def test_zeros_and_extremes(self):
+        sketch = QuantileSketch()
+        for v in [0, 0, 0, 5, 1e6]:
+            sketch.add(v)
+        assert sketch.quantile(0.0) == 0.0
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == pytest.approx(1e6, rel=0.01)
+        assert sketch.min == 0.0 and sketch.max == 1e6
+
+    def test_mean_is_exact(self):
+        sketch = QuantileSketch()
+        for v in (10, 20, 30):
+            sketch.add(v)
+        assert sketch.mean == 20.0
+
+    def test_invalid_alpha(self):
+        with pytest.raises(ValueError):
+            QuantileSketch(alpha=0)
+
+
+class TestBoundedSize:
+    def test_size_independent_of_count(self, samples):
+        sketch = QuantileSketch()
+        for v in samples * 4:
+            sketch.add(v)
+        assert sketch.count == 200000
+        assert len(sketch.bins) < 1000
+
+    def test_collapse_keeps_upper_quantiles(self):
+        sketch = QuantileSketch(max_bins=50)
+        values = [1.05 ** i for i in range(500)]
+        for v in values:
+            sketch.add(v)
+        assert len(sketch.bins) <= 50
+        assert sketch.count == 500
+        assert sketch.quantile(0.99) == pytest.approx(exact_quantile(values, 0.99), rel=0.011)
+
+
+class TestMergeAndSerialize:
+    def test_merge_equals_single_stream(self, samples):
+        whole, a, b = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for i, v in enumerate(samples):
+            whole.add(v)
+            (a if i % 2 else b).add(v)
+        a.merge(b)
+        assert a.count == whole.count
+        assert a.bins == whole.bins
+        for q in (0.5, 0.95, 0.99):
+            assert a.quantile(q) == whole.quantile(q)
+
+    def test_merge_rejects_different_alpha(self):
+        a, b = QuantileSketch(alpha=0.01), QuantileSketch(alpha=0.05)
+        b.add(1.0)
+        with pytest.raises(ValueError):
+            a.merge(b)
+
+    def test_json_round_trip(self, samples):
+        sketch = QuantileSketch()
+        for v in samples[:1000]:
+            sketch.add(v)
+        restored = QuantileSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+        assert restored.count == sketch.count
+        assert restored.quantile(0.95) == sketch.quantile(0.95)
+        assert restored.min == sketch.min and restored.max == sketch.max
+
+    def test_from_empty_dict(self):
+        assert QuantileSketch.from_dict(None).count == 0
+        assert QuantileSketch.from_dict(QuantileSketch().to_dict()).quantile(0.5) == 0.0
+
+    def test_copy_is_independent(self):
+        sketch = QuantileSketch()
+        sketch.add(3.0)
+        clone = sketch.copy()
+        clone.add(4.0)
+        assert sketch.count == 1 and clone.count == 2
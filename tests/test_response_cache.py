@@ -0,0 +1,214 @@
+# Modified: 2026-10-16T10:00:00Z | Author: COPILOT | Change: Add test coverage for response_cache module
+"""
+Tests for slate/response_cache.py — TTL expiry, stale-while-revalidate,
+single-flight coalescing, cacheable predicate and stats counters.
+"""
+
+import asyncio
+
+import pytest
+
+from slate.response_cache import AsyncTTLCache, CacheEntry
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingFetcher:
+    """Fetcher that counts invocations and optionally blocks on an event."""
+
+    def __init__(self, delay: float = 0.0):
+        self.calls = 0
+        self.delay = delay
+
+    async def __call__(self):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return {"value": self.calls}
+
+
+class TestCacheEntry:
+    """Tests for CacheEntry freshness windows."""
+
+    def test_fresh_then_stale_then_expired(self):
+        entry = CacheEntry(value=1, stored_at=0.0, ttl=10, stale_ttl=20)
+        assert entry.is_fresh(5)
+        assert not entry.is_fresh(15) and entry.is_usable(15)
+        assert not entry.is_usable(31)
+
+
+class TestGetOrFetch:
+    """Tests for AsyncTTLCache.get_or_fetch."""
+
+    def test_fresh_hit_skips_fetch(self):
+        cache = AsyncTTLCache(clock=FakeClock())
+        fetch = CountingFetcher()
+
+        async def scenario():
+            a = await cache.get_or_fetch("k", fetch, ttl=10)
+            b = await cache.get_or_fetch("k", fetch, ttl=10)
+            return a, b
+
+        a, b = asyncio.run(scenario())
+        assert a == b == {"value": 1}
+        assert fetch.calls == 1
+        stats = cache.stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+
+    def test_concurrent_misses_single_flight(self):
+        cache = AsyncTTLCache()
+        fetch = CountingFetcher(delay=0.05)
+
+        async def scenario():
+            return await asyncio.gather(*(cache.get_or_fetch("k", fetch) for _ in range(25)))
+
+        results = asyncio.run(scenario())
+        assert fetch.calls == 1
+        assert all(r == {"value": 1} for r in results)
+        stats = cache.stats()["keys"]["k"]
+        assert stats["misses"] == 1
+        assert stats["coalesced"] == 24
+
+    def test_stale_served_while_refreshing(self):
+        clock = FakeClock()
+        cache = AsyncTTLCache(clock=clock)
+        fetch = CountingFetcher()
+
+        async def scenario():
+            await cache.get_or_fetch("k", fetch, ttl=10, stale_ttl=30)
+            clock.now += 15
+            stale = await cache.get_or_fetch("k", fetch, ttl=10, stale_ttl=30)
+            await asyncio.sleep(0)  # let background refresh run
+            await asyncio.sleep(0)
+            fresh = await cache.get_or_fetch("k", fetch, ttl=10, stale_ttl=30)
+            return stale, fresh
+
+        stale, fresh = asyncio.run(scenario())
+        assert stale == {"value": 1}
+        assert fresh == {"value": 2}
+        stats = cache.stats()
+        assert stats["stale_hits"] == 1
+        assert stats["refreshes"] == 1
+        assert fetch.calls == 2
+
+    def test_expired_refetches(self):
+        clock = FakeClock()
+        cache = AsyncTTLCache(clock=clock)
+        fetch = CountingFetcher()
+
+        async def scenario():
+            await cache.get_or_fetch("k", fetch, ttl=10, stale_ttl=0)
+            clock.now += 11
+            return await cache.get_or_fetch("k", fetch, ttl=10, stale_ttl=0)
+
+        assert asyncio.run(scenario()) == {"value": 2}
+        assert cache.stats()["misses"] == 2
+
+    def test_uncacheable_not_stored(self):
+        cache = AsyncTTLCache()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            return {"error": "gh failed"}
+
+        async def scenario():
+            for _ in range(3):
+                await cache.get_or_fetch("k", fetch, cacheable=lambda r: "error" not in r)
+
+        asyncio.run(scenario())
+        assert len(calls) == 3
+        assert cache.stats()["entries"] == 0
+
+    def test_fetch_error_propagates_to_all_waiters(self):
+        cache = AsyncTTLCache()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        async def scenario():
+            return await asyncio.gather(
+                *(cache.get_or_fetch("k", fetch) for _ in range(5)), return_exceptions=True
+            )
+
+        results = asyncio.run(scenario())
+        assert len(calls) == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert cache.stats()["errors"] == 1
+
+    def test_cancelled_waiter_does_not_cancel_fetch(self):
+        cache = AsyncTTLCache()
+        fetch = CountingFetcher(delay=0.05)
+
+        async def scenario():
+            first = asyncio.create_task(cache.get_or_fetch("k", fetch))
+            second = asyncio.create_task(cache.get_or_fetch("k", fetch))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        assert asyncio.run(scenario()) == {"value": 1}
+        assert fetch.calls == 1
+
+
+class TestMaintenance:
+    """Tests for invalidate, eviction and stats."""
+
+    def test_invalidate_key(self):
+        cache = AsyncTTLCache()
+        fetch = CountingFetcher()
+
+        async def scenario():
+            await cache.get_or_fetch("k", fetch)
+            cache.invalidate("k")
+            await cache.get_or_fetch("k", fetch)
+
+        asyncio.run(scenario())
+        assert fetch.calls == 2
+
+    def test_invalidate_all(self):
+        cache = AsyncTTLCache()
+
+        async def scenario():
+            await cache.get_or_fetch("a", CountingFetcher())
+            await cache.get_or_fetch("b", CountingFetcher())
+
+        asyncio.run(scenario())
+        cache.invalidate()
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction(self):
+        cache = AsyncTTLCache(max_entries=2)
+
+        async def scenario():
+            for key in ("a", "b", "c"):
+                await cache.get_or_fetch(key, CountingFetcher())
+
+        asyncio.run(scenario())
+        keys = cache.stats()["keys"]
+        assert not keys["a"]["cached"]
+        assert keys["c"]["cached"]
+
+    def test_hit_rate(self):
+        cache = AsyncTTLCache()
+        fetch = CountingFetcher()
+
+        async def scenario():
+            for _ in range(4):
+                await cache.get_or_fetch("k", fetch)
+
+        asyncio.run(scenario())
+        assert cache.stats()["hit_rate"] == 0.75
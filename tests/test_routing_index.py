@@ -0,0 +1,135 @@
+# Modified: 2026-10-17T03:00:00Z | Author: COPILOT | Change: Add test coverage for routing_index module
+"""
+Tests for slate_core/plugins/routing_index.py — the Aho-Corasick matcher,
+capability scoring that matches the old per-pattern scan, and the
+AgentRegistry index snapshot lifecycle.
+"""
+
+import random
+
+import pytest
+
+from slate.slate_routing_benchmark import VOCABULARY, build_registry, scan_route, synthetic_tasks
+from slate_core.plugins.agent_registry import AgentCapability, AgentInfo, AgentRegistry, AgentState
+from slate_core.plugins.routing_index import PatternMatcher
+from tests.test_agent_registry import MockAgent
+
+
+class TestPatternMatcher:
+    def test_overlapping_patterns(self):
+        matcher = PatternMatcher(["he", "she", "his", "hers"])
+        found = {matcher.patterns[i] for i in matcher.find("ushers")}
+        assert found == {"he", "she", "hers"}
+
+    def test_substrings_inside_words(self):
+        matcher = PatternMatcher(["test", "testing", "sting"])
+        found = {matcher.patterns[i] for i in matcher.find("run testing now")}
+        assert found == {"test", "testing", "sting"}
+
+    def test_no_match_and_unknown_characters(self):
+        matcher = PatternMatcher(["gpu"])
+        assert matcher.find("déploiement ✓ cpu") == set()
+        assert matcher.find("ggpu") == {0}
+
+    def test_matches_builtin_substring_check(self):
+        rng = random.Random(5)
+        patterns = ["".join(rng.choices("abc", k=rng.randint(1, 4))) for _ in range(30)]
+        matcher = PatternMatcher(patterns)
+        for _ in range(200):
+            text = "".join(rng.choices("abcd", k=rng.randint(0, 20)))
+            found = {matcher.patterns[i] for i in matcher.find(text)}
+            assert found == {p for p in patterns if p in text}
+
+
+def _registry_with(*caps_by_agent, state=AgentState.ACTIVE):
+    class Agent(MockAgent):
+        def __init__(self, caps):
+            super().__init__()
+            self._caps = caps
+
+        def capabilities(self):
+            return self._caps
+
+    registry = AgentRegistry()
+    for i, caps in enumerate(caps_by_agent):
+        registry._agents[f"A{i}"] = AgentInfo(f"A{i}", f"A{i}", "1", "", __file__, "Agent",
+                                             state=state, instance=Agent(caps))
+    return registry
+
+
+class TestScoring:
+    def test_higher_confidence_wins(self):
+        registry = _registry_with(
+            [AgentCapability("broad", patterns=["code", "x", "y", "z"], priority=0)],
+            [AgentCapability("narrow", patterns=["code", "review"], priority=90)],
+        )
+        assert registry.route_task({"title": "Code review"}) == "A1"
+
+    def test_equal_confidence_lower_priority_then_first(self):
+        registry = _registry_with(
+            [AgentCapability("a", patterns=["deploy"], priority=50)],
+            [AgentCapability("b", patterns=["deploy"], priority=10)],
+            [AgentCapability("c", patterns=["deploy"], priority=10)],
+        )
+        assert registry.route_task({"title": "deploy"}) == "A1"
+
+    def test_uppercase_and_empty_patterns_keep_old_semantics(self):
+        registry = _registry_with(
+            [AgentCapability("upper", patterns=["GPU"], priority=0)],
+            [AgentCapability("empty", patterns=["", "never"], priority=99)],
+        )
+        assert registry.route_task({"title": "GPU work"}) == "A1"
+
+    def test_unroutable_best_falls_through(self):
+        registry = _registry_with(
+            [AgentCapability("a", patterns=["lint"], priority=0)],
+            [AgentCapability("b", patterns=["lint", "x"], priority=0)],
+        )
+        registry._agents["A0"].state = AgentState.ERROR
+        assert registry.route_task({"title": "lint"}) == "A1"
+        registry._agents["A1"].state = AgentState.UNLOADED
+        assert registry.route_task({"title": "lint"}) is None
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_previous_scan(self, seed):
+        registry = build_registry(40, seed=seed)
+        rng = random.Random(seed)
+        for info in registry._agents.values():
+            info.state = rng.choice([AgentState.ACTIVE] * 4 + [AgentState.DEGRADED, AgentState.ERROR])
+        for task in synthetic_tasks(500, seed=seed):
+            assert registry.route_task(task) == scan_route(registry, task)
+
+
+class TestIndexLifecycle:
+    def test_direct_instance_assignment_rebuilds(self):
+        registry = AgentRegistry()
+        info = AgentInfo("MOCK", "Mock", "1", "", __file__, "MockAgent")
+        registry._agents["MOCK"] = info
+        assert registry.route_task({"title": "mock"}) is None
+        info.state = AgentState.ACTIVE
+        info.instance = MockAgent()
+        assert registry.route_task({"title": "mock"}) == "MOCK"
+        info.instance = None
+        assert registry.route_task({"title": "mock"}) is None
+
+    def test_unrelated_instance_changes_keep_index(self):
+        registry = build_registry(3)
+        registry.route_task({"title": "warm"})
+        index = registry._routing_index
+        other = build_registry(2)
+        info = AgentInfo("NEW", "New", "1", "", __file__, "MockAgent")
+        other._agents["NEW"] = info
+        other._set_instance(info, MockAgent())
+        registry.route_task({"title": "warm"})
+        assert registry._routing_index is index
+
+    def test_routing_does_not_take_the_lock(self):
+        registry = build_registry(5)
+        registry.route_task({"title": "warm"})
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(registry, "_lock", None)  # any `with self._lock` would raise
+            assert registry.route_task({"title": " ".join(VOCABULARY)}) is not None
+
+    def test_index_stats(self):
+        index = build_registry(3).rebuild_routing_index()
+        assert index.stats()["agents"] == 3 and index.stats()["capabilities"] == 9
@@ -12,9 +12,12 @@ from unittest.mock import patch, MagicMock
 from slate.runner_cost_tracker import (
     RUNNER_COSTS,
     DEFAULT_DATA,
+    RunCostStore,
     load_cost_data,
     save_cost_data,
     calculate_job_cost,
+    ingest_runs,
+    update_cost_data,
 )
 
 
@@ -138,3 +141,137 @@ class TestCalculateJobCost:
         result = calculate_job_cost(job)
         assert result["is_self_hosted"] is True
         assert result["actual_cost"] == 0
+
+
+# ── Incremental ingestion ───────────────────────────────────────────────
+
+
+def make_run(run_id: int, created: str = "2026-02-07T10:00:00Z", status: str = "completed") -> dict:
+    return {"databaseId": run_id, "workflowName": f"wf-{run_id}", "status": status,
+            "conclusion": "success", "createdAt": created}
+
+
+def make_jobs(run_id: int) -> list:
+    labels = ["self-hosted", "slate"] if run_id % 2 else ["ubuntu-latest"]
+    return [{"name": f"job-{run_id}", "labels": labels,
+             "started_at": "2026-02-07T10:00:00Z", "completed_at": "2026-02-07T10:10:00Z"}]
+
+
+class FakeGitHub:
+    """Stands in for `gh run list` / `gh api .../jobs` and counts calls."""
+
+    def __init__(self, runs):
+        self.runs = runs  # newest first, like gh
+        self.list_calls = []
+        self.job_calls = []
+        self.failing = set()
+
+    def list_runs(self, limit):
+        self.list_calls.append(limit)
+        return self.runs[:limit]
+
+    def fetch_jobs(self, run_id):
+        self.job_calls.append(run_id)
+        return None if run_id in self.failing else make_jobs(run_id)
+
+
+@pytest.fixture
+def cost_env(tmp_path):
+    store = RunCostStore(tmp_path / "costs.sqlite")
+    with patch("slate.runner_cost_tracker.COST_DATA_FILE", tmp_path / "costs.json"):
+        yield store
+    store.close()
+
+
+class TestIncrementalIngest:
+    """Tests for the SQLite-backed incremental update path."""
+
+    def test_first_update_backfills(self, cost_env):
+        gh = FakeGitHub([make_run(i) for i in range(50, 0, -1)])
+        data = update_cost_data(store=cost_env, list_runs=gh.list_runs, fetch_jobs=gh.fetch_jobs)
+        assert gh.list_calls == [200]
+        assert len(gh.job_calls) == 50
+        assert len(data["runs"]) == 50
+        assert data["total_self_hosted_minutes"] == pytest.approx(250.0)
+        assert data["total_hosted_minutes"] == pytest.approx(250.0)
+
+    def test_idle_update_fetches_no_jobs(self, cost_env):
+        gh = FakeGitHub([make_run(i) for i in range(50, 0, -1)])
+        update_cost_data(store=cost_env, list_runs=gh.list_runs, fetch_jobs=gh.fetch_jobs)
+        gh.job_calls.clear()
+        gh.runs = [make_run(52), make_run(51, status="in_progress")] + gh.runs
+        data = update_cost_data(store=cost_env, list_runs=gh.list_runs, fetch_jobs=gh.fetch_jobs)
+        assert gh.list_calls[-1] == 30
+        assert gh.job_calls == [52]
+        assert data["last_ingest"]["ingested"] == 1
+        assert cost_env.run_count() == 51
+
+    def test_large_gap_widens_to_backfill(self, cost_env):
+        gh = FakeGitHub([make_run(i) for i in range(10, 0, -1)])
+        update_cost_data(store=cost_env, list_runs=gh.list_runs, fetch_jobs=gh.fetch_jobs)
+        gh.runs = [make_run(i) for i in range(100, 10, -1)] + gh.runs
+        update_cost_data(store=cost_env, list_runs=gh.list_runs, fetch_jobs=gh.fetch_jobs)
+        assert gh.list_calls == [200, 30, 200]
+        assert cost_env.run_count() == 100
+
+    def test_failed_job_fetch_is_retried(self, cost_env):
+        gh = FakeGitHub([make_run(2), make_run(1)])
+        gh.failing = {2}
+        stats = ingest_runs(cost_env, gh.runs, fetch_jobs=gh.fetch_jobs)
+        assert stats["failed"] == 1 and stats["ingested"] == 1
+        gh.failing = set()
+        stats = ingest_runs(cost_env, gh.runs, fetch_jobs=gh.fetch_jobs)
+        assert stats["ingested"] == 1
+        assert gh.job_calls == [2, 1, 2]
+
+    def test_job_fetches_run_concurrently(self, cost_env):
+        import threading
+        import time
+
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def slow_jobs(run_id):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return make_jobs(run_id)
+
+        ingest_runs(cost_env, [make_run(i) for i in range(12)], fetch_jobs=slow_jobs, workers=4)
+        assert peak[0] == 4
+
+    def test_monthly_rollups_by_run_month(self, cost_env):
+        runs = [make_run(1, "2026-01-15T00:00:00Z"), make_run(2, "2026-02-01T00:00:00Z"),
+                make_run(3, "2026-02-03T00:00:00Z")]
+        ingest_runs(cost_env, runs, fetch_jobs=make_jobs)
+        ingest_runs(cost_env, runs, fetch_jobs=make_jobs)  # no double counting
+        monthly = cost_env.monthly_summaries()
+        assert monthly["2026-01"]["runs"] == 1
+        assert monthly["2026-02"]["runs"] == 2
+        assert monthly["2026-02"]["spent_usd"] == pytest.approx(0.08)
+        assert cost_env.totals()["total_saved_usd"] == pytest.approx(0.16)
+
+    def test_recent_runs_keep_json_shape(self, cost_env):
+        ingest_runs(cost_env, [make_run(1, "2026-01-01T00:00:00Z"), make_run(2, "2026-01-02T00:00:00Z")],
+                    fetch_jobs=make_jobs)
+        runs = cost_env.recent_runs(1)
+        assert [r["id"] for r in runs] == [2]
+        assert runs[0]["jobs"][0]["runner_type"] == "ubuntu-latest"
+        assert runs[0]["jobs"][0]["is_self_hosted"] is False
+
+    def test_legacy_json_runs_are_migrated(self, cost_env):
+        legacy = DEFAULT_DATA.copy()
+        legacy["runs"] = [{"id": 7, "workflow": "old", "created": "2025-12-01T00:00:00Z",
+                           "conclusion": "success", "total_minutes": 5, "total_cost": 0,
+                           "total_saved": 0.04,
+                           "jobs": [{"job_name": "j", "runner_type": "self-hosted", "is_self_hosted": True,
+                                     "duration_minutes": 5, "cost_rate": 0, "actual_cost": 0,
+                                     "saved": 0.04}]}]
+        save_cost_data(legacy)
+        gh = FakeGitHub([make_run(8), make_run(7)])
+        data = update_cost_data(store=cost_env, list_runs=gh.list_runs, fetch_jobs=gh.fetch_jobs)
+        assert gh.job_calls == [8]
+        assert data["monthly_summaries"]["2025-12"]["self_hosted_minutes"] == 5
@@ -149,7 +149,7 @@ class TestSVGGeneration:
     """Test SVG generation functions."""
 
     def test_generate_from_system_state(self):
-        from slate.schematic_api import generate_from_system_state
+        from slate.schematic_sdk import generate_from_system_state
         svg = generate_from_system_state()
         assert isinstance(svg, str)
         assert len(svg) > 0
@@ -198,6 +198,49 @@ class TestWebSocketManager:
         # Should not raise with no connections
         await mgr.broadcast({"type": "test"})
 
+    @pytest.mark.asyncio
+    async def test_manager_tracks_render_per_connection(self):
+        from slate.schematic_api import SchematicWebSocketManager, schematic_message
+        from slate.schematic_sdk import SchematicRenderCache, build_system_state_engine
+        mgr = SchematicWebSocketManager()
+        ws = AsyncMock()
+        rendered = SchematicRenderCache().render(build_system_state_engine())
+        await mgr.send(ws, schematic_message("system", rendered), rendered)
+        assert mgr.rendered[ws] is rendered
+        await mgr.send(ws, {"type": "mode", "mode": "incremental"})
+        assert mgr.rendered[ws] is rendered
+        patch_msg = schematic_message("system", rendered, mgr.rendered[ws], "incremental")
+        assert patch_msg["type"] == "schematic_patch"
+
+    @pytest.mark.asyncio
+    async def test_full_svg_broadcast_forgets_render(self):
+        from slate.schematic_api import SchematicWebSocketManager, schematic_message
+        from slate.schematic_sdk import SchematicRenderCache, build_system_state_engine
+        mgr = SchematicWebSocketManager()
+        ws = AsyncMock()
+        await mgr.connect(ws)
+        rendered = SchematicRenderCache().render(build_system_state_engine())
+        await mgr.send(ws, schematic_message("system", rendered), rendered)
+        await mgr.broadcast({"type": "schematic_update", "svg": "<svg/>"})
+        assert ws not in mgr.rendered
+        # The next request must resend the full SVG, not a patch
+        message = schematic_message("system", rendered, mgr.rendered.get(ws), "incremental")
+        assert message["type"] == "schematic_update"
+
+    @pytest.mark.asyncio
+    async def test_template_and_disconnect_forget_render(self):
+        from slate.schematic_api import SchematicWebSocketManager, schematic_message
+        from slate.schematic_sdk import SchematicRenderCache, build_system_state_engine
+        mgr = SchematicWebSocketManager()
+        ws = AsyncMock()
+        rendered = SchematicRenderCache().render(build_system_state_engine())
+        await mgr.send(ws, schematic_message("system", rendered), rendered)
+        await mgr.send(ws, {"type": "template_update", "template_id": "system", "svg": "<svg/>"})
+        assert ws not in mgr.rendered
+        await mgr.send(ws, schematic_message("system", rendered), rendered)
+        mgr.disconnect(ws)
+        assert ws not in mgr.rendered
+
 
 # ── Dashboard Template Phase 2 Tests ─────────────────────────────────────────
 
@@ -0,0 +1,103 @@
+# Modified: 2026-10-17T08:00:00Z | Author: COPILOT | Change: Add test coverage for schematic render cache
+"""
+Tests for slate/schematic_sdk/render_cache.py — cache keys, layout and
+render reuse, LRU eviction and status diffs.
+"""
+
+import sys
+from pathlib import Path
+
+WORKSPACE_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(WORKSPACE_ROOT))
+
+from slate.schematic_sdk import (  # noqa: E402
+    ComponentStatus,
+    DatabaseNode,
+    FlowConnector,
+    SchematicConfig,
+    SchematicEngine,
+    ServiceNode,
+    build_system_state_engine,
+)
+from slate.schematic_sdk.render_cache import SchematicRenderCache, schematic_keys  # noqa: E402
+
+
+def _engine(api_status=ComponentStatus.ACTIVE, theme="blueprint", extra_node=False):
+    engine = SchematicEngine(SchematicConfig(title="Cache Test", theme=theme))
+    engine.add_node(ServiceNode(id="api", label="API", status=api_status, layer=0))
+    engine.add_node(DatabaseNode(id="db", label="DB", layer=1))
+    if extra_node:
+        engine.add_node(ServiceNode(id="cache", label="Cache", layer=1))
+    engine.add_connector(FlowConnector(id="c1", from_node="api", to_node="db"))
+    return engine
+
+
+class TestSchematicKeys:
+    def test_status_only_changes_render_key(self):
+        layout, structure, render = schematic_keys(_engine())
+        layout2, structure2, render2 = schematic_keys(_engine(ComponentStatus.ERROR))
+        assert (layout, structure) == (layout2, structure2)
+        assert render != render2
+
+    def test_theme_keeps_layout_key(self):
+        layout, structure, _ = schematic_keys(_engine())
+        layout2, structure2, _ = schematic_keys(_engine(theme="dark"))
+        assert layout == layout2 and structure != structure2
+
+    def test_layout_parameters_are_keyed(self):
+        a = _engine().set_layout("force", iterations=5)
+        b = _engine().set_layout("force", iterations=10)
+        assert schematic_keys(a)[0] != schematic_keys(b)[0]
+        assert schematic_keys(_engine(extra_node=True))[0] != schematic_keys(_engine())[0]
+
+
+class TestSchematicRenderCache:
+    def test_render_matches_uncached(self):
+        cache = SchematicRenderCache()
+        rendered = cache.render(_engine())
+        assert rendered.svg == _engine().render_svg()
+        assert cache.render(_engine()) is rendered
+        assert cache.stats["render_hits"] == 1 and cache.stats["layouts"] == 1
+
+    def test_status_change_reuses_layout(self):
+        cache = SchematicRenderCache()
+        cache.render(_engine())
+        rendered = cache.render(_engine(ComponentStatus.ERROR))
+        assert cache.stats == {"render_hits": 0, "layout_hits": 1, "layouts": 1, "renders": 2}
+        assert rendered.svg == _engine(ComponentStatus.ERROR).render_svg()
+        assert 'data-status="error"' in rendered.svg
+
+    def test_lru_eviction(self):
+        cache = SchematicRenderCache(max_entries=1)
+        cache.render(_engine())
+        cache.render(_engine(extra_node=True))
+        cache.render(_engine())
+        assert cache.stats["layouts"] == 3 and cache.stats["render_hits"] == 0
+        cache.clear()
+        cache.render(_engine())
+        assert cache.stats["layouts"] == 4
+
+    def test_system_state_engine(self):
+        cache = SchematicRenderCache()
+        first = cache.render(build_system_state_engine())
+        assert cache.render(build_system_state_engine()) is first
+        assert set(first.nodes) >= {"dashboard", "router", "gpu"}
+
+
+class TestRenderedSchematicDiff:
+    def test_diff_reports_changed_status_attributes(self):
+        cache = SchematicRenderCache()
+        before = cache.render(_engine())
+        after = cache.render(_engine(ComponentStatus.ERROR))
+        patch = after.diff(before)
+        assert list(patch) == ["api"]
+        assert patch["api"]["status"] == "error"
+        assert set(patch["api"]) == {"status", "status_color", "border"}
+        assert after.diff(after) == {}
+
+    def test_structure_change_needs_full_update(self):
+        cache = SchematicRenderCache()
+        before = cache.render(_engine())
+        assert cache.render(_engine(theme="dark")).diff(before) is None
+        assert cache.render(_engine(extra_node=True)).diff(before) is None
+        assert before.diff(None) is None
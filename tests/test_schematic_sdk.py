@@ -54,6 +54,8 @@ from slate.schematic_sdk.theme import (
     ThemeManager,
 )
 from slate.schematic_sdk.layout import (
+    BARNES_HUT_MIN_NODES,
+    NUMPY_AVAILABLE,
     ForceDirectedLayout,
     GridLayout,
     HierarchicalLayout,
@@ -409,6 +411,76 @@ class TestForceDirectedLayout:
         assert positions[1] != positions[2]
 
 
+def _random_graph(n, seed=7, fixed=False):
+    import random
+    rng = random.Random(seed)
+    comps = [ServiceNode(id=f"n{i}", label=f"N{i}") for i in range(n)]
+    if fixed:
+        comps[1].position = (300.0, 200.0)
+    conns = [FlowConnector(id=f"e{i}", from_node=f"n{rng.randrange(n)}", to_node=f"n{rng.randrange(n)}")
+             for i in range(int(n * 1.5))]
+    conns.append(FlowConnector(id="ghost", from_node="n0", to_node="missing"))
+    return comps, conns
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+class TestForceDirectedLayoutVectorized:
+    """Test the NumPy exact and Barnes-Hut force-directed simulations."""
+
+    @pytest.mark.parametrize("n,fixed", [(1, False), (2, False), (6, False), (6, True), (40, True)])
+    def test_exact_matches_python(self, n, fixed):
+        comps, conns = _random_graph(n, fixed=fixed)
+        config = SchematicConfig()
+        python = ForceDirectedLayout(method="python").calculate_positions(comps, conns, config)
+        exact = ForceDirectedLayout(method="exact").calculate_positions(comps, conns, config)
+        assert exact.positions == python.positions
+        assert exact.bounds == python.bounds
+
+    def test_auto_method(self):
+        layout = ForceDirectedLayout()
+        assert layout.resolve_method(10) == "exact"
+        assert layout.resolve_method(BARNES_HUT_MIN_NODES) == "barnes_hut"
+        assert ForceDirectedLayout(method="python").resolve_method(10) == "python"
+
+    def test_barnes_hut_forces_close_to_exact(self):
+        import numpy as np
+        pos = np.random.default_rng(0).uniform(100, 900, (400, 2))
+        layout = ForceDirectedLayout()
+        exact = layout._repulsion_exact(pos)
+        approx = layout._repulsion_barnes_hut(pos)
+        err = np.linalg.norm(exact - approx, axis=1) / np.linalg.norm(exact, axis=1)
+        assert np.median(err) < 0.05
+
+    def test_barnes_hut_theta_zero_is_exact_up_to_rounding(self):
+        import numpy as np
+        pos = np.random.default_rng(1).uniform(100, 900, (60, 2))
+        layout = ForceDirectedLayout(theta=0.0)
+        assert np.allclose(layout._repulsion_barnes_hut(pos), layout._repulsion_exact(pos), rtol=1e-9)
+
+    def test_barnes_hut_layout_in_bounds(self):
+        comps, conns = _random_graph(120)
+        config = SchematicConfig()
+        result = ForceDirectedLayout(method="barnes_hut").calculate_positions(comps, conns, config)
+        assert len(result.positions) == 120
+        padding = config.padding + 50
+        for x, y in result.positions.values():
+            assert padding <= x <= config.width - padding
+            assert padding <= y <= config.height - padding
+
+    def test_early_stop(self):
+        comps = [ServiceNode(id=f"n{i}", label="N") for i in range(3)]
+        conns = [FlowConnector(id="a", from_node="n0", to_node="n1"),
+                 FlowConnector(id="b", from_node="n1", to_node="n2")]
+        config = SchematicConfig()
+        for method in ("python", "exact", "barnes_hut"):
+            layout = ForceDirectedLayout(iterations=2000, tolerance=0.01, method=method)
+            layout.calculate_positions(comps, conns, config)
+            assert layout.iterations_run < 2000
+        layout = ForceDirectedLayout(iterations=50, method="exact")
+        layout.calculate_positions(comps, conns, config)
+        assert layout.iterations_run == 50
+
+
 class TestGridLayout:
     """Test GridLayout algorithm."""
 
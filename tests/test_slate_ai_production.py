@@ -4,7 +4,6 @@ Tests for slate/slate_ai_production.py — model health monitoring,
 SLA compliance, failover chains, production readiness.
 """
 
-import json
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -231,25 +230,21 @@ class TestGPUInfo:
 class TestOllamaModels:
     """Tests for Ollama model queries."""
 
-    @patch("urllib.request.urlopen")
-    def test_get_ollama_models(self, mock_urlopen):
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = json.dumps({
+    @patch("slate.ollama_http.OllamaHTTPClient.request")
+    def test_get_ollama_models(self, mock_request):
+        mock_request.return_value = {
             "models": [
                 {"name": "slate-fast:latest"},
                 {"name": "slate-coder:latest"},
             ]
-        }).encode()
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
+        }
 
         models = _get_ollama_models()
         assert "slate-fast:latest" in models
         assert "slate-coder:latest" in models
 
-    @patch("urllib.request.urlopen", side_effect=Exception("Connection refused"))
-    def test_get_ollama_models_offline(self, mock_urlopen):
+    @patch("slate.ollama_http.OllamaHTTPClient.request", side_effect=Exception("Connection refused"))
+    def test_get_ollama_models_offline(self, mock_request):
         models = _get_ollama_models()
         assert models == []
 
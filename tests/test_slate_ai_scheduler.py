@@ -0,0 +1,270 @@
+# Modified: 2026-10-16T22:00:00Z | Author: COPILOT | Change: Add test coverage for slate_ai_scheduler parallel executor
+"""
+Tests for slate/slate_ai_scheduler.py — task queue basics and the
+ParallelTaskExecutor: per-GPU slot concurrency, DAG dependency release,
+model-affinity grouping and failure handling, against a mock Ollama.
+"""
+
+import threading
+import time
+
+import pytest
+
+import slate.slate_ai_scheduler as sched_mod
+from slate.slate_ai_scheduler import AIScheduler, AITask, ParallelTaskExecutor, TaskStatus
+
+
+class FakeOllama:
+    """Mock Ollama: fixed latency per generate, records call order and concurrency."""
+
+    latency = 0.1
+    models = ["slate-coder:latest", "slate-fast:latest", "slate-planner:latest",
+              "nomic-embed-text:latest", "mistral-nemo"]
+
+    def __init__(self):
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self.fail_prompts = set()
+        self.lock = threading.Lock()
+
+    def is_running(self):
+        return True
+
+    def list_models(self):
+        return list(self.models)
+
+    def running_models(self):
+        return []
+
+    def generate(self, model, prompt, system="", temperature=0.7, max_tokens=2048, gpu=None):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.calls.append((prompt.split("\n")[0], model, gpu))
+        try:
+            time.sleep(self.latency)
+            if prompt.split("\n")[0] in self.fail_prompts:
+                raise RuntimeError("model crashed")
+            return {"response": f"done: {prompt[:20]}"}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def gpu_config(slots_per_gpu: int, gpus: int = 2) -> dict:
+    return {
+        gid: {"name": f"GPU {gid}", "vram_mb": 16384, "max_concurrent": slots_per_gpu,
+              "preferred_tasks": ["code_generation"] if gid == 0 else ["summarization"]}
+        for gid in range(gpus)
+    }
+
+
+@pytest.fixture
+def scheduler(tmp_path, monkeypatch):
+    monkeypatch.setattr(sched_mod, "STATE_FILE", tmp_path / "state.json")
+    monkeypatch.setattr(sched_mod, "QUEUE_FILE", tmp_path / "queue.json")
+    monkeypatch.setattr(sched_mod, "OllamaClient", FakeOllama)
+    monkeypatch.setattr(sched_mod, "GPU_CONFIG", gpu_config(2))
+    monkeypatch.setattr(AIScheduler, "get_gpu_health", lambda self: {})
+    return AIScheduler()
+
+
+class TestQueue:
+    def test_add_task_persists(self, scheduler):
+        task = scheduler.add_task("quick", "say hi")
+        assert task.task_id == "task_00001"
+        assert task.priority == sched_mod.TASK_PRIORITY["quick"]
+        assert not sched_mod.QUEUE_FILE.exists()  # appended to the event log, no snapshot rewrite
+        assert scheduler.store.load()[0][0]["task_id"] == task.task_id
+
+    def test_transitions_survive_restart(self, scheduler):
+        done = scheduler.add_task("quick", "first")
+        scheduler.add_task("quick", "second")
+        scheduler.run_scheduled(max_tasks=1)
+        restarted = AIScheduler()
+        assert [t.task_id for t in restarted.task_queue] == ["task_00002"]
+        assert restarted.completed_tasks[-1].task_id == done.task_id
+        assert restarted.completed_tasks[-1].status == TaskStatus.COMPLETED
+        assert restarted.add_task("quick", "third").task_id == "task_00003"
+
+    def test_run_picks_up_other_producers(self, scheduler):
+        other = AIScheduler()
+        other.add_task("quick", "from the CLI")
+        assert scheduler.run_scheduled(max_tasks=5)["executed"] == 1
+        assert scheduler.add_task("quick", "next").task_id == "task_00002"
+
+    def test_round_trip(self):
+        task = AITask(priority=3, task_id="t", task_type="quick", description="d", dependencies=["a"])
+        assert AITask.from_dict(task.to_dict()).dependencies == ["a"]
+
+
+class TestParallelExecution:
+    def test_throughput_scales_with_slots(self, scheduler, monkeypatch):
+        def run_with(slots):
+            monkeypatch.setattr(sched_mod, "GPU_CONFIG", gpu_config(slots))
+            for i in range(8):
+                scheduler.add_task("summarization", f"doc {slots}-{i}")
+            result = scheduler.run_scheduled(max_tasks=8)
+            assert result["executed"] == 8
+            return result["elapsed_s"]
+
+        serial = run_with(1)    # 2 GPUs x 1 slot
+        parallel = run_with(4)  # 2 GPUs x 4 slots
+        assert scheduler.ollama.peak == 8
+        assert parallel < serial * 0.6
+
+    def test_respects_slot_limits(self, scheduler):
+        for i in range(10):
+            scheduler.add_task("quick", f"q{i}")
+        result = scheduler.run_scheduled(max_tasks=10)
+        assert scheduler.ollama.peak == 4  # 2 GPUs x 2 slots
+        assert sum(result["per_gpu"].values()) == 10
+
+    def test_max_tasks_limits_dispatch(self, scheduler):
+        for i in range(6):
+            scheduler.add_task("quick", f"q{i}")
+        result = scheduler.run_scheduled(max_tasks=4)
+        assert result["executed"] == 4
+        assert result["remaining"] == 2
+        assert all(t.status == TaskStatus.PENDING for t in scheduler.task_queue)
+
+
+class TestDependencies:
+    def test_dependents_wait_for_inputs(self, scheduler):
+        a = scheduler.add_task("analysis", "A")
+        b = scheduler.add_task("analysis", "B", dependencies=[a.task_id])
+        c = scheduler.add_task("analysis", "C", dependencies=[a.task_id, b.task_id])
+        scheduler.add_task("quick", "independent")
+        result = scheduler.run_scheduled(max_tasks=10)
+        assert result["executed"] == 4
+        order = [call[0] for call in scheduler.ollama.calls]
+        assert order.index("A") < order.index("B") < order.index("C")
+        assert order.index("independent") < order.index("B")  # ran alongside A
+        assert c.status == TaskStatus.COMPLETED
+
+    def test_dependency_completed_in_earlier_run(self, scheduler):
+        a = scheduler.add_task("quick", "A")
+        scheduler.run_scheduled(max_tasks=1)
+        scheduler.add_task("quick", "B", dependencies=[a.task_id])
+        assert scheduler.run_scheduled(max_tasks=5)["executed"] == 1
+
+    def test_failed_dependency_blocks_without_spinning(self, scheduler):
+        scheduler.ollama.fail_prompts = {"A"}
+        a = scheduler.add_task("quick", "A")
+        b = scheduler.add_task("quick", "B", dependencies=[a.task_id])
+        missing = scheduler.add_task("quick", "C", dependencies=["task_99999"])
+        result = scheduler.run_scheduled(max_tasks=10)
+        assert result["failed"] == 1
+        assert a.status == TaskStatus.FAILED and "crashed" in a.error
+        assert result["blocked"] == [b.task_id, missing.task_id]
+        assert {t.task_id for t in scheduler.task_queue} == {b.task_id, missing.task_id}
+
+
+class TestModelAffinity:
+    def test_resident_model_preferred_within_bonus(self, scheduler, monkeypatch):
+        # One slot, VRAM for one of the two models at a time; priorities interleave
+        monkeypatch.setattr(sched_mod, "GPU_CONFIG", {0: {"name": "GPU 0", "vram_mb": 12000,
+                                                          "max_concurrent": 1, "preferred_tasks": []}})
+        scheduler.gpu_states = {}
+        for coder_p, planner_p in [(1, 2), (4, 5), (7, 8), (10, 11)]:
+            scheduler.add_task("code_generation", f"code {coder_p}").priority = coder_p
+            scheduler.add_task("planning", f"plan {planner_p}").priority = planner_p
+        result = scheduler.run_scheduled(max_tasks=8)
+        assert result["executed"] == 8
+        order = [call[0] for call in scheduler.ollama.calls]
+        assert order == ["code 1", "code 4", "plan 2", "plan 5", "plan 8",
+                         "code 7", "code 10", "plan 11"]
+        assert result["model_switches"] == 4  # strict priority order would switch 8 times
+
+    def test_paused_gpus_get_no_work(self, scheduler, monkeypatch):
+        paused = sched_mod.GPUHealthStatus(0, 95, 1000, 16384, 0.06, 100, "pause")
+        healthy = sched_mod.GPUHealthStatus(1, 60, 1000, 16384, 0.06, 10, "healthy")
+        monkeypatch.setattr(AIScheduler, "get_gpu_health", lambda self: {0: paused, 1: healthy})
+        for i in range(3):
+            scheduler.add_task("code_generation", f"c{i}")
+        scheduler.run_scheduled(max_tasks=3)
+        assert {gpu for _, _, gpu in scheduler.ollama.calls} == {1}
+
+    def test_no_model_available_fails_task(self, scheduler):
+        scheduler.ollama.models = []
+        task = scheduler.add_task("quick", "nothing to run on")
+        result = ParallelTaskExecutor(scheduler).run(max_tasks=5)
+        assert result["failed"] == 1
+        assert task.error == "No suitable model available"
+
+
+class TestModelResidency:
+    def test_hits_swaps_and_lru_eviction(self):
+        cache = sched_mod.ModelResidency(16000, ["slate-fast:latest"])
+        assert cache.load("slate-fast:latest") == (0.0, [])
+        cost, evicted = cache.load("slate-coder:latest")   # 3000 + 10000 fits
+        assert cost == sched_mod.model_load_seconds("slate-coder:latest") and evicted == []
+        _, evicted = cache.load("slate-planner:latest")    # 6000 more: oldest goes first
+        assert evicted == ["slate-fast:latest"]
+        assert cache.stats()["swaps"] == 2 and cache.stats()["hits"] == 1
+
+    def test_load_cost_scales_with_vram(self):
+        assert (sched_mod.model_load_seconds("slate-coder:latest")
+                > sched_mod.model_load_seconds("slate-fast:latest")
+                > sched_mod.model_load_seconds("nomic-embed-text:latest"))
+
+
+class TestAffinitySchedule:
+    def tasks(self, spec):
+        return [AITask(priority=p, task_id=f"t{i}", task_type=t, description="")
+                for i, (t, p) in enumerate(spec)]
+
+    def model_of(self, task):
+        return sched_mod.best_model(task.task_type, FakeOllama.models)
+
+    def test_resident_model_batch_runs_first(self):
+        tasks = self.tasks([("code_generation", 4), ("summarization", 6), ("quick", 6), ("code_review", 3)])
+        cache = sched_mod.ModelResidency(16384, ["slate-fast:latest"])
+        batches = sched_mod.plan_affinity_batches(tasks, self.model_of, cache)
+        assert [b["model"] for b in batches] == ["slate-fast:latest", "slate-coder:latest"]
+        assert batches[0]["resident"] and batches[0]["load_s"] == 0
+        assert batches[1]["task_ids"] == ["t3", "t0"]  # priority order within a batch
+
+    def test_much_higher_priority_beats_affinity(self):
+        tasks = self.tasks([("summarization", 9), ("training", 1)])
+        cache = sched_mod.ModelResidency(16384, ["slate-fast:latest"])
+        batches = sched_mod.plan_affinity_batches(tasks, self.model_of, cache)
+        assert batches[0]["model"] == "mistral-nemo"
+
+    def test_dependencies_split_batches(self):
+        tasks = self.tasks([("code_generation", 4), ("code_review", 3), ("summarization", 9)])
+        tasks[1].dependencies = ["t2"]
+        batches = sched_mod.plan_affinity_batches(tasks, self.model_of, sched_mod.ModelResidency(16384))
+        assert [b["task_ids"] for b in batches] == [["t0"], ["t2"], ["t1"]]
+
+    def test_unsatisfiable_dependencies_left_out(self):
+        tasks = self.tasks([("quick", 10), ("quick", 10)])
+        tasks[1].dependencies = ["missing"]
+        batches = sched_mod.plan_affinity_batches(tasks, self.model_of, sched_mod.ModelResidency(16384))
+        assert [b["task_ids"] for b in batches] == [["t0"]]
+
+    def test_generate_schedule_affinity_mode(self, scheduler, monkeypatch):
+        monkeypatch.setattr(scheduler.ollama, "running_models", lambda: [{"name": "slate-planner:latest"}])
+        monkeypatch.setattr(scheduler, "get_best_gpu", lambda task_type, vram: 0)
+        scheduler.add_task("code_generation", "a")
+        scheduler.add_task("planning", "b")
+        assert scheduler.generate_schedule()[0]["task_type"] == "code_generation"
+        schedule = scheduler.generate_schedule(mode="affinity")
+        assert [b["model"] for b in schedule] == ["slate-planner:latest", "slate-coder:latest"]
+        assert schedule[0]["task_type"] == "planning" and schedule[0]["gpu"] == 0
+        assert schedule[1]["estimated_vram_mb"] == sched_mod.MODEL_VRAM["slate-coder:latest"]
+
+    def test_available_models_cached(self, scheduler, monkeypatch):
+        calls = []
+        monkeypatch.setattr(scheduler.ollama, "list_models", lambda: calls.append(1) or ["phi"])
+        for _ in range(3):
+            assert scheduler.available_models() == ["phi"]
+        assert len(calls) == 1
+        scheduler.available_models(max_age=0)
+        assert len(calls) == 2
+
+    def test_executor_reports_load_time(self, scheduler):
+        scheduler.add_task("quick", "q")
+        result = scheduler.run_scheduled(max_tasks=1)
+        assert result["load_s"] == sched_mod.model_load_seconds("slate-fast:latest")
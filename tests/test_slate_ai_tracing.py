@@ -1,10 +1,12 @@
 # Modified: 2026-07-12T02:50:00Z | Author: COPILOT | Change: Create tests for AI tracing module
 """
-Tests for slate/slate_ai_tracing.py — inference tracing, metrics, export.
+Tests for slate/slate_ai_tracing.py — inference tracing, metrics, export,
+background batched export and per-call overhead.
 """
 
 import json
 import os
+import time
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -15,6 +17,7 @@ from slate.slate_ai_tracing import (
     ModelMetrics,
     JSONFileExporter,
     SlateAITracer,
+    benchmark_trace_overhead,
     get_gpu_snapshot,
     get_tracer,
     TRACE_DIR,
@@ -115,27 +118,23 @@ class TestModelMetrics:
 
     def test_metrics_aggregation(self):
         mm = ModelMetrics(model="test-model")
-        mm.total_calls = 10
-        mm.total_tokens = 500
-        mm.total_latency_ms = 5000.0
-        mm.error_count = 1
-        mm.latencies_ms = [400, 450, 500, 550, 600, 450, 500, 520, 480, 510]
-        mm.tokens_per_sec_values = [50.0, 55.0, 60.0, 45.0, 52.0]
+        latencies = [400, 450, 500, 550, 600, 450, 500, 520, 480, 550]
+        for i, latency in enumerate(latencies):
+            mm.record(latency, 50.0, 50, error=(i == 0))
         assert mm.avg_latency_ms == 500.0
         assert mm.error_rate == 0.1
-        assert mm.p50_latency_ms > 0
+        assert mm.avg_tokens_per_sec == 50.0
+        assert mm.p50_latency_ms == pytest.approx(500, rel=0.02)
         assert mm.p95_latency_ms >= mm.p50_latency_ms
 
     def test_metrics_to_dict(self):
         mm = ModelMetrics(model="test-model")
-        mm.total_calls = 5
-        mm.total_tokens = 200
-        mm.latencies_ms = [100, 200, 300]
-        mm.tokens_per_sec_values = [50.0, 60.0]
+        for latency in (100, 200, 300):
+            mm.record(latency, 55.0, 40, error=False)
         d = mm.to_dict()
         assert isinstance(d, dict)
         assert d["model"] == "test-model"
-        assert d["total_calls"] == 5
+        assert d["total_calls"] == 3
         assert "avg_latency_ms" in d
         assert "p95_latency_ms" in d
         assert "avg_tokens_per_sec" in d
@@ -276,6 +275,28 @@ class TestSlateAITracer:
         assert trace.prompt_tokens == 10
         assert trace.tokens_per_sec == 10.0  # 5 tokens / 0.5s
         assert "slate-fast:latest" in tracer.model_metrics
+        assert trace.ttft_ms is None
+
+    def test_trace_inference_records_ttft(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("slate.slate_ai_tracing.TRACE_DIR", tmp_path / "traces")
+        monkeypatch.setattr("slate.slate_ai_tracing.METRICS_FILE", tmp_path / "traces" / "metrics.json")
+
+        tracer = SlateAITracer(enable_otel=False)
+        tracer.json_exporter = JSONFileExporter(tmp_path / "traces" / "test.jsonl")
+
+        with patch("slate.slate_ai_tracing.get_gpu_snapshot", return_value={
+            "gpu_index": 0, "memory_used_mb": 0, "memory_total_mb": 0, "utilization_pct": 0,
+        }):
+            trace = tracer.trace_inference(
+                model="slate-coder:latest",
+                task_type="code_generation",
+                prompt="Stream me",
+                result={"response": "def f(): pass", "eval_count": 4, "eval_duration": 1_000_000_000},
+                elapsed=2.0,
+                ttft=0.1234,
+            )
+
+        assert trace.ttft_ms == 123.4
 
     def test_get_metrics(self):
         tracer = SlateAITracer(enable_otel=False)
@@ -298,6 +319,232 @@ class TestSlateAITracer:
         assert "test-model" in report
 
 
+# ── Buffered Export ─────────────────────────────────────────────────────
+
+RESULT = {"response": "OK", "eval_count": 5, "prompt_eval_count": 10, "eval_duration": 500_000_000}
+
+
+@pytest.fixture
+def buffered_tracer(tmp_path, monkeypatch):
+    monkeypatch.setattr("slate.slate_ai_tracing.TRACE_DIR", tmp_path / "traces")
+    monkeypatch.setattr("slate.slate_ai_tracing.METRICS_FILE", tmp_path / "traces" / "metrics.json")
+    gpu = MagicMock(return_value={"gpu_index": 0, "memory_used_mb": 4000,
+                                  "memory_total_mb": 16384, "utilization_pct": 30})
+    monkeypatch.setattr("slate.slate_ai_tracing.get_gpu_snapshot", gpu)
+    tracer = SlateAITracer(enable_otel=False)
+    tracer.json_exporter = JSONFileExporter(tmp_path / "traces" / "test.jsonl")
+    tracer.gpu_mock = gpu
+    yield tracer
+    tracer.close()
+
+
+class TestBufferedExport:
+    """Tests for the background trace export thread."""
+
+    def test_flush_writes_all_records_in_order(self, buffered_tracer):
+        for i in range(300):
+            buffered_tracer.trace_inference("m", "general", f"prompt {i}", RESULT, 0.1)
+        assert buffered_tracer.flush() is True
+        records = buffered_tracer.json_exporter.read_all()
+        assert [r["prompt_preview"] for r in records] == [f"prompt {i}" for i in range(300)]
+        stats = buffered_tracer.get_export_stats()
+        assert stats["exported"] == 300
+        assert stats["batches"] < 300
+
+    def test_metrics_snapshot_is_periodic_not_per_call(self, buffered_tracer, tmp_path):
+        metrics_file = tmp_path / "traces" / "metrics.json"
+        for _ in range(20):
+            buffered_tracer.trace_inference("m", "general", "p", RESULT, 0.1)
+        time.sleep(0.05)
+        assert not metrics_file.exists()
+        buffered_tracer.flush()
+        data = json.loads(metrics_file.read_text(encoding="utf-8"))
+        assert data["models"]["m"]["total_calls"] == 20
+        assert buffered_tracer.get_export_stats()["metrics_snapshots"] == 1
+
+    def test_close_flushes_and_stops_worker(self, buffered_tracer):
+        buffered_tracer.trace_inference("m", "general", "p", RESULT, 0.1)
+        buffered_tracer.close()
+        assert buffered_tracer.get_export_stats()["worker_alive"] is False
+        assert len(buffered_tracer.json_exporter.read_all()) == 1
+
+    def test_restart_registers_exit_handler_once(self, buffered_tracer):
+        with patch("slate.slate_ai_tracing.atexit.register") as register:
+            for _ in range(3):
+                buffered_tracer.trace_inference("m", "general", "p", RESULT, 0.1)
+                buffered_tracer.close()
+        assert register.call_count == 1
+        assert len(buffered_tracer.json_exporter.read_all()) == 3
+
+    def test_full_queue_drops_without_blocking(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("slate.slate_ai_tracing.TRACE_DIR", tmp_path / "traces")
+        monkeypatch.setattr("slate.slate_ai_tracing.METRICS_FILE", tmp_path / "traces" / "metrics.json")
+        monkeypatch.setattr("slate.slate_ai_tracing.TRACE_QUEUE_SIZE", 2)
+        tracer = SlateAITracer(enable_otel=False)
+        tracer.json_exporter = JSONFileExporter(tmp_path / "traces" / "test.jsonl")
+        tracer._ensure_worker = lambda: None  # no consumer
+        for _ in range(5):
+            tracer.trace_inference("m", "general", "p", RESULT, 0.1)
+        assert tracer.get_export_stats()["dropped"] == 3
+        assert tracer.model_metrics["m"].total_calls == 5
+        tracer.flush()
+        assert len(tracer.json_exporter.read_all()) == 2
+
+    def test_gpu_snapshot_refreshed_off_hot_path(self, buffered_tracer):
+        first = buffered_tracer.trace_inference("m", "general", "p", RESULT, 0.1, gpu_index=1)
+        assert first.gpu_memory_total_mb == 0  # not cached yet; refresh requested
+        buffered_tracer.flush()
+        second = buffered_tracer.trace_inference("m", "general", "p", RESULT, 0.1, gpu_index=1)
+        buffered_tracer.flush()
+        assert second.gpu_memory_total_mb == 16384
+        assert buffered_tracer.gpu_mock.call_count == 1
+
+    def test_export_errors_never_raise(self, buffered_tracer):
+        buffered_tracer.json_exporter = MagicMock()
+        buffered_tracer.json_exporter.export_batch.side_effect = OSError("disk full")
+        buffered_tracer.trace_inference("m", "general", "p", RESULT, 0.1)
+        buffered_tracer.flush()
+        assert buffered_tracer.get_export_stats()["export_errors"] == 1
+
+    def test_export_batch_matches_export_trace(self, tmp_path):
+        record = InferenceTrace(
+            trace_id="t", span_id="s", timestamp="now", model="m", task_type="g",
+            prompt_tokens=1, completion_tokens=2, total_tokens=3, latency_ms=1.0,
+            eval_time_ms=1.0, tokens_per_sec=2.0, gpu_index=0, gpu_memory_used_mb=0,
+            gpu_memory_total_mb=0, status="success",
+        )
+        single = JSONFileExporter(tmp_path / "single.jsonl")
+        batched = JSONFileExporter(tmp_path / "batched.jsonl")
+        single.export_trace(record)
+        batched.export_batch([record])
+        assert single.read_all() == batched.read_all()
+
+    def test_per_call_overhead_is_microseconds(self, tmp_path):
+        result = benchmark_trace_overhead(2000, trace_dir=tmp_path)
+        assert result["records_written"] == 2000
+        assert result["per_call_us"] < 1000
+
+    def test_trace_dir_keeps_module_paths(self, tmp_path):
+        import slate.slate_ai_tracing as tracing
+        before = tracing.TRACE_DIR, tracing.METRICS_FILE
+        tracer = SlateAITracer(enable_otel=False, trace_dir=tmp_path)
+        tracer.trace_inference("m", "general", "p", RESULT, 0.1)
+        tracer.close()
+        assert (tracing.TRACE_DIR, tracing.METRICS_FILE) == before
+        assert tracer.metrics_file == tmp_path / "metrics.json" and tracer.metrics_file.exists()
+        assert tracer.json_exporter.filepath.parent == tmp_path
+
+
+# ── Percentile Sketches ─────────────────────────────────────────────────
+
+
+class TestPercentileSketches:
+    """Per-model / per-task / per-day sketches persisted in metrics.json."""
+
+    def _tracer(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("slate.slate_ai_tracing.TRACE_DIR", tmp_path / "traces")
+        monkeypatch.setattr("slate.slate_ai_tracing.METRICS_FILE", tmp_path / "traces" / "metrics.json")
+        monkeypatch.setattr("slate.slate_ai_tracing.get_gpu_snapshot",
+                            lambda i=0: {"gpu_index": i, "memory_used_mb": 0,
+                                         "memory_total_mb": 0, "utilization_pct": 0})
+        tracer = SlateAITracer(enable_otel=False)
+        tracer.json_exporter = JSONFileExporter(tmp_path / "traces" / "test.jsonl")
+        return tracer
+
+    def test_percentiles_survive_restart(self, tmp_path, monkeypatch):
+        tracer = self._tracer(tmp_path, monkeypatch)
+        for i in range(1, 2001):
+            tracer.trace_inference("m", "code", "p", RESULT, i / 1000)  # 1..2000 ms
+        tracer.close()
+
+        reloaded = self._tracer(tmp_path, monkeypatch)
+        mm = reloaded.model_metrics["m"]
+        assert mm.total_calls == 2000
+        assert mm.p50_latency_ms == pytest.approx(1000, rel=0.02)
+        assert mm.p99_latency_ms == pytest.approx(1980, rel=0.02)
+        assert mm.avg_latency_ms == pytest.approx(1000.5, rel=0.001)
+        reloaded.close()
+
+    def test_processes_merge_into_one_file(self, tmp_path, monkeypatch):
+        a = self._tracer(tmp_path, monkeypatch)
+        b = self._tracer(tmp_path, monkeypatch)
+        for _ in range(30):
+            a.trace_inference("m", "code", "p", RESULT, 0.1)
+        for _ in range(20):
+            b.trace_inference("m", "chat", "p", RESULT, 0.3)
+        a.flush()
+        b.flush()
+        data = json.loads((tmp_path / "traces" / "metrics.json").read_text(encoding="utf-8"))
+        assert data["models"]["m"]["total_calls"] == 50
+        assert data["total_traces"] == 50
+        assert b.model_metrics["m"].total_calls == 50  # b picked up a's data on merge
+        a.close()
+        b.close()
+
+    def test_task_type_and_daily_windows(self, tmp_path, monkeypatch):
+        tracer = self._tracer(tmp_path, monkeypatch)
+        for _ in range(10):
+            tracer.trace_inference("fast", "summarization", "p", RESULT, 0.05)
+            tracer.trace_inference("coder", "code_generation", "p", RESULT, 2.0)
+        metrics = tracer.get_metrics()
+        assert metrics["task_types"]["summarization"]["p50_latency_ms"] == pytest.approx(50, rel=0.02)
+        assert metrics["task_types"]["code_generation"]["total_calls"] == 10
+        today = tracer.get_percentiles(days=1)
+        assert today["total_calls"] == 20
+        assert tracer.get_percentiles("coder", days=7)["p95_latency_ms"] == pytest.approx(2000, rel=0.02)
+        tracer.close()
+
+    def test_windows_are_pruned(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("slate.slate_ai_tracing.METRICS_WINDOW_DAYS", 3)
+        tracer = self._tracer(tmp_path, monkeypatch)
+        for day in ("2026-01-01", "2026-01-02", "2026-01-03", "2026-01-04"):
+            tracer._pending.record("m", "t", day, 10.0, 1.0, 1, False)
+        tracer._metrics_dirty = True
+        tracer.flush()
+        data = json.loads((tmp_path / "traces" / "metrics.json").read_text(encoding="utf-8"))
+        assert sorted(data["windows"]) == ["2026-01-02", "2026-01-03", "2026-01-04"]
+
+    def test_legacy_metrics_file_loads_totals(self, tmp_path, monkeypatch):
+        metrics_file = tmp_path / "traces" / "metrics.json"
+        metrics_file.parent.mkdir(parents=True)
+        metrics_file.write_text(json.dumps({"models": {"old": {
+            "total_calls": 7, "total_tokens": 70, "error_count": 1}}}), encoding="utf-8")
+        tracer = self._tracer(tmp_path, monkeypatch)
+        assert tracer.model_metrics["old"].total_calls == 7
+        assert tracer.model_metrics["old"].p95_latency_ms == 0.0
+
+
+class TestTraceQueries:
+    """Tracer-level access to TraceStore over the daily trace files."""
+
+    def test_query_aggregate_and_reset(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("slate.slate_ai_tracing.TRACE_DIR", tmp_path / "traces")
+        monkeypatch.setattr("slate.slate_ai_tracing.METRICS_FILE", tmp_path / "traces" / "metrics.json")
+        tracer = SlateAITracer(enable_otel=False)
+        tracer._gpu_cache[0] = (float("inf"), {"gpu_index": 0, "memory_used_mb": 0,
+                                               "memory_total_mb": 0, "utilization_pct": 0})
+        tracer.store.block_records = 4
+        for i in range(10):
+            tracer.trace_inference("m1" if i % 2 else "m2", "code", "p", RESULT, 0.1,
+                                   error="boom" if i == 3 else None)
+        assert len(list(tracer.query_traces(model="m1"))) == 5
+        assert [t["status"] for t in tracer.query_traces(errors_only=True)] == ["error"]
+        assert tracer.aggregate_traces(days=1)["m2"]["p50"] == pytest.approx(100, rel=0.02)
+        assert "Last 7 Days" in tracer.generate_report()
+        assert [t["span_id"] for t in tracer.get_recent_traces(2)] == ["inf-000009", "inf-000010"]
+
+        tracer.reset()
+        assert list((tmp_path / "traces").glob("traces_*")) == []
+
+        # The day file grows again after reset: queries must not reuse old indexes
+        for i in range(12):
+            tracer.trace_inference("m3", "code", "p", RESULT, 0.1)
+        tracer.flush()
+        assert len(list(tracer.query_traces(model="m3"))) == 12
+        assert list(tracer.query_traces(model="m1")) == []
+        tracer.close()
+
+
 # ── Singleton ───────────────────────────────────────────────────────────
 
 
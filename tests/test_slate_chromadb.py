@@ -0,0 +1,280 @@
+# Modified: 2026-10-16T11:00:00Z | Author: COPILOT | Change: Add test coverage for slate_chromadb indexing pipeline
+"""
+Tests for slate/slate_chromadb.py — batched embedding, pipelined
+index_collection, incremental skipping and throughput reporting.
+ChromaDB itself is replaced by an in-memory fake collection; Ollama by a
+local mock /api/embed HTTP server.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import slate.slate_chromadb as chroma_mod
+from slate.embedding_cache import EmbeddingCache
+from slate.ml_orchestrator import OllamaClient
+from slate.slate_chromadb import (
+    COLLECTIONS,
+    EMBED_BATCH_SIZE,
+    EMBED_DIM,
+    SlateChromaDB,
+)
+
+
+class FakeCollection:
+    """Minimal in-memory stand-in for a ChromaDB collection."""
+
+    def __init__(self):
+        self.rows = {}
+
+    def delete(self, where=None):
+        path = (where or {}).get("file_path")
+        self.rows = {k: v for k, v in self.rows.items() if v["metadata"]["file_path"] != path}
+
+    def add(self, ids, documents, embeddings, metadatas):
+        assert len(ids) == len(documents) == len(embeddings) == len(metadatas)
+        for i, doc_id in enumerate(ids):
+            self.rows[doc_id] = {"document": documents[i], "embedding": embeddings[i],
+                                 "metadata": metadatas[i]}
+
+    def count(self):
+        return len(self.rows)
+
+
+class FakeClient:
+    def __init__(self):
+        self.collections = {}
+
+    def get_or_create_collection(self, name, metadata=None):
+        return self.collections.setdefault(name, FakeCollection())
+
+
+class FakeOllama:
+    """Records embed calls; returns deterministic vectors."""
+
+    def __init__(self, fail_batch=False):
+        self.batch_calls = []
+        self.single_calls = 0
+        self.fail_batch = fail_batch
+
+    def embed_batch(self, model, texts):
+        self.batch_calls.append(len(texts))
+        if self.fail_batch:
+            raise RuntimeError("batch rejected")
+        return [[float(len(t))] * 4 for t in texts]
+
+    def embed(self, model, text):
+        self.single_calls += 1
+        if text == "BAD":
+            raise RuntimeError("bad chunk")
+        return [float(len(text))] * 4
+
+
+class MockEmbedHandler(BaseHTTPRequestHandler):
+    """Mock Ollama /api/embed with a fixed per-request latency."""
+
+    latency = 0.01
+    requests = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with MockEmbedHandler.lock:
+            MockEmbedHandler.requests += 1
+        time.sleep(self.latency)
+        inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        payload = json.dumps({"embeddings": [[0.1] * 8 for _ in inputs]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    monkeypatch.setattr(chroma_mod, "CHROMADB_DIR", tmp_path / "chromadb")
+    monkeypatch.setattr(chroma_mod, "STATE_FILE", tmp_path / "state.json")
+    code = tmp_path / "ws" / "slate"
+    code.mkdir(parents=True)
+    for i in range(12):
+        lines = [f"def func_{i}_{j}():\n    return {j}  # padding padding padding" for j in range(40)]
+        (code / f"mod_{i}.py").write_text("\n".join(lines), encoding="utf-8")
+    skipped = tmp_path / "ws" / "slate" / "__pycache__"
+    skipped.mkdir()
+    (skipped / "cached.py").write_text("x = 1", encoding="utf-8")
+    return tmp_path / "ws"
+
+
+def make_db(workspace, ollama, cache=None, **kwargs) -> SlateChromaDB:
+    db = SlateChromaDB(**kwargs)
+    db.workspace = workspace
+    db._client = FakeClient()
+    db._ollama = ollama
+    db._embedding_cache = cache or EmbeddingCache(
+        workspace.parent / f"cache_{id(db)}.sqlite"
+    )
+    return db
+
+
+@pytest.fixture
+def mock_server():
+    MockEmbedHandler.requests = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockEmbedHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestConstants:
+    def test_batch_size_positive(self):
+        assert EMBED_BATCH_SIZE >= 1
+
+    def test_embed_dim(self):
+        assert EMBED_DIM == 768
+
+
+class TestEmbedBatch:
+    """Tests for SlateChromaDB._embed_batch."""
+
+    def test_splits_into_batches(self, workspace):
+        ollama = FakeOllama()
+        db = make_db(workspace, ollama, batch_size=4)
+        out = db._embed_batch([f"t{i}" for i in range(10)])
+        assert len(out) == 10
+        assert ollama.batch_calls == [4, 4, 2]
+        assert ollama.single_calls == 0
+
+    def test_falls_back_per_text_with_zero_vector(self, workspace):
+        ollama = FakeOllama(fail_batch=True)
+        db = make_db(workspace, ollama, batch_size=8)
+        out = db._embed_batch(["ok", "BAD", "fine"])
+        assert out[0] == [2.0] * 4
+        assert out[1] == [0.0] * EMBED_DIM
+        assert ollama.single_calls == 3
+
+    def test_empty(self, workspace):
+        assert make_db(workspace, FakeOllama())._embed_batch([]) == []
+
+    def test_cached_chunks_not_reembedded(self, workspace):
+        ollama = FakeOllama()
+        db = make_db(workspace, ollama, batch_size=8)
+        db._embed_batch(["alpha", "beta"])
+        db._embed_batch(["alpha", "beta", "gamma"])
+        assert ollama.batch_calls == [2, 1]
+
+    def test_failed_vectors_not_cached(self, workspace):
+        ollama = FakeOllama(fail_batch=True)
+        db = make_db(workspace, ollama)
+        db._embed_batch(["BAD"])
+        db._embed_batch(["BAD"])
+        assert ollama.single_calls == 2
+
+
+class TestChunkText:
+    """Tests for content-anchored chunk boundaries."""
+
+    def _source(self, n_funcs: int = 60) -> str:
+        return "\n".join(
+            f"def func_{i}(x):\n    y = x * {i}\n    return y + {i}  # compute value\n"
+            for i in range(n_funcs)
+        )
+
+    def test_editing_one_function_changes_few_chunks(self, workspace):
+        db = make_db(workspace, FakeOllama())
+        original = db._chunk_text(self._source(), max_chars=500)
+        edited_src = self._source().replace(
+            "    y = x * 7\n", "    y = x * 7\n    y = y - 1  # extra adjustment line\n"
+        )
+        edited = db._chunk_text(edited_src, max_chars=500)
+        changed = set(edited) - set(original)
+        assert len(original) > 5
+        assert 1 <= len(changed) <= 2
+
+    def test_edit_reembeds_only_changed_chunks(self, workspace):
+        ollama = FakeOllama()
+        db = make_db(workspace, ollama, batch_size=1000)
+        target = workspace / "slate" / "big.py"
+        target.write_text(self._source(300), encoding="utf-8")
+        db.index_collection("slate_code", incremental=True)
+        ollama.batch_calls.clear()
+
+        text = target.read_text(encoding="utf-8")
+        target.write_text(text.replace("    y = x * 150\n", "    y = x * 150 + 1\n"), encoding="utf-8")
+        result = db.index_collection("slate_code", incremental=True)
+        assert result["files_indexed"] == 1
+        assert sum(ollama.batch_calls) <= 2
+
+
+class TestIndexCollection:
+    """Tests for the pipelined index_collection."""
+
+    def test_indexes_all_files_in_order(self, workspace):
+        db = make_db(workspace, FakeOllama(), workers=3)
+        result = db.index_collection("slate_code", incremental=False)
+        assert result["files_indexed"] == 12
+        collection = db.client.get_or_create_collection("slate_code")
+        assert result["chunks_added"] == collection.count()
+        assert not any("__pycache__" in k for k in collection.rows)
+        assert result["chunks_per_sec"] > 0
+
+    def test_incremental_skips_unchanged(self, workspace):
+        db = make_db(workspace, FakeOllama())
+        db.index_collection("slate_code", incremental=True)
+        (workspace / "slate" / "mod_0.py").write_text("def changed():\n    pass\n", encoding="utf-8")
+        result = db.index_collection("slate_code", incremental=True)
+        assert result["files_indexed"] == 1
+        assert result["files_skipped"] == 11
+
+    def test_reindex_replaces_file_chunks(self, workspace):
+        db = make_db(workspace, FakeOllama())
+        db.index_collection("slate_code", incremental=False)
+        (workspace / "slate" / "mod_1.py").write_text("x = 1\n", encoding="utf-8")
+        db.index_collection("slate_code", incremental=False)
+        rows = db.client.get_or_create_collection("slate_code").rows
+        mod1 = [k for k in rows if k.startswith("slate/mod_1.py::") or k.startswith("slate\\mod_1.py::")]
+        assert len(mod1) == 1
+
+    def test_unknown_collection(self, workspace):
+        assert "error" in make_db(workspace, FakeOllama()).index_collection("nope")
+
+    def test_index_all_reports_throughput(self, workspace):
+        db = make_db(workspace, FakeOllama())
+        result = db.index_all(incremental=False)
+        assert set(result["collections"]) == set(COLLECTIONS)
+        assert "chunks_per_sec" in result and "elapsed_s" in result
+
+
+class TestMockServerThroughput:
+    """Batched + concurrent indexing against a mock embed server."""
+
+    def test_embed_batch_http(self, mock_server):
+        client = OllamaClient(base_url=mock_server)
+        out = client.embed_batch("m", ["a", "b", "c"])
+        assert len(out) == 3
+        assert MockEmbedHandler.requests == 1
+
+    def test_batched_reindex_faster_than_per_chunk(self, workspace, mock_server):
+        serial = make_db(workspace, OllamaClient(base_url=mock_server), batch_size=1, workers=1)
+        t0 = time.perf_counter()
+        serial_result = serial.index_collection("slate_code", incremental=False)
+        serial_time = time.perf_counter() - t0
+        serial_requests = MockEmbedHandler.requests
+
+        MockEmbedHandler.requests = 0
+        batched = make_db(workspace, OllamaClient(base_url=mock_server))
+        t0 = time.perf_counter()
+        batched_result = batched.index_collection("slate_code", incremental=False)
+        batched_time = time.perf_counter() - t0
+
+        assert batched_result["chunks_added"] == serial_result["chunks_added"]
+        assert MockEmbedHandler.requests <= serial_requests / 3
+        assert serial_time / batched_time >= 3
@@ -0,0 +1,28 @@
+# Modified: 2026-10-17T07:00:00Z | Author: COPILOT | Change: Add test coverage for slate_layout_benchmark module
+"""
+Tests for slate/slate_layout_benchmark.py — synthetic graphs and one
+benchmark row per graph size.
+"""
+
+import pytest
+
+from slate.schematic_sdk.layout import NUMPY_AVAILABLE
+from slate.slate_layout_benchmark import run_benchmark, synthetic_graph
+
+
+class TestLayoutBenchmark:
+    def test_synthetic_graph(self):
+        comps, conns = synthetic_graph(20)
+        assert len(comps) == 20 and len(conns) == 30
+        assert [c.from_node for c in conns] == [c.from_node for c in synthetic_graph(20)[1]]
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+    def test_run_benchmark(self):
+        row = run_benchmark(30, iterations=20)
+        assert row["exact_matches_python"] is True
+        assert row["python"]["iterations"] == 20
+        assert row["barnes_hut"]["force_error"] < 0.1
+
+    def test_python_max_skips_python(self):
+        row = run_benchmark(12, iterations=5, python_max=10)
+        assert row["python"] is None
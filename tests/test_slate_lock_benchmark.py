@@ -0,0 +1,28 @@
+# Modified: 2026-10-17T01:00:00Z | Author: COPILOT | Change: Add test coverage for slate_lock_benchmark module
+"""
+Tests for slate/slate_lock_benchmark.py — multi-process contention runs
+and the result summary.
+"""
+
+from slate.slate_lock_benchmark import _percentile, run_benchmark
+
+
+class TestPercentile:
+    def test_bounds(self):
+        values = [1.0, 2.0, 3.0, 4.0]
+        assert _percentile(values, 0) == 1.0
+        assert _percentile(values, 100) == 4.0
+        assert _percentile([], 50) == 0.0
+
+
+class TestRunBenchmark:
+    def test_exclusive_has_no_lost_updates(self, tmp_path):
+        row = run_benchmark(4, iterations=50, workdir=tmp_path)
+        assert row["acquisitions"] == 200
+        assert row["writes"] == 200 and row["lost_updates"] == 0
+        assert row["throughput_per_s"] > 0
+        assert row["latency_ms"]["p50"] <= row["latency_ms"]["max"]
+
+    def test_mixed_with_timeout_wait(self, tmp_path):
+        row = run_benchmark(2, iterations=40, mode="mixed", wait="timeout", write_every=4, workdir=tmp_path)
+        assert row["writes"] == 20 and row["lost_updates"] == 0
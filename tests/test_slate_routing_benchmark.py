@@ -0,0 +1,23 @@
+# Modified: 2026-10-17T03:00:00Z | Author: COPILOT | Change: Add test coverage for slate_routing_benchmark module
+"""
+Tests for slate/slate_routing_benchmark.py — synthetic registry and
+workload, and agreement between the index and the old scan.
+"""
+
+from slate.slate_routing_benchmark import build_registry, run_benchmark, synthetic_tasks
+
+
+class TestRoutingBenchmark:
+    def test_build_registry(self):
+        registry = build_registry(7)
+        assert len(registry._agents) == 7
+        assert registry.rebuild_routing_index().stats()["capabilities"] == 21
+
+    def test_synthetic_tasks_are_deterministic(self):
+        assert synthetic_tasks(20, seed=4) == synthetic_tasks(20, seed=4)
+
+    def test_run_benchmark(self):
+        result = run_benchmark(tasks=300, agents=10)
+        assert result["mismatches"] == 0
+        assert result["routed"] > 0
+        assert result["index_tasks_per_s"] > 0 and result["scan_tasks_per_s"] > 0
@@ -0,0 +1,166 @@
+# Modified: 2026-10-17T09:00:00Z | Author: COPILOT | Change: Cover unknown pytorch and first CPU sample
+"""
+Tests for slate/slate_status.py — concurrent probe fan-out, per-probe
+deadlines with partial results, TTL caching and single-flight probes.
+"""
+
+import math
+import threading
+import time
+
+import pytest
+
+from slate import slate_status
+from slate.slate_status import Probe, StatusCollector
+
+
+class CountingProbe:
+    def __init__(self, delay: float = 0.0, value: dict = None):
+        self.delay = delay
+        self.value = value or {"available": True}
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return dict(self.value)
+
+
+def probe(name, fn, ttl=60.0, deadline=1.0):
+    return Probe(name, fn, ttl, deadline, {"available": False})
+
+
+class TestConcurrency:
+    def test_latency_is_slowest_probe_not_sum(self):
+        probes = [probe(f"p{i}", CountingProbe(0.2)) for i in range(4)]
+        collector = StatusCollector(probes)
+        start = time.perf_counter()
+        status = collector.collect()
+        elapsed = time.perf_counter() - start
+        assert elapsed < 0.5  # serial would be 0.8s
+        assert all(status[f"p{i}"] == {"available": True} for i in range(4))
+        assert all(status["probes"][f"p{i}"]["latency_ms"] >= 190 for i in range(4))
+
+    def test_deadline_returns_partial_results(self):
+        fast, slow = CountingProbe(0.0), CountingProbe(1.0)
+        collector = StatusCollector([probe("fast", fast), probe("slow", slow, deadline=0.1)])
+        start = time.perf_counter()
+        status = collector.collect()
+        assert time.perf_counter() - start < 0.5
+        assert status["fast"] == {"available": True}
+        assert status["slow"] == {"available": False}
+        assert status["probes"]["slow"]["timed_out"] is True
+        assert "timed_out" not in status["probes"]["fast"]
+
+    def test_probe_error_becomes_fallback(self):
+        def broken():
+            raise RuntimeError("nvidia-smi exploded")
+
+        status = StatusCollector([probe("gpu", broken)]).collect()
+        assert status["gpu"]["available"] is False
+        assert "exploded" in status["gpu"]["error"]
+
+
+class TestCaching:
+    def test_ttl_per_probe(self):
+        static, volatile = CountingProbe(), CountingProbe()
+        collector = StatusCollector([probe("static", static, ttl=math.inf),
+                                     probe("volatile", volatile, ttl=0.05)])
+        collector.collect()
+        status = collector.collect()
+        assert status["probes"]["static"]["cached"] is True
+        time.sleep(0.06)
+        collector.collect()
+        assert static.calls == 1
+        assert volatile.calls == 2
+
+    def test_force_and_invalidate(self):
+        p = CountingProbe()
+        collector = StatusCollector([probe("p", p)])
+        collector.collect()
+        collector.collect(force=True)
+        collector.invalidate("p")
+        collector.collect()
+        assert p.calls == 3
+
+    def test_timed_out_probe_is_single_flight_and_fills_cache(self):
+        slow = CountingProbe(0.3, {"available": True, "models": 3})
+        collector = StatusCollector([probe("ollama", slow, deadline=0.05)])
+        for _ in range(3):
+            assert collector.collect()["probes"]["ollama"]["timed_out"] is True
+        assert slow.calls == 1
+        time.sleep(0.4)
+        status = collector.collect()
+        assert status["ollama"] == {"available": True, "models": 3}
+        assert status["probes"]["ollama"]["cached"] is True
+
+    def test_stale_value_served_when_refresh_times_out(self):
+        values = iter([0.0, 1.0])
+
+        def flaky():
+            time.sleep(next(values))
+            return {"available": True}
+
+        collector = StatusCollector([probe("gpu", flaky, ttl=0.0, deadline=0.1)])
+        collector.collect()
+        status = collector.collect()
+        assert status["gpu"] == {"available": True}
+        assert status["probes"]["gpu"]["timed_out"] is True
+        assert status["probes"]["gpu"]["cached"] is True
+
+
+class TestGetStatus:
+    @pytest.fixture(autouse=True)
+    def fresh_collector(self, monkeypatch):
+        monkeypatch.setattr(slate_status, "_collector", None)
+        monkeypatch.setattr(slate_status, "get_gpu_info", lambda: {"available": False, "count": 0, "gpus": []})
+        monkeypatch.setattr(slate_status, "get_ollama_info", lambda: {"available": False, "model_count": 0})
+        monkeypatch.setattr(slate_status, "get_pytorch_info", lambda: {"installed": False})
+
+    def test_shape_matches_legacy_keys(self):
+        status = slate_status.get_status()
+        assert {"timestamp", "python", "gpu", "system", "pytorch", "ollama"} <= set(status)
+        assert set(status["probes"]) == {"python", "gpu", "system", "pytorch", "ollama"}
+        assert status["python"]["ok"] is True
+
+    def test_collector_is_shared(self):
+        assert slate_status.get_status_collector() is slate_status.get_status_collector()
+
+    def test_quick_print(self, capsys):
+        slate_status.print_quick_status(slate_status.get_status())
+        assert "S.L.A.T.E. Status" in capsys.readouterr().out
+
+    def test_pytorch_timeout_is_unknown(self, monkeypatch, capsys):
+        probes = slate_status._default_probes()
+        pytorch = next(p for p in probes if p.name == "pytorch")
+        pytorch.fn, pytorch.deadline = CountingProbe(0.5, {"installed": True}), 0.05
+        monkeypatch.setattr(slate_status, "_collector", StatusCollector(probes))
+        status = slate_status.get_status()
+        assert status["pytorch"] == {"installed": None}
+        assert status["probes"]["pytorch"]["timed_out"] is True
+        slate_status.print_quick_status(status)
+        out = capsys.readouterr().out
+        assert "Unknown (probe timed out)" in out and "Not installed" not in out
+
+
+@pytest.mark.skipif(not slate_status.HAS_PSUTIL, reason="psutil not installed")
+class TestCpuSample:
+    @pytest.fixture
+    def intervals(self, monkeypatch):
+        seen = []
+        monkeypatch.setattr(slate_status, "_cpu_sampled_at", None)
+        monkeypatch.setattr(slate_status.psutil, "cpu_percent",
+                            lambda interval=None: seen.append(interval) or 42.0)
+        return seen
+
+    def test_first_read_blocks_briefly(self, intervals):
+        assert slate_status.get_system_info(cpu_interval=None)["cpu_percent"] == 42.0
+        assert intervals == [slate_status.CPU_SAMPLE_INTERVAL]
+
+    def test_later_read_uses_previous_sample(self, intervals, monkeypatch):
+        slate_status.get_system_info(cpu_interval=None)
+        monkeypatch.setattr(slate_status, "_cpu_sampled_at", time.monotonic() - 1.0)
+        slate_status.get_system_info(cpu_interval=None)
+        assert intervals == [slate_status.CPU_SAMPLE_INTERVAL, None]
@@ -0,0 +1,248 @@
+# Modified: 2026-10-16T18:00:00Z | Author: COPILOT | Change: Add test coverage for slate_trace_query module
+"""
+Tests for slate/slate_trace_query.py — streaming filtered queries, sidecar
+block index (incremental extension, block skipping), aggregations, tail
+reads and gzip compaction of old days.
+"""
+
+import gzip
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from slate.slate_trace_query import TraceStore, read_tail
+
+MODELS = ["slate-fast", "slate-coder", "slate-planner"]
+TASKS = ["summarization", "code_generation", "planning"]
+
+
+def make_record(i: int, day: str, model: str = None, status: str = "success") -> dict:
+    ts = datetime.fromisoformat(day).replace(tzinfo=timezone.utc) + timedelta(seconds=i)
+    model = model or MODELS[i % 3]
+    return {
+        "trace_id": f"{day}-{i}",
+        "timestamp": ts.isoformat(),
+        "model": model,
+        "task_type": TASKS[MODELS.index(model)],
+        "latency_ms": float(100 * (MODELS.index(model) + 1) + i % 10),
+        "status": status,
+    }
+
+
+def write_day(trace_dir, day: str, records: list[dict], mode: str = "w"):
+    path = trace_dir / f"traces_{day}.jsonl"
+    with open(path, mode, encoding="utf-8") as f:
+        for r in records:
+            f.write(json.dumps(r) + "\n")
+    return path
+
+
+def days_ago(n: int) -> str:
+    return (datetime.now(timezone.utc).date() - timedelta(days=n)).isoformat()
+
+
+@pytest.fixture
+def trace_dir(tmp_path):
+    d = tmp_path / "traces"
+    d.mkdir()
+    for n in range(3):
+        day = days_ago(n)
+        records = [make_record(i, day) for i in range(300)]
+        records[7]["status"] = "error"
+        write_day(d, day, records)
+    return d
+
+
+@pytest.fixture
+def store(trace_dir):
+    return TraceStore(trace_dir, block_records=50)
+
+
+class TestQuery:
+    def test_streams_all_days_in_order(self, store):
+        records = list(store.query())
+        assert len(records) == 900
+        stamps = [r["timestamp"] for r in records]
+        assert stamps == sorted(stamps)
+
+    def test_query_is_lazy(self, store):
+        stream = store.query()
+        first = next(stream)
+        assert first["trace_id"].startswith(days_ago(2))
+        assert store.stats["blocks_read"] == 1
+
+    def test_model_and_task_filters(self, store):
+        assert {r["model"] for r in store.query(model="slate-coder")} == {"slate-coder"}
+        assert store.count(task_type="planning") == 300
+
+    def test_errors_only_skips_clean_blocks(self, store):
+        errors = list(store.query(errors_only=True))
+        assert len(errors) == 3
+        # one error per day -> one block read per day, the other 5 blocks skipped
+        assert store.stats["blocks_read"] == 3
+        assert store.stats["blocks_skipped"] == 15
+
+    def test_time_range(self, store):
+        day = days_ago(1)
+        since = f"{day}T00:01:00+00:00"
+        until = f"{day}T00:02:00Z"
+        records = list(store.query(since=since, until=until))
+        assert len(records) == 60
+        assert all(since <= r["timestamp"] < until.replace("Z", "+00:00") for r in records)
+
+    def test_days_shorthand(self, store):
+        assert {r["trace_id"][:10] for r in store.query(days=1)} <= {days_ago(0), days_ago(1)}
+
+    def test_limit(self, store):
+        assert len(list(store.query(model="slate-fast", limit=5))) == 5
+
+    def test_skips_malformed_and_partial_lines(self, trace_dir):
+        path = trace_dir / f"traces_{days_ago(0)}.jsonl"
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("not json\n")
+            f.write('{"model": "slate-fast", "timest')  # writer mid-append
+        store = TraceStore(trace_dir)
+        assert store.count() == 900
+        assert store.index(path)["size"] < path.stat().st_size
+
+
+class TestIndex:
+    def test_sidecar_written_and_reused(self, store, trace_dir):
+        store.count()
+        path = trace_dir / f"traces_{days_ago(0)}.jsonl"
+        assert TraceStore.index_path(path).exists()
+        fresh = TraceStore(trace_dir, block_records=50)
+        fresh.count()
+        assert fresh.stats["index_builds"] == 0
+
+    def test_incremental_extension(self, store, trace_dir):
+        day = days_ago(0)
+        path = trace_dir / f"traces_{day}.jsonl"
+        store.index(path)
+        write_day(trace_dir, day, [make_record(i, day) for i in range(300, 330)], mode="a")
+        index = store.index(path)
+        assert index["size"] == path.stat().st_size
+        assert sum(b["count"] for b in index["blocks"]) == 330
+        assert all(b["count"] == 50 for b in index["blocks"][:-1])
+        assert store.count(model="slate-fast") == 300 + 10
+
+    def test_truncated_file_is_reindexed(self, store, trace_dir):
+        day = days_ago(0)
+        path = trace_dir / f"traces_{day}.jsonl"
+        store.index(path)
+        write_day(trace_dir, day, [make_record(0, day)])
+        assert sum(b["count"] for b in store.index(path)["blocks"]) == 1
+
+    def test_block_metadata(self, store, trace_dir):
+        block = store.index(trace_dir / f"traces_{days_ago(0)}.jsonl")["blocks"][0]
+        assert block["count"] == 50
+        assert set(block["models"]) == set(MODELS)
+        assert block["errors"] == 1
+        assert block["ts_min"] < block["ts_max"]
+
+
+class TestAggregate:
+    def test_percentiles_per_model(self, store):
+        rows = store.aggregate(group_by="model", days=7)
+        assert set(rows) == set(MODELS)
+        assert rows["slate-coder"]["count"] == 300
+        assert rows["slate-coder"]["p50"] == pytest.approx(205, rel=0.02)
+        assert rows["slate-planner"]["p95"] == pytest.approx(309, rel=0.02)
+
+    def test_group_by_day_and_errors(self, store):
+        rows = store.aggregate(group_by="day")
+        assert list(rows) == [days_ago(2), days_ago(1), days_ago(0)]
+        assert all(r["errors"] == 1 for r in rows.values())
+
+    def test_single_group(self, store):
+        assert store.aggregate(group_by=None, model="slate-fast")["all"]["count"] == 300
+
+    def test_empty(self, tmp_path):
+        assert TraceStore(tmp_path / "missing").aggregate() == {}
+
+
+class TestTail:
+    def test_tail_spans_days(self, store):
+        tail = store.tail(310)
+        assert len(tail) == 310
+        assert tail[-1]["trace_id"] == f"{days_ago(0)}-299"
+        assert tail[0]["trace_id"] == f"{days_ago(1)}-290"
+
+    def test_read_tail_small_chunks(self, trace_dir, monkeypatch):
+        monkeypatch.setattr("slate.slate_trace_query.TAIL_CHUNK_BYTES", 64)
+        path = trace_dir / f"traces_{days_ago(0)}.jsonl"
+        assert [r["trace_id"] for r in read_tail(path, 3)] == [
+            f"{days_ago(0)}-{i}" for i in (297, 298, 299)]
+        assert len(read_tail(path, 1000)) == 300
+
+
+class TestCompaction:
+    def test_compacts_old_days_only(self, store, trace_dir):
+        before = store.aggregate(group_by="model")
+        summary = store.compact(idle_seconds=0)
+        assert summary["days"] == [days_ago(2), days_ago(1)]
+        assert summary["bytes_after"] < summary["bytes_before"]
+        assert not (trace_dir / f"traces_{days_ago(1)}.jsonl").exists()
+        assert (trace_dir / f"traces_{days_ago(0)}.jsonl").exists()
+
+        reopened = TraceStore(trace_dir)
+        assert reopened.aggregate(group_by="model") == before
+        assert len(list(reopened.query(errors_only=True))) == 3
+
+    def test_compacted_file_is_plain_gzip(self, store, trace_dir):
+        store.compact(idle_seconds=0)
+        with gzip.open(trace_dir / f"traces_{days_ago(1)}.jsonl.gz", "rt", encoding="utf-8") as f:
+            assert sum(1 for _ in f) == 300
+
+    def test_compacted_blocks_are_seekable(self, store, trace_dir):
+        store.compact(idle_seconds=0)
+        fresh = TraceStore(trace_dir)
+        assert len(list(fresh.query(errors_only=True, until=f"{days_ago(0)}T00:00:00Z"))) == 2
+        assert fresh.stats["blocks_read"] == 2
+
+    def test_recently_modified_file_not_compacted(self, store):
+        assert store.compact()["days"] == []
+
+    def test_late_writes_appended_to_existing_gzip(self, store, trace_dir):
+        day = days_ago(1)
+        store.compact(idle_seconds=0)
+        write_day(trace_dir, day, [make_record(i, day) for i in range(300, 310)])
+        assert store.count(model="slate-fast") == 300 + 4  # gz + live file for the same day
+        store.compact(idle_seconds=0)
+        assert TraceStore(trace_dir).count() == 910
+
+    def test_foreign_gzip_without_index(self, tmp_path):
+        day = days_ago(5)
+        path = tmp_path / f"traces_{day}.jsonl.gz"
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            for i in range(20):
+                f.write(json.dumps(make_record(i, day)) + "\n")
+        store = TraceStore(tmp_path)
+        assert store.count(model="slate-coder") == 7
+        assert os.path.exists(TraceStore.index_path(path))
+
+    def test_compaction_appends_to_unindexed_gzip(self, tmp_path):
+        day = days_ago(5)
+        with gzip.open(tmp_path / f"traces_{day}.jsonl.gz", "wt", encoding="utf-8") as f:
+            for i in range(20):
+                f.write(json.dumps(make_record(i, day)) + "\n")
+        write_day(tmp_path, day, [make_record(i, day) for i in range(20, 30)])
+        TraceStore(tmp_path).compact(idle_seconds=0)
+        assert not (tmp_path / f"traces_{day}.jsonl").exists()
+        assert TraceStore(tmp_path).count() == 30
+        with gzip.open(tmp_path / f"traces_{day}.jsonl.gz", "rt", encoding="utf-8") as f:
+            assert sum(1 for _ in f) == 30
+
+    def test_reset_forgets_cached_indexes(self, tmp_path):
+        day = days_ago(0)
+        path = write_day(tmp_path, day, [make_record(i, day, model="slate-fast") for i in range(100)])
+        store = TraceStore(tmp_path, block_records=50)
+        assert store.count() == 100
+        path.unlink()
+        TraceStore.index_path(path).unlink()
+        store.reset()
+        write_day(tmp_path, day, [make_record(i, day, model="slate-coder") for i in range(120)])
+        assert store.count(model="slate-coder") == 120
+        assert store.count(model="slate-fast") == 0
@@ -0,0 +1,151 @@
+# Modified: 2026-10-16T13:00:00Z | Author: COPILOT | Change: Add test coverage for slate_vector_index module
+"""
+Tests for slate/slate_vector_index.py — append/delete by file, top-k cosine
+search, metadata filters, persistence (memory-mapped reload) and the
+SlateChromaDB-compatible search API.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from slate.slate_vector_index import (  # noqa: E402
+    SlateVectorIndex,
+    collection_for,
+)
+
+VOCAB = ["gpu", "queue", "lock", "docs", "schema", "token", "runner", "cache"]
+
+
+def bow(text: str) -> list[float]:
+    """Tiny bag-of-words embedding over VOCAB."""
+    words = text.lower().split()
+    return [float(words.count(w)) + 0.01 for w in VOCAB]
+
+
+def add_file(index, path, chunks, collection=None):
+    index.add(
+        ids=[f"{path}::{i}" for i in range(len(chunks))],
+        embeddings=[bow(c) for c in chunks],
+        documents=chunks,
+        metadatas=[
+            {"file_path": path, "chunk_index": i, "total_chunks": len(chunks),
+             "collection": collection or collection_for(path)}
+            for i in range(len(chunks))
+        ],
+    )
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = SlateVectorIndex(tmp_path / "vi", embed_fn=bow)
+    add_file(idx, "slate/gpu.py", ["gpu gpu runner", "gpu cache"])
+    add_file(idx, "slate/queue.py", ["queue lock lock", "queue token"])
+    add_file(idx, "docs/guide.md", ["docs docs schema"])
+    return idx
+
+
+class TestCollectionFor:
+    def test_mapping(self):
+        assert collection_for("slate/x.py") == "slate_code"
+        assert collection_for("docs/x.md") == "slate_docs"
+        assert collection_for(".github/workflows/ci.yml") == "slate_workflows"
+        assert collection_for("plugins/x.json") == "slate_config"
+
+
+class TestQuery:
+    def test_top_result(self, index):
+        results = index.search("lock queue")
+        assert results[0]["metadata"]["file_path"] == "slate/queue.py"
+        assert results[0]["document"] == "queue lock lock"
+
+    def test_sorted_by_score(self, index):
+        scores = [r["score"] for r in index.search("gpu", n_results=5)]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_result_shape_matches_chromadb(self, index):
+        r = index.search("gpu", n_results=1)[0]
+        assert set(r) == {"id", "collection", "document", "metadata", "distance", "score"}
+        assert r["distance"] == pytest.approx(1.0 - r["score"])
+
+    def test_n_results_limit(self, index):
+        assert len(index.search("gpu", n_results=2)) == 2
+        assert len(index.search("gpu", n_results=50)) == 5
+
+    def test_collection_filter(self, index):
+        results = index.search_docs("gpu")
+        assert [r["metadata"]["file_path"] for r in results] == ["docs/guide.md"]
+        assert all(r["collection"] == "slate_code" for r in index.search_code("docs"))
+
+    def test_where_filter(self, index):
+        results = index.search("gpu", where={"chunk_index": 1})
+        assert {r["id"] for r in results} == {"slate/gpu.py::1", "slate/queue.py::1"}
+
+    def test_find_similar_code(self, index):
+        assert index.find_similar_code("token queue")[0]["id"] == "slate/queue.py::1"
+
+    def test_empty_index(self, tmp_path):
+        assert SlateVectorIndex(tmp_path / "empty", embed_fn=bow).search("gpu") == []
+
+
+class TestMutation:
+    def test_delete_file(self, index):
+        assert index.delete_file("slate/queue.py") == 2
+        assert index.count() == 3
+        assert all(r["metadata"]["file_path"] != "slate/queue.py" for r in index.search("queue", n_results=10))
+
+    def test_reindex_file(self, index):
+        index.delete_file("slate/gpu.py")
+        add_file(index, "slate/gpu.py", ["cache cache cache"])
+        assert index.count() == 4
+        assert index.search("cache")[0]["id"] == "slate/gpu.py::0"
+
+    def test_duplicate_id_replaces_row(self, index):
+        add_file(index, "slate/gpu.py", ["schema"])
+        assert index.count() == 5
+        assert index.search("schema", n_results=10)[0]["id"] in {"slate/gpu.py::0", "docs/guide.md::0"}
+
+    def test_dimension_mismatch(self, index):
+        with pytest.raises(ValueError):
+            index.add(ids=["x"], embeddings=[[1.0, 2.0]], documents=["x"], metadatas=[{}])
+
+
+class TestPersistence:
+    def test_save_and_reload_memory_mapped(self, index, tmp_path):
+        index.file_hashes["slate/gpu.py"] = "abc"
+        index.delete_file("docs/guide.md")
+        index.save()
+
+        reloaded = SlateVectorIndex(tmp_path / "vi", embed_fn=bow)
+        assert isinstance(reloaded._vectors, np.memmap)
+        assert reloaded.count() == 4
+        assert reloaded.file_hashes == {"slate/gpu.py": "abc"}
+        assert reloaded.search("lock")[0]["id"] == "slate/queue.py::0"
+
+    def test_append_after_reload_and_resave(self, index, tmp_path):
+        index.save()
+        reloaded = SlateVectorIndex(tmp_path / "vi", embed_fn=bow)
+        add_file(reloaded, "slate/new.py", ["token token"])
+        reloaded.save()
+        assert SlateVectorIndex(tmp_path / "vi", embed_fn=bow).count() == 6
+
+    def test_status(self, index):
+        index.save()
+        status = index.get_status()
+        assert status["backend"] == "numpy"
+        assert status["rows"] == 5 and status["files"] == 3 and status["dim"] == len(VOCAB)
+
+
+class TestScale:
+    def test_large_index_topk(self, tmp_path):
+        rng = np.random.default_rng(0)
+        idx = SlateVectorIndex(tmp_path / "big", embed_fn=lambda t: [0.0] * 64)
+        vectors = rng.standard_normal((20000, 64)).astype(np.float32)
+        idx.add(
+            ids=[str(i) for i in range(20000)],
+            embeddings=vectors,
+            documents=[""] * 20000,
+            metadatas=[{"file_path": f"f{i // 10}"} for i in range(20000)],
+        )
+        target = vectors[1234]
+        assert idx.query(target.tolist(), n_results=3)[0]["id"] == "1234"
@@ -0,0 +1,160 @@
+# Modified: 2026-10-16T20:00:00Z | Author: COPILOT | Change: Add test coverage for status_snapshot module
+"""
+Tests for slate/status_snapshot.py — per-section background refresh,
+in-memory snapshot reads with age metadata, delta push to subscribers,
+and the SlateOrchestrator section split it is built on.
+"""
+
+import threading
+import time
+
+import pytest
+
+from slate.slate_orchestrator import SlateOrchestrator
+from slate.status_snapshot import StatusSnapshotService
+
+
+class Counter:
+    def __init__(self, delay=0.0, values=None):
+        self.calls = 0
+        self.delay = delay
+        self.values = values
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            self.calls += 1
+            n = self.calls
+        time.sleep(self.delay)
+        if self.values is not None:
+            return {"value": self.values[min(n, len(self.values)) - 1]}
+        return {"value": 1}
+
+
+@pytest.fixture
+def make_service():
+    services = []
+
+    def make(sections):
+        svc = StatusSnapshotService(sections)
+        services.append(svc)
+        return svc
+
+    yield make
+    for svc in services:
+        svc.stop()
+
+
+class TestSnapshot:
+    def test_reads_are_in_memory(self, make_service):
+        slow = Counter(delay=0.3)
+        svc = make_service({"runner": (slow, 60.0)}).start()
+        assert svc.wait_ready(timeout=2)
+        start = time.perf_counter()
+        for _ in range(100):
+            snap = svc.snapshot()
+        assert (time.perf_counter() - start) / 100 < 0.005
+        assert snap["runner"] == {"value": 1}
+        assert slow.calls == 1
+
+    def test_age_metadata(self, make_service):
+        svc = make_service({"a": (Counter(), 60.0)})
+        assert svc.snapshot()["meta"]["a"]["age_s"] is None
+        svc.refresh(wait=True)
+        meta = svc.snapshot()["meta"]["a"]
+        assert meta["age_s"] >= 0 and meta["refreshed_at"] and meta["error"] is None
+
+    def test_snapshot_is_a_copy(self, make_service):
+        svc = make_service({"a": (Counter(), 60.0)})
+        svc.refresh(wait=True)
+        svc.snapshot()["a"]["value"] = 99
+        assert svc.snapshot()["a"]["value"] == 1
+
+    def test_failed_refresh_keeps_last_value(self, make_service):
+        calls = iter([{"ok": True}])
+
+        def flaky():
+            return next(calls)  # StopIteration on the second call
+
+        svc = make_service({"docker": (flaky, 60.0)})
+        svc.refresh(wait=True)
+        svc.refresh(wait=True)
+        snap = svc.snapshot()
+        assert snap["docker"] == {"ok": True}
+        assert snap["meta"]["docker"]["error"] is not None
+
+
+class TestScheduling:
+    def test_sections_refresh_on_own_interval(self, make_service):
+        fast, slow = Counter(), Counter()
+        make_service({"fast": (fast, 0.05), "slow": (slow, 60.0)}).start()
+        time.sleep(0.4)
+        assert fast.calls >= 4
+        assert slow.calls == 1
+
+    def test_slow_section_does_not_delay_fast(self, make_service):
+        fast, slow = Counter(), Counter(delay=1.0)
+        svc = make_service({"fast": (fast, 60.0), "slow": (slow, 60.0)}).start()
+        time.sleep(0.2)
+        assert svc.snapshot()["fast"] == {"value": 1}
+        assert svc.snapshot()["slow"] == {}
+        assert not svc.wait_ready(timeout=0)
+
+    def test_forced_refresh(self, make_service):
+        c = Counter()
+        svc = make_service({"a": (c, 60.0)}).start()
+        svc.wait_ready(timeout=2)
+        svc.refresh("a")
+        time.sleep(0.2)
+        assert c.calls == 2
+
+    def test_waited_refresh_joins_running_one(self, make_service):
+        c = Counter(delay=0.3)
+        svc = make_service({"a": (c, 60.0)}).start()
+        time.sleep(0.05)
+        svc.refresh(wait=True)
+        assert c.calls == 1
+        assert svc.snapshot()["a"] == {"value": 1}
+
+
+class TestSubscribers:
+    def test_deltas_only_on_change(self, make_service):
+        svc = make_service({"wf": (Counter(values=[1, 1, 2]), 60.0)})
+        deltas = []
+        unsubscribe = svc.subscribe(deltas.append)
+        for _ in range(3):
+            svc.refresh(wait=True)
+        assert [d["data"] for d in deltas] == [{"value": 1}, {"value": 2}]
+        assert all(d["section"] == "wf" and "refresh_ms" in d["meta"] for d in deltas)
+        unsubscribe()
+        assert svc.stats()["subscribers"] == 0
+
+    def test_failing_subscriber_is_isolated(self, make_service):
+        svc = make_service({"a": (Counter(), 60.0)})
+        seen = []
+
+        def bad(_delta):
+            raise RuntimeError("socket closed")
+
+        svc.subscribe(bad)
+        svc.subscribe(seen.append)
+        svc.refresh(wait=True)
+        assert len(seen) == 1
+
+
+class TestOrchestratorSections:
+    def test_status_keys_unchanged(self, monkeypatch):
+        orch = SlateOrchestrator(mode="prod")
+        monkeypatch.setattr(orch, "_status_runner", lambda: {"running": False, "status": "unknown"})
+        monkeypatch.setattr(orch, "_status_docker", lambda: {"available": False, "daemon_running": False,
+                                                             "containers": 0})
+        monkeypatch.setattr(orch, "_status_workflow", lambda: {"task_count": 0, "healthy": False})
+        status = orch.status(skip_dashboard_check=True)
+        assert list(status) == ["orchestrator", "runner", "dashboard", "workflow", "file_watcher", "docker"]
+        assert status["dashboard"] == {"running": True, "port": 8080}
+        assert status["file_watcher"] == {"running": False, "mode": "prod"}
+
+    def test_sections_have_intervals(self):
+        sections = SlateOrchestrator(mode="prod").status_sections()
+        assert all(callable(fn) and interval > 0 for fn, interval in sections.values())
+        assert sections["runner"][1] > sections["orchestrator"][1]
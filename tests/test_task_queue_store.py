@@ -0,0 +1,113 @@
+# Modified: 2026-10-16T23:30:00Z | Author: COPILOT | Change: Add test coverage for task_queue_store module
+"""
+Tests for slate/task_queue_store.py — O(1) appends, snapshot + log replay,
+torn-line recovery, crash-safe compaction and ordering across processes.
+"""
+
+import json
+import multiprocessing
+
+import pytest
+
+from slate.task_queue_store import TaskQueueStore
+
+
+def task(task_id, status="pending", **extra):
+    return {"task_id": task_id, "status": status, "priority": 5, **extra}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TaskQueueStore(tmp_path / "queue.json")
+
+
+def _producer(path, name, count):
+    store = TaskQueueStore(path)
+    for i in range(count):
+        store.append(task(f"{name}-{i:03d}", seq=i))
+
+
+class TestAppendAndReplay:
+    def test_append_does_not_touch_snapshot(self, store):
+        store.append(task("a"))
+        store.append(task("b"))
+        assert not store.path.exists()
+        assert len(store.log_path.read_text().splitlines()) == 2
+        pending, completed = store.load()
+        assert [t["task_id"] for t in pending] == ["a", "b"] and completed == []
+
+    def test_last_event_wins(self, store):
+        store.append(task("a"), task("b"))
+        store.append(task("a", "running"))
+        store.append(task("a", "completed", result="ok"))
+        pending, completed = store.load()
+        assert [t["task_id"] for t in pending] == ["b"]
+        assert completed == [task("a", "completed", result="ok")]
+
+    def test_running_tasks_stay_in_pending(self, store):
+        store.append(task("a", "running"))
+        assert store.load()[0][0]["status"] == "running"
+
+    def test_reads_legacy_snapshot(self, store):
+        store.path.write_text(json.dumps({"pending": [task("old")], "completed": [task("x", "failed")]}))
+        store.append(task("old", "completed"))
+        pending, completed = store.load()
+        assert pending == [] and [t["task_id"] for t in completed] == ["x", "old"]
+
+
+class TestRecovery:
+    def test_torn_tail_is_skipped_and_closed(self, store):
+        store.append(task("a"))
+        with open(store.log_path, "a", encoding="utf-8") as f:
+            f.write('{"task_id": "b", "sta')  # writer died mid-line
+        assert [t["task_id"] for t in store.load()[0]] == ["a"]
+        store.append(task("c"))
+        assert [t["task_id"] for t in store.load()[0]] == ["a", "c"]
+        assert store.stats["torn_lines"] >= 1
+
+    def test_crash_between_snapshot_and_truncate(self, store):
+        store.append(task("a"), task("b"))
+        store.append(task("a", "completed"))
+        log = store.log_path.read_bytes()
+        store.compact()
+        store.log_path.write_bytes(log)  # as if truncation never happened
+        pending, completed = store.load()
+        assert [t["task_id"] for t in pending] == ["b"]
+        assert [t["task_id"] for t in completed] == ["a"]
+
+
+class TestCompaction:
+    def test_compacts_past_threshold(self, tmp_path):
+        store = TaskQueueStore(tmp_path / "queue.json", compact_bytes=2048)
+        for i in range(100):
+            store.append(task(f"t{i}", "completed" if i % 2 else "pending"))
+        assert store.stats["compactions"] >= 1
+        assert store.log_path.stat().st_size < 2048
+        pending, completed = store.load()
+        assert len(pending) == 50 and len(completed) == 50
+
+    def test_snapshot_format_and_completed_trim(self, tmp_path):
+        store = TaskQueueStore(tmp_path / "queue.json", keep_completed=3)
+        store.append(*(task(f"t{i}", "completed") for i in range(5)), task("p"))
+        store.compact()
+        data = json.loads(store.path.read_text())
+        assert [t["task_id"] for t in data["completed"]] == ["t2", "t3", "t4"]
+        assert [t["task_id"] for t in data["pending"]] == ["p"]
+        assert "updated_at" in data
+        assert store.log_path.read_text() == ""
+
+
+class TestConcurrentProducers:
+    def test_processes_share_one_order(self, tmp_path):
+        path = tmp_path / "queue.json"
+        ctx = multiprocessing.get_context("fork")
+        procs = [ctx.Process(target=_producer, args=(path, f"p{n}", 50)) for n in range(4)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join(timeout=60)
+        pending, _ = TaskQueueStore(path).load()
+        assert len(pending) == 200
+        for n in range(4):
+            seqs = [t["seq"] for t in pending if t["task_id"].startswith(f"p{n}-")]
+            assert seqs == list(range(50))  # each producer's events stay in order
@@ -0,0 +1,183 @@
+# Modified: 2026-10-17T00:00:00Z | Author: COPILOT | Change: Add test coverage for task_store module
+"""
+Tests for slate_core/task_store.py — point updates, indexed listing,
+change notifications, the coalesced JSON export and merging of edits
+made directly to current_tasks.json.
+"""
+
+import json
+import time
+
+import pytest
+
+from slate_core.task_store import TaskStore
+
+
+@pytest.fixture
+def json_path(tmp_path):
+    path = tmp_path / "current_tasks.json"
+    path.write_text(json.dumps({
+        "tasks": [
+            {"id": "a", "title": "A", "status": "pending", "assigned_to": "workflow"},
+            {"id": "b", "title": "B", "status": "completed", "assigned_to": "copilot"},
+        ],
+        "created_at": "2026-01-01T00:00:00+00:00",
+    }))
+    return path
+
+
+@pytest.fixture
+def make_store(json_path):
+    stores = []
+
+    def make(export_delay=60.0):
+        store = TaskStore(json_path, export_delay=export_delay)
+        stores.append(store)
+        return store
+
+    yield make
+    for store in stores:
+        store.close()
+
+
+def _edit_json(path, mutate):
+    data = json.loads(path.read_text())
+    mutate(data)
+    time.sleep(0.01)  # distinct mtime for the change signature
+    path.write_text(json.dumps(data, indent=2))
+
+
+class TestReads:
+    def test_imports_existing_json(self, make_store):
+        store = make_store()
+        assert [t["id"] for t in store.list()] == ["a", "b"]
+        assert store.get("b")["title"] == "B"
+        assert store.get("missing") is None
+
+    def test_filters_and_counts(self, make_store):
+        store = make_store()
+        store.add({"id": "c", "status": "pending", "assigned_to": "copilot"})
+        assert [t["id"] for t in store.list(status="pending")] == ["a", "c"]
+        assert [t["id"] for t in store.list(status=("pending", "completed"), assigned_to="copilot")] == ["b", "c"]
+        assert store.list(limit=1)[0]["id"] == "a"
+        assert store.counts() == {"pending": 2, "completed": 1}
+
+    def test_read_document_keeps_metadata(self, make_store):
+        doc = make_store().read_document()
+        assert doc["created_at"] == "2026-01-01T00:00:00+00:00"
+        assert len(doc["tasks"]) == 2
+
+
+class TestWrites:
+    def test_update_is_a_point_write(self, make_store):
+        store = make_store()
+        task = store.update("a", status="in-progress", started_at="now")
+        assert task["status"] == "in-progress" and task["title"] == "A"
+        assert store.get("a")["started_at"] == "now"
+        assert store.update("missing", status="x") is None
+
+    def test_add_fills_id_and_created_at(self, make_store):
+        task = make_store().add({"title": "new"})
+        assert task["id"] and task["created_at"]
+
+    def test_add_many_skips_existing(self, make_store):
+        store = make_store()
+        assert store.add_many([{"id": "a"}, {"id": "d"}, {"id": "e"}]) == 2
+        assert [t["id"] for t in store.list()] == ["a", "b", "d", "e"]
+
+    def test_write_document_only_writes_changes(self, make_store):
+        store = make_store()
+        doc = store.read_document()
+        doc["tasks"][1]["status"] = "failed"
+        doc["tasks"].append({"id": "c", "status": "pending"})
+        summary = store.write_document(doc)
+        assert summary == {"written": 2, "deleted": 0}
+        doc["tasks"] = doc["tasks"][1:]
+        assert store.write_document(doc) == {"written": 0, "deleted": 1}
+        assert [t["id"] for t in store.list()] == ["b", "c"]
+
+
+class TestExport:
+    def test_export_is_coalesced(self, make_store, json_path):
+        store = make_store(export_delay=60.0)
+        before = json_path.read_text()
+        store.update("a", status="completed")
+        store.update("b", status="pending")
+        assert json_path.read_text() == before
+        assert store.flush() is True
+        data = json.loads(json_path.read_text())
+        assert [t["status"] for t in data["tasks"]] == ["completed", "pending"]
+        assert data["created_at"] == "2026-01-01T00:00:00+00:00" and "last_updated" in data
+        assert store.flush() is False
+        assert store.stats["exports"] == 1
+
+    def test_export_delay_zero_writes_through(self, make_store, json_path):
+        store = make_store(export_delay=0)
+        store.delete("a")
+        assert [t["id"] for t in json.loads(json_path.read_text())["tasks"]] == ["b"]
+
+    def test_timer_exports(self, make_store, json_path):
+        store = make_store(export_delay=0.05)
+        store.update("a", status="completed")
+        time.sleep(0.3)
+        assert json.loads(json_path.read_text())["tasks"][0]["status"] == "completed"
+
+    def test_list_shaped_file_stays_a_list(self, tmp_path):
+        path = tmp_path / "tasks.json"
+        path.write_text(json.dumps([{"id": "x", "status": "pending"}]))
+        store = TaskStore(path, export_delay=0)
+        store.add({"id": "y", "status": "pending"})
+        assert [t["id"] for t in json.loads(path.read_text())] == ["x", "y"]
+        store.close()
+
+
+class TestLegacyEdits:
+    def test_direct_json_edit_is_merged(self, make_store, json_path):
+        store = make_store()
+        store.list()
+        _edit_json(json_path, lambda d: d["tasks"].append({"id": "z", "status": "pending"}))
+        assert store.get("z") is not None
+        _edit_json(json_path, lambda d: d["tasks"].pop(0))
+        assert store.get("a") is None
+
+    def test_local_changes_win_over_file(self, make_store, json_path):
+        store = make_store()
+        store.update("a", status="completed")
+        _edit_json(json_path, lambda d: d["tasks"][0].update(status="failed"))
+        assert store.get("a")["status"] == "completed"
+
+    def test_tombstone_survives_stale_file(self, make_store, json_path):
+        store = make_store()
+        store.delete("b")
+        _edit_json(json_path, lambda d: d.update(note="touched"))
+        assert store.get("b") is None
+        store.flush()
+        assert [t["id"] for t in json.loads(json_path.read_text())["tasks"]] == ["a"]
+
+    def test_second_process_view(self, make_store):
+        writer, reader = make_store(export_delay=0), make_store()
+        reader.list()
+        writer.update("a", status="completed")
+        assert reader.get("a")["status"] == "completed"
+
+
+class TestNotifications:
+    def test_subscribe(self, make_store):
+        store = make_store()
+        store.list()
+        seen = []
+        unsubscribe = store.subscribe(seen.append)
+        store.update("a", status="completed")
+        assert seen[-1][0]["task_id"] == "a" and seen[-1][0]["status"] == "completed"
+        unsubscribe()
+        store.update("b", status="pending")
+        assert len(seen) == 1
+
+    def test_changes_since(self, make_store):
+        store = make_store()
+        seq = store.last_seq()
+        store.add({"id": "c", "status": "pending"})
+        store.delete("c")
+        changes = store.changes_since(seq)
+        assert [(c["task_id"], c["op"]) for c in changes] == [("c", "add"), ("c", "delete")]
+        assert store.changes_since(changes[-1]["seq"]) == []